@@ -122,7 +122,7 @@ class AggregateClfCalculator(ConfigReader):
             print("Analyzing video {}...".format(file_name))
             _, _, fps = self.read_video_info(video_name=file_name)
             check_file_exist_and_readable(file_path)
-            data_df = read_df(file_path, self.file_type)
+            data_df = read_df(file_path, self.file_type, usecols=list(self.clf_names))
             bouts_df = detect_bouts(data_df=data_df, target_lst=self.clf_names, fps=fps)
             if self.detailed_bout_data and (len(bouts_df) > 0):
                 bouts_df_for_detailes = deepcopy(bouts_df)
@@ -1,333 +1,359 @@
-__author__ = "Simon Nilsson"
-
-import itertools
-import os
-from typing import Optional, Union
-
-import numpy as np
-import pandas as pd
-
-from simba.mixins.config_reader import ConfigReader
-from simba.mixins.feature_extraction_mixin import FeatureExtractionMixin
-from simba.utils.checks import (check_if_filepath_list_is_empty,
-                                check_that_dir_has_list_of_filenames)
-from simba.utils.enums import TagNames
-from simba.utils.errors import AnimalNumberError, CountError, InvalidInputError
-from simba.utils.printing import SimbaTimer, log_event, stdout_success
-from simba.utils.read_write import get_fn_ext, read_df, write_df
-
-
-class DirectingOtherAnimalsAnalyzer(ConfigReader, FeatureExtractionMixin):
-    """
-    Calculate when animals are directing towards body-parts of other animals. Results are stored in
-    the ``project_folder/logs/directionality_dataframes`` directory of the SimBA project.
-
-    .. note:
-       `Example expected bool table <https://github.com/sgoldenlab/simba/blob/master/misc/boolean_directionaly_example.csv>`__.
-       `Example expected summary table <https://github.com/sgoldenlab/simba/blob/master/misc/detailed_summary_directionality_example.csv>`__.
-       `Example expected aggregate statistics table <https://github.com/sgoldenlab/simba/blob/master/misc/direction_data_aggregates_example.csv>`__.
-
-    .. important::
-       Requires the pose-estimation data for the ``left ear``, ``right ear`` and ``nose`` of each individual animals.
-       `Github Tutorial <https://github.com/sgoldenlab/simba/blob/master/docs/ROI_tutorial.md#part-3-generating-features-from-roi-data>`__.
-       `Expected output <https://github.com/sgoldenlab/simba/blob/master/misc/Direction_data_example.csv>`__.
-
-    :parameter str config_path: path to SimBA project config file in Configparser format.
-    :parameter bool bool_tables: If True, creates boolean output tables.
-    :parameter bool summary_tables: If True, creates summary tables including approximate location of eye of observer and the location of observed body-parts and frames when observation was detected.
-    :parameter bool aggregate_statistics_tables: If True, summary statistics tables of how much time each animal spent observation the other animals.
-
-    :examples:
-    >>> directing_analyzer = DirectingOtherAnimalsAnalyzer(config_path='MyProjectConfig')
-    >>> directing_analyzer.run()
-    """
-
-    def __init__(
-        self,
-        config_path: Union[str, os.PathLike],
-        bool_tables: Optional[bool] = True,
-        summary_tables: Optional[bool] = False,
-        append_bool_tables_to_features: Optional[bool] = False,
-        aggregate_statistics_tables: Optional[bool] = False,
-    ):
-
-        super().__init__(config_path=config_path)
-        log_event(
-            logger_name=str(self.__class__.__name__),
-            log_type=TagNames.CLASS_INIT.value,
-            msg=self.create_log_msg_from_init_args(locals=locals()),
-        )
-        if self.animal_cnt < 2:
-            raise AnimalNumberError(
-                "Cannot analyze directionality between animals in a 1 animal project.",
-                source=self.__class__.__name__,
-            )
-        check_if_filepath_list_is_empty(
-            filepaths=self.outlier_corrected_paths,
-            error_msg=f"SIMBA ERROR: No data found in the {self.outlier_corrected_dir} directory",
-        )
-        self.animal_permutations = list(itertools.permutations(self.animal_bp_dict, 2))
-        (
-            self.bool_tables,
-            self.summary_tables,
-            self.aggregate_statistics_tables,
-            self.append_bool_tables_to_features,
-        ) = (
-            bool_tables,
-            summary_tables,
-            aggregate_statistics_tables,
-            append_bool_tables_to_features,
-        )
-        if self.append_bool_tables_to_features:
-            check_that_dir_has_list_of_filenames(
-                dir=self.features_dir,
-                file_name_lst=self.outlier_corrected_paths,
-                file_type=self.file_type,
-            )
-        print(f"Processing {str(len(self.outlier_corrected_paths))} video(s)...")
-
-    def run(self):
-        self.results_dict = {}
-        for file_cnt, file_path in enumerate(self.outlier_corrected_paths):
-            video_timer = SimbaTimer(start=True)
-            _, video_name, _ = get_fn_ext(file_path)
-            print(f"Analyzing directionality between animals in video {video_name}...")
-            self.results_dict[video_name] = {}
-            data_df = read_df(file_path, self.file_type)
-            direct_bp_dict = self.check_directionality_cords()
-            for animal_permutation in self.animal_permutations:
-                self.results_dict[video_name][
-                    "{} {} {}".format(
-                        animal_permutation[0],
-                        "directing towards",
-                        animal_permutation[1],
-                    )
-                ] = {}
-                first_animal_bps, second_animal_bps = (
-                    direct_bp_dict[animal_permutation[0]],
-                    self.animal_bp_dict[animal_permutation[1]],
-                )
-                first_ear_left_arr = data_df[
-                    [
-                        first_animal_bps["Ear_left"]["X_bps"],
-                        first_animal_bps["Ear_left"]["Y_bps"],
-                    ]
-                ].to_numpy()
-                first_ear_right_arr = data_df[
-                    [
-                        first_animal_bps["Ear_right"]["X_bps"],
-                        first_animal_bps["Ear_right"]["Y_bps"],
-                    ]
-                ].to_numpy()
-                first_nose_arr = data_df[
-                    [
-                        first_animal_bps["Nose"]["X_bps"],
-                        first_animal_bps["Nose"]["Y_bps"],
-                    ]
-                ].to_numpy()
-                other_animal_x_bps, other_animal_y_bps = (
-                    second_animal_bps["X_bps"],
-                    second_animal_bps["Y_bps"],
-                )
-                for x_bp, y_bp in zip(other_animal_x_bps, other_animal_y_bps):
-                    target_cord_arr = data_df[[x_bp, y_bp]].to_numpy()
-                    direction_data = self.jitted_line_crosses_to_nonstatic_targets(
-                        left_ear_array=first_ear_left_arr,
-                        right_ear_array=first_ear_right_arr,
-                        nose_array=first_nose_arr,
-                        target_array=target_cord_arr,
-                    )
-                    x_min = np.minimum(direction_data[:, 1], first_nose_arr[:, 0])
-                    y_min = np.minimum(direction_data[:, 2], first_nose_arr[:, 1])
-                    delta_x = abs((direction_data[:, 1] - first_nose_arr[:, 0]) / 2)
-                    delta_y = abs((direction_data[:, 2] - first_nose_arr[:, 1]) / 2)
-                    x_middle, y_middle = np.add(x_min, delta_x), np.add(y_min, delta_y)
-                    direction_data = np.concatenate(
-                        (y_middle.reshape(-1, 1), direction_data), axis=1
-                    )
-                    direction_data = np.concatenate(
-                        (x_middle.reshape(-1, 1), direction_data), axis=1
-                    )
-                    direction_data = np.delete(direction_data, [2, 3, 4], 1)
-                    direction_data = np.hstack((direction_data, target_cord_arr))
-                    bp_data = pd.DataFrame(
-                        direction_data,
-                        columns=["Eye_x", "Eye_y", "Directing_BOOL", x_bp, y_bp],
-                    )
-                    bp_data = bp_data[["Eye_x", "Eye_y", x_bp, y_bp, "Directing_BOOL"]]
-                    bp_data.insert(loc=0, column="Animal_2_body_part", value=x_bp[:-2])
-                    bp_data.insert(
-                        loc=0, column="Animal_2", value=animal_permutation[1]
-                    )
-                    bp_data.insert(
-                        loc=0, column="Animal_1", value=animal_permutation[0]
-                    )
-                    self.results_dict[video_name][
-                        "{} {} {}".format(
-                            animal_permutation[0],
-                            "directing towards",
-                            animal_permutation[1],
-                        )
-                    ][x_bp[:-2]] = bp_data
-            video_timer.stop_timer()
-            print(
-                f"Direction analysis complete for video {video_name} ({file_cnt + 1}/{len(self.outlier_corrected_paths)}, elapsed time: {video_timer.elapsed_time_str}s)..."
-            )
-        if self.bool_tables:
-            self.create_bool_tables()
-        if self.summary_tables:
-            self._transpose_results_to_df()
-            self._save_directionality_dfs()
-        if self.aggregate_statistics_tables:
-            self.summary_statistics()
-
-    def create_bool_tables(self):
-        save_dir = os.path.join(
-            self.logs_path, f"Animal_directing_animal_booleans_{self.datetime}"
-        )
-        if not os.path.isdir(save_dir):
-            os.makedirs(save_dir)
-        for video_cnt, (video_name, video_data) in enumerate(self.results_dict.items()):
-            video_df = pd.DataFrame()
-            print(
-                f"Saving boolean directing tables for video {video_name} (Video {video_cnt+1}/{len(self.results_dict.keys())})..."
-            )
-            for animal_permutation, animal_permutation_data in video_data.items():
-                for body_part_name, body_part_data in animal_permutation_data.items():
-                    video_df[f"{animal_permutation}_{body_part_name}"] = body_part_data[
-                        "Directing_BOOL"
-                    ]
-            if self.append_bool_tables_to_features:
-                print(
-                    f"Adding directionality tables to features data for video {video_name}..."
-                )
-                df = read_df(
-                    file_path=os.path.join(
-                        self.features_dir, f"{video_name}.{self.file_type}"
-                    ),
-                    file_type=self.file_type,
-                )
-                if len(df) != len(video_df):
-                    raise CountError(
-                        msg=f"Failed to join data files as they contains different number of frames: the file representing video {video_name} in directory {self.outlier_corrected_dir} contains {len(video_df)} frames, and the file representing video {video_name} in directory {self.features_dir} contains {len(df)} frames."
-                    )
-                else:
-                    df = pd.concat(
-                        [df.reset_index(drop=True), video_df.reset_index(drop=True)],
-                        axis=1,
-                    )
-                    write_df(
-                        df=df,
-                        file_type=self.file_type,
-                        save_path=os.path.join(
-                            self.features_dir, f"{video_name}.{self.file_type}"
-                        ),
-                    )
-            video_df.to_csv(os.path.join(save_dir, f"{video_name}.csv"))
-        stdout_success(
-            msg=f"All boolean tables saved in {save_dir}!",
-            source=self.__class__.__name__,
-        )
-
-    def _transpose_results_to_df(self):
-        """
-        Privet method to transpose results created by :meth:`~simba.DirectingOtherAnimalsAnalyzer.process_directionality`.
-        into dict of dataframes.
-        """
-
-        print("Transposing directionality data for summary tables...")
-        self.directionality_df_dict = {}
-        for video_name, video_data in self.results_dict.items():
-            out_df_lst = []
-            for animal_permutation, permutation_data in video_data.items():
-                for bp_name, bp_data in permutation_data.items():
-                    directing_df = (
-                        bp_data[bp_data["Directing_BOOL"] == 1]
-                        .reset_index()
-                        .rename(
-                            columns={
-                                "index": "Frame_#",
-                                bp_name + "_x": "Animal_2_bodypart_x",
-                                bp_name + "_y": "Animal_2_bodypart_y",
-                            }
-                        )
-                    )
-                    directing_df.insert(loc=0, column="Video", value=video_name)
-                    out_df_lst.append(directing_df)
-            self.directionality_df_dict[video_name] = pd.concat(
-                out_df_lst, axis=0
-            ).drop("Directing_BOOL", axis=1)
-
-    def _save_directionality_dfs(self):
-        """
-        Privat method to save result created by :meth:`~simba.DirectingOtherAnimalsAnalyzer.create_directionality_dfs`.
-        into CSV files on disk. Results are stored in `project_folder/logs` directory of the SimBA project.
-        """
-        save_dir = os.path.join(
-            self.logs_path,
-            f"detailed_directionality_summary_dataframes_{self.datetime}",
-        )
-        if not os.path.exists(save_dir):
-            os.makedirs(save_dir)
-        for video_cnt, (video_name, video_data) in enumerate(
-            self.directionality_df_dict.items()
-        ):
-            save_name = os.path.join(save_dir, f"{video_name}.csv")
-            video_data.to_csv(save_name)
-            print(
-                f"Detailed directional summary tables saved for video {video_name} (Video {video_cnt+1}/{len(list(self.directionality_df_dict.keys()))})..."
-            )
-        stdout_success(
-            f"All detailed directional data saved in the {save_dir} directory!",
-            source=self.__class__.__name__,
-        )
-
-    def summary_statistics(self):
-        """
-        Method to save aggregate statistics of data created by :meth:`~simba.DirectingOtherAnimalsAnalyzer.create_directionality_dfs`.
-        into CSV files on disk. Results are stored in `project_folder/logs` directory of the SimBA project.
-        """
-        print("Computing summary statistics...")
-        out_df_lst = []
-        for video_name, video_data in self.results_dict.items():
-            _, _, fps = self.read_video_info(video_name=video_name)
-            for animal_permutation, permutation_data in video_data.items():
-                idx_directing = set()
-                for bp_name, bp_data in permutation_data.items():
-                    idx_directing.update(
-                        list(bp_data.index[bp_data["Directing_BOOL"] == 1])
-                    )
-                value = round(len(idx_directing) / fps, 3)
-                out_df_lst.append(
-                    pd.DataFrame(
-                        [[video_name, animal_permutation, value]],
-                        columns=["Video", "Animal permutation", "Value (s)"],
-                    )
-                )
-        self.summary_df = (
-            pd.concat(out_df_lst, axis=0)
-            .sort_values(by=["Video", "Animal permutation"])
-            .set_index("Video")
-        )
-        self.save_path = os.path.join(
-            self.logs_path, f"Direction_aggregate_summary_data_{self.datetime}.csv"
-        )
-        self.summary_df.to_csv(self.save_path)
-        self.timer.stop_timer()
-        stdout_success(
-            msg=f"Summary directional statistics saved at {self.save_path}",
-            source=self.__class__.__name__,
-        )
-        stdout_success(
-            msg="All directional data saved in SimBA project",
-            elapsed_time=self.timer.elapsed_time_str,
-            source=self.__class__.__name__,
-        )
-
-
-# test = DirectingOtherAnimalsAnalyzer(config_path='/Users/simon/Desktop/envs/troubleshooting/two_black_animals_14bp/project_folder/project_config.ini',
-#                                      bool_tables=True,
-#                                      summary_tables=False,
-#                                      aggregate_statistics_tables=False,
-#                                      append_bool_tables_to_features=True)
-# test.run()
+__author__ = "Simon Nilsson"
+
+import itertools
+import os
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from simba.mixins.config_reader import ConfigReader
+from simba.mixins.feature_extraction_mixin import FeatureExtractionMixin
+from simba.utils.checks import (check_if_filepath_list_is_empty,
+                                check_that_dir_has_list_of_filenames)
+from simba.utils.enums import TagNames
+from simba.utils.errors import AnimalNumberError, CountError, InvalidInputError
+from simba.utils.printing import SimbaTimer, log_event, stdout_success
+from simba.utils.read_write import get_fn_ext, read_df, write_df
+
+
+class DirectingOtherAnimalsAnalyzer(ConfigReader, FeatureExtractionMixin):
+    """
+    Calculate when animals are directing towards body-parts of other animals. Results are stored in
+    the ``project_folder/logs/directionality_dataframes`` directory of the SimBA project.
+
+    .. note:
+       `Example expected bool table <https://github.com/sgoldenlab/simba/blob/master/misc/boolean_directionaly_example.csv>`__.
+       `Example expected summary table <https://github.com/sgoldenlab/simba/blob/master/misc/detailed_summary_directionality_example.csv>`__.
+       `Example expected aggregate statistics table <https://github.com/sgoldenlab/simba/blob/master/misc/direction_data_aggregates_example.csv>`__.
+
+    .. important::
+       Requires the pose-estimation data for the ``left ear``, ``right ear`` and ``nose`` of each individual animals.
+       `Github Tutorial <https://github.com/sgoldenlab/simba/blob/master/docs/ROI_tutorial.md#part-3-generating-features-from-roi-data>`__.
+       `Expected output <https://github.com/sgoldenlab/simba/blob/master/misc/Direction_data_example.csv>`__.
+
+    :parameter str config_path: path to SimBA project config file in Configparser format.
+    :parameter bool bool_tables: If True, creates boolean output tables.
+    :parameter bool summary_tables: If True, creates summary tables including approximate location of eye of observer and the location of observed body-parts and frames when observation was detected.
+    :parameter bool aggregate_statistics_tables: If True, summary statistics tables of how much time each animal spent observation the other animals.
+
+    :examples:
+    >>> directing_analyzer = DirectingOtherAnimalsAnalyzer(config_path='MyProjectConfig')
+    >>> directing_analyzer.run()
+    """
+
+    def __init__(
+        self,
+        config_path: Union[str, os.PathLike],
+        bool_tables: Optional[bool] = True,
+        summary_tables: Optional[bool] = False,
+        append_bool_tables_to_features: Optional[bool] = False,
+        aggregate_statistics_tables: Optional[bool] = False,
+    ):
+
+        super().__init__(config_path=config_path)
+        log_event(
+            logger_name=str(self.__class__.__name__),
+            log_type=TagNames.CLASS_INIT.value,
+            msg=self.create_log_msg_from_init_args(locals=locals()),
+        )
+        if self.animal_cnt < 2:
+            raise AnimalNumberError(
+                "Cannot analyze directionality between animals in a 1 animal project.",
+                source=self.__class__.__name__,
+            )
+        check_if_filepath_list_is_empty(
+            filepaths=self.outlier_corrected_paths,
+            error_msg=f"SIMBA ERROR: No data found in the {self.outlier_corrected_dir} directory",
+        )
+        self.animal_permutations = list(itertools.permutations(self.animal_bp_dict, 2))
+        self.__create_combinations()
+        (
+            self.bool_tables,
+            self.summary_tables,
+            self.aggregate_statistics_tables,
+            self.append_bool_tables_to_features,
+        ) = (
+            bool_tables,
+            summary_tables,
+            aggregate_statistics_tables,
+            append_bool_tables_to_features,
+        )
+        if self.append_bool_tables_to_features:
+            check_that_dir_has_list_of_filenames(
+                dir=self.features_dir,
+                file_name_lst=self.outlier_corrected_paths,
+                file_type=self.file_type,
+            )
+        print(f"Processing {str(len(self.outlier_corrected_paths))} video(s)...")
+
+    def __create_combinations(self):
+        """
+        Private helper to create the column names of the observer and target body-parts, and the
+        (observer animal, target body-part) combinations evaluated by the directionality kernel.
+        """
+        direct_bp_dict = self.check_directionality_cords()
+        animal_names = list(self.animal_bp_dict.keys())
+        self.left_ear_cols, self.right_ear_cols, self.nose_cols = [], [], []
+        for animal_name in animal_names:
+            for cols, bp_name in zip(
+                [self.left_ear_cols, self.right_ear_cols, self.nose_cols],
+                ["Ear_left", "Ear_right", "Nose"],
+            ):
+                cols.extend(
+                    [
+                        direct_bp_dict[animal_name][bp_name]["X_bps"],
+                        direct_bp_dict[animal_name][bp_name]["Y_bps"],
+                    ]
+                )
+        self.target_cols = []
+        for animal_name in animal_names:
+            for x_bp, y_bp in zip(
+                self.animal_bp_dict[animal_name]["X_bps"],
+                self.animal_bp_dict[animal_name]["Y_bps"],
+            ):
+                self.target_cols.extend([x_bp, y_bp])
+        observer_idx, target_idx, permutation_idx = [], [], []
+        self.permutation_names, self.combinations = [], []
+        for animal_permutation in self.animal_permutations:
+            self.permutation_names.append(
+                f"{animal_permutation[0]} directing towards {animal_permutation[1]}"
+            )
+            for x_bp in self.animal_bp_dict[animal_permutation[1]]["X_bps"]:
+                observer_idx.append(animal_names.index(animal_permutation[0]))
+                target_idx.append(self.target_cols.index(x_bp) // 2)
+                permutation_idx.append(len(self.permutation_names) - 1)
+                self.combinations.append(
+                    (animal_permutation[0], animal_permutation[1], x_bp[:-2])
+                )
+        self.observer_idx, self.target_idx, self.permutation_idx = (
+            np.array(observer_idx),
+            np.array(target_idx),
+            np.array(permutation_idx),
+        )
+
+    def run(self):
+        self.directing_dict, self.location_dict = {}, {}
+        for file_cnt, file_path in enumerate(self.outlier_corrected_paths):
+            video_timer = SimbaTimer(start=True)
+            _, video_name, _ = get_fn_ext(file_path)
+            print(f"Analyzing directionality between animals in video {video_name}...")
+            data_df = read_df(file_path, self.file_type)
+            left_ear_arr, right_ear_arr, nose_arr, target_arr = (
+                data_df[cols].to_numpy().reshape(len(data_df), -1, 2)
+                for cols in [
+                    self.left_ear_cols,
+                    self.right_ear_cols,
+                    self.nose_cols,
+                    self.target_cols,
+                ]
+            )
+            self.directing_dict[video_name] = (
+                self.jitted_line_crosses_to_nonstatic_target_permutations(
+                    left_ear_array=left_ear_arr,
+                    right_ear_array=right_ear_arr,
+                    nose_array=nose_arr,
+                    target_array=target_arr,
+                    observer_idx=self.observer_idx,
+                    target_idx=self.target_idx,
+                )
+            )
+            self.location_dict[video_name] = (
+                left_ear_arr,
+                right_ear_arr,
+                nose_arr,
+                target_arr,
+            )
+            video_timer.stop_timer()
+            print(
+                f"Direction analysis complete for video {video_name} ({file_cnt + 1}/{len(self.outlier_corrected_paths)}, elapsed time: {video_timer.elapsed_time_str}s)..."
+            )
+        if self.bool_tables:
+            self.create_bool_tables()
+        if self.summary_tables:
+            self._transpose_results_to_df()
+            self._save_directionality_dfs()
+        if self.aggregate_statistics_tables:
+            self.summary_statistics()
+
+    def create_bool_tables(self):
+        save_dir = os.path.join(
+            self.logs_path, f"Animal_directing_animal_booleans_{self.datetime}"
+        )
+        if not os.path.isdir(save_dir):
+            os.makedirs(save_dir)
+        for video_cnt, (video_name, directing) in enumerate(
+            self.directing_dict.items()
+        ):
+            print(
+                f"Saving boolean directing tables for video {video_name} (Video {video_cnt+1}/{len(self.directing_dict.keys())})..."
+            )
+            video_df = pd.DataFrame(
+                directing.astype(np.float64),
+                columns=[
+                    f"{self.permutation_names[permutation_idx]}_{combination[2]}"
+                    for permutation_idx, combination in zip(
+                        self.permutation_idx, self.combinations
+                    )
+                ],
+            )
+            if self.append_bool_tables_to_features:
+                print(
+                    f"Adding directionality tables to features data for video {video_name}..."
+                )
+                df = read_df(
+                    file_path=os.path.join(
+                        self.features_dir, f"{video_name}.{self.file_type}"
+                    ),
+                    file_type=self.file_type,
+                )
+                if len(df) != len(video_df):
+                    raise CountError(
+                        msg=f"Failed to join data files as they contains different number of frames: the file representing video {video_name} in directory {self.outlier_corrected_dir} contains {len(video_df)} frames, and the file representing video {video_name} in directory {self.features_dir} contains {len(df)} frames."
+                    )
+                else:
+                    df = pd.concat(
+                        [df.reset_index(drop=True), video_df.reset_index(drop=True)],
+                        axis=1,
+                    )
+                    write_df(
+                        df=df,
+                        file_type=self.file_type,
+                        save_path=os.path.join(
+                            self.features_dir, f"{video_name}.{self.file_type}"
+                        ),
+                    )
+            video_df.to_csv(os.path.join(save_dir, f"{video_name}.csv"))
+        stdout_success(
+            msg=f"All boolean tables saved in {save_dir}!",
+            source=self.__class__.__name__,
+        )
+
+    def _transpose_results_to_df(self):
+        """
+        Private method to transpose the directionality arrays created by :meth:`~simba.DirectingOtherAnimalsAnalyzer.run`
+        into dict of dataframes with one row per frame and (observer, target body-part) combination where the observer is
+        directing towards the target body-part.
+        """
+
+        print("Transposing directionality data for summary tables...")
+        self.directionality_df_dict = {}
+        combinations = np.array(self.combinations)
+        for video_name, directing in self.directing_dict.items():
+            left_ear_arr, right_ear_arr, nose_arr, target_arr = self.location_dict[
+                video_name
+            ]
+            combination_idx, frm_idx = np.nonzero(directing.T)
+            observer_idx = self.observer_idx[combination_idx]
+            left_ear = left_ear_arr[frm_idx, observer_idx]
+            right_ear = right_ear_arr[frm_idx, observer_idx]
+            nose = nose_arr[frm_idx, observer_idx].astype(np.float64)
+            target = target_arr[frm_idx, self.target_idx[combination_idx]]
+            left_dist, right_dist = np.abs(left_ear - target), np.abs(
+                right_ear - target
+            )
+            left_dist = np.sqrt(
+                left_dist[:, 0] * left_dist[:, 0] + left_dist[:, 1] * left_dist[:, 1]
+            )
+            right_dist = np.sqrt(
+                right_dist[:, 0] * right_dist[:, 0]
+                + right_dist[:, 1] * right_dist[:, 1]
+            )
+            ear = np.where(
+                (right_dist < left_dist).reshape(-1, 1), right_ear, left_ear
+            ).astype(np.float64)
+            eye = np.minimum(ear, nose) + np.abs((ear - nose) / 2)
+            # The rows are sorted by combination. Each row is indexed by its position within its combination
+            # (0, 1, 2, ... restarting at every new combination), as the previous per-combination dataframes were
+            # indexed before being concatenated. searchsorted gives the position of the first row of each combination.
+            combination_row_idx = np.arange(len(combination_idx)) - np.searchsorted(
+                combination_idx, combination_idx
+            )
+            self.directionality_df_dict[video_name] = pd.DataFrame(
+                {
+                    "Video": video_name,
+                    "Frame_#": frm_idx,
+                    "Animal_1": combinations[combination_idx, 0],
+                    "Animal_2": combinations[combination_idx, 1],
+                    "Animal_2_body_part": combinations[combination_idx, 2],
+                    "Eye_x": eye[:, 0],
+                    "Eye_y": eye[:, 1],
+                    "Animal_2_bodypart_x": target[:, 0].astype(np.float64),
+                    "Animal_2_bodypart_y": target[:, 1].astype(np.float64),
+                },
+                index=combination_row_idx,
+            )
+
+    def _save_directionality_dfs(self):
+        """
+        Privat method to save result created by :meth:`~simba.DirectingOtherAnimalsAnalyzer.create_directionality_dfs`.
+        into CSV files on disk. Results are stored in `project_folder/logs` directory of the SimBA project.
+        """
+        save_dir = os.path.join(
+            self.logs_path,
+            f"detailed_directionality_summary_dataframes_{self.datetime}",
+        )
+        if not os.path.exists(save_dir):
+            os.makedirs(save_dir)
+        for video_cnt, (video_name, video_data) in enumerate(
+            self.directionality_df_dict.items()
+        ):
+            save_name = os.path.join(save_dir, f"{video_name}.csv")
+            video_data.to_csv(save_name)
+            print(
+                f"Detailed directional summary tables saved for video {video_name} (Video {video_cnt+1}/{len(list(self.directionality_df_dict.keys()))})..."
+            )
+        stdout_success(
+            f"All detailed directional data saved in the {save_dir} directory!",
+            source=self.__class__.__name__,
+        )
+
+    def summary_statistics(self):
+        """
+        Method to save aggregate statistics of data created by :meth:`~simba.DirectingOtherAnimalsAnalyzer.create_directionality_dfs`.
+        into CSV files on disk. Results are stored in `project_folder/logs` directory of the SimBA project.
+        """
+        print("Computing summary statistics...")
+        out_df_lst = []
+        for video_name, directing in self.directing_dict.items():
+            _, _, fps = self.read_video_info(video_name=video_name)
+            for permutation_cnt, permutation_name in enumerate(self.permutation_names):
+                frm_cnt = np.sum(
+                    np.any(
+                        directing[:, self.permutation_idx == permutation_cnt], axis=1
+                    )
+                )
+                value = round(frm_cnt / fps, 3)
+                out_df_lst.append(
+                    pd.DataFrame(
+                        [[video_name, permutation_name, value]],
+                        columns=["Video", "Animal permutation", "Value (s)"],
+                    )
+                )
+        self.summary_df = (
+            pd.concat(out_df_lst, axis=0)
+            .sort_values(by=["Video", "Animal permutation"])
+            .set_index("Video")
+        )
+        self.save_path = os.path.join(
+            self.logs_path, f"Direction_aggregate_summary_data_{self.datetime}.csv"
+        )
+        self.summary_df.to_csv(self.save_path)
+        self.timer.stop_timer()
+        stdout_success(
+            msg=f"Summary directional statistics saved at {self.save_path}",
+            source=self.__class__.__name__,
+        )
+        stdout_success(
+            msg="All directional data saved in SimBA project",
+            elapsed_time=self.timer.elapsed_time_str,
+            source=self.__class__.__name__,
+        )
+
+
+# test = DirectingOtherAnimalsAnalyzer(config_path='/Users/simon/Desktop/envs/troubleshooting/two_black_animals_14bp/project_folder/project_config.ini',
+#                                      bool_tables=True,
+#                                      summary_tables=False,
+#                                      aggregate_statistics_tables=False,
+#                                      append_bool_tables_to_features=True)
+# test.run()
@@ -129,6 +129,10 @@ class FSTTCCalculator(ConfigReader, PlottingMixin):
         Method to create list of dataframes holding information on the sequences of behaviors including
         inter-temporal distances.
 
+        .. note::
+           The bouts of each behavior are sorted by start frame once per video. The first bout of the second
+           behavior starting within the time window of each bout of the first behavior is found with ``np.searchsorted``.
+
         Returns
         -------
         Attribute: list
@@ -156,7 +160,9 @@ class FSTTCCalculator(ConfigReader, PlottingMixin):
             _, _, self.fps = self.read_video_info(video_name=self.video_name)
             self.video_sequences[self.video_name]["fps"] = self.fps
             self.frames_in_window = int((self.fps / 1000) * self.time_delta)
-            self.data_df = read_df(file_path, self.file_type)  # [self.behavior_lst]
+            self.data_df = read_df(
+                file_path, self.file_type, usecols=list(self.behavior_lst)
+            )
             self.video_sequences[self.video_name]["session_length_frames"] = len(
                 self.data_df
             )
@@ -169,141 +175,69 @@ class FSTTCCalculator(ConfigReader, PlottingMixin):
             self.bouts_df = self.bouts_df[["Event", "Start_frame", "End_frame"]]
             if self.join_bouts_within_delta:
                 self.bouts_df = self.__join_bouts()
+            clf_bouts = {}
+            for clf in self.behavior_lst:
+                clf_df = self.bouts_df[self.bouts_df["Event"] == clf].sort_values(
+                    by=["Start_frame"], kind="stable"
+                )
+                clf_bouts[clf] = (
+                    clf_df["Start_frame"].values.astype(np.int64),
+                    clf_df["End_frame"].values.astype(np.int64),
+                )
             for first_clf, second_clf in self.clf_permutations:
-                self.vide_df_sequence_lst = []
                 sequence_name = "FSTTC {} {}".format(first_clf, second_clf)
-                first_clf_df = (
-                    self.bouts_df[self.bouts_df["Event"] == first_clf]
-                    .sort_values(by=["Start_frame"])
-                    .reset_index(drop=True)
-                )
-                second_clf_df = (
-                    self.bouts_df[self.bouts_df["Event"] == second_clf]
-                    .sort_values(by=["Start_frame"])
-                    .reset_index(drop=True)
+                first_start, first_end = clf_bouts[first_clf]
+                second_start, _ = clf_bouts[second_clf]
+                if len(first_start) == 0:
+                    self.video_sequences[self.video_name][sequence_name] = None
+                    continue
+                if self.time_delta_at_onset:
+                    window_end = first_start + self.frames_in_window
+                    frame_crtrn_max = window_end
+                elif not self.join_bouts_within_delta:
+                    window_end = first_end + self.frames_in_window
+                    frame_crtrn_max = window_end
+                else:
+                    window_end = first_end + self.frames_in_window
+                    frame_crtrn_max = first_end
+                second_idx = np.searchsorted(second_start, first_start + 1, side="left")
+                matched = second_idx < len(second_start)
+                second_start_matched = np.full(len(first_start), -1, dtype=np.int64)
+                second_start_matched[matched] = second_start[second_idx[matched]]
+                matched = matched & (second_start_matched <= frame_crtrn_max)
+                frames_between_behaviors = np.maximum(
+                    second_start_matched - first_start, 1
                 )
-                for index, row in first_clf_df.iterrows():
-                    if self.time_delta_at_onset:
-                        frame_crtrn_min, frame_crtrn_max = (
-                            row["Start_frame"] + 1,
-                            row["Start_frame"] + self.frames_in_window,
-                        )
-                    else:
-                        if not self.join_bouts_within_delta:
-                            frame_crtrn_min, frame_crtrn_max = (
-                                row["Start_frame"] + 1,
-                                row["End_frame"] + self.frames_in_window,
-                            )
-                        else:
-                            frame_crtrn_min, frame_crtrn_max = (
-                                row["Start_frame"] + 1,
-                                row["End_frame"],
-                            )
-
-                    second_clf_df_crtrn = second_clf_df.loc[
-                        (second_clf_df["Start_frame"] >= frame_crtrn_min)
-                        & (second_clf_df["Start_frame"] <= frame_crtrn_max)
-                    ]
-                    if len(second_clf_df_crtrn) > 0:
-                        second_clf_df_crtrn = second_clf_df_crtrn.head(1)
-                        frames_between_behaviors = (
-                            second_clf_df_crtrn["Start_frame"] - row["Start_frame"]
-                        ).values
-                        second_clf_df_crtrn["Frames_between_behaviors"] = (
-                            second_clf_df_crtrn["Start_frame"] - row["Start_frame"]
-                        )
-                        if frames_between_behaviors <= 0:
-                            frames_between_behaviors = 1
-                        second_clf_df_crtrn["Frames_between_behaviors"] = (
-                            frames_between_behaviors
-                        )
-                        if self.time_delta_at_onset:
-                            second_clf_df_crtrn[
-                                "Frames_between_second_behavior_start_to_time_window_end"
-                            ] = (
-                                row["Start_frame"] + self.frames_in_window
-                            ) - second_clf_df_crtrn[
-                                "Start_frame"
-                            ].values[
-                                0
-                            ]
-                        else:
-                            second_clf_df_crtrn[
-                                "Frames_between_second_behavior_start_to_time_window_end"
-                            ] = (
-                                row["End_frame"] + self.frames_in_window
-                            ) - second_clf_df_crtrn[
-                                "Start_frame"
-                            ].values[
-                                0
-                            ]
-                        self.vide_df_sequence_lst.append(
-                            pd.DataFrame(
-                                [
-                                    [
-                                        self.video_name,
-                                        first_clf,
-                                        row["Start_frame"],
-                                        row["End_frame"],
-                                        second_clf,
-                                        second_clf_df_crtrn["Start_frame"].values[0],
-                                        second_clf_df_crtrn[
-                                            "Frames_between_behaviors"
-                                        ].values[0],
-                                        second_clf_df_crtrn[
-                                            "Frames_between_second_behavior_start_to_time_window_end"
-                                        ].values[0],
-                                    ]
-                                ],
-                                columns=out_columns,
-                            )
-                        )
-                    else:
-                        self.vide_df_sequence_lst.append(
-                            pd.DataFrame(
-                                [
-                                    [
-                                        self.video_name,
-                                        first_clf,
-                                        int(row["Start_frame"]),
-                                        int(row["End_frame"]),
-                                        "None",
-                                        "None",
-                                        "None",
-                                        "None",
-                                    ]
-                                ],
-                                columns=out_columns,
-                            )
-                        )
-
-                if len(self.vide_df_sequence_lst) > 0:
-                    video_sequences = (
-                        pd.concat(self.vide_df_sequence_lst, axis=0)
-                        .drop_duplicates(
-                            subset=[
-                                "Video",
-                                "First behaviour",
-                                "First behaviour start frame",
-                                "First behavior end frame",
-                                "Second behaviour",
-                            ],
-                            keep="first",
-                        )
-                        .reset_index(drop=True)
-                    )
-                    if self.time_delta_at_onset:
-                        video_sequences["Total_window_frames"] = self.frames_in_window
-                    else:
-                        video_sequences["Total_window_frames"] = (
-                            video_sequences["First behavior end frame"]
-                            - video_sequences["First behaviour start frame"]
-                        ) + self.frames_in_window
-                    self.video_sequences[self.video_name][
-                        sequence_name
-                    ] = video_sequences
+                frames_to_window_end = window_end - second_start_matched
+                video_sequences = pd.DataFrame(
+                    {
+                        out_columns[0]: self.video_name,
+                        out_columns[1]: first_clf,
+                        out_columns[2]: first_start,
+                        out_columns[3]: first_end,
+                        out_columns[4]: np.where(matched, second_clf, "None"),
+                        out_columns[5]: np.where(
+                            matched, second_start_matched.astype(object), "None"
+                        ),
+                        out_columns[6]: np.where(
+                            matched, frames_between_behaviors.astype(object), "None"
+                        ),
+                        out_columns[7]: np.where(
+                            matched, frames_to_window_end.astype(object), "None"
+                        ),
+                    }
+                ).infer_objects()
+                video_sequences = video_sequences.drop_duplicates(
+                    subset=out_columns[:5], keep="first"
+                ).reset_index(drop=True)
+                if self.time_delta_at_onset:
+                    video_sequences["Total_window_frames"] = self.frames_in_window
                 else:
-                    self.video_sequences[self.video_name][sequence_name] = None
+                    video_sequences["Total_window_frames"] = (
+                        video_sequences["First behavior end frame"]
+                        - video_sequences["First behaviour start frame"]
+                    ) + self.frames_in_window
+                self.video_sequences[self.video_name][sequence_name] = video_sequences
 
     def run(self):
         """
@@ -1,9 +1,10 @@
 __author__ = "Simon Nilsson"
 
+import functools
 import glob
 import os
 import shutil
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -16,13 +17,93 @@ except ImportError:
 
 from simba.mixins.config_reader import ConfigReader
 from simba.utils.checks import (check_if_filepath_list_is_empty,
-                                check_if_valid_input, check_that_column_exist)
+                                check_if_valid_input, check_int,
+                                check_that_column_exist)
 from simba.utils.enums import Methods, TagNames
 from simba.utils.errors import DataHeaderError, NoFilesFoundError
 from simba.utils.printing import SimbaTimer, log_event, stdout_success
-from simba.utils.read_write import (find_files_of_filetypes_in_directory,
+from simba.utils.read_write import (find_core_cnt,
+                                    find_files_of_filetypes_in_directory,
                                     find_video_of_file, get_fn_ext,
-                                    get_video_meta_data, read_df, write_df)
+                                    get_video_meta_data, read_df,
+                                    run_file_tasks, write_df)
+
+
+def _write_pre_processed_df(
+    df: pd.DataFrame,
+    file_path: Union[str, os.PathLike],
+    file_type: str,
+    initial_import_multi_index: bool,
+    move_dir: Optional[Union[str, os.PathLike]],
+) -> None:
+    """
+    Helper to save a pre-processed (interpolated or smoothed) dataframe in place of the original file. If ``move_dir``
+    is not None, then the original file is moved to ``move_dir`` first.
+    """
+
+    if move_dir is not None:
+        shutil.move(
+            src=file_path,
+            dst=os.path.join(move_dir, os.path.basename(file_path)),
+        )
+    if initial_import_multi_index:
+        multi_idx_header = []
+        for i in range(len(df.columns)):
+            multi_idx_header.append(
+                ("IMPORTED_POSE", "IMPORTED_POSE", list(df.columns)[i])
+            )
+        df.columns = pd.MultiIndex.from_tuples(multi_idx_header)
+    write_df(
+        df=df,
+        file_type=file_type,
+        save_path=file_path,
+        multi_idx_header=initial_import_multi_index,
+    )
+
+
+def find_smoothing_fps(
+    config_reader: ConfigReader,
+    file_paths: List[Union[str, os.PathLike]],
+    smoothing_method: Literal["Gaussian", "Savitzky-Golay"],
+) -> Dict[str, float]:
+    """
+    Helper to find the fps of the videos represented by ``file_paths`` before smoothing. The fps is read from the
+    video in the SimBA project. For Savitzky-Golay smoothing, the fps falls back to the
+    ``project_folder/logs/video_info.csv`` file if the video is not found.
+
+    :parameter ConfigReader config_reader: The ConfigReader instance of the SimBA project.
+    :parameter List[Union[str, os.PathLike]] file_paths: The pose-estimation data files to be smoothed.
+    :parameter Literal str smoothing_method: Type of smoothing_method. OPTIONS: ``Gaussian``, ``Savitzky-Golay``.
+    :return Dict[str, float]: The fps of each video, keyed by video name.
+    """
+
+    fps = {}
+    for file_path in file_paths:
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        video_path = find_video_of_file(
+            video_dir=config_reader.video_dir, filename=video_name
+        )
+        if video_path:
+            fps[video_name] = get_video_meta_data(video_path=video_path)["fps"]
+        elif smoothing_method == Methods.GAUSSIAN.value:
+            raise NoFilesFoundError(
+                msg=f"No video for file {video_name} found in SimBA project. Import the video before doing Gaussian smoothing. To perform smoothing, SimBA needs the video in order to read the video FPS.",
+                source=config_reader.__class__.__name__,
+            )
+        else:
+            try:
+                config_reader.video_info_df = config_reader.read_video_info_csv(
+                    file_path=config_reader.video_info_path
+                )
+                _, _, fps[video_name] = config_reader.read_video_info(
+                    video_name=video_name
+                )
+            except:
+                raise NoFilesFoundError(
+                    msg=f"No video for file {video_name} found in SimBA project. Import the video before doing smoothing. To perform smoothing, SimBA needs the video fps from the video itself or the logs/video_info.csv file in order to read the video FPS.",
+                    source=config_reader.__class__.__name__,
+                )
+    return fps
 
 
 class Interpolate(ConfigReader):
@@ -35,6 +116,7 @@ class Interpolate(ConfigReader):
     :parameter Literal str: Type of interpolation. OPTIONS: 'Animal(s): Nearest', 'Animal(s): Linear', 'Animal(s): Quadratic','Body-parts: Nearest', 'Body-parts: Linear', 'Body-parts: Quadratic']
                             See `tutorial for info/images of the different interpolation types <https://github.com/sgoldenlab/simba/blob/master/docs/Scenario1.md#to-import-multiple-dlc-csv-files>`__.
     :parameter bool initial_import_multi_index: If True, the incoming data is multi-index columns dataframes. Default: False.
+    :parameter Optional[int] core_cnt: Number of files to interpolate in parallel. If -1, then all available cores. Default: 1.
 
     .. image:: _static/img/interpolation_comparison.png
        :width: 400
@@ -61,6 +143,7 @@ class Interpolate(ConfigReader):
             "Body-parts: Quadratic",
         ],
         initial_import_multi_index: bool = False,
+        core_cnt: Optional[int] = 1,
     ) -> None:
         super().__init__(config_path=config_path, read_video_info=False)
         log_event(
@@ -68,6 +151,13 @@ class Interpolate(ConfigReader):
             log_type=TagNames.CLASS_INIT.value,
             msg=self.create_log_msg_from_init_args(locals=locals()),
         )
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
+        )
+        self.core_cnt = core_cnt
         self.interpolation_type, self.interpolation_method = (
             method.split(":")[0],
             method.split(":")[1].replace(" ", "").lower(),
@@ -82,6 +172,7 @@ class Interpolate(ConfigReader):
         else:
             self.files_found = [input_path]
             self.input_dir = os.path.dirname(input_path)
+        self.save_dir = None
         if not initial_import_multi_index:
             self.save_dir = os.path.join(
                 self.input_dir,
@@ -96,127 +187,213 @@ class Interpolate(ConfigReader):
             self.body_part_interpolator()
         self.timer.stop_timer()
         stdout_success(
-            msg=f"{str(len(self.files_found))} data file(s) interpolated)",
+            msg=f"{self.processed_cnt} data file(s) interpolated ({self.skipped_cnt} file(s) skipped)",
             elapsed_time=self.timer.elapsed_time_str,
             source=self.__class__.__name__,
         )
 
-    def animal_interpolator(self):
-        for file_path in self.files_found:
-            video_timer = SimbaTimer()
-            video_timer.start_timer()
-            _, video_name, _ = get_fn_ext(filepath=file_path)
-            df = read_df(
-                file_path=file_path,
-                file_type=self.file_type,
-                check_multiindex=self.initial_import_multi_index,
+    @staticmethod
+    def _animal_interpolator_file(
+        file_path: Union[str, os.PathLike],
+        file_type: str,
+        animal_bp_dict: Dict[str, Any],
+        bp_headers: List[str],
+        interpolation_method: str,
+        initial_import_multi_index: bool,
+        save_dir: Optional[Union[str, os.PathLike]],
+    ) -> None:
+        """
+        Helper to interpolate the missing animals in a single file. Called by
+        :meth:`simba.data_processors.interpolation_smoothing.Interpolate.animal_interpolator`.
+        """
+
+        video_timer = SimbaTimer()
+        video_timer.start_timer()
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        df = read_df(
+            file_path=file_path,
+            file_type=file_type,
+            check_multiindex=initial_import_multi_index,
+        )
+        if initial_import_multi_index:
+            df.columns = bp_headers
+        df = Interpolate.interpolate_animals(
+            df=df,
+            video_name=video_name,
+            animal_bp_dict=animal_bp_dict,
+            interpolation_method=interpolation_method,
+        )
+        _write_pre_processed_df(
+            df=df,
+            file_path=file_path,
+            file_type=file_type,
+            initial_import_multi_index=initial_import_multi_index,
+            move_dir=save_dir,
+        )
+        video_timer.stop_timer()
+        print(
+            f"Video {video_name} interpolated (elapsed time {video_timer.elapsed_time_str})..."
+        )
+
+    @staticmethod
+    def interpolate_animals(
+        df: pd.DataFrame,
+        video_name: str,
+        animal_bp_dict: Dict[str, Any],
+        interpolation_method: str,
+    ) -> pd.DataFrame:
+        """
+        Interpolate the frames where all body-parts of an animal are identical (i.e., the same 2D coordinate or all
+        None) in a single dataframe of pose-estimation data.
+
+        :parameter pd.DataFrame df: Pose-estimation data with the body-part headers of the SimBA project.
+        :parameter str video_name: Name of the video represented by ``df``. Used in printed messages.
+        :parameter Dict[str, Any] animal_bp_dict: The x and y body-part header names of each animal.
+        :parameter str interpolation_method: Pandas interpolation method. OPTIONS: ``nearest``, ``linear``, ``quadratic``.
+        :return pd.DataFrame: The interpolated dataframe.
+        """
+
+        df[df < 0] = 0
+        for animal_name, animal_bps in animal_bp_dict.items():
+            animal_df = (
+                df[animal_bps["X_bps"] + animal_bps["Y_bps"]].fillna(0).astype(int)
             )
-            df[df < 0] = 0
-            if self.initial_import_multi_index:
-                df.columns = self.bp_headers
-            for animal_name, animal_bps in self.animal_bp_dict.items():
-                animal_df = (
-                    df[animal_bps["X_bps"] + animal_bps["Y_bps"]].fillna(0).astype(int)
-                )
-                idx = list(
-                    animal_df[
-                        animal_df.eq(animal_df.iloc[:, 0], axis=0).all(axis="columns")
-                    ].index
-                )
+            idx = list(
+                animal_df[
+                    animal_df.eq(animal_df.iloc[:, 0], axis=0).all(axis="columns")
+                ].index
+            )
+            print(
+                f"Interpolating {len(idx)} body-parts for animal {animal_name} in video {video_name}..."
+            )
+            animal_df.loc[idx, :] = np.nan
+            animal_df = (
+                animal_df.interpolate(method=interpolation_method, axis=0)
+                .ffill()
+                .bfill()
+            )
+            animal_df[animal_df < 0] = 0
+            df.update(animal_df)
+        return df
+
+    @staticmethod
+    def _body_part_interpolator_file(
+        file_path: Union[str, os.PathLike],
+        file_type: str,
+        animal_bp_dict: Dict[str, Any],
+        bp_headers: List[str],
+        interpolation_method: str,
+        initial_import_multi_index: bool,
+        save_dir: Optional[Union[str, os.PathLike]],
+    ) -> None:
+        """
+        Helper to interpolate the missing body-parts in a single file. Called by
+        :meth:`simba.data_processors.interpolation_smoothing.Interpolate.body_part_interpolator`.
+        """
+
+        video_timer = SimbaTimer(start=True)
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        df = read_df(file_path=file_path, file_type=file_type, check_multiindex=True)
+        if initial_import_multi_index:
+            df.columns = bp_headers
+        df = Interpolate.interpolate_body_parts(
+            df=df,
+            video_name=video_name,
+            animal_bp_dict=animal_bp_dict,
+            interpolation_method=interpolation_method,
+        )
+        _write_pre_processed_df(
+            df=df,
+            file_path=file_path,
+            file_type=file_type,
+            initial_import_multi_index=initial_import_multi_index,
+            move_dir=save_dir,
+        )
+        video_timer.stop_timer()
+        print(
+            f"Video {video_name} interpolated (elapsed time {video_timer.elapsed_time_str}) ..."
+        )
+
+    @staticmethod
+    def interpolate_body_parts(
+        df: pd.DataFrame,
+        video_name: str,
+        animal_bp_dict: Dict[str, Any],
+        interpolation_method: str,
+    ) -> pd.DataFrame:
+        """
+        Interpolate the frames where a body-part is missing (i.e., both x and y are zero or negative) in a single
+        dataframe of pose-estimation data.
+
+        :parameter pd.DataFrame df: Pose-estimation data with the body-part headers of the SimBA project.
+        :parameter str video_name: Name of the video represented by ``df``. Used in printed messages.
+        :parameter Dict[str, Any] animal_bp_dict: The x and y body-part header names of each animal.
+        :parameter str interpolation_method: Pandas interpolation method. OPTIONS: ``nearest``, ``linear``, ``quadratic``.
+        :return pd.DataFrame: The interpolated dataframe.
+        """
+
+        df[df < 0] = 0
+        for animal in animal_bp_dict:
+            for x_bps_name, y_bps_name in zip(
+                animal_bp_dict[animal]["X_bps"],
+                animal_bp_dict[animal]["Y_bps"],
+            ):
+                df[x_bps_name] = df[x_bps_name].astype(int)
+                df[y_bps_name] = df[y_bps_name].astype(int)
+                idx = df.loc[
+                    (df[x_bps_name] <= 0.0) & (df[y_bps_name] <= 0.0)
+                ].index.tolist()
                 print(
-                    f"Interpolating {len(idx)} body-parts for animal {animal_name} in video {video_name}..."
+                    f"Interpolating {len(idx)} {x_bps_name[:-2]} body-parts for animal {animal} in video {video_name}..."
                 )
-                animal_df.loc[idx, :] = np.nan
-                animal_df = (
-                    animal_df.interpolate(method=self.interpolation_method, axis=0)
+                df.loc[idx, [x_bps_name, y_bps_name]] = np.nan
+                df[x_bps_name] = (
+                    df[x_bps_name]
+                    .interpolate(method=interpolation_method, axis=0)
                     .ffill()
                     .bfill()
                 )
-                animal_df[animal_df < 0] = 0
-                df.update(animal_df)
-            if not self.initial_import_multi_index:
-                shutil.move(
-                    src=file_path,
-                    dst=os.path.join(self.save_dir, os.path.basename(file_path)),
+                df[x_bps_name][df[x_bps_name] < 0] = 0
+                df[y_bps_name] = (
+                    df[y_bps_name]
+                    .interpolate(method=interpolation_method, axis=0)
+                    .ffill()
+                    .bfill()
                 )
-            else:
-                multi_idx_header = []
-                for i in range(len(df.columns)):
-                    multi_idx_header.append(
-                        ("IMPORTED_POSE", "IMPORTED_POSE", list(df.columns)[i])
-                    )
-                df.columns = pd.MultiIndex.from_tuples(multi_idx_header)
-            write_df(
-                df=df,
+                df[y_bps_name][df[y_bps_name] < 0] = 0
+        return df
+
+    def animal_interpolator(self):
+        _, self.processed_cnt, self.skipped_cnt = run_file_tasks(
+            func=functools.partial(
+                self._animal_interpolator_file,
                 file_type=self.file_type,
-                save_path=file_path,
-                multi_idx_header=self.initial_import_multi_index,
-            )
-            video_timer.stop_timer()
-            print(
-                f"Video {video_name} interpolated (elapsed time {video_timer.elapsed_time_str})..."
-            )
+                animal_bp_dict=self.animal_bp_dict,
+                bp_headers=self.bp_headers,
+                interpolation_method=self.interpolation_method,
+                initial_import_multi_index=self.initial_import_multi_index,
+                save_dir=self.save_dir,
+            ),
+            file_paths=self.files_found,
+            core_cnt=self.core_cnt,
+            source=self.__class__.__name__,
+        )
 
     def body_part_interpolator(self):
-        for file_path in self.files_found:
-            video_timer = SimbaTimer(start=True)
-            _, video_name, _ = get_fn_ext(filepath=file_path)
-            df = read_df(
-                file_path=file_path, file_type=self.file_type, check_multiindex=True
-            )
-            if self.initial_import_multi_index:
-                df.columns = self.bp_headers
-            df[df < 0] = 0
-            for animal in self.animal_bp_dict:
-                for x_bps_name, y_bps_name in zip(
-                    self.animal_bp_dict[animal]["X_bps"],
-                    self.animal_bp_dict[animal]["Y_bps"],
-                ):
-                    df[x_bps_name] = df[x_bps_name].astype(int)
-                    df[y_bps_name] = df[y_bps_name].astype(int)
-                    idx = df.loc[
-                        (df[x_bps_name] <= 0.0) & (df[y_bps_name] <= 0.0)
-                    ].index.tolist()
-                    print(
-                        f"Interpolating {len(idx)} {x_bps_name[:-2]} body-parts for animal {animal} in video {video_name}..."
-                    )
-                    df.loc[idx, [x_bps_name, y_bps_name]] = np.nan
-                    df[x_bps_name] = (
-                        df[x_bps_name]
-                        .interpolate(method=self.interpolation_method, axis=0)
-                        .ffill()
-                        .bfill()
-                    )
-                    df[x_bps_name][df[x_bps_name] < 0] = 0
-                    df[y_bps_name] = (
-                        df[y_bps_name]
-                        .interpolate(method=self.interpolation_method, axis=0)
-                        .ffill()
-                        .bfill()
-                    )
-                    df[y_bps_name][df[y_bps_name] < 0] = 0
-            if not self.initial_import_multi_index:
-                shutil.move(
-                    src=file_path,
-                    dst=os.path.join(self.save_dir, os.path.basename(file_path)),
-                )
-            else:
-                multi_idx_header = []
-                for i in range(len(df.columns)):
-                    multi_idx_header.append(
-                        ("IMPORTED_POSE", "IMPORTED_POSE", list(df.columns)[i])
-                    )
-                df.columns = pd.MultiIndex.from_tuples(multi_idx_header)
-            write_df(
-                df=df,
+        _, self.processed_cnt, self.skipped_cnt = run_file_tasks(
+            func=functools.partial(
+                self._body_part_interpolator_file,
                 file_type=self.file_type,
-                save_path=file_path,
-                multi_idx_header=self.initial_import_multi_index,
-            )
-            video_timer.stop_timer()
-            print(
-                f"Video {video_name} interpolated (elapsed time {video_timer.elapsed_time_str}) ..."
-            )
+                animal_bp_dict=self.animal_bp_dict,
+                bp_headers=self.bp_headers,
+                interpolation_method=self.interpolation_method,
+                initial_import_multi_index=self.initial_import_multi_index,
+                save_dir=self.save_dir,
+            ),
+            file_paths=self.files_found,
+            core_cnt=self.core_cnt,
+            source=self.__class__.__name__,
+        )
 
 
 class Smooth(ConfigReader):
@@ -228,6 +405,7 @@ class Smooth(ConfigReader):
     :parameter Literal str: Type of smoothing_method. OPTIONS: ``Gaussian``, ``Savitzky-Golay``.
     :parameter int time_window: Rolling time window in millisecond to use when smoothing. Larger time-windows and greater smoothing.
     :parameter bool initial_import_multi_index: If True, the incoming data is multi-index columns dataframes. Default: False.
+    :parameter Optional[int] core_cnt: Number of files to smooth in parallel. If -1, then all available cores. Default: 1.
 
     .. note::
         `Smoothing tutorial <https://github.com/sgoldenlab/simba/blob/master/docs/Scenario1.md#to-import-multiple-dlc-csv-files>`__.
@@ -251,13 +429,21 @@ class Smooth(ConfigReader):
         time_window: int,
         smoothing_method: Literal["Gaussian", "Savitzky-Golay"],
         initial_import_multi_index: bool = False,
+        core_cnt: Optional[int] = 1,
     ):
         super().__init__(config_path=config_path, read_video_info=False)
         log_event(
             logger_name=str(self.__class__.__name__),
             log_type=TagNames.CLASS_INIT.value,
-            msg=f"input_path: {input_path}, time_window: {time_window}, smoothing_method: {smoothing_method}, initial_import_multi_index: {initial_import_multi_index}",
+            msg=f"input_path: {input_path}, time_window: {time_window}, smoothing_method: {smoothing_method}, initial_import_multi_index: {initial_import_multi_index}, core_cnt: {core_cnt}",
+        )
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
         )
+        self.core_cnt = core_cnt
         if os.path.isdir(input_path):
             self.files_found = glob.glob(input_path + "/*" + self.file_type)
             self.input_dir = input_path
@@ -268,6 +454,7 @@ class Smooth(ConfigReader):
         else:
             self.files_found = [input_path]
             self.input_dir = os.path.dirname(input_path)
+        self.save_dir = None
         if not initial_import_multi_index:
             self.save_dir = os.path.join(
                 self.input_dir, f"Pre_{smoothing_method}_interpolation_{self.datetime}"
@@ -284,133 +471,172 @@ class Smooth(ConfigReader):
             self.gaussian_smoother()
         self.timer.stop_timer()
         stdout_success(
-            msg=f"{str(len(self.files_found))} data file(s) smoothened",
+            msg=f"{self.processed_cnt} data file(s) smoothened ({self.skipped_cnt} file(s) skipped)",
             elapsed_time=self.timer.elapsed_time_str,
             source=self.__class__.__name__,
         )
 
-    def savgol_smoother(self):
-        for file_path in self.files_found:
-            video_timer = SimbaTimer(start=True)
-            _, video_name, _ = get_fn_ext(filepath=file_path)
-            df = read_df(
-                file_path=file_path,
-                file_type=self.file_type,
-                check_multiindex=self.initial_import_multi_index,
-            )
-            video_path = find_video_of_file(
-                video_dir=self.video_dir, filename=video_name
-            )
-            if not video_path:
-                try:
-                    video_meta_data = {}
-                    self.video_info_df = self.read_video_info_csv(
-                        file_path=self.video_info_path
-                    )
-                    _, _, fps = self.read_video_info(video_name=video_name)
-                    video_meta_data["fps"] = fps
-                except:
-                    raise NoFilesFoundError(
-                        msg=f"No video for file {video_name} found in SimBA project. Import the video before doing smoothing. To perform smoothing, SimBA needs the video fps from the video itself or the logs/video_info.csv file in order to read the video FPS.",
-                        source=self.__class__.__name__,
-                    )
-            else:
-                video_meta_data = get_video_meta_data(video_path=video_path)
-            frames_in_time_window = int(
-                self.time_window / (1000 / int(video_meta_data["fps"]))
+    @staticmethod
+    def _savgol_smoother_file(
+        file_path: Union[str, os.PathLike],
+        file_type: str,
+        fps: Dict[str, float],
+        time_window: int,
+        initial_import_multi_index: bool,
+        save_dir: Optional[Union[str, os.PathLike]],
+    ) -> None:
+        """
+        Helper to Savitzky-Golay smooth a single file. Called by
+        :meth:`simba.data_processors.interpolation_smoothing.Smooth.savgol_smoother`.
+        """
+
+        video_timer = SimbaTimer(start=True)
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        df = read_df(
+            file_path=file_path,
+            file_type=file_type,
+            check_multiindex=initial_import_multi_index,
+        )
+        df = Smooth.savgol_smooth(df=df, fps=fps[video_name], time_window=time_window)
+        _write_pre_processed_df(
+            df=df,
+            file_path=file_path,
+            file_type=file_type,
+            initial_import_multi_index=initial_import_multi_index,
+            move_dir=save_dir,
+        )
+        video_timer.stop_timer()
+        print(
+            f"Video {video_name} smoothed (Savitzky Golay: {str(time_window)}ms) (elapsed time {video_timer.elapsed_time_str})..."
+        )
+
+    @staticmethod
+    def savgol_smooth(df: pd.DataFrame, fps: float, time_window: int) -> pd.DataFrame:
+        """
+        Savitzky-Golay smooth all columns of a single dataframe of pose-estimation data.
+
+        :parameter pd.DataFrame df: Pose-estimation data.
+        :parameter float fps: The frame-rate of the video represented by ``df``.
+        :parameter int time_window: Rolling time window in milliseconds.
+        :return pd.DataFrame: The smoothed dataframe.
+        """
+
+        frames_in_time_window = int(time_window / (1000 / int(fps)))
+        if (frames_in_time_window % 2) == 0:
+            frames_in_time_window = frames_in_time_window - 1
+        if (frames_in_time_window % 2) <= 3:
+            frames_in_time_window = 5
+        df[df < 0] = 0
+        for c in df.columns:
+            df[c] = savgol_filter(
+                x=df[c].to_numpy(),
+                window_length=frames_in_time_window,
+                polyorder=3,
+                mode="nearest",
             )
-            if (frames_in_time_window % 2) == 0:
-                frames_in_time_window = frames_in_time_window - 1
-            if (frames_in_time_window % 2) <= 3:
-                frames_in_time_window = 5
-            df[df < 0] = 0
-            for c in df.columns:
-                df[c] = savgol_filter(
-                    x=df[c].to_numpy(),
-                    window_length=frames_in_time_window,
-                    polyorder=3,
-                    mode="nearest",
-                )
-                df[c][df[c] < 0] = 0
-            if not self.initial_import_multi_index:
-                shutil.move(
-                    src=file_path,
-                    dst=os.path.join(self.save_dir, os.path.basename(file_path)),
+            df[c][df[c] < 0] = 0
+        return df
+
+    @staticmethod
+    def _gaussian_smoother_file(
+        file_path: Union[str, os.PathLike],
+        file_type: str,
+        fps: Dict[str, float],
+        time_window: int,
+        initial_import_multi_index: bool,
+        save_dir: Optional[Union[str, os.PathLike]],
+    ) -> None:
+        """
+        Helper to Gaussian smooth a single file. Called by
+        :meth:`simba.data_processors.interpolation_smoothing.Smooth.gaussian_smoother`.
+        """
+
+        video_timer = SimbaTimer(start=True)
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        df = read_df(
+            file_path=file_path,
+            file_type=file_type,
+            check_multiindex=initial_import_multi_index,
+        )
+        df = Smooth.gaussian_smooth(df=df, fps=fps[video_name], time_window=time_window)
+        _write_pre_processed_df(
+            df=df,
+            file_path=file_path,
+            file_type=file_type,
+            initial_import_multi_index=initial_import_multi_index,
+            move_dir=save_dir,
+        )
+        video_timer.stop_timer()
+        print(
+            f"Video {video_name} smoothed (Gaussian: {str(time_window)}ms) (elapsed time {video_timer.elapsed_time_str})..."
+        )
+
+    @staticmethod
+    def gaussian_smooth(df: pd.DataFrame, fps: float, time_window: int) -> pd.DataFrame:
+        """
+        Gaussian smooth all columns of a single dataframe of pose-estimation data.
+
+        :parameter pd.DataFrame df: Pose-estimation data.
+        :parameter float fps: The frame-rate of the video represented by ``df``.
+        :parameter int time_window: Rolling time window in milliseconds.
+        :return pd.DataFrame: The smoothed dataframe.
+        """
+
+        frames_in_time_window = int(time_window / (1000 / fps))
+        for c in df.columns:
+            df[c] = (
+                df[c]
+                .rolling(
+                    window=int(frames_in_time_window),
+                    win_type="gaussian",
+                    center=True,
                 )
-            else:
-                multi_idx_header = []
-                for i in range(len(df.columns)):
-                    multi_idx_header.append(
-                        ("IMPORTED_POSE", "IMPORTED_POSE", list(df.columns)[i])
-                    )
-                df.columns = pd.MultiIndex.from_tuples(multi_idx_header)
-            write_df(
-                df=df,
-                file_type=self.file_type,
-                save_path=file_path,
-                multi_idx_header=self.initial_import_multi_index,
-            )
-            video_timer.stop_timer()
-            print(
-                f"Video {video_name} smoothed (Savitzky Golay: {str(self.time_window)}ms) (elapsed time {video_timer.elapsed_time_str})..."
+                .mean(std=5)
+                .fillna(df[c])
+                .abs()
             )
+            df[c][df[c] < 0] = 0
+        return df
 
-    def gaussian_smoother(self):
-        for file_path in self.files_found:
-            video_timer = SimbaTimer(start=True)
-            _, video_name, _ = get_fn_ext(filepath=file_path)
-            df = read_df(
-                file_path=file_path,
+    def savgol_smoother(self):
+        fps = find_smoothing_fps(
+            config_reader=self,
+            file_paths=self.files_found,
+            smoothing_method=Methods.SAVITZKY_GOLAY.value,
+        )
+        _, self.processed_cnt, self.skipped_cnt = run_file_tasks(
+            func=functools.partial(
+                self._savgol_smoother_file,
                 file_type=self.file_type,
-                check_multiindex=self.initial_import_multi_index,
-            )
-            video_path = find_video_of_file(
-                video_dir=self.video_dir, filename=video_name
-            )
-            if not video_path:
-                raise NoFilesFoundError(
-                    msg=f"No video for file {video_name} found in SimBA project. Import the video before doing Gaussian smoothing. To perform smoothing, SimBA needs the video in order to read the video FPS.",
-                    source=self.__class__.__name__,
-                )
-            video_meta_data = get_video_meta_data(video_path=video_path)
-            frames_in_time_window = int(
-                self.time_window / (1000 / video_meta_data["fps"])
-            )
-            for c in df.columns:
-                df[c] = (
-                    df[c]
-                    .rolling(
-                        window=int(frames_in_time_window),
-                        win_type="gaussian",
-                        center=True,
-                    )
-                    .mean(std=5)
-                    .fillna(df[c])
-                    .abs()
-                )
-                df[c][df[c] < 0] = 0
-            if not self.initial_import_multi_index:
-                shutil.move(
-                    src=file_path,
-                    dst=os.path.join(self.save_dir, os.path.basename(file_path)),
-                )
-            else:
-                multi_idx_header = []
-                for i in range(len(df.columns)):
-                    multi_idx_header.append(
-                        ("IMPORTED_POSE", "IMPORTED_POSE", list(df.columns)[i])
-                    )
-                df.columns = pd.MultiIndex.from_tuples(multi_idx_header)
-            write_df(
-                df=df,
+                fps=fps,
+                time_window=self.time_window,
+                initial_import_multi_index=self.initial_import_multi_index,
+                save_dir=self.save_dir,
+            ),
+            file_paths=self.files_found,
+            core_cnt=self.core_cnt,
+            source=self.__class__.__name__,
+        )
+
+    def gaussian_smoother(self):
+        fps = find_smoothing_fps(
+            config_reader=self,
+            file_paths=self.files_found,
+            smoothing_method=Methods.GAUSSIAN.value,
+        )
+        _, self.processed_cnt, self.skipped_cnt = run_file_tasks(
+            func=functools.partial(
+                self._gaussian_smoother_file,
                 file_type=self.file_type,
-                save_path=file_path,
-                multi_idx_header=self.initial_import_multi_index,
-            )
-            video_timer.stop_timer()
-            print(
-                f"Video {video_name} smoothed (Gaussian: {str(self.time_window)}ms) (elapsed time {video_timer.elapsed_time_str})..."
-            )
+                fps=fps,
+                time_window=self.time_window,
+                initial_import_multi_index=self.initial_import_multi_index,
+                save_dir=self.save_dir,
+            ),
+            file_paths=self.files_found,
+            core_cnt=self.core_cnt,
+            source=self.__class__.__name__,
+        )
 
 
 class AdvancedInterpolator(ConfigReader):
@@ -424,6 +650,7 @@ class AdvancedInterpolator(ConfigReader):
     :parameter Dict settings: Interpolation rules for each animal or each animal body-part.
     :parameter bool initial_import_multi_index: If True, the incoming data is multi-index columns dataframes. Use of input data is the ``project_folder/csv/input_csv`` directory. Default: False.
     :parameter bool overwrite: If True, overwrites the input data. If False, then saves input data in datetime-stamped sub-directory.
+    :parameter Optional[int] core_cnt: Number of files to interpolate in parallel. If -1, then all available cores. Default: 1.
 
     :examples:
     >>> interpolator = AdvancedInterpolator(data_dir='/Users/simon/Desktop/envs/troubleshooting/two_black_animals_14bp/project_folder/csv/input_csv',
@@ -441,13 +668,21 @@ class AdvancedInterpolator(ConfigReader):
         settings: Dict[str, Any],
         initial_import_multi_index: Optional[bool] = False,
         overwrite: Optional[bool] = True,
+        core_cnt: Optional[int] = 1,
     ):
         ConfigReader.__init__(self, config_path=config_path, read_video_info=False)
         log_event(
             logger_name=str(self.__class__.__name__),
             log_type=TagNames.CLASS_INIT.value,
-            msg=f"data dir: {data_dir}, type: {type}, settings: {settings}, initial_import_multi_index: {initial_import_multi_index}, overwrite: {overwrite}",
+            msg=f"data dir: {data_dir}, type: {type}, settings: {settings}, initial_import_multi_index: {initial_import_multi_index}, overwrite: {overwrite}, core_cnt: {core_cnt}",
+        )
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
         )
+        self.core_cnt = core_cnt
         self.file_paths = find_files_of_filetypes_in_directory(
             directory=data_dir,
             extensions=[f".{self.file_type}"],
@@ -483,71 +718,87 @@ class AdvancedInterpolator(ConfigReader):
                 ]
         self.settings = transposed_settings
 
-    def run(self):
-        for file_cnt, file_path in enumerate(self.file_paths):
-            df = (
-                read_df(
-                    file_path=file_path,
-                    file_type=self.file_type,
-                    check_multiindex=self.initial_import_multi_index,
-                )
-                .fillna(0)
-                .reset_index(drop=True)
+    @staticmethod
+    def _interpolate_file(
+        file_path: Union[str, os.PathLike],
+        file_type: str,
+        settings: Dict[str, Any],
+        bp_headers: List[str],
+        initial_import_multi_index: bool,
+        move_dir: Optional[Union[str, os.PathLike]],
+    ) -> None:
+        """
+        Helper to interpolate a single file. Called by
+        :meth:`simba.data_processors.interpolation_smoothing.AdvancedInterpolator.run`.
+        """
+
+        df = (
+            read_df(
+                file_path=file_path,
+                file_type=file_type,
+                check_multiindex=initial_import_multi_index,
             )
-            _, video_name, _ = get_fn_ext(filepath=file_path)
-            if self.initial_import_multi_index:
-                if len(df.columns) != len(self.bp_col_names):
-                    raise DataHeaderError(
-                        msg=f"The SimBA project suggest the data should have {len(self.bp_col_names)} columns, but the input data has {len(df.columns)} columns",
-                        source=self.__class__.__name__,
-                    )
-                df.columns = self.bp_headers
-            df[df < 0] = 0
-            for animal_name, animal_body_parts in self.settings.items():
-                for bp, interpolation_setting in animal_body_parts.items():
-                    check_that_column_exist(
-                        df=df, column_name=f"{bp}_x", file_name=file_path
-                    )
-                    check_that_column_exist(
-                        df=df, column_name=f"{bp}_y", file_name=file_path
-                    )
-                    df[[f"{bp}_x", f"{bp}_y"]] = df[[f"{bp}_x", f"{bp}_y"]].astype(int)
-                    idx = df.loc[
-                        (df[f"{bp}_x"] <= 0.0) & (df[f"{bp}_y"] <= 0.0)
-                    ].index.tolist()
-                    print(
-                        f"Interpolating {len(idx)} {bp} body-parts in video {video_name}..."
-                    )
-                    df.loc[idx, [f"{bp}_x", f"{bp}_y"]] = np.nan
-                    df[[f"{bp}_x", f"{bp}_y"]] = (
-                        df[[f"{bp}_x", f"{bp}_y"]]
-                        .interpolate(method=interpolation_setting, axis=0)
-                        .ffill()
-                        .bfill()
-                        .astype(int)
-                    )
-                    df[[f"{bp}_x", f"{bp}_y"]][df[[f"{bp}_x", f"{bp}_y"]] < 0] = 0
-            if self.initial_import_multi_index:
-                multi_idx_header = []
-                for i in range(len(df.columns)):
-                    multi_idx_header.append(
-                        ("IMPORTED_POSE", "IMPORTED_POSE", list(df.columns)[i])
-                    )
-                df.columns = pd.MultiIndex.from_tuples(multi_idx_header)
-            if not self.overwrite:
-                shutil.move(
-                    src=file_path,
-                    dst=os.path.join(self.move_dir, os.path.basename(file_path)),
+            .fillna(0)
+            .reset_index(drop=True)
+        )
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        if initial_import_multi_index:
+            if len(df.columns) != len(bp_headers):
+                raise DataHeaderError(
+                    msg=f"The SimBA project suggest the data should have {len(bp_headers)} columns, but the input data has {len(df.columns)} columns",
+                    source=AdvancedInterpolator.__name__,
+                )
+            df.columns = bp_headers
+        df[df < 0] = 0
+        for animal_name, animal_body_parts in settings.items():
+            for bp, interpolation_setting in animal_body_parts.items():
+                check_that_column_exist(
+                    df=df, column_name=f"{bp}_x", file_name=file_path
+                )
+                check_that_column_exist(
+                    df=df, column_name=f"{bp}_y", file_name=file_path
+                )
+                df[[f"{bp}_x", f"{bp}_y"]] = df[[f"{bp}_x", f"{bp}_y"]].astype(int)
+                idx = df.loc[
+                    (df[f"{bp}_x"] <= 0.0) & (df[f"{bp}_y"] <= 0.0)
+                ].index.tolist()
+                print(
+                    f"Interpolating {len(idx)} {bp} body-parts in video {video_name}..."
+                )
+                df.loc[idx, [f"{bp}_x", f"{bp}_y"]] = np.nan
+                df[[f"{bp}_x", f"{bp}_y"]] = (
+                    df[[f"{bp}_x", f"{bp}_y"]]
+                    .interpolate(method=interpolation_setting, axis=0)
+                    .ffill()
+                    .bfill()
+                    .astype(int)
                 )
-            write_df(
-                df=df,
+                df[[f"{bp}_x", f"{bp}_y"]][df[[f"{bp}_x", f"{bp}_y"]] < 0] = 0
+        _write_pre_processed_df(
+            df=df,
+            file_path=file_path,
+            file_type=file_type,
+            initial_import_multi_index=initial_import_multi_index,
+            move_dir=move_dir,
+        )
+
+    def run(self):
+        _, self.processed_cnt, self.skipped_cnt = run_file_tasks(
+            func=functools.partial(
+                self._interpolate_file,
                 file_type=self.file_type,
-                save_path=file_path,
-                multi_idx_header=self.initial_import_multi_index,
-            )
+                settings=self.settings,
+                bp_headers=self.bp_headers,
+                initial_import_multi_index=self.initial_import_multi_index,
+                move_dir=self.move_dir,
+            ),
+            file_paths=self.file_paths,
+            core_cnt=self.core_cnt,
+            source=self.__class__.__name__,
+        )
         self.timer.stop_timer()
         stdout_success(
-            msg="Interpolation complete!",
+            msg=f"Interpolation complete! {self.processed_cnt} data file(s) interpolated ({self.skipped_cnt} file(s) skipped)",
             elapsed_time=self.timer.elapsed_time_str,
             source=self.__class__.__name__,
         )
@@ -564,6 +815,7 @@ class AdvancedSmoother(ConfigReader):
     :parameter Dict settings: Smoothing rules for each animal or each animal body-part.
     :parameter bool initial_import_multi_index: If True, the incoming data is multi-index columns dataframes. Use of input data is the ``project_folder/csv/input_csv`` directory. Default: False.
     :parameter bool overwrite: If True, overwrites the input data. If False, then saves a copy input data in datetime-stamped sub-directory.
+    :parameter Optional[int] core_cnt: Number of files to smooth in parallel. If -1, then all available cores. Default: 1.
 
     :examples:
 
@@ -585,13 +837,21 @@ class AdvancedSmoother(ConfigReader):
         settings: Dict[str, Any],
         initial_import_multi_index: Optional[bool] = False,
         overwrite: Optional[bool] = True,
+        core_cnt: Optional[int] = 1,
     ):
         ConfigReader.__init__(self, config_path=config_path, read_video_info=False)
         log_event(
             logger_name=str(self.__class__.__name__),
             log_type=TagNames.CLASS_INIT.value,
-            msg=f"data_dir: {data_dir}, type: {type}, settings: {settings}, initial_import_multi_index: {initial_import_multi_index}, overwrite: {overwrite}",
+            msg=f"data_dir: {data_dir}, type: {type}, settings: {settings}, initial_import_multi_index: {initial_import_multi_index}, overwrite: {overwrite}, core_cnt: {core_cnt}",
+        )
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
         )
+        self.core_cnt = core_cnt
         self.file_paths = find_files_of_filetypes_in_directory(
             directory=data_dir,
             extensions=[f".{self.file_type}"],
@@ -627,109 +887,122 @@ class AdvancedSmoother(ConfigReader):
                 ]
         self.settings = transposed_settings
 
-    def run(self):
-        for file_cnt, file_path in enumerate(self.file_paths):
-            df = (
-                read_df(
-                    file_path=file_path,
-                    file_type=self.file_type,
-                    check_multiindex=self.initial_import_multi_index,
-                )
-                .fillna(0)
-                .reset_index(drop=True)
+    @staticmethod
+    def _smooth_file(
+        file_path: Union[str, os.PathLike],
+        file_type: str,
+        settings: Dict[str, Any],
+        fps: Dict[str, float],
+        bp_headers: List[str],
+        initial_import_multi_index: bool,
+        move_dir: Optional[Union[str, os.PathLike]],
+    ) -> None:
+        """
+        Helper to smooth a single file. Called by
+        :meth:`simba.data_processors.interpolation_smoothing.AdvancedSmoother.run`.
+        """
+
+        df = (
+            read_df(
+                file_path=file_path,
+                file_type=file_type,
+                check_multiindex=initial_import_multi_index,
             )
-            _, video_name, _ = get_fn_ext(filepath=file_path)
-            print(f"Smoothing data in video {video_name}...")
-            if self.initial_import_multi_index:
-                if len(df.columns) != len(self.bp_col_names):
-                    raise DataHeaderError(
-                        msg=f"The SimBA project suggest the data should have {len(self.bp_col_names)} columns, but the input data has {len(df.columns)} columns",
-                        source=self.__class__.__name__,
+            .fillna(0)
+            .reset_index(drop=True)
+        )
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        print(f"Smoothing data in video {video_name}...")
+        if initial_import_multi_index:
+            if len(df.columns) != len(bp_headers):
+                raise DataHeaderError(
+                    msg=f"The SimBA project suggest the data should have {len(bp_headers)} columns, but the input data has {len(df.columns)} columns",
+                    source=AdvancedSmoother.__name__,
+                )
+            df.columns = bp_headers
+        df[df < 0] = 0
+        for animal_name, animal_body_parts in settings.items():
+            for bp, smoothing_setting in animal_body_parts.items():
+                print(smoothing_setting)
+                frames_in_time_window = int(
+                    smoothing_setting["time_window"] / (1000 / int(fps[video_name]))
+                )
+                check_that_column_exist(
+                    df=df, column_name=f"{bp}_x", file_name=file_path
+                )
+                check_that_column_exist(
+                    df=df, column_name=f"{bp}_y", file_name=file_path
+                )
+                df[[f"{bp}_x", f"{bp}_y"]] = df[[f"{bp}_x", f"{bp}_y"]].astype(int)
+                if smoothing_setting["method"].lower == Methods.GAUSSIAN.value:
+                    df[[f"{bp}_x", f"{bp}_y"]] = (
+                        df[[f"{bp}_x", f"{bp}_y"]]
+                        .rolling(
+                            window=int(frames_in_time_window),
+                            win_type="gaussian",
+                            center=True,
+                        )
+                        .mean(std=5)
+                        .fillna(df[[f"{bp}_x", f"{bp}_y"]])
+                        .abs()
                     )
-                df.columns = self.bp_headers
-            df[df < 0] = 0
+                if smoothing_setting["method"].lower == Methods.SAVITZKY_GOLAY.value:
+                    if (frames_in_time_window % 2) == 0:
+                        frames_in_time_window = frames_in_time_window - 1
+                    if (frames_in_time_window % 2) <= 3:
+                        frames_in_time_window = 5
+                    df[[f"{bp}_x", f"{bp}_y"]] = savgol_filter(
+                        x=df[[f"{bp}_x", f"{bp}_y"]].to_numpy(),
+                        window_length=frames_in_time_window,
+                        polyorder=3,
+                        mode="nearest",
+                    )
+                df[[f"{bp}_x", f"{bp}_y"]][df[[f"{bp}_x", f"{bp}_y"]] < 0] = 0
+        _write_pre_processed_df(
+            df=df,
+            file_path=file_path,
+            file_type=file_type,
+            initial_import_multi_index=initial_import_multi_index,
+            move_dir=move_dir,
+        )
+
+    def run(self):
+        fps = {}
+        for file_path in self.file_paths:
+            _, video_name, _ = get_fn_ext(filepath=file_path)
             video_path = find_video_of_file(
                 video_dir=self.video_dir, filename=video_name
             )
             if not video_path:
                 try:
-                    video_meta_data = {}
                     self.video_info_df = self.read_video_info_csv(
                         file_path=self.video_info_path
                     )
-                    _, _, fps = self.read_video_info(video_name=video_name)
-                    video_meta_data["fps"] = fps
+                    _, _, fps[video_name] = self.read_video_info(video_name=video_name)
                 except:
                     raise NoFilesFoundError(
                         msg=f"No video for file {video_name} found in SimBA project. Import the video before doing smoothing. To perform smoothing, SimBA needs the video fps from the video itself OR the logs/video_info.csv file in order to read the video FPS.",
                         source=self.__class__.__name__,
                     )
             else:
-                video_meta_data = get_video_meta_data(video_path=video_path)
-
-            for animal_name, animal_body_parts in self.settings.items():
-                for bp, smoothing_setting in animal_body_parts.items():
-                    print(smoothing_setting)
-                    frames_in_time_window = int(
-                        smoothing_setting["time_window"]
-                        / (1000 / int(video_meta_data["fps"]))
-                    )
-                    check_that_column_exist(
-                        df=df, column_name=f"{bp}_x", file_name=file_path
-                    )
-                    check_that_column_exist(
-                        df=df, column_name=f"{bp}_y", file_name=file_path
-                    )
-                    df[[f"{bp}_x", f"{bp}_y"]] = df[[f"{bp}_x", f"{bp}_y"]].astype(int)
-                    if smoothing_setting["method"].lower == Methods.GAUSSIAN.value:
-                        df[[f"{bp}_x", f"{bp}_y"]] = (
-                            df[[f"{bp}_x", f"{bp}_y"]]
-                            .rolling(
-                                window=int(frames_in_time_window),
-                                win_type="gaussian",
-                                center=True,
-                            )
-                            .mean(std=5)
-                            .fillna(df[[f"{bp}_x", f"{bp}_y"]])
-                            .abs()
-                        )
-                    if (
-                        smoothing_setting["method"].lower
-                        == Methods.SAVITZKY_GOLAY.value
-                    ):
-                        if (frames_in_time_window % 2) == 0:
-                            frames_in_time_window = frames_in_time_window - 1
-                        if (frames_in_time_window % 2) <= 3:
-                            frames_in_time_window = 5
-                        df[[f"{bp}_x", f"{bp}_y"]] = savgol_filter(
-                            x=df[[f"{bp}_x", f"{bp}_y"]].to_numpy(),
-                            window_length=frames_in_time_window,
-                            polyorder=3,
-                            mode="nearest",
-                        )
-                    df[[f"{bp}_x", f"{bp}_y"]][df[[f"{bp}_x", f"{bp}_y"]] < 0] = 0
-            if self.initial_import_multi_index:
-                multi_idx_header = []
-                for i in range(len(df.columns)):
-                    multi_idx_header.append(
-                        ("IMPORTED_POSE", "IMPORTED_POSE", list(df.columns)[i])
-                    )
-                df.columns = pd.MultiIndex.from_tuples(multi_idx_header)
-            if not self.overwrite:
-                shutil.move(
-                    src=file_path,
-                    dst=os.path.join(self.move_dir, os.path.basename(file_path)),
-                )
-            write_df(
-                df=df,
+                fps[video_name] = get_video_meta_data(video_path=video_path)["fps"]
+        _, self.processed_cnt, self.skipped_cnt = run_file_tasks(
+            func=functools.partial(
+                self._smooth_file,
                 file_type=self.file_type,
-                save_path=file_path,
-                multi_idx_header=self.initial_import_multi_index,
-            )
-
+                settings=self.settings,
+                fps=fps,
+                bp_headers=self.bp_headers,
+                initial_import_multi_index=self.initial_import_multi_index,
+                move_dir=self.move_dir,
+            ),
+            file_paths=self.file_paths,
+            core_cnt=self.core_cnt,
+            source=self.__class__.__name__,
+        )
         self.timer.stop_timer()
         stdout_success(
-            msg="Smoothing complete complete!",
+            msg=f"Smoothing complete! {self.processed_cnt} data file(s) smoothened ({self.skipped_cnt} file(s) skipped)",
             elapsed_time=self.timer.elapsed_time_str,
             source=self.__class__.__name__,
         )
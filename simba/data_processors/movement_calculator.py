@@ -92,7 +92,11 @@ class MovementCalculator(ConfigReader, FeatureExtractionMixin):
             self.__find_body_part_columns()
             _, video_name, _ = get_fn_ext(file_path)
             print("Analysing {}...".format(video_name))
-            self.data_df = read_df(file_path=file_path, file_type=self.file_type)
+            self.data_df = read_df(
+                file_path=file_path,
+                file_type=self.file_type,
+                usecols=self.bp_list if self.bp_list else None,
+            )
             self.video_info, self.px_per_mm, self.fps = self.read_video_info(
                 video_name=video_name
             )
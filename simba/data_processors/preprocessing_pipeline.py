@@ -0,0 +1,328 @@
+__author__ = "Simon Nilsson"
+
+import functools
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from simba.data_processors.interpolation_smoothing import (
+    Interpolate, Smooth, _write_pre_processed_df, find_smoothing_fps)
+from simba.mixins.config_reader import ConfigReader
+from simba.outlier_tools.outlier_corrector_location import \
+    OutlierCorrecterLocation
+from simba.outlier_tools.outlier_corrector_movement import \
+    OutlierCorrecterMovement
+from simba.utils.checks import (check_if_filepath_list_is_empty,
+                                check_if_valid_input, check_int)
+from simba.utils.enums import Methods, TagNames
+from simba.utils.errors import DataHeaderError
+from simba.utils.printing import SimbaTimer, log_event, stdout_success
+from simba.utils.read_write import (find_core_cnt, get_fn_ext, read_df,
+                                    read_outlier_settings, run_file_tasks,
+                                    write_df)
+
+INTERPOLATION_OPTIONS = [
+    "Animal(s): Nearest",
+    "Animal(s): Linear",
+    "Animal(s): Quadratic",
+    "Body-parts: Nearest",
+    "Body-parts: Linear",
+    "Body-parts: Quadratic",
+]
+
+
+class PreprocessingPipeline(ConfigReader):
+    """
+    Pre-process the pose-estimation data in the ``project_folder/csv/input_csv`` directory of a SimBA project in a
+    single pass: interpolation, smoothing, movement outlier correction and location outlier correction. Each video is
+    read once, the configured stages are applied in memory, and the results are written once to the
+    ``project_folder/csv/outlier_corrected_movement_location`` directory.
+
+    The results are the same as running :class:`simba.data_processors.interpolation_smoothing.Interpolate`,
+    :class:`simba.data_processors.interpolation_smoothing.Smooth`,
+    :class:`simba.outlier_tools.outlier_corrector_movement.OutlierCorrecterMovement` and
+    :class:`simba.outlier_tools.outlier_corrector_location.OutlierCorrecterLocation` one after the other, without
+    the disk round-trip between each stage.
+
+    .. note::
+       The intermediate results are only written if ``save_intermediate`` is True: the interpolated and/or smoothed
+       data is written to ``project_folder/csv/input_csv`` (the original files are moved to a datetime-stamped
+       sub-directory), and the movement corrected data is written to ``project_folder/csv/outlier_corrected_movement``.
+
+    :parameter str config_path: path to SimBA project config file in Configparser format.
+    :parameter Optional[str] interpolation_settings: Type of interpolation. OPTIONS: 'None', 'Animal(s): Nearest', 'Animal(s): Linear', 'Animal(s): Quadratic','Body-parts: Nearest', 'Body-parts: Linear', 'Body-parts: Quadratic'. Default: None.
+    :parameter Optional[Dict[str, Any]] smoothing_settings: Dictionary defining the smoothing method. EXAMPLE: {'Method': 'Savitzky Golay', 'Parameters': {'Time_window': '200'}}. Default: None.
+    :parameter bool movement_correction: If True, correct movement outliers using the criteria in the project_config.ini. Default: True.
+    :parameter bool location_correction: If True, correct location outliers using the criteria in the project_config.ini. Default: True.
+    :parameter bool save_intermediate: If True, also save the results of the intermediate stages. Default: False.
+    :parameter Optional[int] core_cnt: Number of files to process in parallel. If -1, then all available cores. Default: 1.
+
+    :examples:
+    >>> pipeline = PreprocessingPipeline(config_path='MyProjectConfig', interpolation_settings='Body-parts: Nearest', smoothing_settings={'Method': 'Savitzky Golay', 'Parameters': {'Time_window': '200'}})
+    >>> pipeline.run()
+    """
+
+    def __init__(
+        self,
+        config_path: Union[str, os.PathLike],
+        interpolation_settings: Optional[str] = None,
+        smoothing_settings: Optional[Dict[str, Any]] = None,
+        movement_correction: bool = True,
+        location_correction: bool = True,
+        save_intermediate: bool = False,
+        core_cnt: Optional[int] = 1,
+    ):
+        super().__init__(config_path=config_path, read_video_info=False)
+        log_event(
+            logger_name=str(self.__class__.__name__),
+            log_type=TagNames.CLASS_INIT.value,
+            msg=self.create_log_msg_from_init_args(locals=locals()),
+        )
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
+        )
+        check_if_filepath_list_is_empty(
+            filepaths=self.input_csv_paths,
+            error_msg=f"No files found in {self.input_csv_dir}.",
+        )
+        self.interpolation_type, self.interpolation_method = None, None
+        if interpolation_settings not in [None, "None"]:
+            check_if_valid_input(
+                name="interpolation_settings",
+                input=interpolation_settings,
+                options=INTERPOLATION_OPTIONS,
+            )
+            self.interpolation_type, self.interpolation_method = (
+                interpolation_settings.split(":")[0],
+                interpolation_settings.split(":")[1].replace(" ", "").lower(),
+            )
+        self.smoothing_method, self.smoothing_time_window = None, None
+        if (smoothing_settings is not None) and (
+            smoothing_settings["Method"] != "None"
+        ):
+            check_if_valid_input(
+                name="smoothing_settings",
+                input=smoothing_settings["Method"],
+                options=[Methods.GAUSSIAN.value, Methods.SAVITZKY_GOLAY.value],
+            )
+            check_int(
+                name="smoothing_settings Time_window",
+                value=smoothing_settings["Parameters"]["Time_window"],
+                min_value=1,
+            )
+            self.smoothing_method = smoothing_settings["Method"]
+            self.smoothing_time_window = int(
+                smoothing_settings["Parameters"]["Time_window"]
+            )
+        self.movement_settings, self.location_settings = None, None
+        if movement_correction:
+            animal_bp_dict, outlier_bp_dict, criterion = read_outlier_settings(
+                config=self.config,
+                animal_bp_dict=self.animal_bp_dict,
+                animal_cnt=self.animal_cnt,
+                outlier_type="movement",
+            )
+            self.movement_settings = {
+                "animal_bp_dict": animal_bp_dict,
+                "outlier_bp_dict": outlier_bp_dict,
+                "criterion": criterion,
+            }
+        if location_correction:
+            animal_bp_dict, outlier_bp_dict, criterion = read_outlier_settings(
+                config=self.config,
+                animal_bp_dict=self.animal_bp_dict,
+                animal_cnt=self.animal_cnt,
+                outlier_type="location",
+            )
+            self.location_settings = {
+                "animal_bp_dict": animal_bp_dict,
+                "outlier_bp_dict": outlier_bp_dict,
+                "criterion": criterion,
+            }
+        self.save_intermediate, self.core_cnt = save_intermediate, core_cnt
+        if not os.path.exists(self.outlier_corrected_dir):
+            os.makedirs(self.outlier_corrected_dir)
+
+    @staticmethod
+    def _process_file(
+        file_path: Union[str, os.PathLike],
+        file_type: str,
+        bp_headers: List[str],
+        animal_bp_dict: Dict[str, Any],
+        interpolation_type: Optional[str],
+        interpolation_method: Optional[str],
+        smoothing_method: Optional[str],
+        smoothing_time_window: Optional[int],
+        fps: Dict[str, float],
+        movement_settings: Optional[Dict[str, Any]],
+        location_settings: Optional[Dict[str, Any]],
+        pre_processed_dir: Optional[Union[str, os.PathLike]],
+        movement_dir: Optional[Union[str, os.PathLike]],
+        save_dir: Union[str, os.PathLike],
+    ) -> Tuple[List[list], List[list]]:
+        """
+        Helper to run the configured pre-processing stages on a single file. Called by
+        :meth:`simba.data_processors.preprocessing_pipeline.PreprocessingPipeline.run` through
+        :func:`simba.utils.read_write.run_file_tasks`.
+
+        :return Tuple[List[list], List[list]]: The movement and location outlier log rows of the file.
+        """
+
+        video_timer = SimbaTimer(start=True)
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        print(f"Pre-processing video {video_name}...")
+        df = read_df(file_path=file_path, file_type=file_type, check_multiindex=True)
+        if len(df.columns) != len(bp_headers):
+            raise DataHeaderError(
+                msg=f"SIMBA ERROR: SimBA expects {len(bp_headers)} columns of data inside the files within project_folder/csv/input_csv directory. However, within file {file_path} file, SimBA found {len(df.columns)} columns.",
+                source=PreprocessingPipeline.__name__,
+            )
+        df.columns = bp_headers
+        if interpolation_type == "Animal(s)":
+            df = Interpolate.interpolate_animals(
+                df=df,
+                video_name=video_name,
+                animal_bp_dict=animal_bp_dict,
+                interpolation_method=interpolation_method,
+            )
+        elif interpolation_type == "Body-parts":
+            df = Interpolate.interpolate_body_parts(
+                df=df,
+                video_name=video_name,
+                animal_bp_dict=animal_bp_dict,
+                interpolation_method=interpolation_method,
+            )
+        # cast to float32 between stages, as read_df does when the stages are run one after the other
+        df = df.astype(np.float32)
+        if smoothing_method == Methods.SAVITZKY_GOLAY.value:
+            df = Smooth.savgol_smooth(
+                df=df, fps=fps[video_name], time_window=smoothing_time_window
+            )
+        elif smoothing_method == Methods.GAUSSIAN.value:
+            df = Smooth.gaussian_smooth(
+                df=df, fps=fps[video_name], time_window=smoothing_time_window
+            )
+        df = df.astype(np.float32)
+        if pre_processed_dir is not None:
+            _write_pre_processed_df(
+                df=df.copy(),
+                file_path=file_path,
+                file_type=file_type,
+                initial_import_multi_index=True,
+                move_dir=pre_processed_dir,
+            )
+        movement_log, location_log = [], []
+        if movement_settings is not None:
+            df, movement_log = OutlierCorrecterMovement.correct_movement_outliers(
+                data_df=df, video_name=video_name, **movement_settings
+            )
+            df = df.astype(np.float32)
+            if movement_dir is not None:
+                write_df(
+                    df=df,
+                    file_type=file_type,
+                    save_path=os.path.join(movement_dir, f"{video_name}.{file_type}"),
+                )
+        if location_settings is not None:
+            df, location_log = OutlierCorrecterLocation.correct_location_outliers(
+                data_df=df, video_name=video_name, **location_settings
+            )
+        write_df(
+            df=df,
+            file_type=file_type,
+            save_path=os.path.join(save_dir, f"{video_name}.{file_type}"),
+        )
+        video_timer.stop_timer()
+        print(
+            f"Pre-processed video {video_name} (elapsed time: {video_timer.elapsed_time_str}s)..."
+        )
+        return movement_log, location_log
+
+    def run(self):
+        """
+        Runs the pre-processing pipeline. Results are stored in the
+        ``project_folder/csv/outlier_corrected_movement_location`` directory of the SimBA project, and the outlier
+        correction logs are stored in the ``project_folder/logs`` directory.
+        """
+
+        print(f"Pre-processing {len(self.input_csv_paths)} file(s)...")
+        fps = {}
+        if self.smoothing_method is not None:
+            fps = find_smoothing_fps(
+                config_reader=self,
+                file_paths=self.input_csv_paths,
+                smoothing_method=self.smoothing_method,
+            )
+        pre_processed_dir, movement_dir = None, None
+        if self.save_intermediate:
+            if (self.interpolation_type is not None) or (
+                self.smoothing_method is not None
+            ):
+                pre_processed_dir = os.path.join(
+                    self.input_csv_dir, f"Pre_pipeline_{self.datetime}"
+                )
+                os.makedirs(pre_processed_dir)
+            if self.movement_settings is not None:
+                movement_dir = self.outlier_corrected_movement_dir
+                if not os.path.exists(movement_dir):
+                    os.makedirs(movement_dir)
+        results, processed_cnt, skipped_cnt = run_file_tasks(
+            func=functools.partial(
+                self._process_file,
+                file_type=self.file_type,
+                bp_headers=self.bp_headers,
+                animal_bp_dict=self.animal_bp_dict,
+                interpolation_type=self.interpolation_type,
+                interpolation_method=self.interpolation_method,
+                smoothing_method=self.smoothing_method,
+                smoothing_time_window=self.smoothing_time_window,
+                fps=fps,
+                movement_settings=self.movement_settings,
+                location_settings=self.location_settings,
+                pre_processed_dir=pre_processed_dir,
+                movement_dir=movement_dir,
+                save_dir=self.outlier_corrected_dir,
+            ),
+            file_paths=self.input_csv_paths,
+            core_cnt=self.core_cnt,
+            source=self.__class__.__name__,
+        )
+        if self.movement_settings is not None:
+            self.movement_log = pd.DataFrame(
+                [row for file_log, _ in results.values() for row in file_log],
+                columns=[
+                    "VIDEO",
+                    "ANIMAL",
+                    "BODY-PART",
+                    "CORRECTION COUNT",
+                    "CORRECTION PCT",
+                ],
+            )
+            self.movement_log.to_csv(
+                os.path.join(self.logs_path, f"Outliers_movement_{self.datetime}.csv")
+            )
+        if self.location_settings is not None:
+            self.location_log = pd.DataFrame(
+                [row for _, file_log in results.values() for row in file_log],
+                columns=[
+                    "Video",
+                    "Animal",
+                    "Body-part",
+                    "Corrections",
+                    "Correction ratio (%)",
+                ],
+            )
+            self.location_log.to_csv(
+                os.path.join(self.logs_path, f"Outliers_location_{self.datetime}.csv")
+            )
+        self.timer.stop_timer()
+        stdout_success(
+            msg=f"{processed_cnt} data file(s) pre-processed and saved in {self.outlier_corrected_dir} ({skipped_cnt} file(s) skipped)",
+            elapsed_time=self.timer.elapsed_time_str,
+            source=self.__class__.__name__,
+        )
@@ -2,6 +2,48 @@
 import math
 
 import numpy as np
+from numba import njit
+
+
+@njit("(float64[:], float64[:], float64)", cache=True)
+def _kleinberg_viterbi(gaps: np.ndarray, alpha: np.ndarray, gamma_log_n: float):
+    """
+    Jitted helper computing the minimum-cost state sequence of the Kleinberg burst automaton.
+
+    Costs are carried forward one time step at a time and only the best preceding state of every state and time step
+    is stored, so the state sequence is recovered by backtracking in O(n·k²) time and O(n·k) memory.
+
+    :param np.ndarray gaps: 1D array with the n inter-event gaps.
+    :param np.ndarray alpha: 1D array with the expected event rate of each of the k states.
+    :param float gamma_log_n: Cost of moving up one state.
+    :return np.ndarray: 1D array with the state (1-based) at each of the n gaps.
+    """
+
+    n, k = gaps.shape[0], alpha.shape[0]
+    C = np.full(k, np.inf)
+    C[0] = 0.0
+    backpointers = np.zeros((n, k), dtype=np.int64)
+    for t in range(n):
+        C_prime = np.full(k, np.inf)
+        for j in range(k):
+            el, min_cost = 0, np.inf
+            for x in range(k):
+                cost = C[x]
+                if x < j:
+                    cost = cost + (j - x) * gamma_log_n
+                if (x == 0) or (cost < min_cost):
+                    el, min_cost = x, cost
+            f = alpha[j] * math.exp(-alpha[j] * gaps[t])
+            if f > 0:
+                C_prime[j] = min_cost - math.log(f)
+            backpointers[t, j] = el
+        C = C_prime
+    q = np.empty(n, dtype=np.float64)
+    j = np.argmin(C)
+    for t in range(n - 1, -1, -1):
+        q[t] = j + 1
+        j = backpointers[t, j]
+    return q
 
 
 def kleinberg_burst_detection(offsets: np.ndarray, s: float, gamma: float):
@@ -9,6 +51,9 @@ def kleinberg_burst_detection(offsets: np.ndarray, s: float, gamma: float):
     Burst detection using `pyburst <https://pypi.org/project/pybursts/>`_.
     Private method called by ``simba.data_processors.kleinberg_calculator.KleinbergCalculator``.
 
+    The optimal state sequence is computed by the jitted Viterbi recursion in
+    :func:`simba.data_processors.pybursts_calculator._kleinberg_viterbi`.
+
     """
 
     offsets = np.array(offsets, dtype=object)
@@ -32,46 +77,12 @@ def kleinberg_burst_detection(offsets: np.ndarray, s: float, gamma: float):
 
     gamma_log_n = gamma * math.log(n)
 
-    def tau(i, j):
-        if i >= j:
-            return 0
-        else:
-            return (j - i) * gamma_log_n
-
     alpha_function = np.vectorize(lambda x: s**x / g_hat)
     alpha = alpha_function(np.arange(k))
 
-    def f(j, x):
-        return alpha[j] * math.exp(-alpha[j] * x)
-
-    C = np.repeat(float("inf"), k)
-    C[0] = 0
-
-    q = np.empty((k, 0))
-    for t in range(n):
-        C_prime = np.repeat(float("inf"), k)
-        q_prime = np.empty((k, t + 1))
-        q_prime.fill(np.nan)
-
-        for j in range(k):
-            cost_function = np.vectorize(lambda x: C[x] + tau(x, j))
-            cost = cost_function(np.arange(0, k))
-
-            el = np.argmin(cost)
-
-            if f(j, gaps[t]) > 0:
-                C_prime[j] = cost[el] - math.log(f(j, gaps[t]))
-
-            if t > 0:
-                q_prime[j, :t] = q[el, :]
-
-            q_prime[j, t] = j + 1
-
-        C = C_prime
-        q = q_prime
-
-    j = np.argmin(C)
-    q = q[j, :]
+    q = _kleinberg_viterbi(
+        gaps.astype(np.float64), alpha.astype(np.float64), float(gamma_log_n)
+    )
 
     prev_q = 0
 
@@ -101,7 +101,7 @@ class TimeBinsClfCalculator(ConfigReader):
         video_dict = {}
         for file_cnt, file_path in enumerate(self.files_found):
             dir_name, file_name, extension = get_fn_ext(file_path)
-            data_df = read_df(file_path, self.file_type)
+            data_df = read_df(file_path, self.file_type, usecols=list(self.clf_names))
             video_settings, px_per_mm, fps = self.read_video_info(video_name=file_name)
             fps = int(fps)
             bin_frame_length = self.bin_length * fps
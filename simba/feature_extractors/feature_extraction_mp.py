@@ -0,0 +1,199 @@
+__author__ = "Simon Nilsson"
+
+import io
+import multiprocessing
+import os
+import platform
+from contextlib import redirect_stdout
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from simba.feature_extractors.perimeter_jit import jitted_hull
+from simba.mixins.config_reader import ConfigReader
+from simba.mixins.feature_extraction_mixin import FeatureExtractionMixin
+from simba.utils.checks import (
+    check_all_file_names_are_represented_in_video_log,
+    check_if_filepath_list_is_empty, check_int)
+from simba.utils.enums import Defaults, Formats
+from simba.utils.errors import InvalidInputError
+from simba.utils.lookups import get_bp_config_code_class_pairs
+from simba.utils.printing import SimbaTimer, stdout_success
+from simba.utils.read_write import find_core_cnt, get_fn_ext
+from simba.utils.warnings import SkippingFileWarning
+
+_WORKER_EXTRACTOR = None
+
+
+def _warm_up_jitted_feature_functions() -> None:
+    """
+    Compile the numba functions shared by the hard-coded feature extractors on small arrays, so that the first video
+    analyzed by each worker is not charged the compilation time.
+    """
+
+    for dtype in (np.float32, np.float64):
+        x = np.arange(1, 9).astype(dtype)
+        y = np.flip(x).copy()
+        FeatureExtractionMixin.euclidean_distance(x, y, y, x, 1.0)
+        FeatureExtractionMixin.angle3pt_serialized(
+            data=np.column_stack((x, y, y, x, x, x))
+        )
+        FeatureExtractionMixin.path_tortuosity(x=x, y=y, window_sizes=[2])
+        FeatureExtractionMixin.cdist(
+            array_1=np.column_stack((x, y)), array_2=np.column_stack((y, x))
+        )
+        FeatureExtractionMixin.count_values_in_range(
+            data=np.column_stack((x, y)) / 10, ranges=np.array([[0.0, 0.5]])
+        )
+    points = np.random.randint(0, 100, (4, 4, 2)).astype(np.float32)
+    jitted_hull(points=points, target=Formats.PERIMETER.value)
+    jitted_hull(points=points, target=Formats.AREA.value)
+
+
+def _init_feature_extraction_worker(
+    extractor_class: object, config_path: Union[str, os.PathLike]
+) -> None:
+    """
+    Pool initializer called once per worker by :meth:`simba.feature_extractors.feature_extraction_mp.FeatureExtractionMultiProcess.run`.
+    Creates the feature extractor of the worker and warms up the jitted feature functions.
+    """
+
+    global _WORKER_EXTRACTOR
+    with redirect_stdout(io.StringIO()):
+        _WORKER_EXTRACTOR = extractor_class(config_path=config_path)
+        _warm_up_jitted_feature_functions()
+
+
+def _feature_extraction_helper(
+    file_path: Union[str, os.PathLike], extractor: Optional[object] = None
+) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Helper to extract features from a single file. Called by
+    :meth:`simba.feature_extractors.feature_extraction_mp.FeatureExtractionMultiProcess.run`.
+
+    Any error is caught and returned so that a single faulty file does not abort the remaining files.
+
+    :parameter Union[str, os.PathLike] file_path: Path to the outlier corrected pose-estimation file.
+    :return Tuple[str, Optional[str], Optional[str]]: The video name, the elapsed time (None on failure) and the error message (None on success).
+    """
+
+    video_timer = SimbaTimer(start=True)
+    _, video_name, _ = get_fn_ext(file_path)
+    if extractor is None:
+        extractor = _WORKER_EXTRACTOR
+    extractor.files_found = [file_path]
+    extractor.outlier_corrected_paths = [file_path]
+    try:
+        with redirect_stdout(io.StringIO()):
+            extractor.run()
+    except Exception as e:
+        return video_name, None, f"{e.__class__.__name__}: {e}"
+    video_timer.stop_timer()
+    return video_name, video_timer.elapsed_time_str, None
+
+
+class FeatureExtractionMultiProcess(ConfigReader):
+    """
+    Extract features from all files in the ``project_folder/csv/outlier_corrected_movement_location`` directory with the
+    hard-coded feature extractor of the project pose-estimation setting, analyzing one video per worker.
+    Results are stored in the ``project_folder/csv/features_extracted`` directory of the SimBA project.
+
+    .. note::
+       Each worker creates its own feature extractor and compiles the jitted feature functions once at pool start-up.
+       Progress is reported in the order of the input files. Failures are isolated per video: a file that raises an
+       error is skipped with a warning and the remaining files are analyzed.
+
+    :parameter str config_path: path to SimBA project config file in Configparser format.
+    :parameter Optional[int] core_cnt: Number of videos to analyze in parallel. If -1, then all available cores. Default: -1.
+
+    :example:
+    >>> feature_extractor = FeatureExtractionMultiProcess(config_path='MyProjectConfig', core_cnt=-1)
+    >>> feature_extractor.run()
+    """
+
+    def __init__(
+        self, config_path: Union[str, os.PathLike], core_cnt: Optional[int] = -1
+    ):
+        ConfigReader.__init__(self, config_path=config_path)
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
+        )
+        check_if_filepath_list_is_empty(
+            filepaths=self.outlier_corrected_paths,
+            error_msg=f"No files of type {self.file_type} found in {self.outlier_corrected_dir}",
+        )
+        feature_extractor_classes = get_bp_config_code_class_pairs()
+        if self.pose_setting not in feature_extractor_classes.keys():
+            raise InvalidInputError(
+                msg=f"The project pose-configuration key is set to {self.pose_setting} which is invalid. OPTIONS: {list(feature_extractor_classes.keys())}. Check the pose-estimation setting in the project_config.ini",
+                source=self.__class__.__name__,
+            )
+        self.extractor_class = feature_extractor_classes[self.pose_setting]
+        if isinstance(self.extractor_class, dict):
+            self.extractor_class = self.extractor_class[self.animal_cnt]
+        self.core_cnt = find_core_cnt()[0] if int(core_cnt) == -1 else int(core_cnt)
+        self.core_cnt = max(1, min(self.core_cnt, len(self.outlier_corrected_paths)))
+        self.failed_videos = {}
+
+    def run(self):
+        check_all_file_names_are_represented_in_video_log(
+            video_info_df=self.video_info_df, data_paths=self.outlier_corrected_paths
+        )
+        file_paths = sorted(self.outlier_corrected_paths)
+        print(
+            f"Extracting features from {len(file_paths)} file(s) with {self.extractor_class.__name__} ({self.core_cnt} core(s))..."
+        )
+        if self.core_cnt == 1:
+            with redirect_stdout(io.StringIO()):
+                extractor = self.extractor_class(config_path=self.config_path)
+            results = (
+                _feature_extraction_helper(x, extractor=extractor) for x in file_paths
+            )
+            self._report(results=results, file_cnt=len(file_paths))
+        else:
+            if (platform.system() == "Darwin") and (
+                multiprocessing.get_start_method() != "spawn"
+            ):
+                multiprocessing.set_start_method("spawn", force=True)
+            with multiprocessing.Pool(
+                self.core_cnt,
+                initializer=_init_feature_extraction_worker,
+                initargs=(self.extractor_class, self.config_path),
+                maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value,
+            ) as pool:
+                results = pool.imap(_feature_extraction_helper, file_paths, chunksize=1)
+                self._report(results=results, file_cnt=len(file_paths))
+            pool.terminate()
+            pool.join()
+        self.timer.stop_timer()
+        for video_name, error in self.failed_videos.items():
+            SkippingFileWarning(
+                msg=f"Feature extraction failed for video {video_name}: {error}",
+                source=self.__class__.__name__,
+            )
+        stdout_success(
+            msg=f"Feature extraction complete for {len(file_paths) - len(self.failed_videos)}/{len(file_paths)} video(s). Results are saved inside the project_folder/csv/features_extracted directory",
+            elapsed_time=self.timer.elapsed_time_str,
+            source=self.__class__.__name__,
+        )
+
+    def _report(
+        self, results: List[Tuple[str, Optional[str], Optional[str]]], file_cnt: int
+    ) -> None:
+        for video_cnt, (video_name, elapsed_time, error) in enumerate(results):
+            if error is None:
+                print(
+                    f"Feature extraction complete for {video_name} ({video_cnt + 1}/{file_cnt}, elapsed time: {elapsed_time}s)..."
+                )
+            else:
+                self.failed_videos[video_name] = error
+                print(
+                    f"Feature extraction FAILED for {video_name} ({video_cnt + 1}/{file_cnt}): {error}"
+                )
+
+
+# feature_extractor = FeatureExtractionMultiProcess(config_path='/Users/simon/Desktop/envs/simba/troubleshooting/two_black_animals_14bp/project_folder/project_config.ini', core_cnt=-1)
+# feature_extractor.run()
@@ -1,7 +1,6 @@
 __author__ = "Simon Nilsson"
 
 
-import math
 import os
 from collections import defaultdict
 from copy import deepcopy
@@ -1180,71 +1179,14 @@ class ExtractFeaturesFrom16bps(ConfigReader, FeatureExtractionMixin):
                 )
 
             print("Calculating path tortuosities...")
-            as_strided = np.lib.stride_tricks.as_strided
-            win_size = 3
-            centroid_lst_mouse1_x = as_strided(
-                self.out_data.Center_1_x,
-                (len(self.out_data) - (win_size - 1), win_size),
-                (self.out_data.Center_1_x.values.strides * 2),
-            )
-            centroid_lst_mouse1_y = as_strided(
-                self.out_data.Center_1_y,
-                (len(self.out_data) - (win_size - 1), win_size),
-                (self.out_data.Center_1_y.values.strides * 2),
-            )
-            centroid_lst_mouse2_x = as_strided(
-                self.out_data.Center_2_x,
-                (len(self.out_data) - (win_size - 1), win_size),
-                (self.out_data.Center_2_x.values.strides * 2),
-            )
-            centroid_lst_mouse2_y = as_strided(
-                self.out_data.Center_2_y,
-                (len(self.out_data) - (win_size - 1), win_size),
-                (self.out_data.Center_2_y.values.strides * 2),
+            tortuosities = self.path_tortuosity(
+                x=self.out_data["Center_1_x"].values,
+                y=self.out_data["Center_1_y"].values,
+                window_sizes=self.roll_windows_values,
             )
-
-            for window in self.roll_windows_values:
-                start, end = 0, 0 + int(window)
-                tortuosities_results = defaultdict(list)
-                for frame in range(len(self.out_data)):
-                    tortuosities_dict = defaultdict(list)
-                    c_centroid_lst_mouse1_x, c_centroid_lst_mouse1_y = (
-                        centroid_lst_mouse1_x[start:end],
-                        centroid_lst_mouse1_y[start:end],
-                    )
-                    c_centroid_lst_mouse2_x, c_centroid_lst_mouse2_y = (
-                        centroid_lst_mouse2_x[start:end],
-                        centroid_lst_mouse2_y[start:end],
-                    )
-                    for frame_in_window in range(len(c_centroid_lst_mouse1_x)):
-                        move_angle_mouse_1 = self.angle3pt(
-                            c_centroid_lst_mouse1_x[frame_in_window][0],
-                            c_centroid_lst_mouse1_y[frame_in_window][0],
-                            c_centroid_lst_mouse1_x[frame_in_window][1],
-                            c_centroid_lst_mouse1_y[frame_in_window][1],
-                            c_centroid_lst_mouse1_x[frame_in_window][2],
-                            c_centroid_lst_mouse1_y[frame_in_window][2],
-                        )
-                        move_angle_mouse_2 = self.angle3pt(
-                            c_centroid_lst_mouse2_x[frame_in_window][0],
-                            c_centroid_lst_mouse2_y[frame_in_window][0],
-                            c_centroid_lst_mouse2_x[frame_in_window][1],
-                            c_centroid_lst_mouse2_y[frame_in_window][1],
-                            c_centroid_lst_mouse2_x[frame_in_window][2],
-                            c_centroid_lst_mouse2_y[frame_in_window][2],
-                        )
-                        tortuosities_dict["Animal_1"].append(move_angle_mouse_1)
-                        tortuosities_dict["Animal_2"].append(move_angle_mouse_2)
-                    tortuosities_results["Animal_1"].append(
-                        sum(tortuosities_dict["Animal_1"]) / (2 * math.pi)
-                    )
-                    tortuosities_results["Animal_2"].append(
-                        sum(tortuosities_dict["Animal_2"]) / (2 * math.pi)
-                    )
-                    start += 1
-                    end += 1
+            for window_cnt, window in enumerate(self.roll_windows_values):
                 col_name = "Tortuosity_Mouse1_{}".format(str(window))
-                self.out_data[col_name] = tortuosities_results["Animal_1"]
+                self.out_data[col_name] = tortuosities[:, window_cnt]
 
             print("Calculating pose probability scores...")
             all_p_columns = self.mouse_2_p_headers + self.mouse_1_p_headers
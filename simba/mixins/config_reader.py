@@ -33,6 +33,7 @@ from simba.utils.errors import (BodypartColumnNotFoundError, DataHeaderError,
 from simba.utils.lookups import (create_color_palettes, get_color_dict,
                                  get_emojis, get_log_config)
 from simba.utils.printing import SimbaTimer, stdout_success
+from simba.utils.project_index import PROJECT_FILE_INDEX
 from simba.utils.read_write import (find_core_cnt, get_all_clf_names,
                                     get_fn_ext, read_config_file, read_df,
                                     read_project_path_and_file_type, write_df)
@@ -142,27 +143,14 @@ class ConfigReader(object):
             Dtypes.INT.value,
         )
         self.clf_names = get_all_clf_names(config=self.config, target_cnt=self.clf_cnt)
-        self.feature_file_paths = glob.glob(self.features_dir + f"/*.{self.file_type}")
-        self.target_file_paths = glob.glob(self.targets_folder + f"/*.{self.file_type}")
-        self.input_csv_paths = glob.glob(self.input_csv_dir + f"/*.{self.file_type}")
-        self.body_part_directionality_paths = glob.glob(
-            self.body_part_directionality_df_dir + f"/*.{self.file_type}"
-        )
-        self.outlier_corrected_paths = glob.glob(
-            self.outlier_corrected_dir + f"/*.{self.file_type}"
-        )
-        self.outlier_corrected_movement_paths = glob.glob(
-            self.outlier_corrected_movement_dir + f"/*.{self.file_type}"
-        )
         self.cpu_cnt, self.cpu_to_use = find_core_cnt()
-        self.machine_results_paths = glob.glob(
-            self.machine_results_dir + f"/*.{self.file_type}"
-        )
         self.logs_path = os.path.join(self.project_path, "logs")
         self.body_parts_path = os.path.join(self.project_path, Paths.BP_NAMES.value)
         check_file_exist_and_readable(file_path=self.body_parts_path)
         self.body_parts_lst = (
-            pd.read_csv(self.body_parts_path, header=None).iloc[:, 0].to_list()
+            PROJECT_FILE_INDEX.read_csv(file_path=self.body_parts_path, header=None)
+            .iloc[:, 0]
+            .to_list()
         )
         self.body_parts_lst = [x for x in self.body_parts_lst if str(x) != "nan"]
         self.get_body_part_names()
@@ -214,6 +202,104 @@ class ConfigReader(object):
                 file_path=self.video_info_path
             )
 
+    def _get_project_file_paths(self, name: str, directory: str) -> List[str]:
+        project_file_paths = self.__dict__.setdefault("_project_file_paths", {})
+        if name not in project_file_paths:
+            project_file_paths[name] = PROJECT_FILE_INDEX.file_paths(
+                directory=directory, file_type=self.file_type
+            )
+        return project_file_paths[name]
+
+    def _set_project_file_paths(self, name: str, file_paths: List[str]) -> None:
+        self.__dict__.setdefault("_project_file_paths", {})[name] = file_paths
+
+    @property
+    def feature_file_paths(self) -> List[str]:
+        """Paths of the data files in the ``project_folder/csv/features_extracted`` directory. Listed on first access."""
+        return self._get_project_file_paths(
+            name="feature_file_paths", directory=self.features_dir
+        )
+
+    @feature_file_paths.setter
+    def feature_file_paths(self, file_paths: List[str]) -> None:
+        self._set_project_file_paths(name="feature_file_paths", file_paths=file_paths)
+
+    @property
+    def target_file_paths(self) -> List[str]:
+        """Paths of the data files in the ``project_folder/csv/targets_inserted`` directory. Listed on first access."""
+        return self._get_project_file_paths(
+            name="target_file_paths", directory=self.targets_folder
+        )
+
+    @target_file_paths.setter
+    def target_file_paths(self, file_paths: List[str]) -> None:
+        self._set_project_file_paths(name="target_file_paths", file_paths=file_paths)
+
+    @property
+    def input_csv_paths(self) -> List[str]:
+        """Paths of the data files in the ``project_folder/csv/input_csv`` directory. Listed on first access."""
+        return self._get_project_file_paths(
+            name="input_csv_paths", directory=self.input_csv_dir
+        )
+
+    @input_csv_paths.setter
+    def input_csv_paths(self, file_paths: List[str]) -> None:
+        self._set_project_file_paths(name="input_csv_paths", file_paths=file_paths)
+
+    @property
+    def body_part_directionality_paths(self) -> List[str]:
+        """Paths of the data files in the ``project_folder/logs/body_part_directionality_dataframes`` directory. Listed on first access."""
+        return self._get_project_file_paths(
+            name="body_part_directionality_paths",
+            directory=self.body_part_directionality_df_dir,
+        )
+
+    @body_part_directionality_paths.setter
+    def body_part_directionality_paths(self, file_paths: List[str]) -> None:
+        self._set_project_file_paths(
+            name="body_part_directionality_paths", file_paths=file_paths
+        )
+
+    @property
+    def outlier_corrected_paths(self) -> List[str]:
+        """Paths of the data files in the ``project_folder/csv/outlier_corrected_movement_location`` directory. Listed on first access."""
+        return self._get_project_file_paths(
+            name="outlier_corrected_paths", directory=self.outlier_corrected_dir
+        )
+
+    @outlier_corrected_paths.setter
+    def outlier_corrected_paths(self, file_paths: List[str]) -> None:
+        self._set_project_file_paths(
+            name="outlier_corrected_paths", file_paths=file_paths
+        )
+
+    @property
+    def outlier_corrected_movement_paths(self) -> List[str]:
+        """Paths of the data files in the ``project_folder/csv/outlier_corrected_movement`` directory. Listed on first access."""
+        return self._get_project_file_paths(
+            name="outlier_corrected_movement_paths",
+            directory=self.outlier_corrected_movement_dir,
+        )
+
+    @outlier_corrected_movement_paths.setter
+    def outlier_corrected_movement_paths(self, file_paths: List[str]) -> None:
+        self._set_project_file_paths(
+            name="outlier_corrected_movement_paths", file_paths=file_paths
+        )
+
+    @property
+    def machine_results_paths(self) -> List[str]:
+        """Paths of the data files in the ``project_folder/csv/machine_results`` directory. Listed on first access."""
+        return self._get_project_file_paths(
+            name="machine_results_paths", directory=self.machine_results_dir
+        )
+
+    @machine_results_paths.setter
+    def machine_results_paths(self, file_paths: List[str]) -> None:
+        self._set_project_file_paths(
+            name="machine_results_paths", file_paths=file_paths
+        )
+
     def read_roi_data(self) -> None:
         """
         Method to read in ROI definitions from SimBA project
@@ -636,20 +722,44 @@ class ConfigReader(object):
         >>> df = read_df(config_reader.machine_results_paths[0], file_type='csv')
         >>> df = config_reader.drop_bp_cords(df=df)
         """
-        missing_body_part_fields = list(set(self.bp_col_names) - set(list(df.columns)))
+        return self.drop_bp_col_names(
+            df=df,
+            bp_col_names=self.bp_col_names,
+            raise_error=raise_error,
+            source=self.__class__.__name__,
+        )
+
+    @staticmethod
+    def drop_bp_col_names(
+        df: pd.DataFrame,
+        bp_col_names: List[str],
+        raise_error: bool = False,
+        source: str = "",
+    ) -> pd.DataFrame:
+        """
+        Helper to remove the pose-estimation fields ``bp_col_names`` from dataframe. Used by
+        :meth:`simba.mixins.config_reader.ConfigReader.drop_bp_cords`, and by worker processes that do not hold a ``ConfigReader``.
+
+        :param pd.DataFrame df: pandas dataframe containing pose-estimation fields (body-part x, y, p fields)
+        :param List[str] bp_col_names: The pose-estimation field names.
+        :param bool raise_error: If True, raise error if body-parts cant be found. Else, print warning
+        :param str source: Name of the caller, used in warnings and errors.
+        :return pd.DataFrame: ``df`` without pose-estimation fields
+        """
+        missing_body_part_fields = list(set(bp_col_names) - set(list(df.columns)))
         if len(missing_body_part_fields) > 0 and not raise_error:
             BodypartColumnNotFoundWarning(
                 msg=f"SimBA could not drop body-part coordinates, some body-part names are missing in dataframe. SimBA expected the following body-parts, that could not be found inside the file: {missing_body_part_fields}",
-                source=self.__class__.__name__,
+                source=source,
             )
-            return df.drop(self.bp_col_names, axis=1, errors="ignore")
+            return df.drop(bp_col_names, axis=1, errors="ignore")
         elif len(missing_body_part_fields) > 0 and raise_error:
             raise BodypartColumnNotFoundError(
                 msg=f"SimBA could not drop body-part coordinates, some body-part names are missing in dataframe. SimBA expected the following body-parts, that could not be found inside the file: {missing_body_part_fields}",
-                source=self.__class__.__name__,
+                source=source,
             )
         else:
-            return df.drop(self.bp_col_names, axis=1)
+            return df.drop(bp_col_names, axis=1)
 
     def get_bp_headers(self) -> None:
         """
@@ -749,7 +859,7 @@ class ConfigReader(object):
                 msg=f"Could not find the video_info.csv table in your SimBA project. Create it using the [Video parameters] tab. SimBA expects the file at location {file_path}",
                 source=self.__class__.__name__,
             )
-        info_df = pd.read_csv(file_path)
+        info_df = PROJECT_FILE_INDEX.read_csv(file_path=file_path)
         for c in [
             "Video",
             "fps",
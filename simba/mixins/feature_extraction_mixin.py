@@ -152,6 +152,56 @@ class FeatureExtractionMixin(object):
 
         return results
 
+    @staticmethod
+    @njit("(float64[:], int64[:], int64)")
+    def _forward_window_sums(
+        data: np.ndarray, window_sizes: np.ndarray, frm_cnt: int
+    ) -> np.ndarray:
+        results = np.full((frm_cnt, window_sizes.shape[0]), 0.0)
+        for i in range(frm_cnt):
+            for j in range(window_sizes.shape[0]):
+                window_sum = 0.0
+                for k in range(i, min(i + window_sizes[j], data.shape[0])):
+                    window_sum += data[k]
+                results[i, j] = window_sum
+        return results
+
+    @staticmethod
+    def path_tortuosity(
+        x: np.ndarray, y: np.ndarray, window_sizes: List[int]
+    ) -> np.ndarray:
+        """
+        Compute the forward-looking windowed path tortuosity of a moving location.
+
+        For every frame ``n`` and window size ``w``, the tortuosity is the sum of the 3-point movement angles (degrees)
+        at frames ``n+1`` to ``n+w`` divided by 2π, where the angle at frame ``m`` is computed from the locations at
+        frames ``m-1``, ``m`` and ``m+1``. Windows are truncated at the end of the video.
+
+        .. note::
+           Jitted replacement of the per-frame ``angle3pt`` loops previously used by the hard-coded feature extractors.
+           Angles are summed in frame order, so results are identical to the previous implementation.
+
+        :parameter np.ndarray x: 1D array of x-coordinates of size len(frames).
+        :parameter np.ndarray y: 1D array of y-coordinates of size len(frames).
+        :parameter List[int] window_sizes: Window sizes in frames.
+        :return np.ndarray: 2D array of size len(frames) x len(window_sizes).
+
+        :example:
+        >>> x, y = np.random.randint(0, 500, (100,)), np.random.randint(0, 500, (100,))
+        >>> FeatureExtractionMixin.path_tortuosity(x=x, y=y, window_sizes=[2, 5, 10])
+        """
+
+        x, y = np.asarray(x), np.asarray(y)
+        angles = np.full((max(x.shape[0] - 2, 0)), 0.0)
+        if angles.shape[0] > 0:
+            angles = FeatureExtractionMixin.angle3pt_serialized(
+                data=np.column_stack((x[:-2], y[:-2], x[1:-1], y[1:-1], x[2:], y[2:]))
+            )
+        window_sums = FeatureExtractionMixin._forward_window_sums(
+            angles, np.array(window_sizes).astype(np.int64), x.shape[0]
+        )
+        return window_sums / (2 * math.pi)
+
     @staticmethod
     def convex_hull_calculator_mp(arr: np.ndarray, px_per_mm: float) -> float:
         """
@@ -626,6 +676,71 @@ class FeatureExtractionMixin(object):
 
         return results_array
 
+    @staticmethod
+    @jit(nopython=True)
+    def jitted_line_crosses_to_nonstatic_target_permutations(
+        left_ear_array: np.ndarray,
+        right_ear_array: np.ndarray,
+        nose_array: np.ndarray,
+        target_array: np.ndarray,
+        observer_idx: np.ndarray,
+        target_idx: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Jitted helper to calculate if animals are directing towards the body-parts of other animals for all
+        (observer, target body-part) combinations in a single pass. Uses the same test as
+        :meth:`simba.mixins.feature_extraction_mixin.FeatureExtractionMixin.jitted_line_crosses_to_nonstatic_targets`.
+
+        :parameter np.ndarray left_ear_array: 3D array of size len(frames) x len(animals) x 2 with the coordinates of the left ear of each observer animal.
+        :parameter np.ndarray right_ear_array: 3D array of size len(frames) x len(animals) x 2 with the coordinates of the right ear of each observer animal.
+        :parameter np.ndarray nose_array: 3D array of size len(frames) x len(animals) x 2 with the coordinates of the nose of each observer animal.
+        :parameter np.ndarray target_array: 3D array of size len(frames) x len(body-parts) x 2 with the coordinates of the target body-parts.
+        :parameter np.ndarray observer_idx: 1D array of size len(combinations) with the observer animal index of each combination.
+        :parameter np.ndarray target_idx: 1D array of size len(combinations) with the target body-part index of each combination.
+        :return np.ndarray: 2D boolean array of size len(frames) x len(combinations). True if the observer is directing towards the target body-part.
+
+        :example:
+        >>> left_ear, right_ear, nose = np.random.randint(0, 500, (3, 100, 2, 2)).astype(np.float32)
+        >>> targets = np.random.randint(0, 500, (100, 4, 2)).astype(np.float32)
+        >>> FeatureExtractionMixin.jitted_line_crosses_to_nonstatic_target_permutations(left_ear_array=left_ear, right_ear_array=right_ear, nose_array=nose, target_array=targets, observer_idx=np.array([0, 0, 1, 1]), target_idx=np.array([2, 3, 0, 1]))
+        """
+
+        results = np.full((target_array.shape[0], observer_idx.shape[0]), False)
+        for frame_no in range(target_array.shape[0]):
+            for i in range(observer_idx.shape[0]):
+                observer, target = observer_idx[i], target_idx[i]
+                Px = np.abs(
+                    left_ear_array[frame_no][observer][0]
+                    - target_array[frame_no][target][0]
+                )
+                Py = np.abs(
+                    left_ear_array[frame_no][observer][1]
+                    - target_array[frame_no][target][1]
+                )
+                Qx = np.abs(
+                    right_ear_array[frame_no][observer][0]
+                    - target_array[frame_no][target][0]
+                )
+                Qy = np.abs(
+                    right_ear_array[frame_no][observer][1]
+                    - target_array[frame_no][target][1]
+                )
+                Nx = np.abs(
+                    nose_array[frame_no][observer][0]
+                    - target_array[frame_no][target][0]
+                )
+                Ny = np.abs(
+                    nose_array[frame_no][observer][1]
+                    - target_array[frame_no][target][1]
+                )
+                Ph = np.sqrt(Px * Px + Py * Py)
+                Qh = np.sqrt(Qx * Qx + Qy * Qy)
+                Nh = np.sqrt(Nx * Nx + Ny * Ny)
+                if Nh < Ph and Nh < Qh and Qh != Ph:
+                    results[frame_no][i] = True
+
+        return results
+
     @staticmethod
     @jit(nopython=True)
     def jitted_line_crosses_to_static_targets(
@@ -4,6 +4,7 @@ import math
 import multiprocessing
 import os
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import Dict, Iterable, List, Optional, Tuple, Union
 
@@ -11,6 +12,7 @@ import cv2
 import imutils
 import numpy as np
 import pandas as pd
+import shapely
 from numba import njit, prange
 from shapely.geometry import (GeometryCollection, LineString, MultiLineString,
                               MultiPoint, MultiPolygon, Point, Polygon)
@@ -1123,6 +1125,113 @@ class GeometryMixin(object):
 
         return L
 
+    @staticmethod
+    def _batch_geometry_apply(
+        func: object, data: Tuple[np.ndarray, ...], core_cnt: int
+    ) -> np.ndarray:
+        """
+        Helper to apply a vectorized shapely function to row-aligned arrays in contiguous chunks over threads.
+
+        Shapely >= 2.0 array functions (e.g., ``shapely.area``, ``shapely.intersection``) release the GIL, so
+        the chunks run in parallel without pickling geometries across process boundaries.
+
+        :param object func: Callable accepting one chunk of each array in ``data`` and returning a 1D array of the same length as the chunk.
+        :param Tuple[np.ndarray, ...] data: Arrays with equal length along the first axis (e.g., object arrays of geometries or coordinate arrays).
+        :param int core_cnt: Number of threads.
+        :return np.ndarray: The results of ``func`` for all rows, in the order of ``data``.
+        """
+
+        row_cnt = data[0].shape[0]
+        chunk_cnt = max(1, min(core_cnt, row_cnt))
+        if chunk_cnt == 1:
+            return func(*data)
+        bounds = np.linspace(0, row_cnt, chunk_cnt + 1).astype(np.int64)
+        chunks = [
+            [x[bounds[i] : bounds[i + 1]] for x in data] for i in range(chunk_cnt)
+        ]
+        with ThreadPoolExecutor(max_workers=chunk_cnt) as executor:
+            results = list(executor.map(lambda x: func(*x), chunks))
+        return np.concatenate(results)
+
+    @staticmethod
+    def _to_geometry_array(shapes: Iterable[object]) -> np.ndarray:
+        """Helper to convert an iterable of shapely geometries to a 1D object array without unpacking multi-part geometries."""
+        shapes = list(shapes)
+        results = np.empty(len(shapes), dtype=object)
+        results[:] = shapes
+        return results
+
+    @staticmethod
+    def _to_shape_matrix(shapes: Iterable[Iterable[object]], source: str) -> np.ndarray:
+        """Helper to convert an iterable of equal-length geometry rows (e.g., one row per frame) to a 2D object array of LineStrings, Polygons, or MultiPolygons. Use :meth:`simba.mixins.geometry_mixin.GeometryMixin._apply_to_shape_rows` for rows of different lengths."""
+        rows = [list(x) for x in shapes]
+        col_cnts = list(set([len(x) for x in rows]))
+        if (len(col_cnts) != 1) or (col_cnts[0] < 2):
+            raise InvalidInputError(
+                msg=f"Each row of shapes requires the same number of geometries and at least 2 geometries, got {col_cnts}",
+                source=source,
+            )
+        results = np.empty((len(rows), col_cnts[0]), dtype=object)
+        for i in range(col_cnts[0]):
+            results[:, i] = [x[i] for x in rows]
+        type_ids = shapely.get_type_id(results)
+        if not np.all(
+            np.isin(
+                type_ids,
+                [
+                    shapely.GeometryType.LINESTRING,
+                    shapely.GeometryType.POLYGON,
+                    shapely.GeometryType.MULTIPOLYGON,
+                ],
+            )
+        ):
+            raise InvalidInputError(
+                msg=f"shapes has to be LineStrings, Polygons or MultiPolygons, got {list(set([type(x) for x in results.flatten()]))}",
+                source=source,
+            )
+        return results
+
+    @staticmethod
+    def _apply_to_shape_rows(
+        func: object,
+        shapes: Iterable[Iterable[object]],
+        core_cnt: int,
+        source: str,
+    ) -> List[object]:
+        """
+        Helper to apply a vectorized shapely function to rows of geometries (e.g., one row per frame).
+
+        Rows are grouped by their number of geometries and each group is passed as one 2D object array to
+        :meth:`simba.mixins.geometry_mixin.GeometryMixin._batch_geometry_apply`, so rows with different numbers of
+        geometries are supported while rows of equal length take the single-matrix path.
+
+        :param object func: Callable accepting a 2D object array of geometries and returning one result per row.
+        :param Iterable[Iterable[object]] shapes: Rows of LineStrings, Polygons, or MultiPolygons with at least 2 geometries each.
+        :param int core_cnt: Number of threads.
+        :param str source: Name of the calling method for error messages.
+        :return List[object]: The result of ``func`` for each row, in the order of ``shapes``. Empty if ``shapes`` is empty.
+        """
+
+        rows = [list(x) for x in shapes]
+        results = [None] * len(rows)
+        if len(rows) == 0:
+            return results
+        col_cnts = np.array([len(x) for x in rows])
+        for col_cnt in np.unique(col_cnts):
+            row_idx = np.argwhere(col_cnts == col_cnt).flatten()
+            group_results = GeometryMixin._batch_geometry_apply(
+                func=func,
+                data=(
+                    GeometryMixin._to_shape_matrix(
+                        shapes=[rows[i] for i in row_idx], source=source
+                    ),
+                ),
+                core_cnt=core_cnt,
+            )
+            for i, result in zip(row_idx, group_results):
+                results[i] = result
+        return results
+
     def multiframe_bodyparts_to_polygon(
         self,
         data: np.ndarray,
@@ -1139,10 +1248,15 @@ class GeometryMixin(object):
         """
         Convert multidimensional NumPy array representing body part coordinates to a list of Polygons.
 
+        .. note::
+           Polygons are created with vectorized shapely array functions in ``core_cnt`` thread chunks, and are identical to
+           calling :func:`~simba.mixins.geometry_mixin.GeometryMixin.bodyparts_to_polygon` on each frame.
+
         :param np.ndarray data: NumPy array of body part coordinates. Each subarray represents the coordinates of a body part.
         :param Literal['round', 'square', 'flat'] cap_style: Style of line cap for parallel offset. Options: 'round', 'square', 'flat'.
         :param int parallel_offset: Offset distance for parallel lines. Default is 1.
         :param float simplify_tolerance: Tolerance parameter for simplifying geometries. Default is 2.
+        :param int core_cnt: Number of threads. Default is -1, which uses all available cores.
 
         :example:
         >>> data = np.array([[[364, 308], [383, 323], [403, 335], [423, 351]],[[356, 307], [376, 319], [396, 331], [419, 347]]])
@@ -1164,41 +1278,73 @@ class GeometryMixin(object):
                 raise_error=True,
             )
             parallel_offset = parallel_offset / pixels_per_mm
+        check_valid_array(
+            data=data,
+            source=f"{GeometryMixin.multiframe_bodyparts_to_polygon.__name__} data",
+            accepted_ndims=(3,),
+        )
+        check_str(
+            name=f"{GeometryMixin.multiframe_bodyparts_to_polygon.__name__} cap style",
+            value=cap_style,
+            options=list(GeometryEnum.CAP_STYLE_MAP.value.keys()),
+        )
+        check_float(
+            name=f"{GeometryMixin.multiframe_bodyparts_to_polygon.__name__} simplify_tolerance",
+            value=simplify_tolerance,
+            min_value=1,
+        )
         if core_cnt == -1:
             core_cnt = find_core_cnt()[0]
-        results, timer = [], SimbaTimer(start=True)
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            constants = functools.partial(
-                GeometryMixin.bodyparts_to_polygon,
-                parallel_offset=parallel_offset,
-                cap_style=cap_style,
-                simplify_tolerance=simplify_tolerance,
-                preserve_topology=preserve_topology,
-            )
-            for cnt, mp_return in enumerate(pool.imap(constants, data, chunksize=1)):
-                if verbose:
-                    if not video_name and not animal_name:
-                        print(f"Computing polygon {cnt+1}/{data.shape[0]}...")
-                    elif not video_name and animal_name:
-                        print(
-                            f"Computing polygon {cnt + 1}/{data.shape[0]} (Animal: {animal_name})..."
-                        )
-                    elif video_name and not animal_name:
-                        print(
-                            f"Computing polygon {cnt + 1}/{data.shape[0]} (Video: {video_name})..."
-                        )
-                    else:
-                        print(
-                            f"Computing polygon {cnt + 1}/{data.shape[0]} (Video: {video_name}, Animal: {animal_name})..."
-                        )
-                results.append(mp_return)
-
+        timer = SimbaTimer(start=True)
+        if verbose:
+            if not video_name and not animal_name:
+                print(f"Computing {data.shape[0]} polygons...")
+            elif not video_name and animal_name:
+                print(f"Computing {data.shape[0]} polygons (Animal: {animal_name})...")
+            elif video_name and not animal_name:
+                print(f"Computing {data.shape[0]} polygons (Video: {video_name})...")
+            else:
+                print(
+                    f"Computing {data.shape[0]} polygons (Video: {video_name}, Animal: {animal_name})..."
+                )
+        buffer = int(parallel_offset) if parallel_offset > 0 else 0
+        data = data.astype(np.float64)
+        sorted_points = np.sort(data[:, :, 0] + 1j * data[:, :, 1], axis=1)
+        valid = (np.diff(sorted_points, axis=1) != 0).sum(axis=1) + 1 >= 3
+        results = np.full(data.shape[0], None, dtype=object)
+        if np.any(valid):
+
+            def _polygons(x: np.ndarray) -> np.ndarray:
+                polygons = shapely.buffer(
+                    shapely.linestrings(x),
+                    distance=buffer,
+                    quad_segs=16,
+                    cap_style=GeometryEnum.CAP_STYLE_MAP.value[cap_style],
+                )
+                polygons = shapely.simplify(
+                    polygons,
+                    tolerance=simplify_tolerance,
+                    preserve_topology=preserve_topology,
+                )
+                return shapely.convex_hull(polygons)
+
+            results[valid] = GeometryMixin._batch_geometry_apply(
+                func=_polygons, data=(data[valid],), core_cnt=core_cnt
+            )
+        results = list(results)
+        for i in range(len(results)):
+            if not valid[i]:
+                results[i] = Polygon([(0, 0), (0, 0), (0, 0)])
+            elif not isinstance(results[i], Polygon):
+                results[i] = GeometryMixin.bodyparts_to_polygon(
+                    data=data[i],
+                    cap_style=cap_style,
+                    parallel_offset=parallel_offset,
+                    simplify_tolerance=simplify_tolerance,
+                    preserve_topology=preserve_topology,
+                )
         timer.stop_timer()
         stdout_success(msg="Polygons complete.", elapsed_time=timer.elapsed_time_str)
-        pool.join()
-        pool.terminate()
         return results
 
     @staticmethod
@@ -1212,7 +1358,7 @@ class GeometryMixin(object):
         Process multiple frames of body part data in parallel and convert them to shapely Points.
 
         This function takes a multi-frame body part data represented as an array and
-        converts it into points. It utilizes multiprocessing for parallel processing.
+        converts it into points using vectorized shapely array functions chunked over threads.
 
         :param np.ndarray data: 2D or 3D array with body-part coordinates where rows are frames and columns are x and y coordinates.
         :param Optional[int] core_cnt: The number of cores to use. If -1, then all available cores.
@@ -1244,24 +1390,35 @@ class GeometryMixin(object):
         )
         if core_cnt == -1:
             core_cnt = find_core_cnt()[0]
-        results = []
-        data_ndim = data.ndim
-        if data_ndim == 2:
-            data = np.array_split(data, core_cnt)
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            constants = functools.partial(
-                GeometryMixin.bodyparts_to_points, buffer=buffer, px_per_mm=px_per_mm
+        area = None
+        if buffer is not None:
+            check_float(
+                name=f"{GeometryMixin.multiframe_bodypart_to_point.__name__} buffer",
+                value=buffer,
+                min_value=1,
             )
-            for cnt, result in enumerate(pool.imap(constants, data, chunksize=1)):
-                results.append(result)
-        pool.join()
-        pool.terminate()
-        if data_ndim == 2:
-            return [i for s in results for i in s]
+            check_float(
+                name=f"{GeometryMixin.multiframe_bodypart_to_point.__name__} px_per_mm",
+                value=px_per_mm,
+                min_value=1,
+            )
+            area = buffer / px_per_mm
+
+        def _points(x: np.ndarray) -> np.ndarray:
+            points = shapely.points(x)
+            if area is not None:
+                points = shapely.buffer(points, area / 2, quad_segs=16, cap_style=3)
+            return points
+
+        results = GeometryMixin._batch_geometry_apply(
+            func=_points,
+            data=(data.reshape(-1, 2).astype(np.float64),),
+            core_cnt=core_cnt,
+        )
+        if data.ndim == 2:
+            return list(results)
         else:
-            return results
+            return [list(x) for x in results.reshape(data.shape[0], data.shape[1])]
 
     def multiframe_bodyparts_to_circle(
         self,
@@ -1271,7 +1428,7 @@ class GeometryMixin(object):
         pixels_per_mm: Optional[int] = 1,
     ) -> List[Polygon]:
         """
-        Convert a set of pose-estimated key-points to circles with specified radius using multiprocessing.
+        Convert a set of pose-estimated key-points to circles with specified radius using vectorized shapely array functions chunked over threads.
 
         :param np.ndarray data: The body-part coordinates xy as a 2d array where rows are frames and columns represent x and y coordinates . E.g., np.array([[364, 308], [369, 309]])
         :param int data: The radius of the resultant circle in millimeters.
@@ -1294,20 +1451,30 @@ class GeometryMixin(object):
         )
         if core_cnt == -1:
             core_cnt = find_core_cnt()[0]
-        results = []
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            constants = functools.partial(
-                GeometryMixin.bodyparts_to_circle,
-                parallel_offset=parallel_offset,
-                pixels_per_mm=pixels_per_mm,
+        check_valid_array(
+            data=data,
+            source=f"{GeometryMixin.multiframe_bodyparts_to_circle.__name__} data",
+            accepted_ndims=(2,),
+        )
+        if data.shape[1] != 2:
+            raise InvalidInputError(
+                msg=f"Cannot create circles, data is not a (N, 2) array: {data.shape}",
+                source=GeometryMixin.multiframe_bodyparts_to_circle.__name__,
             )
-            for cnt, mp_return in enumerate(pool.imap(constants, data, chunksize=1)):
-                results.append(mp_return)
-
-        pool.join()
-        pool.terminate()
+        check_float(
+            name=f"{GeometryMixin.multiframe_bodyparts_to_circle.__name__} pixels_per_mm",
+            value=pixels_per_mm,
+            min_value=1,
+        )
+        results = list(
+            GeometryMixin._batch_geometry_apply(
+                func=lambda x: shapely.buffer(
+                    shapely.points(x), parallel_offset / pixels_per_mm, quad_segs=16
+                ),
+                data=(data.astype(np.float64),),
+                core_cnt=core_cnt,
+            )
+        )
         timer.stop_timer()
         stdout_success(
             msg="Multiframe body-parts to circle complete",
@@ -1366,12 +1533,12 @@ class GeometryMixin(object):
         core_cnt: Optional[int] = -1,
     ) -> List[LineString]:
         """
-        Convert multiframe body-parts data to a list of LineString objects using multiprocessing.
+        Convert multiframe body-parts data to a list of LineString objects using vectorized shapely array functions chunked over threads.
 
         :param np.ndarray data: Input array representing multiframe body-parts data. It should be a 3D array with dimensions (frames, points, coordinates).
         :param Optional[int] buffer: If not None, then the linestring will be expanded into a 2D geometry polygon with area ``buffer``.
         :param Optional[int] px_per_mm: If ``buffer`` if not None, then provide the pixels to millimeter
-        :param Optional[int] core_cnt: Number of CPU cores to use for parallel processing. If set to -1, the function will automatically determine the available core count.
+        :param Optional[int] core_cnt: Number of threads to use for parallel processing. If set to -1, the function will automatically determine the available core count.
         :return List[LineString]: A list of LineString objects representing the body-parts trajectories.
 
         :example:
@@ -1405,18 +1572,20 @@ class GeometryMixin(object):
                 value=px_per_mm,
                 min_value=1,
             )
-        results = []
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            constants = functools.partial(
-                GeometryMixin.bodyparts_to_line, buffer=buffer, px_per_mm=px_per_mm
+
+        def _lines(x: np.ndarray) -> np.ndarray:
+            lines = shapely.linestrings(x)
+            if buffer is not None:
+                lines = shapely.buffer(
+                    lines, buffer * px_per_mm, quad_segs=16, cap_style=3
+                )
+            return lines
+
+        return list(
+            GeometryMixin._batch_geometry_apply(
+                func=_lines, data=(data.astype(np.float64),), core_cnt=core_cnt
             )
-            for cnt, result in enumerate(pool.imap(constants, data, chunksize=1)):
-                results.append(result)
-        pool.join()
-        pool.terminate()
-        return results
+        )
 
     def multiframe_compute_pct_shape_overlap(
         self,
@@ -1432,7 +1601,7 @@ class GeometryMixin(object):
 
         :param List[Polygon] shape_1: List of Polygons.
         :param List[Polygon] shape_2: List of Polygons with the same length as shape_1.
-        :param int core_cnt: Number of CPU cores to use for parallel processing. Default is -1, which uses all available cores.
+        :param int core_cnt: Number of threads to use for parallel processing. Default is -1, which uses all available cores.
         :return List[float]: List of percentage overlap between corresponding Polygons.
 
         :example:
@@ -1466,40 +1635,45 @@ class GeometryMixin(object):
             instance=shape_1[0],
             accepted_types=(LineString, Polygon),
         )
-        data, results, timer = (
-            np.column_stack((shape_1, shape_2)),
-            [],
-            SimbaTimer(start=True),
+        timer = SimbaTimer(start=True)
+        if verbose:
+            if not video_name and not animal_names:
+                print(f"Computing % overlap for {len(shape_1)} frames...")
+            elif not video_name and animal_names:
+                print(
+                    f"Computing % overlap for {len(shape_1)} frames (Animals: {animal_names})..."
+                )
+            elif video_name and not animal_names:
+                print(
+                    f"Computing % overlap for {len(shape_1)} frames (Video: {video_name})..."
+                )
+            else:
+                print(
+                    f"Computing % overlap for {len(shape_1)} frames (Video: {video_name}, Animals: {animal_names})..."
+                )
+
+        def _pct_overlap(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+            intersects = shapely.intersects(x, y)
+            intersection_area = shapely.area(shapely.intersection(x, y))
+            union_area = (shapely.area(x) + shapely.area(y)) - intersection_area
+            pct = np.zeros(x.shape[0], dtype=np.float64)
+            valid = intersects & (union_area > 0)
+            pct[valid] = np.round(intersection_area[valid] / union_area[valid] * 100, 2)
+            return pct
+
+        results = GeometryMixin._batch_geometry_apply(
+            func=_pct_overlap,
+            data=(
+                GeometryMixin._to_geometry_array(shape_1),
+                GeometryMixin._to_geometry_array(shape_2),
+            ),
+            core_cnt=core_cnt,
         )
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            for cnt, result in enumerate(
-                pool.imap(GeometryMixin.compute_pct_shape_overlap, data, chunksize=1)
-            ):
-                if verbose:
-                    if not video_name and not animal_names:
-                        print(f"Computing % overlap {cnt+1}/{data.shape[0]}...")
-                    elif not video_name and animal_names:
-                        print(
-                            f"Computing % overlap {cnt + 1}/{data.shape[0]} (Animals: {animal_names})..."
-                        )
-                    elif video_name and not animal_names:
-                        print(
-                            f"Computing % overlap {cnt + 1}/{data.shape[0]} (Video: {video_name})..."
-                        )
-                    else:
-                        print(
-                            f"Computing % overlap {cnt + 1}/{data.shape[0]} (Video: {video_name}, Animals: {animal_names})..."
-                        )
-                results.append(result)
         timer.stop_timer()
         stdout_success(
             msg="Compute overlap complete.", elapsed_time=timer.elapsed_time_str
         )
-        pool.join()
-        pool.terminate()
-        return results
+        return list(results)
 
     def multiframe_compute_shape_overlap(
         self,
@@ -1510,7 +1684,7 @@ class GeometryMixin(object):
         names: Optional[Tuple[str]] = None,
     ) -> List[int]:
         """
-        Multiprocess compute overlap between corresponding Polygons in two lists.
+        Compute overlap between corresponding Polygons in two lists using vectorized shapely array functions chunked over threads.
 
         .. note::
            Only returns if two shapes are overlapping or not overlapping. If the amount of overlap is required, use
@@ -1518,7 +1692,7 @@ class GeometryMixin(object):
 
         :param List[Polygon] shape_1: List of Polygons.
         :param List[Polygon] shape_2: List of Polygons with the same length as shape_1.
-        :param int core_cnt: Number of CPU cores to use for parallel processing. Default is -1, which uses all available cores.
+        :param int core_cnt: Number of threads to use for parallel processing. Default is -1, which uses all available cores.
         :return List[float]: List of overlap between corresponding Polygons. If overlap 1, else 0.
         """
 
@@ -1534,7 +1708,7 @@ class GeometryMixin(object):
         if len(shape_1) != len(shape_2):
             raise InvalidInputError(
                 msg=f"shape_1 and shape_2 are unequal sizes: {len(shape_1)} vs {len(shape_2)}",
-                source=GeometryMixin.multifrm_compute_pct_shape_overlap.__name__,
+                source=GeometryMixin.multiframe_compute_shape_overlap.__name__,
             )
         input_dtypes = list(
             set([type(x) for x in shape_1] + [type(x) for x in shape_2])
@@ -1549,25 +1723,22 @@ class GeometryMixin(object):
             instance=shape_1[0],
             accepted_types=(LineString, Polygon),
         )
-        data, results = np.column_stack((shape_1, shape_2)), []
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            for cnt, result in enumerate(
-                pool.imap(GeometryMixin.compute_shape_overlap, data, chunksize=1)
-            ):
-                if verbose:
-                    if not names:
-                        print(f"Computing overlap {cnt + 1}/{data.shape[0]}...")
-                    else:
-                        print(
-                            f"Computing overlap {cnt + 1}/{data.shape[0]} (Shape 1: {names[0]}, Shape 2: {names[1]}, Video: {names[2]}...)"
-                        )
-                results.append(result)
-
-        pool.join()
-        pool.terminate()
-        return results
+        if verbose:
+            if not names:
+                print(f"Computing overlap for {len(shape_1)} frames...")
+            else:
+                print(
+                    f"Computing overlap for {len(shape_1)} frames (Shape 1: {names[0]}, Shape 2: {names[1]}, Video: {names[2]}...)"
+                )
+        results = GeometryMixin._batch_geometry_apply(
+            func=lambda x, y: shapely.intersects(x, y).astype(np.int64),
+            data=(
+                GeometryMixin._to_geometry_array(shape_1),
+                GeometryMixin._to_geometry_array(shape_2),
+            ),
+            core_cnt=core_cnt,
+        )
+        return list(results)
 
     def multiframe_shape_distance(
         self,
@@ -1584,7 +1755,7 @@ class GeometryMixin(object):
         :param List[Union[LineString, Polygon]] shape_2: List of LineString or Polygon geometries with the same length as shape_1.
         :param float pixels_per_mm: Conversion factor from pixels to millimeters.
         :param Literal['mm', 'cm', 'dm', 'm'] unit: Unit of measurement for the result. Options: 'mm', 'cm', 'dm', 'm'. Default: 'mm'.
-        :param core_cnt: Number of CPU cores to use for parallel processing. Default is -1, which uses all available cores.
+        :param core_cnt: Number of threads to use for parallel processing. Default is -1, which uses all available cores.
         :return List[float]: List of shape distances between corresponding shapes in passed unit.
         """
 
@@ -1605,20 +1776,21 @@ class GeometryMixin(object):
                 source=GeometryMixin.multiframe_shape_distance.__name__,
             )
         check_float(name="pixels_per_mm", value=pixels_per_mm, min_value=0.0)
-        data = [list(x) for x in zip(shape_1, shape_2)]
-        results = []
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            constants = functools.partial(
-                GeometryMixin.shape_distance, pixels_per_mm=pixels_per_mm, unit=unit
-            )
-            for cnt, result in enumerate(pool.imap(constants, data, chunksize=1)):
-                results.append(result)
-
-        pool.join()
-        pool.terminate()
-        return results
+        results = GeometryMixin._batch_geometry_apply(
+            func=lambda x, y: shapely.distance(x, y) / pixels_per_mm,
+            data=(
+                GeometryMixin._to_geometry_array(shape_1),
+                GeometryMixin._to_geometry_array(shape_2),
+            ),
+            core_cnt=core_cnt,
+        )
+        if unit == "cm":
+            results = results / 10
+        elif unit == "dm":
+            results = results / 100
+        elif unit == "m":
+            results = results / 1000
+        return list(results)
 
     def multiframe_minimum_rotated_rectangle(
         self,
@@ -1629,10 +1801,10 @@ class GeometryMixin(object):
         core_cnt: int = -1,
     ) -> List[Polygon]:
         """
-        Compute the minimum rotated rectangle for each Polygon in a list using mutiprocessing.
+        Compute the minimum rotated rectangle for each Polygon in a list using vectorized shapely array functions chunked over threads.
 
         :param List[Polygon] shapes: List of Polygons.
-        :param core_cnt: Number of CPU cores to use for parallel processing. Default is -1, which uses all available cores.
+        :param core_cnt: Number of threads to use for parallel processing. Default is -1, which uses all available cores.
         """
 
         check_int(
@@ -1644,36 +1816,36 @@ class GeometryMixin(object):
         )
         if core_cnt == -1:
             core_cnt = find_core_cnt()[0]
-        results, timer = [], SimbaTimer(start=True)
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            for cnt, result in enumerate(
-                pool.imap(GeometryMixin.minimum_rotated_rectangle, shapes, chunksize=1)
-            ):
-                if verbose:
-                    if not video_name and not animal_name:
-                        print(f"Rotating polygon {cnt+1}/{len(shapes)}...")
-                    elif not video_name and animal_name:
-                        print(
-                            f"Rotating polygon {cnt + 1}/{len(shapes)} (Animal: {animal_name})..."
-                        )
-                    elif video_name and not animal_name:
-                        print(
-                            f"Rotating polygon {cnt + 1}/{len(shapes)} (Video: {video_name})..."
-                        )
-                    else:
-                        print(
-                            f"Rotating polygon {cnt + 1}/{len(shapes)} (Video: {video_name}, Animal: {animal_name})..."
-                        )
-                results.append(result)
-
+        timer = SimbaTimer(start=True)
+        shapes = GeometryMixin._to_geometry_array(shapes)
+        if not np.all(shapely.get_type_id(shapes) == shapely.GeometryType.POLYGON):
+            raise InvalidInputError(
+                msg=f"Minimum rotated rectangle requires Polygons, got {list(set([type(x) for x in shapes]))}",
+                source=GeometryMixin.multiframe_minimum_rotated_rectangle.__name__,
+            )
+        if verbose:
+            if not video_name and not animal_name:
+                print(f"Rotating {len(shapes)} polygons...")
+            elif not video_name and animal_name:
+                print(f"Rotating {len(shapes)} polygons (Animal: {animal_name})...")
+            elif video_name and not animal_name:
+                print(f"Rotating {len(shapes)} polygons (Video: {video_name})...")
+            else:
+                print(
+                    f"Rotating {len(shapes)} polygons (Video: {video_name}, Animal: {animal_name})..."
+                )
+        results = list(
+            GeometryMixin._batch_geometry_apply(
+                func=shapely.oriented_envelope, data=(shapes,), core_cnt=core_cnt
+            )
+        )
+        for i in range(len(results)):
+            if isinstance(results[i], Point):
+                results[i] = Polygon([(0, 0), (0, 0), (0, 0)])
         timer.stop_timer()
         stdout_success(
             msg="Rotated rectangles complete.", elapsed_time=timer.elapsed_time_str
         )
-        pool.join()
-        pool.terminate()
         return results
 
     @staticmethod
@@ -1850,6 +2022,8 @@ class GeometryMixin(object):
         unit: Literal["mm", "cm", "dm", "m"] = "mm",
     ) -> List[float]:
         """
+        Compute the lengths of a list of LineString geometries using vectorized shapely array functions chunked over threads.
+
         :example:
         >>> data = np.random.randint(0, 100, (5000, 2))
         >>> data = data.reshape(2500,-1, data.shape[1])
@@ -1868,23 +2042,29 @@ class GeometryMixin(object):
             core_cnt = find_core_cnt()[0]
         check_float(name="PIXELS PER MM", value=pixels_per_mm, min_value=0.0)
         check_if_valid_input(name="UNIT", input=unit, options=["mm", "cm", "dm", "m"])
-        results = []
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            constants = functools.partial(
-                GeometryMixin.length, pixels_per_mm=pixels_per_mm, unit=unit
+        shapes = GeometryMixin._to_geometry_array(shapes)
+        if not np.all(shapely.get_type_id(shapes) == shapely.GeometryType.LINESTRING):
+            raise InvalidInputError(
+                msg=f"Length requires LineStrings, got {list(set([type(x) for x in shapes]))}",
+                source=GeometryMixin.multiframe_length.__name__,
             )
-            for cnt, result in enumerate(pool.imap(constants, shapes, chunksize=1)):
-                results.append(result)
-        pool.join()
-        pool.terminate()
-        return results
+        results = GeometryMixin._batch_geometry_apply(
+            func=shapely.length, data=(shapes,), core_cnt=core_cnt
+        )
+        if unit == "cm":
+            results = results / 10
+        elif unit == "dm":
+            results = results / 100
+        elif unit == "m":
+            results = results / 1000
+        return list(results)
 
     def multiframe_union(
         self, shapes: Iterable[Union[LineString, MultiLineString]], core_cnt: int = -1
     ) -> Iterable[Union[LineString, MultiLineString]]:
         """
+        Compute the union of the geometries in each row of ``shapes`` using vectorized shapely array functions chunked over threads.
+
         :example:
         >>> data_1 = np.random.randint(0, 100, (5000, 2)).reshape(1000,-1, 2)
         >>> data_2 = np.random.randint(0, 100, (5000, 2)).reshape(1000,-1, 2)
@@ -1903,23 +2083,18 @@ class GeometryMixin(object):
         )
         if core_cnt == -1:
             core_cnt = find_core_cnt()[0]
-        results = []
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            for cnt, result in enumerate(
-                pool.imap(GeometryMixin().union, shapes, chunksize=1)
-            ):
-                results.append(result)
-        pool.join()
-        pool.terminate()
-        return results
+        return GeometryMixin._apply_to_shape_rows(
+            func=lambda x: shapely.union_all(x, axis=1),
+            shapes=shapes,
+            core_cnt=core_cnt,
+            source=GeometryMixin.multiframe_union.__name__,
+        )
 
     def multiframe_symmetric_difference(
         self, shapes: Iterable[Union[LineString, MultiLineString]], core_cnt: int = -1
     ):
         """
-        Compute the symmetric differences between corresponding LineString or MultiLineString geometries usng multiprocessing.
+        Compute the symmetric differences between corresponding LineString or MultiLineString geometries using vectorized shapely array functions chunked over threads.
 
         :example:
         >>> data_1 = np.random.randint(0, 100, (5000, 2)).reshape(1000,-1, 2)
@@ -1938,17 +2113,25 @@ class GeometryMixin(object):
         )
         if core_cnt == -1:
             core_cnt = find_core_cnt()[0]
-        results = []
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            for cnt, result in enumerate(
-                pool.imap(GeometryMixin().symmetric_difference, shapes, chunksize=1)
-            ):
-                results.append(result)
-        pool.join()
-        pool.terminate()
-        return results
+
+        def _symmetric_difference(x: np.ndarray) -> np.ndarray:
+            x = x.copy()
+            for c in itertools.combinations(list(range(0, x.shape[1])), 2):
+                x[:, c[0]] = shapely.difference(
+                    shapely.convex_hull(x[:, c[0]]), shapely.convex_hull(x[:, c[1]])
+                )
+                x[:, c[1]] = shapely.difference(
+                    shapely.convex_hull(x[:, c[1]]), shapely.convex_hull(x[:, c[0]])
+                )
+            return x
+
+        results = GeometryMixin._apply_to_shape_rows(
+            func=_symmetric_difference,
+            shapes=shapes,
+            core_cnt=core_cnt,
+            source=GeometryMixin.multiframe_symmetric_difference.__name__,
+        )
+        return [list(x[~shapely.is_empty(x)]) for x in results]
 
     def multiframe_delaunay_triangulate_keypoints(
         self, data: np.ndarray, core_cnt: int = -1
@@ -1980,20 +2163,12 @@ class GeometryMixin(object):
                 msg=f"Multiframe delaunay triangulate keypointstriangulate keypoints expects a 3D array, got {data.ndim}",
                 source=GeometryMixin.multiframe_delaunay_triangulate_keypoints.__name__,
             )
-        results = []
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            for cnt, result in enumerate(
-                pool.imap(
-                    GeometryMixin().delaunay_triangulate_keypoints, data, chunksize=1
-                )
-            ):
-                results.append(result)
-
-        pool.join()
-        pool.terminate()
-        return results
+        results = GeometryMixin._batch_geometry_apply(
+            func=lambda x: shapely.delaunay_triangles(shapely.multipoints(x)),
+            data=(data.astype(np.int64).astype(np.float64),),
+            core_cnt=core_cnt,
+        )
+        return [list(x.geoms) for x in results]
 
     def multiframe_difference(
         self,
@@ -2004,10 +2179,10 @@ class GeometryMixin(object):
         video_name: Optional[str] = None,
     ) -> List[Union[Polygon, MultiPolygon]]:
         """
-        Compute the multi-frame difference for a collection of shapes using parallel processing.
+        Compute the multi-frame difference for a collection of shapes using vectorized shapely array functions chunked over threads.
 
         :param Iterable[Union[LineString, Polygon, MultiPolygon]] shapes: A collection of shapes, where each shape is a list containing two geometries.
-        :param int core_cnt: The number of CPU cores to use for parallel processing. Default is -1, which automatically detects the available cores.
+        :param int core_cnt: The number of threads to use for parallel processing. Default is -1, which automatically detects the available cores.
         :param Optional[bool] verbose: If True, print progress messages during computation. Default is False.
         :param Optional[str] animal_names: Optional string representing the names of animals for informative messages.
         :param Optional[str]video_name: Optional string representing the name of the video for informative messages.
@@ -2019,23 +2194,6 @@ class GeometryMixin(object):
             instance=shapes,
             accepted_types=list,
         )
-        for i in shapes:
-            check_instance(
-                source=f"{GeometryMixin().multiframe_difference.__name__} shapes {i}",
-                instance=i,
-                accepted_types=list,
-            )
-            check_iterable_length(
-                f"{GeometryMixin().multiframe_difference.__name__} shapes {i}",
-                val=len(i),
-                exact_accepted_length=2,
-            )
-            for j in i:
-                check_instance(
-                    source=f"{GeometryMixin().multiframe_difference.__name__} shapes",
-                    instance=j,
-                    accepted_types=(LineString, Polygon, MultiPolygon),
-                )
         check_int(
             name="CORE COUNT",
             value=core_cnt,
@@ -2045,39 +2203,40 @@ class GeometryMixin(object):
         )
         if core_cnt == -1:
             core_cnt = find_core_cnt()[0]
-        results, timer = [], SimbaTimer(start=True)
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            for cnt, result in enumerate(
-                pool.imap(GeometryMixin().difference, shapes, chunksize=1)
-            ):
-                if verbose:
-                    if not video_name and not animal_names:
-                        print(
-                            f"Computing geometry difference {cnt + 1}/{len(shapes)}..."
-                        )
-                    elif not video_name and animal_names:
-                        print(
-                            f"Computing geometry difference {cnt + 1}/{len(shapes)} (Animals: {animal_names})..."
-                        )
-                    elif video_name and not animal_names:
-                        print(
-                            f"Computing geometry difference {cnt + 1}/{len(shapes)} (Video: {video_name})..."
-                        )
-                    else:
-                        print(
-                            f"Computing geometry difference {cnt + 1}/{len(shapes)} (Video: {video_name}, Animals: {animal_names})..."
-                        )
-                results.append(result)
+        timer = SimbaTimer(start=True)
+        if verbose:
+            if not video_name and not animal_names:
+                print(f"Computing geometry difference for {len(shapes)} frames...")
+            elif not video_name and animal_names:
+                print(
+                    f"Computing geometry difference for {len(shapes)} frames (Animals: {animal_names})..."
+                )
+            elif video_name and not animal_names:
+                print(
+                    f"Computing geometry difference for {len(shapes)} frames (Video: {video_name})..."
+                )
+            else:
+                print(
+                    f"Computing geometry difference for {len(shapes)} frames (Video: {video_name}, Animals: {animal_names})..."
+                )
+
+        def _difference(x: np.ndarray) -> np.ndarray:
+            results = x[:, 0]
+            for i in range(1, x.shape[1]):
+                results = shapely.difference(results, x[:, i])
+            return results
 
+        results = GeometryMixin._apply_to_shape_rows(
+            func=_difference,
+            shapes=shapes,
+            core_cnt=core_cnt,
+            source=GeometryMixin.multiframe_difference.__name__,
+        )
         timer.stop_timer()
         stdout_success(
             msg="Multi-frame difference compute complete",
             elapsed_time=timer.elapsed_time_str,
         )
-        pool.join()
-        pool.terminate()
         return results
 
     def multiframe_area(
@@ -2095,11 +2254,16 @@ class GeometryMixin(object):
             instance=shapes,
             accepted_types=list,
         )
-        for i in shapes:
-            check_instance(
-                source=f"{GeometryMixin().multiframe_difference.__name__} shapes {i}",
-                instance=i,
-                accepted_types=(MultiPolygon, Polygon),
+        shapes = GeometryMixin._to_geometry_array(shapes)
+        if not np.all(
+            np.isin(
+                shapely.get_type_id(shapes),
+                [shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON],
+            )
+        ):
+            raise InvalidInputError(
+                msg=f"Area requires Polygons or MultiPolygons, got {list(set([type(x) for x in shapes]))}",
+                source=GeometryMixin.multiframe_area.__name__,
             )
         check_float(
             name=f"{self.__class__.__name__} pixels_per_mm",
@@ -2115,38 +2279,32 @@ class GeometryMixin(object):
         )
         if core_cnt == -1:
             core_cnt = find_core_cnt()[0]
-        results, timer = [], SimbaTimer(start=True)
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            constants = functools.partial(
-                GeometryMixin.area, pixels_per_mm=pixels_per_mm
-            )
-            for cnt, result in enumerate(pool.imap(constants, shapes, chunksize=1)):
-                if verbose:
-                    if not video_name and not animal_names:
-                        print(f"Computing area {cnt + 1}/{len(shapes)}...")
-                    elif not video_name and animal_names:
-                        print(
-                            f"Computing % area {cnt + 1}/{len(shapes)} (Animals: {animal_names})..."
-                        )
-                    elif video_name and not animal_names:
-                        print(
-                            f"Computing % area {cnt + 1}/{len(shapes)} (Video: {video_name})..."
-                        )
-                    else:
-                        print(
-                            f"Computing % area {cnt + 1}/{len(shapes)} (Video: {video_name}, Animals: {animal_names})..."
-                        )
-                results.append(result)
-
+        timer = SimbaTimer(start=True)
+        if verbose:
+            if not video_name and not animal_names:
+                print(f"Computing area for {len(shapes)} frames...")
+            elif not video_name and animal_names:
+                print(
+                    f"Computing area for {len(shapes)} frames (Animals: {animal_names})..."
+                )
+            elif video_name and not animal_names:
+                print(
+                    f"Computing area for {len(shapes)} frames (Video: {video_name})..."
+                )
+            else:
+                print(
+                    f"Computing area for {len(shapes)} frames (Video: {video_name}, Animals: {animal_names})..."
+                )
+        results = GeometryMixin._batch_geometry_apply(
+            func=lambda x: shapely.area(x) / pixels_per_mm,
+            data=(shapes,),
+            core_cnt=core_cnt,
+        )
         timer.stop_timer()
         stdout_success(
             msg="Multi-frame area compute complete", elapsed_time=timer.elapsed_time_str
         )
-        pool.join()
-        pool.terminate()
-        return results
+        return list(results)
 
     def multiframe_bodyparts_to_multistring_skeleton(
         self,
@@ -2158,7 +2316,7 @@ class GeometryMixin(object):
         animal_names: Optional[bool] = False,
     ) -> List[Union[LineString, MultiLineString]]:
         """
-        Convert body parts to LineString skeleton representations in a videos using multiprocessing.
+        Convert body parts to LineString skeleton representations in a videos using vectorized shapely array functions chunked over threads.
 
         :param pd.DataFrame data_df: Pose-estimation data.
         :param Iterable[str] skeleton: Iterable of body part pairs defining the skeleton structure. Eg., [['Center', 'Lat_left'], ['Center', 'Lat_right'], ['Center', 'Nose'], ['Center', 'Tail_base']]
@@ -2215,33 +2373,34 @@ class GeometryMixin(object):
             else:
                 skeleton_data = np.concatenate((skeleton_data, line), axis=1)
         skeleton_data = skeleton_data.reshape(len(data_df), len(skeleton), 2, -1)
-        with multiprocessing.Pool(
-            core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
-        ) as pool:
-            for cnt, result in enumerate(
-                pool.imap(
-                    GeometryMixin.bodyparts_to_multistring_skeleton,
-                    skeleton_data,
-                    chunksize=1,
+        if verbose:
+            if not video_name and not animal_names:
+                print(f"Computing {len(data_df)} skeletons...")
+            elif not video_name and animal_names:
+                print(
+                    f"Computing {len(data_df)} skeletons (Animals: {animal_names})..."
+                )
+            elif video_name and not animal_names:
+                print(f"Computing {len(data_df)} skeletons (Video: {video_name})...")
+            else:
+                print(
+                    f"Computing {len(data_df)} skeletons (Video: {video_name}, Animals: {animal_names})..."
                 )
-            ):
-                if verbose:
-                    if not video_name and not animal_names:
-                        print(f"Computing skeleton {cnt + 1}/{len(data_df)}...")
-                    elif not video_name and animal_names:
-                        print(
-                            f"Computing skeleton {cnt + 1}/{len(data_df)} (Animals: {animal_names})..."
-                        )
-                    elif video_name and not animal_names:
-                        print(
-                            f"Computing skeleton {cnt + 1}/{len(data_df)} (Video: {video_name})..."
-                        )
-                    else:
-                        print(
-                            f"Computing skeleton {cnt + 1}/{len(data_df)} (Video: {video_name}, Animals: {animal_names})..."
-                        )
-                results.append(result)
 
+        def _skeletons(x: np.ndarray) -> np.ndarray:
+            lines = shapely.linestrings(x.reshape(-1, x.shape[2], x.shape[3]))
+            skeletons = shapely.multilinestrings(
+                lines, indices=np.repeat(np.arange(x.shape[0]), x.shape[1])
+            )
+            return shapely.line_merge(skeletons)
+
+        results = list(
+            GeometryMixin._batch_geometry_apply(
+                func=_skeletons,
+                data=(skeleton_data.astype(np.float64),),
+                core_cnt=core_cnt,
+            )
+        )
         timer.stop_timer()
         stdout_success(
             msg="Multistring skeleton complete.",
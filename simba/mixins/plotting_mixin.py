@@ -27,6 +27,7 @@ except:
 import simba
 from simba.utils.checks import check_file_exist_and_readable
 from simba.utils.enums import Formats, Options, TextOptions
+from simba.utils.errors import FrameRangeError
 from simba.utils.lookups import get_color_dict, get_named_colors
 from simba.utils.printing import SimbaTimer, stdout_success
 from simba.utils.read_write import get_fn_ext, read_frm_of_video
@@ -678,6 +679,28 @@ class PlottingMixin(object):
             columns=["Event", "Start_time", "End Time", "End_frame", "Bout_time"],
         )
 
+    @staticmethod
+    def check_chunk_frame_index(frm_idx: np.ndarray, source: str = "") -> None:
+        """
+        Helper to check that the frame numbers of a multiprocessing chunk are contiguous and increasing. The
+        multiprocessing frame renderers read the data of frame ``n`` from row ``n - start frame`` of per-chunk arrays.
+
+        :parameter np.ndarray frm_idx: The frame numbers of the chunk, in row order.
+        :parameter str source: Name of the caller, used in the error message.
+        :raises FrameRangeError: If the frame numbers are not contiguous.
+        """
+
+        frm_idx = np.asarray(frm_idx)
+        if (len(frm_idx) > 0) and (
+            not np.array_equal(
+                frm_idx, np.arange(frm_idx[0], frm_idx[0] + len(frm_idx))
+            )
+        ):
+            raise FrameRangeError(
+                msg=f"The frame numbers of the chunk have to be contiguous. Got {len(frm_idx)} rows for frames {frm_idx[0]}-{frm_idx[-1]}.",
+                source=source,
+            )
+
     def resize_gantt(self, gantt_img: np.array, img_height: int) -> np.ndarray:
         """
         Helper to resize image while retaining aspect ratio.
@@ -996,6 +1019,9 @@ class PlottingMixin(object):
         fourcc = cv2.VideoWriter_fourcc(*Formats.MP4_CODEC.value)
         group_cnt = int(data.iloc[0]["group"])
         start_frm, current_frm, end_frm = data.index[0], data.index[0], data.index[-1]
+        PlottingMixin.check_chunk_frame_index(
+            frm_idx=data.index, source=PlottingMixin.directing_animals_mp.__name__
+        )
         save_path = os.path.join(save_temp_dir, "{}.mp4".format(str(group_cnt)))
         _, video_name, _ = get_fn_ext(filepath=video_path)
         writer = cv2.VideoWriter(
@@ -1007,6 +1033,19 @@ class PlottingMixin(object):
         cap = cv2.VideoCapture(video_path)
         cap.set(1, start_frm)
         color = colors[0]
+        pose_data = {}
+        for animal_name, animal_bps in bp_names.items():
+            bp_cols = []
+            for x_bp, y_bp in zip(animal_bps["X_bps"], animal_bps["Y_bps"]):
+                bp_cols.extend([x_bp, y_bp])
+            pose_data[animal_name] = data[bp_cols].values.reshape(len(data), -1, 2)
+        chunk_directionality_data = directionality_data[
+            directionality_data["Frame_#"].between(start_frm, end_frm)
+        ]
+        frame_directionality_data = {
+            frm: frm_data
+            for frm, frm_data in chunk_directionality_data.groupby("Frame_#")
+        }
 
         def __draw_individual_lines(animal_img_data: pd.DataFrame, img: np.array):
             color = colors[0]
@@ -1043,12 +1082,10 @@ class PlottingMixin(object):
             try:
                 if ret:
                     if style_attr["Show_pose"]:
-                        bp_data = data.loc[current_frm]
-                        for cnt, (animal_name, animal_bps) in enumerate(
-                            bp_names.items()
-                        ):
-                            for bp in zip(animal_bps["X_bps"], animal_bps["Y_bps"]):
-                                x_bp, y_bp = bp_data[bp[0]], bp_data[bp[1]]
+                        for cnt, animal_name in enumerate(bp_names.keys()):
+                            for x_bp, y_bp in pose_data[animal_name][
+                                current_frm - start_frm
+                            ]:
                                 cv2.circle(
                                     img,
                                     (int(x_bp), int(y_bp)),
@@ -1057,10 +1094,8 @@ class PlottingMixin(object):
                                     style_attr["Direction_thickness"],
                                 )
 
-                    if current_frm in list(directionality_data["Frame_#"].unique()):
-                        img_data = directionality_data[
-                            directionality_data["Frame_#"] == current_frm
-                        ]
+                    if current_frm in frame_directionality_data.keys():
+                        img_data = frame_directionality_data[current_frm]
                         unique_animals = img_data["Animal_1"].unique()
                         for animal in unique_animals:
                             animal_img_data = img_data[
@@ -1330,6 +1365,9 @@ class PlottingMixin(object):
         fourcc = cv2.VideoWriter_fourcc(*Formats.MP4_CODEC.value)
         group_cnt = int(data["group"].values[0])
         start_frm, current_frm, end_frm = data.index[0], data.index[0], data.index[-1]
+        PlottingMixin.check_chunk_frame_index(
+            frm_idx=data.index, source=PlottingMixin.roi_plotter_mp.__name__
+        )
         save_path = os.path.join(save_temp_directory, "{}.mp4".format(str(group_cnt)))
         writer = cv2.VideoWriter(
             save_path,
@@ -1339,9 +1377,20 @@ class PlottingMixin(object):
         )
         cap = cv2.VideoCapture(input_video_path)
         cap.set(1, start_frm)
+        bp_data, timer_data, entries_data = {}, {}, {}
+        for animal_name in animal_ids:
+            bp_data[animal_name] = data[body_part_dict[animal_name]].values
+            for shape_name in video_shape_names:
+                timer_data[(animal_name, shape_name)] = data[
+                    "{}_{}_cum_sum_time".format(animal_name, shape_name)
+                ].values
+                entries_data[(animal_name, shape_name)] = data[
+                    "{}_{}_cum_sum_entries".format(animal_name, shape_name)
+                ].values
 
         while current_frm < end_frm:
             ret, img = cap.read()
+            frm_idx = current_frm - start_frm
             border_img = cv2.copyMakeBorder(
                 img,
                 0,
@@ -1395,12 +1444,12 @@ class PlottingMixin(object):
 
             for animal_cnt, animal_name in enumerate(animal_ids):
                 if style_attr["Show_body_part"] or style_attr["Show_animal_name"]:
-                    bp_data = data.loc[current_frm, body_part_dict[animal_name]].values
-                    if threshold < bp_data[2]:
+                    animal_bp_data = bp_data[animal_name][frm_idx]
+                    if threshold < animal_bp_data[2]:
                         if style_attr["Show_body_part"]:
                             cv2.circle(
                                 border_img,
-                                (int(bp_data[0]), int(bp_data[1])),
+                                (int(animal_bp_data[0]), int(animal_bp_data[1])),
                                 scalers["circle_size"],
                                 colors[animal_cnt],
                                 -1,
@@ -1409,7 +1458,7 @@ class PlottingMixin(object):
                             cv2.putText(
                                 border_img,
                                 animal_name,
-                                (int(bp_data[0]), int(bp_data[1])),
+                                (int(animal_bp_data[0]), int(animal_bp_data[1])),
                                 font,
                                 scalers["font_size"],
                                 colors[animal_cnt],
@@ -1417,17 +1466,8 @@ class PlottingMixin(object):
                             )
 
                 for shape_name in video_shape_names:
-                    timer = round(
-                        data.loc[
-                            current_frm,
-                            "{}_{}_cum_sum_time".format(animal_name, shape_name),
-                        ],
-                        2,
-                    )
-                    entries = data.loc[
-                        current_frm,
-                        "{}_{}_cum_sum_entries".format(animal_name, shape_name),
-                    ]
+                    timer = round(timer_data[(animal_name, shape_name)][frm_idx], 2)
+                    entries = entries_data[(animal_name, shape_name)][frm_idx]
                     cv2.putText(
                         border_img,
                         str(timer),
@@ -1517,6 +1557,9 @@ class PlottingMixin(object):
         cap = cv2.VideoCapture(video_path)
         group = data["group"].iloc[0]
         start_frm, current_frm, end_frm = data.index[0], data.index[0], data.index[-1]
+        PlottingMixin.check_chunk_frame_index(
+            frm_idx=data.index, source=PlottingMixin.validation_video_mp.__name__
+        )
         video_save_path = os.path.join(video_save_dir, "{}.mp4".format(str(group)))
         if gantt_setting is not None:
             writer = cv2.VideoWriter(
@@ -1537,21 +1580,24 @@ class PlottingMixin(object):
             )
 
         cap.set(1, start_frm)
+        clf_cumsum = np.concatenate(([0], np.cumsum(clf_data)))
+        pose_data = {}
+        for animal_name, animal_data in bp_dict.items():
+            bp_cols = []
+            for x_header, y_header in zip(animal_data["X_bps"], animal_data["Y_bps"]):
+                bp_cols.extend([x_header, y_header])
+            pose_data[animal_name] = data[bp_cols].values.reshape(len(data), -1, 2)
         while current_frm < end_frm:
-            clf_frm_cnt = np.sum(clf_data[0:current_frm])
+            clf_frm_cnt = clf_cumsum[current_frm]
             ret, img = cap.read()
+            frm_idx = current_frm - start_frm
             if settings["pose"]:
                 for animal_cnt, (animal_name, animal_data) in enumerate(
                     bp_dict.items()
                 ):
-                    for bp_cnt, bp in enumerate(range(len(animal_data["X_bps"]))):
-                        x_header, y_header = (
-                            animal_data["X_bps"][bp],
-                            animal_data["Y_bps"][bp],
-                        )
-                        animal_cords = tuple(
-                            data.loc[current_frm, [x_header, y_header]]
-                        )
+                    for bp_cnt, animal_cords in enumerate(
+                        pose_data[animal_name][frm_idx]
+                    ):
                         cv2.circle(
                             img,
                             (int(animal_cords[0]), int(animal_cords[1])),
@@ -1563,11 +1609,7 @@ class PlottingMixin(object):
                 for animal_cnt, (animal_name, animal_data) in enumerate(
                     bp_dict.items()
                 ):
-                    x_header, y_header = (
-                        animal_data["X_bps"][0],
-                        animal_data["Y_bps"][0],
-                    )
-                    animal_cords = tuple(data.loc[current_frm, [x_header, y_header]])
+                    animal_cords = pose_data[animal_name][frm_idx][0]
                     cv2.putText(
                         img,
                         animal_name,
@@ -1,11 +1,12 @@
 __author__ = "Simon Nilsson"
 
+import functools
 import itertools
 import os
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import cv2
 import h5py
@@ -14,10 +15,14 @@ import pandas as pd
 import scipy.io as sio
 from numba import jit, prange
 
-from simba.utils.enums import ConfigKey
-from simba.utils.errors import (CountError, IntegerError, InvalidInputError,
-                                NoDataError, NoFilesFoundError)
-from simba.utils.read_write import get_fn_ext
+from simba.data_processors.interpolation_smoothing import (Interpolate, Smooth,
+                                                           find_smoothing_fps)
+from simba.utils.enums import ConfigKey, Methods
+from simba.utils.errors import (BodypartColumnNotFoundError, CountError,
+                                IntegerError, InvalidInputError, NoDataError,
+                                NoFilesFoundError)
+from simba.utils.printing import SimbaTimer
+from simba.utils.read_write import get_fn_ext, run_file_tasks, write_df
 from simba.utils.warnings import FrameRangeWarning
 
 
@@ -503,6 +508,133 @@ class PoseImporterMixin(object):
             self.config.write(f)
         f.close()
 
+    @staticmethod
+    def _import_pose_file(
+        file_path: Union[str, os.PathLike],
+        read_func: Callable,
+        save_paths: Dict[str, str],
+        file_type: str,
+        bp_headers: List[str],
+        animal_bp_dict: Dict[str, Any],
+        interpolation_settings: str,
+        smoothing_settings: Dict[str, Any],
+        fps: Dict[str, float],
+    ) -> str:
+        """
+        Helper to import a single pose-estimation data file without user interaction. The data is read, interpolated and
+        smoothed in memory, and written once. Called by
+        :meth:`simba.mixins.pose_importer_mixin.PoseImporterMixin.run_parallel_import` through
+        :func:`simba.utils.read_write.run_file_tasks`.
+
+        :return str: The path of the imported file.
+        """
+
+        video_timer = SimbaTimer(start=True)
+        save_path = save_paths[file_path]
+        _, video_name, _ = get_fn_ext(filepath=save_path)
+        print(f"Importing {video_name}...")
+        df = read_func(file_path)
+        if len(df.columns) != len(bp_headers):
+            raise BodypartColumnNotFoundError(
+                msg=f"The number of body-parts in data file {file_path} do not match the number of body-parts in your SimBA project. "
+                f"The number of of body-parts expected by your SimBA project is {int(len(bp_headers) / 3)}. "
+                f"The number of of body-parts contained in data file {file_path} is {int(len(df.columns) / 3)}. "
+                f"Make sure you have specified the correct number of animals and body-parts in your project.",
+                source=PoseImporterMixin.__name__,
+            )
+        df.columns = bp_headers
+        # cast to float32 between stages, as read_df does when the stages are run one after the other
+        df = df.fillna(0).astype(np.float32)
+        if interpolation_settings != "None":
+            interpolation_type, interpolation_method = (
+                interpolation_settings.split(":")[0],
+                interpolation_settings.split(":")[1].replace(" ", "").lower(),
+            )
+            if interpolation_type == "Animal(s)":
+                df = Interpolate.interpolate_animals(
+                    df=df,
+                    video_name=video_name,
+                    animal_bp_dict=animal_bp_dict,
+                    interpolation_method=interpolation_method,
+                )
+            elif interpolation_type == "Body-parts":
+                df = Interpolate.interpolate_body_parts(
+                    df=df,
+                    video_name=video_name,
+                    animal_bp_dict=animal_bp_dict,
+                    interpolation_method=interpolation_method,
+                )
+            df = df.astype(np.float32)
+        time_window = smoothing_settings.get("Parameters", {}).get("Time_window")
+        if smoothing_settings["Method"] == Methods.SAVITZKY_GOLAY.value:
+            df = Smooth.savgol_smooth(
+                df=df, fps=fps[video_name], time_window=int(time_window)
+            )
+        elif smoothing_settings["Method"] == Methods.GAUSSIAN.value:
+            df = Smooth.gaussian_smooth(
+                df=df, fps=fps[video_name], time_window=int(time_window)
+            )
+        df.columns = pd.MultiIndex.from_tuples(
+            [("IMPORTED_POSE", "IMPORTED_POSE", x) for x in df.columns],
+            names=("scorer", "bodypart", "coords"),
+        )
+        write_df(df=df, file_type=file_type, save_path=save_path, multi_idx_header=True)
+        video_timer.stop_timer()
+        print(
+            f"Video {video_name} data imported (elapsed time: {video_timer.elapsed_time_str}s)..."
+        )
+        return save_path
+
+    def run_parallel_import(
+        self,
+        read_func: Callable,
+        output_names: Dict[str, str],
+        core_cnt: int = -1,
+    ) -> None:
+        """
+        Import the pose-estimation data files in ``self.data_and_videos_lk`` without user interaction, in parallel with
+        one file per worker. Reading, interpolation and smoothing of each file run in the worker.
+
+        .. note::
+           The animal identification interface of the sequential import is not opened. In multi-animal projects, the
+           animal identities follow the track order in the pose-estimation data files, i.e., the first track is
+           assigned to the first animal name in the project, the second track to the second animal name, etc. Files
+           that fail to import are skipped with a ``SkippingFileWarning``.
+
+        :param Callable read_func: Picklable function (e.g., static method or ``functools.partial`` of one) that accepts the path to a data file and returns the pose-estimation data as a dataframe with one x, y and p column per body-part in the order of the SimBA project body-parts.
+        :param Dict[str, str] output_names: The file name, without extension, of the imported file of each video in ``self.data_and_videos_lk``.
+        :param int core_cnt: Number of files to import in parallel. If -1, then all available cores. Default: -1.
+        """
+
+        save_paths = {}
+        for video_name, video_data in self.data_and_videos_lk.items():
+            save_paths[video_data["DATA"]] = os.path.join(
+                self.input_csv_dir, f"{output_names[video_name]}.{self.file_type}"
+            )
+        fps = {}
+        if self.smoothing_settings["Method"] != "None":
+            fps = find_smoothing_fps(
+                config_reader=self,
+                file_paths=list(save_paths.values()),
+                smoothing_method=self.smoothing_settings["Method"],
+            )
+        run_file_tasks(
+            func=functools.partial(
+                self._import_pose_file,
+                read_func=read_func,
+                save_paths=save_paths,
+                file_type=self.file_type,
+                bp_headers=self.bp_headers,
+                animal_bp_dict=self.animal_bp_dict,
+                interpolation_settings=self.interpolation_settings,
+                smoothing_settings=self.smoothing_settings,
+                fps=fps,
+            ),
+            file_paths=list(save_paths.keys()),
+            core_cnt=core_cnt,
+            source=self.__class__.__name__,
+        )
+
     @staticmethod
     @jit(nopython=True)
     def transpose_multi_animal_table(
@@ -26,6 +26,187 @@ from simba.utils.checks import (check_instance, check_int, check_str,
 from simba.utils.read_write import find_core_cnt
 
 
+@njit("(float64[:], int64)", cache=True)
+def _sliding_sum(data: np.ndarray, window_size: int) -> np.ndarray:
+    """
+    O(n) running sum of ``data`` in windows of ``window_size`` ending at each index. The sum is re-computed
+    from scratch every ``window_size`` steps to bound floating-point drift, and windows holding non-finite values
+    are summed directly so that NaN / inf only propagate to the windows that contain them.
+    """
+
+    n = data.shape[0]
+    results = np.full(n, np.nan)
+    if (window_size < 1) or (window_size > n):
+        return results
+    bad_cnt, total = 0, 0.0
+    for k in range(window_size):
+        if not np.isfinite(data[k]):
+            bad_cnt += 1
+    anchor = window_size - 1
+    for r in range(window_size - 1, n):
+        l = r - window_size + 1
+        if r > window_size - 1:
+            if not np.isfinite(data[r]):
+                bad_cnt += 1
+            if not np.isfinite(data[l - 1]):
+                bad_cnt -= 1
+                anchor = r
+        if (bad_cnt > 0) or (r == anchor) or (r - anchor >= window_size):
+            total = np.sum(data[l : r + 1])
+            if bad_cnt == 0:
+                anchor = r
+        else:
+            total += data[r] - data[l - 1]
+        results[r] = total
+    return results
+
+
+@njit("(float64[:], int64)", cache=True)
+def _sliding_mean_var(data: np.ndarray, window_size: int) -> (np.ndarray, np.ndarray):
+    """
+    O(n) sliding mean and population variance using Welford's update for adding and removing one observation.
+    The moments are re-computed with two passes every ``window_size`` steps to bound drift, and windows holding
+    non-finite values are computed directly.
+    """
+
+    n = data.shape[0]
+    means, variances = np.full(n, np.nan), np.full(n, np.nan)
+    if (window_size < 1) or (window_size > n):
+        return means, variances
+    bad_cnt, mean, m2 = 0, 0.0, 0.0
+    for k in range(window_size):
+        if not np.isfinite(data[k]):
+            bad_cnt += 1
+    anchor = window_size - 1
+    for r in range(window_size - 1, n):
+        l = r - window_size + 1
+        if r > window_size - 1:
+            if not np.isfinite(data[r]):
+                bad_cnt += 1
+            if not np.isfinite(data[l - 1]):
+                bad_cnt -= 1
+                anchor = r
+        if (bad_cnt > 0) or (r == anchor) or (r - anchor >= window_size):
+            sample = data[l : r + 1]
+            mean = np.mean(sample)
+            m2 = np.sum((sample - mean) ** 2)
+            means[r], variances[r] = mean, np.var(sample)
+            if bad_cnt == 0:
+                anchor = r
+            continue
+        x_in, x_out = data[r], data[l - 1]
+        prior_mean = mean
+        mean += (x_in - x_out) / window_size
+        m2 += (x_in - x_out) * (x_in - mean + x_out - prior_mean)
+        if m2 < 0:
+            m2 = 0.0
+        means[r], variances[r] = mean, m2 / window_size
+    return means, variances
+
+
+@njit("(float64[:], int64, boolean)", cache=True)
+def _sliding_min_max(data: np.ndarray, window_size: int, maximum: bool) -> np.ndarray:
+    """
+    O(n) sliding minimum or maximum using a monotonic deque of indexes, held in a ring buffer of ``window_size``.
+    Windows holding NaN are set to NaN.
+    """
+
+    n = data.shape[0]
+    results = np.full(n, np.nan)
+    if (window_size < 1) or (window_size > n):
+        return results
+    deque = np.empty(window_size, dtype=np.int64)
+    head, size, nan_cnt = 0, 0, 0
+    for r in range(n):
+        l = r - window_size + 1
+        if l > 0 and np.isnan(data[l - 1]):
+            nan_cnt -= 1
+        while size > 0 and deque[head] < l:
+            head = (head + 1) % window_size
+            size -= 1
+        if np.isnan(data[r]):
+            nan_cnt += 1
+        else:
+            while size > 0:
+                tail = deque[(head + size - 1) % window_size]
+                if (maximum and data[tail] <= data[r]) or (
+                    not maximum and data[tail] >= data[r]
+                ):
+                    size -= 1
+                else:
+                    break
+            deque[(head + size) % window_size] = r
+            size += 1
+        if (r >= window_size - 1) and (nan_cnt == 0):
+            results[r] = data[deque[head]]
+    return results
+
+
+@njit("(float64[:], int64, boolean)", cache=True)
+def _sliding_median(
+    data: np.ndarray, window_size: int, mad: bool
+) -> (np.ndarray, np.ndarray):
+    """
+    Sliding median, and optionally median absolute deviation, using a sorted window buffer. Each step inserts and
+    removes one observation through binary search and a contiguous shift, instead of sorting every window. The
+    median absolute deviation is found in O(window_size) by merging the deviations on each side of the median,
+    which are already ordered. Windows holding NaN are set to NaN.
+    """
+
+    n = data.shape[0]
+    medians, mads = np.full(n, np.nan), np.full(n, np.nan)
+    if (window_size < 1) or (window_size > n):
+        return medians, mads
+    buffer = np.empty(window_size, dtype=np.float64)
+    size, nan_cnt = 0, 0
+    for r in range(n):
+        l = r - window_size
+        if l >= 0:
+            if np.isnan(data[l]):
+                nan_cnt -= 1
+            else:
+                idx = np.searchsorted(buffer[:size], data[l])
+                for k in range(idx, size - 1):
+                    buffer[k] = buffer[k + 1]
+                size -= 1
+        if np.isnan(data[r]):
+            nan_cnt += 1
+        else:
+            idx = np.searchsorted(buffer[:size], data[r])
+            for k in range(size, idx, -1):
+                buffer[k] = buffer[k - 1]
+            buffer[idx] = data[r]
+            size += 1
+        if (r < window_size - 1) or (nan_cnt > 0):
+            continue
+        half = size // 2
+        if size % 2 == 1:
+            median = buffer[half]
+        else:
+            median = (buffer[half - 1] + buffer[half]) / 2.0
+        medians[r] = median
+        if not mad:
+            continue
+        right = np.searchsorted(buffer[:size], median)
+        left = right - 1
+        prior, current = 0.0, 0.0
+        for k in range(half + 1):
+            if (left >= 0) and (
+                (right >= size) or (median - buffer[left] <= buffer[right] - median)
+            ):
+                value = median - buffer[left]
+                left -= 1
+            else:
+                value = buffer[right] - median
+                right += 1
+            prior, current = current, value
+        if size % 2 == 1:
+            mads[r] = current
+        else:
+            mads[r] = (prior + current) / 2.0
+    return medians, mads
+
+
 class TimeseriesFeatureMixin(object):
     """
     Time-series methods focused on signal complexity in sliding windows. Mainly in time-domain - fft methods (through e.g. scipy)
@@ -382,19 +563,20 @@ class TimeseriesFeatureMixin(object):
         :param np.ndarray window_sizes: An array of window sizes (in seconds) to use for the sliding calculation.
         :param int sample_rate: The sampling rate (samples per second) of the time series data.
         :return np.ndarray: A 2D array containing the percentage of data points beyond the specified 'n' standard deviations for each window size.
+
+        .. note::
+           Computed in O(n) per window size through a running count of the data points beyond the threshold.
         """
 
         results = np.full((data.shape[0], window_sizes.shape[0]), -1.0)
         target = (np.std(data) * n) + np.mean(data)
-        for i in prange(window_sizes.shape[0]):
+        beyond = (np.abs(data) > target).astype(np.float64)
+        for i in range(window_sizes.shape[0]):
             window_size = int(window_sizes[i] * sample_rate)
-            for l, r in zip(
-                prange(0, data.shape[0] + 1), prange(window_size, data.shape[0] + 1)
-            ):
-                sample = data[l:r]
-                results[r - 1, i] = (
-                    np.argwhere(np.abs(sample) > target).shape[0] / sample.shape[0]
-                )
+            if (window_size < 1) or (window_size > data.shape[0]):
+                continue
+            beyond_cnt = _sliding_sum(beyond, window_size)
+            results[window_size - 1 :, i] = beyond_cnt[window_size - 1 :] / window_size
 
         return results.astype(np.float32)
 
@@ -742,6 +924,9 @@ class TimeseriesFeatureMixin(object):
         :param sample_rate: The sampling rate (samples per second) of the time series data.
         :return np.ndarray: A 2D array containing line length values for each window size at each position in the time series.
 
+        .. note::
+           Computed in O(n) per window size as a running sum of the absolute differences between consecutive elements.
+
         .. image:: _static/img/sliding_line_length.png
            :width: 600
            :align: center
@@ -752,13 +937,17 @@ class TimeseriesFeatureMixin(object):
         """
 
         results = np.full((data.shape[0], window_sizes.shape[0]), -1.0)
-        for i in prange(window_sizes.shape[0]):
+        diffs = np.zeros(data.shape[0])
+        diffs[1:] = np.abs(np.diff(data.astype(np.float64)))
+        for i in range(window_sizes.shape[0]):
             window_size = int(window_sizes[i] * sample_rate)
-            for l, r in zip(
-                prange(0, data.shape[0] + 1), prange(window_size, data.shape[0] + 1)
-            ):
-                sample = data[l:r]
-                results[r - 1, i] = np.sum(np.abs(np.diff(sample.astype(np.float64))))
+            if (window_size < 1) or (window_size > data.shape[0]):
+                continue
+            elif window_size == 1:
+                results[:, i] = 0.0
+            else:
+                line_lengths = _sliding_sum(diffs, window_size - 1)
+                results[window_size - 1 :, i] = line_lengths[window_size - 1 :]
         return results.astype(np.float32)
 
     @staticmethod
@@ -779,6 +968,9 @@ class TimeseriesFeatureMixin(object):
         :param sample_rate: Sampling rate of the data in samples per second.
         :return: Variance values for each window size and data point. The shape of the result array is (data.shape[0], window_sizes.shape[0]).
 
+        .. note::
+           Computed in O(n) per window size using Welford's update for adding and removing one observation per step.
+
         :example:
         >>> data = np.array([1, 2, 3, 1, 2, 9, 17, 2, 10, 4]).astype(np.float32)
         >>> TimeseriesFeatureMixin().sliding_variance(data=data, window_sizes=np.array([0.5]), sample_rate=10)
@@ -786,13 +978,13 @@ class TimeseriesFeatureMixin(object):
         """
 
         results = np.full((data.shape[0], window_sizes.shape[0]), -1.0)
-        for i in prange(window_sizes.shape[0]):
+        x = data.astype(np.float64)
+        for i in range(window_sizes.shape[0]):
             window_size = int(window_sizes[i] * sample_rate)
-            for l, r in zip(
-                prange(0, data.shape[0] + 1), prange(window_size, data.shape[0] + 1)
-            ):
-                sample = data[l:r]
-                results[r - 1, i] = np.var(sample)
+            if (window_size < 1) or (window_size > data.shape[0]):
+                continue
+            variances = _sliding_mean_var(x, window_size)[1]
+            results[window_size - 1 :, i] = variances[window_size - 1 :]
 
         return results.astype(np.float32)
 
@@ -839,6 +1031,8 @@ class TimeseriesFeatureMixin(object):
            'rms' (root mean square), 'absenergy' (absolute energy).
            - If the statistics list is ['var', 'max', 'mean'], the
            3rd dimension order in the result array will be: [variance, maximum, mean]
+           - Each statistic is computed incrementally rather than from each full window: running sums for 'sum', 'mean', 'mac', 'rms' and
+           'absenergy', Welford's update for 'var' and 'std', a monotonic deque for 'max' and 'min', and a sorted window for 'median' and 'mad'.
 
         :example:
         >>> data = np.array([1, 4, 2, 3, 5, 6, 8, 7, 9, 10]).astype(np.float32)
@@ -846,37 +1040,44 @@ class TimeseriesFeatureMixin(object):
         """
 
         results = np.full((len(statistics), data.shape[0], window_sizes.shape[0]), -1.0)
-        for j in prange(len(statistics)):
-            for i in prange(window_sizes.shape[0]):
-                window_size = int(window_sizes[i] * sample_rate)
-                for l, r in zip(
-                    prange(0, data.shape[0] + 1), prange(window_size, data.shape[0] + 1)
-                ):
-                    sample = data[l:r]
-                    if statistics[j] == "var":
-                        results[j, r - 1, i] = np.var(sample)
-                    elif statistics[j] == "max":
-                        results[j, r - 1, i] = np.max(sample)
-                    elif statistics[j] == "min":
-                        results[j, r - 1, i] = np.min(sample)
-                    elif statistics[j] == "std":
-                        results[j, r - 1, i] = np.std(sample)
-                    elif statistics[j] == "median":
-                        results[j, r - 1, i] = np.median(sample)
-                    elif statistics[j] == "mean":
-                        results[j, r - 1, i] = np.mean(sample)
-                    elif statistics[j] == "mad":
-                        results[j, r - 1, i] = np.median(
-                            np.abs(sample - np.median(sample))
+        x = data.astype(np.float64)
+        diffs = np.zeros(x.shape[0])
+        diffs[1:] = np.abs(np.diff(x))
+        for i in range(window_sizes.shape[0]):
+            window_size = int(window_sizes[i] * sample_rate)
+            if (window_size < 1) or (window_size > data.shape[0]):
+                continue
+            for j in range(len(statistics)):
+                if statistics[j] == "var":
+                    values = _sliding_mean_var(x, window_size)[1]
+                elif statistics[j] == "max":
+                    values = _sliding_min_max(x, window_size, True)
+                elif statistics[j] == "min":
+                    values = _sliding_min_max(x, window_size, False)
+                elif statistics[j] == "std":
+                    values = np.sqrt(_sliding_mean_var(x, window_size)[1])
+                elif statistics[j] == "median":
+                    values = _sliding_median(x, window_size, False)[0]
+                elif statistics[j] == "mean":
+                    values = _sliding_mean_var(x, window_size)[0]
+                elif statistics[j] == "mad":
+                    values = _sliding_median(x, window_size, True)[1]
+                elif statistics[j] == "sum":
+                    values = _sliding_sum(x, window_size)
+                elif statistics[j] == "mac":
+                    if window_size == 1:
+                        values = np.full(x.shape[0], np.nan)
+                    else:
+                        values = _sliding_sum(diffs, window_size - 1) / (
+                            window_size - 1
                         )
-                    elif statistics[j] == "sum":
-                        results[j, r - 1, i] = np.sum(sample)
-                    elif statistics[j] == "mac":
-                        results[j, r - 1, i] = np.mean(np.abs(sample[1:] - sample[:-1]))
-                    elif statistics[j] == "rms":
-                        results[j, r - 1, i] = np.sqrt(np.mean(sample**2))
-                    elif statistics[j] == "absenergy":
-                        results[j, r - 1, i] = np.sqrt(np.sum(sample**2))
+                elif statistics[j] == "rms":
+                    values = np.sqrt(_sliding_sum(x**2, window_size) / window_size)
+                elif statistics[j] == "absenergy":
+                    values = np.sqrt(_sliding_sum(x**2, window_size))
+                else:
+                    continue
+                results[j, window_size - 1 :, i] = values[window_size - 1 :]
 
         return results.astype(np.float32)
 
@@ -52,6 +52,7 @@ try:
 except:
     from typing_extensions import Literal
 
+from simba.model.model_cache import read_cached_model
 from simba.plotting.shap_agg_stats_visualizer import \
     ShapAggregateStatisticsVisualizer
 from simba.ui.tkinter_functions import TwoOptionQuestionPopUp
@@ -60,7 +61,7 @@ from simba.utils.checks import (check_float, check_if_dir_exists,
                                 check_int, check_str, check_that_column_exist)
 from simba.utils.data import (create_color_palette, detect_bouts,
                               detect_bouts_multiclass)
-from simba.utils.enums import (ConfigKey, Defaults, Dtypes, Methods,
+from simba.utils.enums import (ConfigKey, Defaults, Dtypes, Formats, Methods,
                                MLParamKeys, Options)
 from simba.utils.errors import (ClassifierInferenceError, ColumnNotFoundError,
                                 CorruptedFileError, DataHeaderError,
@@ -70,7 +71,8 @@ from simba.utils.errors import (ClassifierInferenceError, ColumnNotFoundError,
                                 SamplingError)
 from simba.utils.lookups import get_meta_data_file_headers
 from simba.utils.printing import SimbaTimer, stdout_success
-from simba.utils.read_write import (find_core_cnt, get_fn_ext,
+from simba.utils.read_write import (find_core_cnt, get_data_file_headers,
+                                    get_data_file_row_count, get_fn_ext,
                                     get_memory_usage_of_df, read_config_entry,
                                     read_df, read_meta_file, str_2_bool)
 from simba.utils.warnings import (MissingUserInputWarning,
@@ -101,6 +103,9 @@ class TrainModelMixin(object):
         .. note::
            For improved runtime through pyarrow, use :meth:`simba.mixins.train_model_mixin.read_all_files_in_folder_mp`
 
+           The row counts and column names of all files are read up-front, and each file is written in-place into a
+           single pre-allocated float32 array. Columns missing in a file are filled with zeros.
+
         :parameter List[str] file_paths: List of file paths representing files to be read in.
         :parameter str file_type: List of file paths representing files to be read in.
         :parameter str or None classifier_names: List of classifier names representing fields of human annotations. If not None, then assert that classifier names
@@ -113,19 +118,44 @@ class TrainModelMixin(object):
         """
 
         timer = SimbaTimer(start=True)
-        frm_number_lst = []
-        df_concat = pd.DataFrame()
+        frm_number_lst, column_idx, row_cnt = [], {}, 0
+        file_columns, pickled_dfs = {}, {}
+        for file in file_paths:
+            if file_type == Formats.PICKLE.value:
+                pickled_dfs[file] = read_df(file, file_type)
+                row_cnt += len(pickled_dfs[file])
+                headers = list(pickled_dfs[file].columns)
+            else:
+                row_cnt += get_data_file_row_count(file_path=file, file_type=file_type)
+                headers = get_data_file_headers(file_path=file, file_type=file_type)
+            file_columns[file] = [
+                x for x in headers if (x != "scorer") and (not x.startswith("Unnamed"))
+            ]
+            for column in file_columns[file]:
+                if column not in column_idx:
+                    column_idx[column] = len(column_idx)
+        columns = list(column_idx.keys())
+        data = np.zeros((row_cnt, len(columns)), dtype=np.float32)
+        video_names = np.empty(row_cnt, dtype=object)
+        row_idx = 0
         for file_cnt, file in enumerate(file_paths):
             print(f"Reading in file {str(file_cnt + 1)}/{str(len(file_paths))}...")
             _, vid_name, _ = get_fn_ext(file)
-            df = (
-                read_df(file, file_type)
-                .dropna(axis=0, how="all")
-                .fillna(0)
-                .astype(np.float32)
-            )
-            frm_number_lst.extend((df.index))
-            df.index = [vid_name] * len(df)
+            if file in pickled_dfs.keys():
+                df = pickled_dfs.pop(file)
+            else:
+                df = read_df(file, file_type)
+            df = df.dropna(axis=0, how="all").fillna(0).astype(np.float32)
+            data_columns = [
+                x
+                for x in df.columns
+                if (x != "scorer") and (not x.startswith("Unnamed"))
+            ]
+            if set(data_columns) != set(file_columns[file]):
+                raise DataHeaderError(
+                    msg=f"The column names in the header of file {file} do not match the column names of the data read from the file, which can happen if the file has duplicate column names. Make sure that every column name in {file} is unique.",
+                    source=self.__class__.__name__,
+                )
             if classifier_names != None:
                 for clf_name in classifier_names:
                     if not clf_name in df.columns:
@@ -141,22 +171,21 @@ class TrainModelMixin(object):
                             msg=f"The annotation column for a classifier should contain only 0 or 1 values. However, in file {file} the {clf_name} field contains additional value(s): {list(set(df[clf_name].unique()) - {0, 1})}.",
                             source=self.__class__.__name__,
                         )
-                    else:
-                        df_concat = pd.concat([df_concat, df], axis=0)
-            else:
-                df_concat = pd.concat([df_concat, df], axis=0)
-        try:
-            df_concat = df_concat.set_index("scorer")
-        except KeyError:
-            pass
-        if len(df_concat) == 0:
+            df = df[[x for x in df.columns if x in column_idx]]
+            data[row_idx : row_idx + len(df), [column_idx[x] for x in df.columns]] = (
+                df.values
+            )
+            video_names[row_idx : row_idx + len(df)] = vid_name
+            frm_number_lst.extend((df.index))
+            row_idx += len(df)
+        if row_idx == 0:
             raise NoDataError(
                 msg="SimBA found 0 annotated frames in the project_folder/csv/targets_inserted directory",
                 source=self.__class__.__name__,
             )
-        df_concat = df_concat.loc[
-            :, ~df_concat.columns.str.contains("^Unnamed")
-        ].fillna(0)
+        df_concat = pd.DataFrame(
+            data=data[:row_idx], columns=columns, index=video_names[:row_idx]
+        )
         timer.stop_timer()
         memory_size = get_memory_usage_of_df(df=df_concat)
         print(
@@ -168,7 +197,7 @@ class TrainModelMixin(object):
             )
         )
 
-        return df_concat.astype(np.float32), frm_number_lst
+        return df_concat, frm_number_lst
 
     def read_in_all_model_names_to_remove(
         self, config: configparser.ConfigParser, model_cnt: int, clf_name: str
@@ -1187,15 +1216,20 @@ class TrainModelMixin(object):
             data_df.columns = new_headers
             return data_df
 
-    def read_pickle(self, file_path: Union[str, os.PathLike]) -> object:
+    def read_pickle(
+        self, file_path: Union[str, os.PathLike], use_cache: Optional[bool] = False
+    ) -> object:
         """
         Read pickle file
 
         :parameter str file_path: Path to pickle file on disk.
+        :parameter Optional[bool] use_cache: If True, read the file through the process-wide :class:`simba.model.model_cache.ModelCache` so that each model is only un-pickled once per process. Default: False.
         :return dict
 
         """
 
+        if use_cache:
+            return read_cached_model(file_path=file_path)
         try:
             clf = pickle.load(open(file_path, "rb"))
         except pickle.UnpicklingError:
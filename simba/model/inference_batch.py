@@ -1,35 +1,117 @@
 __author__ = "Simon Nilsson"
 
+import functools
+import multiprocessing
 import os
+import platform
 from copy import deepcopy
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 
 from simba.mixins.config_reader import ConfigReader
 from simba.mixins.train_model_mixin import TrainModelMixin
-from simba.utils.checks import \
-    check_all_file_names_are_represented_in_video_log
+from simba.utils.checks import (
+    check_all_file_names_are_represented_in_video_log, check_int)
 from simba.utils.data import plug_holes_shortest_bout
-from simba.utils.enums import TagNames
+from simba.utils.enums import Defaults, TagNames
 from simba.utils.errors import NoFilesFoundError, ParametersFileError
 from simba.utils.printing import SimbaTimer, log_event, stdout_success
-from simba.utils.read_write import get_fn_ext, read_df, write_df
+from simba.utils.read_write import find_core_cnt, get_fn_ext, read_df, write_df
 from simba.utils.warnings import SkippingFileWarning
 
+_WORKER_MODELS = {}
+
+
+def _init_inference_worker(models: Dict[int, Any]) -> None:
+    """
+    Pool initializer called once per worker by :meth:`simba.model.inference_batch.InferenceBatch.run`. The
+    classifiers are handed to each worker once (inherited copy-on-write when processes are forked), and are not
+    re-pickled for every video.
+    """
+
+    global _WORKER_MODELS
+    _WORKER_MODELS = models
+    for clf in _WORKER_MODELS.values():
+        if hasattr(clf, "n_jobs"):
+            clf.n_jobs = 1
+
+
+def _inference_batch_helper(
+    data: List[Union[str, int]],
+    file_type: str,
+    model_dict: Dict[int, Dict[str, Any]],
+    bp_col_names: List[str],
+    save_dir: Union[str, os.PathLike],
+    logs_path: Union[str, os.PathLike],
+    models: Optional[Dict[int, Any]] = None,
+):
+    """
+    Helper to run all classifiers on a single feature file and save the results in ``save_dir``. Called by
+    :meth:`simba.model.inference_batch.InferenceBatch.run`.
+
+    :parameter List[Union[str, int]] data: The path to the feature file and the fps of the video.
+    :return Tuple[str, str]: The name of the video and the elapsed time of the inference.
+    """
+
+    video_timer = SimbaTimer(start=True)
+    file_path, fps = data
+    if models is None:
+        models = _WORKER_MODELS
+    train_model_mixin = TrainModelMixin()
+    _, file_name, _ = get_fn_ext(file_path)
+    print("Analyzing video {}...".format(file_name))
+    file_save_path = os.path.join(save_dir, file_name + "." + file_type)
+    in_df = read_df(file_path, file_type)
+    x_df = ConfigReader.drop_bp_col_names(
+        df=in_df, bp_col_names=bp_col_names, source=_inference_batch_helper.__name__
+    ).astype("float32")
+    train_model_mixin.check_df_dataset_integrity(
+        df=x_df, logs_path=logs_path, file_name=file_name
+    )
+    out_df = deepcopy(in_df)
+    for m, m_hyp in model_dict.items():
+        probability_column = "Probability_" + m_hyp["model_name"]
+        out_df[probability_column] = train_model_mixin.clf_predict_proba(
+            clf=models[m],
+            x_df=x_df,
+            data_path=file_path,
+            model_name=m_hyp["model_name"],
+        )
+        out_df[m_hyp["model_name"]] = np.where(
+            out_df[probability_column] > m_hyp["threshold"], 1, 0
+        )
+        out_df = plug_holes_shortest_bout(
+            data_df=out_df,
+            clf_name=m_hyp["model_name"],
+            fps=fps,
+            shortest_bout=m_hyp["minimum_bout_length"],
+        )
+    write_df(out_df, file_type, file_save_path)
+    video_timer.stop_timer()
+    return file_name, video_timer.elapsed_time_str
+
 
 class InferenceBatch(TrainModelMixin, ConfigReader):
     """
     Run classifier inference on all files with the ``project_folder/csv/features_extracted`` directory.
     Results are stored in the ``project_folder/csv/machine_results`` directory of the SimBA project.
 
+    .. note::
+       If ``core_cnt`` > 1, videos are analyzed in parallel with one video per worker. Each classifier is read once
+       and shared with the workers at pool start-up, and each worker holds the data of a single video at any time, so
+       peak memory is bounded by ``core_cnt`` times the size of the largest feature file.
+
     :param str config_path: path to SimBA project config file in Configparser format
+    :param Optional[int] core_cnt: Number of videos to analyze in parallel. If -1, then all available cores. Default: 1.
 
     Example
     ----------
     >>> _ = InferenceBatch(config_path='MyConfigPath').run()
+    >>> _ = InferenceBatch(config_path='MyConfigPath', core_cnt=-1).run()
     """
 
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, core_cnt: Optional[int] = 1):
 
         ConfigReader.__init__(self, config_path=config_path)
         TrainModelMixin.__init__(self)
@@ -43,6 +125,14 @@ class InferenceBatch(TrainModelMixin, ConfigReader):
                 "Zero files found in the project_folder/csv/features_extracted directory. Create features before running classifier.",
                 source=self.__class__.__name__,
             )
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
+        )
+        self.core_cnt = find_core_cnt()[0] if int(core_cnt) == -1 else int(core_cnt)
+        self.core_cnt = max(1, min(self.core_cnt, len(self.feature_file_paths)))
         print(
             f"Analyzing {len(self.feature_file_paths)} file(s) with {self.clf_cnt} classifier(s)"
         )
@@ -55,50 +145,52 @@ class InferenceBatch(TrainModelMixin, ConfigReader):
         check_all_file_names_are_represented_in_video_log(
             video_info_df=self.video_info_df, data_paths=self.feature_file_paths
         )
-        for file_cnt, file_path in enumerate(self.feature_file_paths):
-            video_timer = SimbaTimer(start=True)
-            _, file_name, _ = get_fn_ext(file_path)
-            print("Analyzing video {}...".format(file_name))
-            file_save_path = os.path.join(
-                self.machine_results_dir, file_name + "." + self.file_type
-            )
-            in_df = read_df(file_path, self.file_type)
-            x_df = self.drop_bp_cords(df=in_df).astype("float32")
-            self.check_df_dataset_integrity(
-                df=x_df, logs_path=self.logs_path, file_name=file_name
-            )
-            _, px_per_mm, fps = self.read_video_info(
-                video_name=file_name, raise_error=False
-            )
-            out_df = deepcopy(in_df)
-            for m, m_hyp in self.model_dict.items():
-                if not os.path.isfile(m_hyp["model_path"]):
-                    raise NoFilesFoundError(
-                        msg=f"{m_hyp['model_path']} is not a VALID model file path",
-                        source=self.__class__.__name__,
-                    )
-                probability_column = "Probability_" + m_hyp["model_name"]
-                clf = self.read_pickle(file_path=m_hyp["model_path"])
-                out_df[probability_column] = self.clf_predict_proba(
-                    clf=clf,
-                    x_df=x_df,
-                    data_path=file_path,
-                    model_name=m_hyp["model_name"],
-                )
-                out_df[m_hyp["model_name"]] = np.where(
-                    out_df[probability_column] > m_hyp["threshold"], 1, 0
+        models = {}
+        for m, m_hyp in self.model_dict.items():
+            if not os.path.isfile(m_hyp["model_path"]):
+                raise NoFilesFoundError(
+                    msg=f"{m_hyp['model_path']} is not a VALID model file path",
+                    source=self.__class__.__name__,
                 )
-                out_df = plug_holes_shortest_bout(
-                    data_df=out_df,
-                    clf_name=m_hyp["model_name"],
-                    fps=fps,
-                    shortest_bout=m_hyp["minimum_bout_length"],
+            models[m] = self.read_pickle(file_path=m_hyp["model_path"], use_cache=True)
+        data = []
+        for file_path in self.feature_file_paths:
+            _, file_name, _ = get_fn_ext(file_path)
+            _, _, fps = self.read_video_info(video_name=file_name, raise_error=False)
+            data.append([file_path, fps])
+        constants = functools.partial(
+            _inference_batch_helper,
+            file_type=self.file_type,
+            model_dict=self.model_dict,
+            bp_col_names=self.bp_col_names,
+            save_dir=self.machine_results_dir,
+            logs_path=self.logs_path,
+        )
+        if self.core_cnt == 1:
+            for file_cnt, video_data in enumerate(data):
+                file_name, elapsed_time = constants(video_data, models=models)
+                print(
+                    f"Predictions created for {file_name} ({file_cnt + 1}/{len(data)}, elapsed time: {elapsed_time}) ..."
                 )
-            write_df(out_df, self.file_type, file_save_path)
-            video_timer.stop_timer()
-            print(
-                f"Predictions created for {file_name} (elapsed time: {video_timer.elapsed_time_str}) ..."
-            )
+        else:
+            if (platform.system() == "Darwin") and (
+                multiprocessing.get_start_method() != "spawn"
+            ):
+                multiprocessing.set_start_method("spawn", force=True)
+            with multiprocessing.Pool(
+                self.core_cnt,
+                initializer=_init_inference_worker,
+                initargs=(models,),
+                maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value,
+            ) as pool:
+                for file_cnt, (file_name, elapsed_time) in enumerate(
+                    pool.imap(constants, data, chunksize=1)
+                ):
+                    print(
+                        f"Predictions created for {file_name} ({file_cnt + 1}/{len(data)}, elapsed time: {elapsed_time}) ..."
+                    )
+            pool.terminate()
+            pool.join()
         self.timer.stop_timer()
         stdout_success(
             msg="Machine predictions complete. Files saved in project_folder/csv/machine_results directory",
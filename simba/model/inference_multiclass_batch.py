@@ -61,7 +61,9 @@ class InferenceMulticlassBatch(TrainModelMixin, ConfigReader):
                         source=self.__class__.__name__,
                     )
                 self._create_p_col_headers(model_info=m_hyp)
-                clf = self.read_pickle(file_path=m_hyp["model_path"])
+                clf = self.read_pickle(
+                    file_path=m_hyp["model_path"], use_cache=True
+                )
                 probability_df = pd.DataFrame(
                     self.clf_predict_proba(
                         clf=clf,
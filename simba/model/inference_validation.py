@@ -58,7 +58,7 @@ class InferenceValidation(ConfigReader, TrainModelMixin):
         data_df = read_df(input_file_path, self.file_type)
         output_df = deepcopy(data_df)
         data_df = self.drop_bp_cords(df=data_df)
-        clf = self.read_pickle(file_path=clf_path)
+        clf = self.read_pickle(file_path=clf_path, use_cache=True)
         probability_col_name = f"Probability_{classifier_name}"
         output_df[probability_col_name] = self.clf_predict_proba(
             clf=clf, x_df=data_df, model_name=classifier_name, data_path=input_file_path
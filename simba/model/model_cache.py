@@ -0,0 +1,147 @@
+__author__ = "Simon Nilsson"
+
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Union
+
+from simba.utils.checks import check_file_exist_and_readable, check_int
+from simba.utils.enums import Defaults
+from simba.utils.errors import CorruptedFileError
+
+
+class ModelCache(object):
+    """
+    Process-wide least-recently-used cache of pickled classifiers.
+
+    Models are keyed by their absolute path, and a cached model is only re-used while the file modification time and
+    size on disk are unchanged. When the summed on-disk size of the cached models exceeds ``max_size_mb``, the least
+    recently used models are evicted. A model larger than ``max_size_mb`` is returned but not cached.
+
+    .. note::
+       Cached models are shared between callers and should be treated as read-only (i.e., used for ``predict_proba``
+       but not re-fitted).
+
+    :param int max_size_mb: Memory budget of the cache in megabytes. Default: ``Defaults.MODEL_CACHE_SIZE_MB``.
+
+    :example:
+    >>> cache = ModelCache(max_size_mb=2000)
+    >>> clf = cache.read(file_path='project_folder/models/generated_models/Attack.sav')
+    >>> clf = cache.read(file_path='project_folder/models/generated_models/Attack.sav') # No disk read
+    >>> cache.clear()
+    """
+
+    def __init__(self, max_size_mb: int = Defaults.MODEL_CACHE_SIZE_MB.value):
+        check_int(
+            name=f"{self.__class__.__name__} max_size_mb",
+            value=max_size_mb,
+            min_value=0,
+        )
+        self.max_size_mb = int(max_size_mb)
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_file_key(file_path: Union[str, os.PathLike]) -> (str, int, int):
+        file_path = os.path.abspath(file_path)
+        file_stat = os.stat(file_path)
+        return file_path, file_stat.st_mtime_ns, file_stat.st_size
+
+    def read(self, file_path: Union[str, os.PathLike]) -> object:
+        """
+        Return the un-pickled model at ``file_path``, reading from disk only if the model is not cached or has been modified.
+
+        :parameter Union[str, os.PathLike] file_path: Path to pickled model.
+        :return object: The un-pickled model.
+        """
+
+        check_file_exist_and_readable(file_path=file_path)
+        file_path, mtime, size = self._get_file_key(file_path=file_path)
+        with self._lock:
+            if file_path in self._models:
+                cached_mtime, cached_size, model = self._models[file_path]
+                if (cached_mtime == mtime) and (cached_size == size):
+                    self._models.move_to_end(file_path)
+                    return model
+                del self._models[file_path]
+        try:
+            with open(file_path, "rb") as f:
+                model = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError):
+            raise CorruptedFileError(
+                msg=f"Can not read {file_path} as a classifier file (pickle).",
+                source=self.__class__.__name__,
+            )
+        if size <= self.max_size_mb * 1_000_000:
+            with self._lock:
+                self._models[file_path] = (mtime, size, model)
+                self._models.move_to_end(file_path)
+                self._evict()
+        return model
+
+    def _evict(self) -> None:
+        while self.size_mb > self.max_size_mb:
+            self._models.popitem(last=False)
+
+    def set_max_size(self, max_size_mb: int) -> None:
+        """
+        Change the memory budget of the cache, evicting least recently used models if required.
+
+        :parameter int max_size_mb: Memory budget of the cache in megabytes.
+        """
+
+        check_int(
+            name=f"{self.__class__.__name__} max_size_mb",
+            value=max_size_mb,
+            min_value=0,
+        )
+        with self._lock:
+            self.max_size_mb = int(max_size_mb)
+            self._evict()
+
+    def remove(self, file_path: Union[str, os.PathLike]) -> None:
+        """Remove a single model from the cache, e.g., after the model file has been re-trained and overwritten."""
+        with self._lock:
+            self._models.pop(os.path.abspath(file_path), None)
+
+    def clear(self) -> None:
+        """Remove all models from the cache."""
+        with self._lock:
+            self._models.clear()
+
+    @property
+    def size_mb(self) -> float:
+        """The summed on-disk size of all cached models in megabytes."""
+        return sum([v[1] for v in self._models.values()]) / 1_000_000
+
+    def get_cached_paths(self) -> Dict[str, float]:
+        """
+        Return the paths and sizes (megabytes) of the cached models, ordered from least to most recently used.
+
+        :return Dict[str, float]: Model paths as keys and model sizes in megabytes as values.
+        """
+        with self._lock:
+            return {k: v[1] / 1_000_000 for k, v in self._models.items()}
+
+
+MODEL_CACHE = ModelCache()
+
+
+def read_cached_model(
+    file_path: Union[str, os.PathLike], cache: Optional[ModelCache] = None
+) -> object:
+    """
+    Read a pickled classifier through the process-wide :class:`simba.model.model_cache.ModelCache`.
+
+    :parameter Union[str, os.PathLike] file_path: Path to pickled model.
+    :parameter Optional[ModelCache] cache: Cache to read through. If None, then the process-wide ``MODEL_CACHE``.
+    :return object: The un-pickled model.
+
+    :example:
+    >>> clf = read_cached_model(file_path='project_folder/models/generated_models/Attack.sav')
+    """
+
+    if cache is None:
+        cache = MODEL_CACHE
+    return cache.read(file_path=file_path)
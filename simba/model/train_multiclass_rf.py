@@ -2,26 +2,49 @@ import ast
 import json
 import os
 from itertools import product
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 
+import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 
 from simba.mixins.config_reader import ConfigReader
 from simba.mixins.train_model_mixin import TrainModelMixin
+from simba.model.training_store import ROW_FIELD, TrainingDataStore
 from simba.utils.checks import (check_if_filepath_list_is_empty,
                                 check_if_list_contains_values,
                                 check_if_valid_input)
 from simba.utils.enums import (ConfigKey, Dtypes, Formats, Methods,
-                               MLParamKeys, Options, TagNames)
-from simba.utils.errors import SamplingError
+                               MLParamKeys, Options, Paths, TagNames)
+from simba.utils.errors import NoDataError, SamplingError
 from simba.utils.printing import SimbaTimer, log_event, stdout_success
-from simba.utils.read_write import read_config_entry, write_df
+from simba.utils.read_write import read_config_entry, str_2_bool, write_df
 
 
 class TrainMultiClassRandomForestClassifier(ConfigReader, TrainModelMixin):
-    def __init__(self, config_path: Union[str, os.PathLike]):
+    """
+    Train a single multi-class random forest model using hyperparameter setting and evaluation methods
+    stored within the SimBA project config .ini file (``global environment``).
+
+    :param str config_path: path to SimBA project config file in Configparser format
+    :param Optional[bool] use_training_store: If True, the annotated data is read through the memory-mapped
+        :class:`simba.model.training_store.TrainingDataStore` in ``project_folder/csv/training_store``. Only the
+        target is held in memory while sampling, the model is fitted on the sampled train rows, and learning curves
+        are computed on the sampled rows. If None, the ``use_training_store`` entry of the
+        ``create ensemble settings`` section in the project config is used. Default: None.
+
+    :example:
+    >>> model_trainer = TrainMultiClassRandomForestClassifier(config_path='MyConfigPath')
+    >>> model_trainer.run()
+    >>> model_trainer.save_model()
+    """
+
+    def __init__(
+        self,
+        config_path: Union[str, os.PathLike],
+        use_training_store: Optional[bool] = None,
+    ):
 
         ConfigReader.__init__(self, config_path=config_path)
         TrainModelMixin.__init__(self)
@@ -36,27 +59,21 @@ class TrainMultiClassRandomForestClassifier(ConfigReader, TrainModelMixin):
             filepaths=self.target_file_paths,
             error_msg="Zero annotation files found in project_folder/csv/targets_inserted, cannot create model.",
         )
-        print(f"Reading in {len(self.target_file_paths)} annotated files...")
-        self.data_df, self.frm_idx = self.read_all_files_in_folder_mp_futures(
-            annotations_file_paths=self.target_file_paths,
-            file_type=self.file_type,
-            classifier_names=self.clf_names,
-            raise_bool_clf_error=False,
-        )
-        self.frm_idx = pd.DataFrame(
-            {"VIDEO": list(self.data_df.index), "FRAME_IDX": self.frm_idx}
-        )
-
-        self.check_raw_dataset_integrity(df=self.data_df, logs_path=self.logs_path)
-        self.data_df_wo_cords = self.drop_bp_cords(df=self.data_df)
-        annotation_cols_to_remove = self.read_in_all_model_names_to_remove(
-            self.config, self.clf_cnt, self.clf_name
-        )
-        self.x_y_df = self.delete_other_annotation_columns(
-            df=self.data_df_wo_cords,
-            annotations_lst=list(annotation_cols_to_remove),
-            raise_error=False,
-        )
+        if use_training_store is None:
+            use_training_store = str_2_bool(
+                read_config_entry(
+                    self.config,
+                    ConfigKey.CREATE_ENSEMBLE_SETTINGS.value,
+                    MLParamKeys.TRAINING_STORE.value,
+                    data_type=Dtypes.STR.value,
+                    default_value="False",
+                )
+            )
+        self.use_training_store, self.store = use_training_store, None
+        if self.use_training_store:
+            self.read_training_store()
+        else:
+            self.read_training_data()
         self.classifier_map = ast.literal_eval(
             read_config_entry(
                 self.config,
@@ -84,14 +101,11 @@ class TrainMultiClassRandomForestClassifier(ConfigReader, TrainModelMixin):
                 data_type=Dtypes.STR.value,
             )
         )
-        self.x_df, self.y_df = self.split_df_to_x_y(self.x_y_df, self.clf_name)
         check_if_list_contains_values(
             data=list(self.y_df),
             values=list(self.classifier_map.keys()),
             name=self.clf_name,
         )
-
-        self.feature_names = self.x_df.columns
         self.check_sampled_dataset_integrity(x_df=self.x_df, y_df=self.y_df)
         print(f"Number of features in dataset: {len(self.feature_names)}")
         for k, v in self.classifier_map.items():
@@ -99,6 +113,94 @@ class TrainMultiClassRandomForestClassifier(ConfigReader, TrainModelMixin):
                 f"Number of {v} frames in dataset: {len(self.y_df[self.y_df == k])} ({(len(self.y_df[self.y_df == k]) / len(self.x_df)) * 100}%)"
             )
 
+    def read_training_data(self) -> None:
+        """
+        Method for reading all annotated files into memory and splitting them into features and target.
+        """
+
+        print(f"Reading in {len(self.target_file_paths)} annotated files...")
+        self.data_df, self.frm_idx = self.read_all_files_in_folder_mp_futures(
+            annotations_file_paths=self.target_file_paths,
+            file_type=self.file_type,
+            classifier_names=self.clf_names,
+            raise_bool_clf_error=False,
+        )
+        self.frm_idx = pd.DataFrame(
+            {"VIDEO": list(self.data_df.index), "FRAME_IDX": self.frm_idx}
+        )
+
+        self.check_raw_dataset_integrity(df=self.data_df, logs_path=self.logs_path)
+        self.data_df_wo_cords = self.drop_bp_cords(df=self.data_df)
+        annotation_cols_to_remove = self.read_in_all_model_names_to_remove(
+            self.config, self.clf_cnt, self.clf_name
+        )
+        self.x_y_df = self.delete_other_annotation_columns(
+            df=self.data_df_wo_cords,
+            annotations_lst=list(annotation_cols_to_remove),
+            raise_error=False,
+        )
+        self.x_df, self.y_df = self.split_df_to_x_y(self.x_y_df, self.clf_name)
+        self.feature_names = self.x_df.columns
+
+    def read_training_store(self) -> None:
+        """
+        Method for synchronizing the training store with the annotated files and reading the target into memory.
+        The features are represented by a single column of store row numbers, so that the samplers operate on row
+        numbers and target values only, and the row numbers survive samplers that reset the index.
+        """
+
+        self.store = TrainingDataStore(
+            store_dir=os.path.join(self.project_path, Paths.TRAINING_STORE_DIR.value)
+        )
+        self.store.update(file_paths=self.target_file_paths, file_type=self.file_type)
+        self.store.check_columns()
+        annotation_cols_to_remove = self.read_in_all_model_names_to_remove(
+            self.config, self.clf_cnt, self.clf_name
+        )
+        if self.clf_name not in self.store.columns:
+            raise NoDataError(
+                msg=f"Could not find expected column {self.clf_name} in the data",
+                source=self.__class__.__name__,
+            )
+        self.feature_names = pd.Index(
+            [
+                x
+                for x in self.store.columns
+                if x not in self.bp_col_names + annotation_cols_to_remove
+                and x != self.clf_name
+            ]
+        )
+        self.y_df = self.store.read_columns(columns=[self.clf_name])[
+            self.clf_name
+        ].astype(np.int64)
+        self.x_df = pd.DataFrame({ROW_FIELD: self.y_df.index.values})
+        self.frm_idx = self.store.get_frame_index()
+        self.x_y_df = None
+
+    def page_in_sampled_rows(self) -> None:
+        """
+        Method for reading the features of the sampled train and test rows from the training store.
+        """
+
+        train_rows = self.x_train[ROW_FIELD].values
+        test_rows = self.x_test[ROW_FIELD].values
+        print(
+            f"Reading {len(train_rows) + len(test_rows)} sampled frames from training store..."
+        )
+        self.sampled_rows = np.sort(np.concatenate((train_rows, test_rows)))
+        self.x_train = self.store.read_rows(
+            rows=train_rows, columns=list(self.feature_names)
+        )
+        self.x_test = self.store.read_rows(
+            rows=test_rows, columns=list(self.feature_names)
+        )
+        self.y_train = pd.Series(
+            self.y_train.values, index=train_rows, name=self.clf_name
+        )
+        self.y_test = pd.Series(self.y_test.values, index=test_rows, name=self.clf_name)
+        self.check_sampled_dataset_integrity(x_df=self.x_train, y_df=self.y_train)
+        self.check_sampled_dataset_integrity(x_df=self.x_test, y_df=self.y_test)
+
     def _check_presence_of_classes_post_sampling(self):
         for set, clf_code in product(
             [self.y_train, self.y_test], self.classifier_map.keys()
@@ -137,6 +239,8 @@ class TrainMultiClassRandomForestClassifier(ConfigReader, TrainModelMixin):
                     msg=f"Under sample setting {self.under_sample_setting} not recognized. Options: [None, random undersample multiclass frames, random undersample multiclass bouts]",
                     source=self.__class__.__name__,
                 )
+        if self.use_training_store:
+            self.page_in_sampled_rows()
 
         if self.save_train_test_frm_info:
             train_data = self.frm_idx[
@@ -174,7 +278,12 @@ class TrainMultiClassRandomForestClassifier(ConfigReader, TrainModelMixin):
             verbose=1,
             class_weight=self.class_weights,
         )
-        self.rf_clf = self.clf_fit(clf=self.rf_clf, x_df=self.x_df, y_df=self.y_df)
+        if self.use_training_store:
+            self.rf_clf = self.clf_fit(
+                clf=self.rf_clf, x_df=self.x_train, y_df=self.y_train
+            )
+        else:
+            self.rf_clf = self.clf_fit(clf=self.rf_clf, x_df=self.x_df, y_df=self.y_df)
         if self.compute_permutation_importance in Options.PERFORM_FLAGS.value:
             self.calc_permutation_importance(
                 self.x_test,
@@ -185,6 +294,12 @@ class TrainMultiClassRandomForestClassifier(ConfigReader, TrainModelMixin):
                 self.eval_out_path,
             )
         if self.generate_learning_curve in Options.PERFORM_FLAGS.value:
+            if self.x_y_df is None:
+                self.x_y_df = self.store.read_rows(
+                    rows=self.sampled_rows,
+                    columns=list(self.feature_names) + [self.clf_name],
+                )
+                self.x_y_df[self.clf_name] = self.x_y_df[self.clf_name].astype(np.int64)
             self.calc_learning_curve(
                 x_y_df=self.x_y_df,
                 clf_name=self.clf_name,
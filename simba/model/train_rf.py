@@ -2,19 +2,22 @@ __author__ = "Simon Nilsson"
 
 import ast
 import os
-from typing import Union
+from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 
 from simba.mixins.config_reader import ConfigReader
 from simba.mixins.train_model_mixin import TrainModelMixin
+from simba.model.training_store import TrainingDataStore
 from simba.utils.checks import check_if_filepath_list_is_empty, check_int
 from simba.utils.enums import (ConfigKey, Dtypes, Formats, Methods,
-                               MLParamKeys, Options, TagNames)
+                               MLParamKeys, Options, Paths, TagNames)
+from simba.utils.errors import NoDataError
 from simba.utils.printing import SimbaTimer, log_event, stdout_success
-from simba.utils.read_write import read_config_entry, write_df
+from simba.utils.read_write import read_config_entry, str_2_bool, write_df
 
 
 class TrainRandomForestClassifier(ConfigReader, TrainModelMixin):
@@ -23,6 +26,12 @@ class TrainRandomForestClassifier(ConfigReader, TrainModelMixin):
     stored within the SimBA project config .ini file (``global environment``).
 
     :param str config_path: path to SimBA project config file in Configparser format
+    :param Optional[bool] use_training_store: If True, the annotated data is read through the memory-mapped
+        :class:`simba.model.training_store.TrainingDataStore` in ``project_folder/csv/training_store``. Only the
+        target is held in memory while sampling, and only the sampled train and test rows are paged in before fitting.
+        Use for data sets that do not fit in memory; learning curves are then computed on the sampled rows. If
+        None, the ``use_training_store`` entry of the ``create ensemble settings`` section in the project config
+        is used. Default: None.
 
     .. note::
        `Tutorial <https://github.com/sgoldenlab/simba/blob/master/docs/Scenario1.md#step-7-train-machine-model>`_
@@ -34,7 +43,11 @@ class TrainRandomForestClassifier(ConfigReader, TrainModelMixin):
     >>> model_trainer.save_model()
     """
 
-    def __init__(self, config_path: Union[str, os.PathLike]):
+    def __init__(
+        self,
+        config_path: Union[str, os.PathLike],
+        use_training_store: Optional[bool] = None,
+    ):
 
         ConfigReader.__init__(self, config_path=config_path, create_logger=False)
         TrainModelMixin.__init__(self)
@@ -43,6 +56,36 @@ class TrainRandomForestClassifier(ConfigReader, TrainModelMixin):
             filepaths=self.target_file_paths,
             error_msg="Zero annotation files found in project_folder/csv/targets_inserted directory, cannot create model.",
         )
+        if use_training_store is None:
+            use_training_store = str_2_bool(
+                read_config_entry(
+                    self.config,
+                    ConfigKey.CREATE_ENSEMBLE_SETTINGS.value,
+                    MLParamKeys.TRAINING_STORE.value,
+                    data_type=Dtypes.STR.value,
+                    default_value="False",
+                )
+            )
+        self.use_training_store, self.store = use_training_store, None
+        self.class_names = ["Not_" + self.clf_name, self.clf_name]
+        if self.use_training_store:
+            self.read_training_store()
+        else:
+            self.read_training_data()
+        print("Number of features in dataset: " + str(len(self.feature_names)))
+        print(
+            "Number of {} frames in dataset: {} ({}%)".format(
+                self.clf_name,
+                str(self.y_df.sum()),
+                str(round(self.y_df.sum() / len(self.y_df), 4) * 100),
+            )
+        )
+
+    def read_training_data(self) -> None:
+        """
+        Method for reading all annotated files into memory.
+        """
+
         print(
             "Reading in {} annotated files...".format(str(len(self.target_file_paths)))
         )
@@ -62,18 +105,67 @@ class TrainRandomForestClassifier(ConfigReader, TrainModelMixin):
         self.x_y_df = self.delete_other_annotation_columns(
             self.data_df_wo_cords, list(annotation_cols_to_remove)
         )
-        self.class_names = ["Not_" + self.clf_name, self.clf_name]
         self.x_df, self.y_df = self.split_df_to_x_y(self.x_y_df, self.clf_name)
         self.feature_names = self.x_df.columns
         self.check_sampled_dataset_integrity(x_df=self.x_df, y_df=self.y_df)
-        print("Number of features in dataset: " + str(len(self.x_df.columns)))
-        print(
-            "Number of {} frames in dataset: {} ({}%)".format(
-                self.clf_name,
-                str(self.y_df.sum()),
-                str(round(self.y_df.sum() / len(self.y_df), 4) * 100),
+
+    def read_training_store(self) -> None:
+        """
+        Method for synchronizing the training store with the annotated files and reading the target into memory.
+        The features are represented by an empty dataframe indexed by store row numbers, so that the samplers
+        operate on row numbers and target values only.
+        """
+
+        self.store = TrainingDataStore(
+            store_dir=os.path.join(self.project_path, Paths.TRAINING_STORE_DIR.value)
+        )
+        self.store.update(file_paths=self.target_file_paths, file_type=self.file_type)
+        self.store.check_columns()
+        annotation_cols_to_remove = self.read_in_all_model_names_to_remove(
+            self.config, self.clf_cnt, self.clf_name
+        )
+        if self.clf_name not in self.store.columns:
+            raise NoDataError(
+                msg=f"Could not find expected column {self.clf_name} in the data",
+                source=self.__class__.__name__,
             )
+        self.feature_names = pd.Index(
+            [
+                x
+                for x in self.store.columns
+                if x not in self.bp_col_names + annotation_cols_to_remove
+                and x != self.clf_name
+            ]
         )
+        self.y_df = self.store.read_columns(columns=[self.clf_name])[
+            self.clf_name
+        ].astype(np.int8)
+        self.x_df = pd.DataFrame(index=self.y_df.index)
+        self.frm_idx = self.store.get_frame_index()
+        self.x_y_df = None
+        self.check_sampled_dataset_integrity(x_df=self.x_df, y_df=self.y_df)
+
+    def page_in_sampled_rows(self) -> None:
+        """
+        Method for reading the features of the sampled train and test rows from the training store. The sampled
+        store rows are kept in ``sampled_rows`` so that evaluations (e.g., learning curves) can be computed without
+        paging in the full feature matrix.
+        """
+
+        print(
+            f"Reading {len(self.x_train) + len(self.x_test)} sampled frames from training store..."
+        )
+        self.sampled_rows = np.sort(
+            np.concatenate((self.x_train.index.values, self.x_test.index.values))
+        )
+        self.x_train = self.store.read_rows(
+            rows=self.x_train.index.values, columns=list(self.feature_names)
+        )
+        self.x_test = self.store.read_rows(
+            rows=self.x_test.index.values, columns=list(self.feature_names)
+        )
+        self.check_sampled_dataset_integrity(x_df=self.x_train, y_df=self.y_train)
+        self.check_sampled_dataset_integrity(x_df=self.x_test, y_df=self.y_test)
 
     def perform_sampling(self):
         """
@@ -95,6 +187,8 @@ class TrainRandomForestClassifier(ConfigReader, TrainModelMixin):
             self.x_train, self.y_train = self.random_undersampler(
                 self.x_train, self.y_train, float(self.under_sample_ratio)
             )
+        if self.use_training_store:
+            self.page_in_sampled_rows()
         if self.over_sample_setting == Methods.SMOTEENN.value.lower():
             self.x_train, self.y_train = self.smoteen_oversampler(
                 self.x_train, self.y_train, float(self.over_sample_ratio)
@@ -376,6 +470,11 @@ class TrainRandomForestClassifier(ConfigReader, TrainModelMixin):
                     self.eval_out_path,
                 )
             if generate_learning_curve in Options.PERFORM_FLAGS.value:
+                if self.x_y_df is None:
+                    self.x_y_df = self.store.read_rows(
+                        rows=self.sampled_rows,
+                        columns=list(self.feature_names) + [self.clf_name],
+                    )
                 self.calc_learning_curve(
                     x_y_df=self.x_y_df,
                     clf_name=self.clf_name,
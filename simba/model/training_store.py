@@ -0,0 +1,254 @@
+__author__ = "Simon Nilsson"
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from typing import Literal
+except:
+    from typing_extensions import Literal
+
+from simba.utils.checks import check_if_dir_exists, check_valid_lst
+from simba.utils.errors import FaultyTrainingSetError, MissingColumnsError
+from simba.utils.printing import SimbaTimer
+from simba.utils.read_write import get_fn_ext, read_df
+
+MANIFEST_FILE_NAME = "manifest.json"
+FRAMES_SUFFIX = "_frames"
+ROW_FIELD = "TRAINING_STORE_ROW"
+
+
+class TrainingDataStore(object):
+    """
+    Persistent, memory-mapped columnar store of annotated data for out-of-core model training.
+
+    The store is a directory holding one column-major (Fortran-ordered) float32 ``.npy`` block per video, one ``.npy``
+    array with the original frame numbers of each block, and a ``manifest.json`` recording the source file path,
+    modification time, size, row count and column names of every block. Blocks are memory-mapped when read, so
+    callers only page in the rows and columns they index.
+
+    .. note::
+       :meth:`simba.model.training_store.TrainingDataStore.update` only (re-)converts source files that are new or
+       have been modified since the last update, so the store is built incrementally as annotations are added.
+
+       Rows are numbered globally from ``0`` to ``row_cnt - 1`` with videos concatenated in alphabetical order.
+
+    :param Union[str, os.PathLike] store_dir: Directory of the store. Created if it does not exist.
+
+    :example:
+    >>> store = TrainingDataStore(store_dir='project_folder/csv/training_store')
+    >>> store.update(file_paths=['project_folder/csv/targets_inserted/Video_1.csv'], file_type='csv')
+    >>> y = store.read_columns(columns=['Attack'])
+    >>> x = store.read_rows(rows=np.array([10, 11, 500]), columns=['Feature_1', 'Feature_2'])
+    """
+
+    def __init__(self, store_dir: Union[str, os.PathLike]):
+        if not os.path.isdir(store_dir):
+            os.makedirs(store_dir)
+        check_if_dir_exists(in_dir=store_dir)
+        self.store_dir = store_dir
+        self.manifest_path = os.path.join(store_dir, MANIFEST_FILE_NAME)
+        self.manifest = {"videos": {}}
+        if os.path.isfile(self.manifest_path):
+            with open(self.manifest_path, "r") as f:
+                self.manifest = json.load(f)
+        self._set_row_ranges()
+
+    def _set_row_ranges(self) -> None:
+        self.video_names = sorted(list(self.manifest["videos"].keys()))
+        self.row_ranges, row_cnt = {}, 0
+        for video_name in self.video_names:
+            video_rows = self.manifest["videos"][video_name]["rows"]
+            self.row_ranges[video_name] = (row_cnt, row_cnt + video_rows)
+            row_cnt += video_rows
+        self.row_cnt = row_cnt
+        self.columns = []
+        for video_name in self.video_names:
+            for column in self.manifest["videos"][video_name]["columns"]:
+                if column not in self.columns:
+                    self.columns.append(column)
+
+    def _write_manifest(self) -> None:
+        temp_path = self.manifest_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.manifest, f)
+        os.replace(temp_path, self.manifest_path)
+
+    def _get_block_paths(self, video_name: str) -> Tuple[str, str]:
+        return os.path.join(self.store_dir, f"{video_name}.npy"), os.path.join(
+            self.store_dir, f"{video_name}{FRAMES_SUFFIX}.npy"
+        )
+
+    def update(
+        self,
+        file_paths: List[Union[str, os.PathLike]],
+        file_type: Literal["csv", "parquet", "pickle"],
+    ) -> None:
+        """
+        Synchronize the store with ``file_paths``: convert new and modified files to blocks, and remove blocks of
+        videos that are no longer represented in ``file_paths``.
+
+        :parameter List[Union[str, os.PathLike]] file_paths: Paths to annotated data files (e.g., ``project_folder/csv/targets_inserted``).
+        :parameter Literal["csv", "parquet", "pickle"] file_type: The file type of ``file_paths``.
+        """
+
+        check_valid_lst(
+            data=list(file_paths),
+            source=f"{self.__class__.__name__} file_paths",
+            min_len=0,
+        )
+        timer = SimbaTimer(start=True)
+        video_paths = {get_fn_ext(x)[1]: x for x in file_paths}
+        for video_name in list(self.manifest["videos"].keys()):
+            if video_name not in video_paths.keys():
+                for block_path in self._get_block_paths(video_name=video_name):
+                    if os.path.isfile(block_path):
+                        os.remove(block_path)
+                del self.manifest["videos"][video_name]
+        converted_cnt = 0
+        for video_name, file_path in video_paths.items():
+            file_stat = os.stat(file_path)
+            if video_name in self.manifest["videos"].keys():
+                video_info = self.manifest["videos"][video_name]
+                if (
+                    (video_info["source"] == os.path.abspath(file_path))
+                    and (video_info["mtime"] == file_stat.st_mtime_ns)
+                    and (video_info["size"] == file_stat.st_size)
+                ):
+                    continue
+            print(f"Adding {video_name} to training store...")
+            df = read_df(file_path, file_type).dropna(axis=0, how="all").fillna(0)
+            df = df[
+                [
+                    x
+                    for x in df.columns
+                    if (x != "scorer") and (not str(x).startswith("Unnamed"))
+                ]
+            ]
+            data_path, frames_path = self._get_block_paths(video_name=video_name)
+            np.save(data_path, np.asfortranarray(df.values.astype(np.float32)))
+            np.save(frames_path, np.array(df.index).astype(np.int64))
+            self.manifest["videos"][video_name] = {
+                "source": os.path.abspath(file_path),
+                "mtime": file_stat.st_mtime_ns,
+                "size": file_stat.st_size,
+                "rows": len(df),
+                "columns": [str(x) for x in df.columns],
+            }
+            converted_cnt += 1
+        self._write_manifest()
+        self._set_row_ranges()
+        timer.stop_timer()
+        print(
+            f"Training store updated: {converted_cnt} file(s) converted, {len(self.video_names)} video(s) and {self.row_cnt} frames in store (elapsed time: {timer.elapsed_time_str}s)..."
+        )
+
+    def check_columns(self, columns: Optional[List[str]] = None) -> None:
+        """
+        Check that all videos in the store hold the same columns, or, if ``columns`` is not None, that all videos hold ``columns``.
+
+        :parameter Optional[List[str]] columns: Columns that has to be present in every video. If None, then all columns in the store.
+        :raises FaultyTrainingSetError: If one or more columns are present in some videos but missing in others.
+        """
+
+        if columns is None:
+            columns = self.columns
+        for video_name in self.video_names:
+            missing = list(
+                set(columns) - set(self.manifest["videos"][video_name]["columns"])
+            )
+            if len(missing) > 0:
+                raise FaultyTrainingSetError(
+                    msg=f"{len(missing)} column(s) exist in some files within the project_folder/csv/targets_inserted directory, but are missing in video {video_name}. SimBA expects all files to have the same columns: the first 10 missing columns are: {missing[0:10]}",
+                    source=self.__class__.__name__,
+                )
+
+    def _read_block(self, video_name: str) -> np.ndarray:
+        return np.load(self._get_block_paths(video_name=video_name)[0], mmap_mode="r")
+
+    def _get_column_idx(self, video_name: str, columns: List[str]) -> np.ndarray:
+        video_columns = self.manifest["videos"][video_name]["columns"]
+        missing = list(set(columns) - set(video_columns))
+        if len(missing) > 0:
+            raise MissingColumnsError(
+                msg=f"The columns {missing[0:10]} are missing in the training store data for video {video_name}",
+                source=self.__class__.__name__,
+            )
+        lookup = {column: idx for idx, column in enumerate(video_columns)}
+        return np.array([lookup[x] for x in columns], dtype=np.int64)
+
+    def read_columns(self, columns: List[str]) -> pd.DataFrame:
+        """
+        Read ``columns`` for all rows in the store. As the blocks are column-major, only the pages of the requested
+        columns are read from disk.
+
+        :parameter List[str] columns: Column names to read.
+        :return pd.DataFrame: Dataframe with ``row_cnt`` rows indexed by the global row number.
+        """
+
+        results = np.empty((self.row_cnt, len(columns)), dtype=np.float32)
+        for video_name in self.video_names:
+            start, end = self.row_ranges[video_name]
+            block = self._read_block(video_name=video_name)
+            results[start:end] = block[
+                :, self._get_column_idx(video_name=video_name, columns=columns)
+            ]
+        return pd.DataFrame(data=results, columns=columns)
+
+    def read_rows(self, rows: np.ndarray, columns: List[str]) -> pd.DataFrame:
+        """
+        Read a subset of global ``rows`` and ``columns`` from the store, e.g., the rows selected by a sampler. Only
+        the indexed rows and columns are paged in from the memory-mapped blocks.
+
+        :parameter np.ndarray rows: 1D array of global row numbers. May be unsorted.
+        :parameter List[str] columns: Column names to read.
+        :return pd.DataFrame: Dataframe in the order of ``rows`` and indexed by ``rows``.
+        """
+
+        rows = np.array(rows).astype(np.int64).flatten()
+        if (len(rows) > 0) and ((rows.min() < 0) or (rows.max() >= self.row_cnt)):
+            raise FaultyTrainingSetError(
+                msg=f"Row numbers have to be between 0 and {self.row_cnt - 1}, got {rows.min()} - {rows.max()}",
+                source=self.__class__.__name__,
+            )
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        results = np.empty((len(rows), len(columns)), dtype=np.float32)
+        for video_name in self.video_names:
+            start, end = self.row_ranges[video_name]
+            left, right = np.searchsorted(sorted_rows, [start, end], side="left")
+            if left == right:
+                continue
+            block = self._read_block(video_name=video_name)
+            column_idx = self._get_column_idx(video_name=video_name, columns=columns)
+            results[order[left:right]] = block[
+                np.ix_(sorted_rows[left:right] - start, column_idx)
+            ]
+        return pd.DataFrame(data=results, columns=columns, index=rows)
+
+    def get_frame_index(self) -> pd.DataFrame:
+        """
+        Get the video name and original frame number of every row in the store.
+
+        :return pd.DataFrame: Dataframe with ``VIDEO`` and ``FRAME_IDX`` columns indexed by the global row number.
+        """
+
+        video_names, frame_idx = [], []
+        for video_name in self.video_names:
+            frames = np.load(self._get_block_paths(video_name=video_name)[1])
+            video_names.extend([video_name] * len(frames))
+            frame_idx.extend(list(frames))
+        return pd.DataFrame({"VIDEO": video_names, "FRAME_IDX": frame_idx})
+
+    def get_row_ranges(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Get the global row range of each video in the store.
+
+        :return Dict[str, Tuple[int, int]]: Video names as keys and (start, end) global row numbers as values, where end is exclusive.
+        """
+
+        return dict(self.row_ranges)
@@ -1,15 +1,18 @@
 __author__ = "Simon Nilsson"
 
+import functools
 import glob
 import os
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from simba.mixins.config_reader import ConfigReader
-from simba.utils.enums import ConfigKey, Dtypes
+from simba.utils.checks import check_int
 from simba.utils.printing import SimbaTimer, stdout_success
-from simba.utils.read_write import (get_fn_ext, read_config_entry, read_df,
+from simba.utils.read_write import (find_core_cnt, get_fn_ext, read_df,
+                                    read_outlier_settings, run_file_tasks,
                                     write_df)
 
 
@@ -26,111 +29,189 @@ class OutlierCorrecterLocation(ConfigReader):
        :width: 500
        :align: center
 
+    .. note::
+       Outliers are found with vectorized pairwise body-part distances, and each outlier is replaced with the
+       location of the body-part in the closest preceding non-outlier frame (forward-fill).
+
     :parameter str config_path: path to SimBA project config file in Configparser format
+    :parameter Optional[int] core_cnt: Number of files to process in parallel. If -1, then all available cores. Default: 1.
 
     Examples
     ----------
     >>> _ = OutlierCorrecterLocation(config_path='MyProjectConfig').run()
     """
 
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, core_cnt: Optional[int] = 1):
         super().__init__(config_path=config_path)
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
+        )
+        self.core_cnt = core_cnt
         if not os.path.exists(self.outlier_corrected_dir):
             os.makedirs(self.outlier_corrected_dir)
-        if self.animal_cnt == 1:
-            self.animal_id = read_config_entry(
-                self.config,
-                ConfigKey.MULTI_ANIMAL_ID_SETTING.value,
-                ConfigKey.MULTI_ANIMAL_IDS.value,
-                Dtypes.STR.value,
+        (
+            self.animal_bp_dict,
+            self.outlier_bp_dict,
+            self.criterion,
+        ) = read_outlier_settings(
+            config=self.config,
+            animal_bp_dict=self.animal_bp_dict,
+            animal_cnt=self.animal_cnt,
+            outlier_type="location",
+        )
+
+    @staticmethod
+    def find_location_outliers(
+        data: np.ndarray, criterion: float, chunk_size: int = 100_000
+    ) -> np.ndarray:
+        """
+        Find the body-parts that are located more than ``criterion`` away from more than one other body-part of the
+        same animal. The distances between all body-part pairs are computed in chunks of ``chunk_size`` frames.
+
+        :parameter np.ndarray data: 3D array of body-part coordinates of size len(frames) x len(body-parts) x 2.
+        :parameter float criterion: Distance in pixels.
+        :parameter int chunk_size: Number of frames in each chunk. Bounds memory to chunk_size x len(body-parts)^2 distances.
+        :return np.ndarray: 2D boolean array of size len(frames) x len(body-parts). True if the body-part is an outlier in the frame.
+
+        :example:
+        >>> data = np.random.randint(0, 100, (1000, 8, 2)).astype(np.float64)
+        >>> OutlierCorrecterLocation.find_location_outliers(data=data, criterion=50.0)
+        """
+
+        results = np.full((data.shape[0], data.shape[1]), False)
+        for chunk_start in range(0, data.shape[0], chunk_size):
+            chunk = data[chunk_start : chunk_start + chunk_size]
+            diff = chunk[:, :, np.newaxis, :] - chunk[:, np.newaxis, :, :]
+            distances = np.sqrt(diff[..., 0] ** 2 + diff[..., 1] ** 2)
+            results[chunk_start : chunk_start + chunk_size] = (
+                np.sum(distances > criterion, axis=2) > 1
             )
-            if self.animal_id != "None":
-                self.animal_bp_dict[self.animal_id] = self.animal_bp_dict.pop(
-                    "Animal_1"
-                )
-        self.above_criterion_dict_dict = {}
-        self.below_criterion_dict_dict = {}
-        self.criterion = read_config_entry(
-            self.config,
-            ConfigKey.OUTLIER_SETTINGS.value,
-            ConfigKey.LOCATION_CRITERION.value,
-            Dtypes.FLOAT.value,
+        return results
+
+    @staticmethod
+    def last_valid_idx(outliers: np.ndarray) -> np.ndarray:
+        """
+        Find the index of the closest preceding non-outlier frame for every frame. Non-outlier frames, and outlier
+        frames without a preceding non-outlier frame, map to themselves.
+
+        :parameter np.ndarray outliers: 1D boolean array of size len(frames). True if frame is an outlier.
+        :return np.ndarray: 1D integer array of size len(frames).
+
+        :example:
+        >>> OutlierCorrecterLocation.last_valid_idx(outliers=np.array([True, False, True, True, False]))
+        >>> [0, 1, 1, 1, 4]
+        """
+
+        frm_idx = np.arange(outliers.shape[0])
+        last_valid = np.maximum.accumulate(np.where(~outliers, frm_idx, -1))
+        return np.where(last_valid == -1, frm_idx, last_valid)
+
+    @staticmethod
+    def _correct_file(
+        file_path: Union[str, os.PathLike],
+        file_type: str,
+        save_dir: Union[str, os.PathLike],
+        animal_bp_dict: Dict[str, Any],
+        outlier_bp_dict: Dict[str, Dict[str, str]],
+        criterion: float,
+    ) -> List[list]:
+        """
+        Helper to correct the location outliers in a single file and save the results in ``save_dir``. Called by
+        :meth:`simba.outlier_tools.outlier_corrector_location.OutlierCorrecterLocation.run` through
+        :func:`simba.utils.read_write.run_file_tasks`.
+
+        :return List[list]: The log rows of the file with one row per body-part.
+        """
+
+        video_timer = SimbaTimer(start=True)
+        _, video_name, _ = get_fn_ext(file_path)
+        print(f"Processing video {video_name}...")
+        data_df = read_df(file_path, file_type)
+        data_df, log = OutlierCorrecterLocation.correct_location_outliers(
+            data_df=data_df,
+            video_name=video_name,
+            animal_bp_dict=animal_bp_dict,
+            outlier_bp_dict=outlier_bp_dict,
+            criterion=criterion,
+        )
+        save_path = os.path.join(save_dir, video_name + "." + file_type)
+        write_df(df=data_df, file_type=file_type, save_path=save_path)
+        video_timer.stop_timer()
+        print(
+            f"Corrected location outliers for file {video_name} (elapsed time: {video_timer.elapsed_time_str}s)..."
         )
-        self.outlier_bp_dict = {}
-        for animal_name in self.animal_bp_dict.keys():
-            self.outlier_bp_dict[animal_name] = {}
-            self.outlier_bp_dict[animal_name]["bp_1"] = read_config_entry(
-                self.config,
-                ConfigKey.OUTLIER_SETTINGS.value,
-                "location_bodypart1_{}".format(animal_name.lower()),
-                "str",
+        return log
+
+    @staticmethod
+    def correct_location_outliers(
+        data_df: pd.DataFrame,
+        video_name: str,
+        animal_bp_dict: Dict[str, Any],
+        outlier_bp_dict: Dict[str, Dict[str, str]],
+        criterion: float,
+    ) -> Tuple[pd.DataFrame, List[list]]:
+        """
+        Correct the location outliers in a single dataframe of pose-estimation data. The criterion of each animal is
+        ``criterion`` multiplied by the mean distance between the two outlier body-parts of the animal.
+
+        :parameter pd.DataFrame data_df: Pose-estimation data with the body-part headers of the SimBA project.
+        :parameter str video_name: Name of the video represented by ``data_df``. Used in the log.
+        :parameter Dict[str, Any] animal_bp_dict: The x and y body-part header names of each animal.
+        :parameter Dict[str, Dict[str, str]] outlier_bp_dict: The two body-parts of each animal used to compute the animal criterion.
+        :parameter float criterion: The location criterion from the project_config.ini.
+        :return Tuple[pd.DataFrame, List[list]]: The corrected dataframe, and the log rows with one row per body-part.
+        """
+
+        animal_criteria = {}
+        for animal_name, animal_bps in outlier_bp_dict.items():
+            animal_bp_distances = np.sqrt(
+                (
+                    data_df[animal_bps["bp_1"] + "_x"]
+                    - data_df[animal_bps["bp_2"] + "_x"]
+                )
+                ** 2
+                + (
+                    data_df[animal_bps["bp_1"] + "_y"]
+                    - data_df[animal_bps["bp_2"] + "_y"]
+                )
+                ** 2
             )
-            self.outlier_bp_dict[animal_name]["bp_2"] = read_config_entry(
-                self.config,
-                ConfigKey.OUTLIER_SETTINGS.value,
-                "location_bodypart2_{}".format(animal_name.lower()),
-                "str",
+            animal_criteria[animal_name] = animal_bp_distances.mean() * criterion
+        log = []
+        for animal_name, animal_bps in animal_bp_dict.items():
+            bp_names = [x[:-2] for x in animal_bps["X_bps"]]
+            animal_arr = np.stack(
+                [
+                    data_df[[x, y]].to_numpy()
+                    for x, y in zip(animal_bps["X_bps"], animal_bps["Y_bps"])
+                ],
+                axis=1,
             )
-
-    def __find_location_outliers(self):
-        for animal_name, animal_data in self.bp_dict.items():
-            animal_criterion = self.animal_criteria[animal_name]
-            self.above_criterion_dict_dict[self.video_name][animal_name] = {}
-            self.below_criterion_dict_dict[self.video_name][animal_name] = {}
-            for body_part_name, body_part_data in animal_data.items():
-                self.above_criterion_dict_dict[self.video_name][animal_name][
-                    body_part_name
-                ] = []
-                self.below_criterion_dict_dict[self.video_name][animal_name][
-                    body_part_name
-                ] = []
-                for frame in range(body_part_data.shape[0]):
-                    second_bp_names = [
-                        x for x in list(animal_data.keys()) if x != body_part_name
+            outliers = OutlierCorrecterLocation.find_location_outliers(
+                data=animal_arr, criterion=animal_criteria[animal_name]
+            )
+            for bp_cnt, bp_name in enumerate(bp_names):
+                bp_outliers = outliers[:, bp_cnt]
+                if bp_outliers.any():
+                    fill_idx = OutlierCorrecterLocation.last_valid_idx(
+                        outliers=bp_outliers
+                    )
+                    for col in [bp_name + "_x", bp_name + "_y"]:
+                        data_df[col] = data_df[col].values[fill_idx]
+                outlier_cnt = int(np.sum(bp_outliers))
+                log.append(
+                    [
+                        video_name,
+                        animal_name,
+                        bp_name,
+                        outlier_cnt,
+                        round(outlier_cnt / len(data_df), 6),
                     ]
-                    first_bp_cord = body_part_data[frame]
-                    distance_above_criterion_counter = 0
-                    for second_bp in second_bp_names:
-                        second_bp_cord = animal_data[second_bp][frame]
-                        distance = np.sqrt(
-                            (first_bp_cord[0] - second_bp_cord[0]) ** 2
-                            + (first_bp_cord[1] - second_bp_cord[1]) ** 2
-                        )
-                        if distance > animal_criterion:
-                            distance_above_criterion_counter += 1
-                    if distance_above_criterion_counter > 1:
-                        self.above_criterion_dict_dict[self.video_name][animal_name][
-                            body_part_name
-                        ].append(frame)
-                    else:
-                        self.below_criterion_dict_dict[self.video_name][animal_name][
-                            body_part_name
-                        ].append(frame)
-
-    def __correct_outliers(self):
-        above_citeria_dict = self.above_criterion_dict_dict[self.video_name]
-        for animal_name, animal_bp_data in above_citeria_dict.items():
-            for bp_name, outlier_idx_lst in animal_bp_data.items():
-                body_part_x, body_part_y = bp_name + "_x", bp_name + "_y"
-                for outlier_idx in outlier_idx_lst:
-                    try:
-                        closest_idx = max(
-                            [
-                                i
-                                for i in self.below_criterion_dict_dict[
-                                    self.video_name
-                                ][animal_name][bp_name]
-                                if outlier_idx > i
-                            ]
-                        )
-                    except ValueError:
-                        closest_idx = outlier_idx
-                    self.data_df.loc[[outlier_idx], body_part_x] = self.data_df.loc[
-                        [closest_idx], body_part_x
-                    ].values[0]
-                    self.data_df.loc[[outlier_idx], body_part_y] = self.data_df.loc[
-                        [closest_idx], body_part_y
-                    ].values[0]
+                )
+        return data_df, log
 
     def run(self):
         """
@@ -138,90 +219,40 @@ class OutlierCorrecterLocation(ConfigReader):
         ``project_folder/csv/outlier_corrected_movement_location`` directory of the SimBA project.
         """
 
-        for file_cnt, file_path in enumerate(self.outlier_corrected_movement_paths):
-            video_timer = SimbaTimer(start=True)
-            _, self.video_name, _ = get_fn_ext(file_path)
-            print(
-                f"Processing video {self.video_name}. Video {file_cnt+1}/{len(self.outlier_corrected_movement_paths)}.."
-            )
-            self.above_criterion_dict_dict[self.video_name] = {}
-            self.below_criterion_dict_dict[self.video_name] = {}
-            save_path = os.path.join(
-                self.outlier_corrected_dir, self.video_name + "." + self.file_type
-            )
-            self.data_df = read_df(file_path, self.file_type)
-            self.animal_criteria = {}
-            for animal_name, animal_bps in self.outlier_bp_dict.items():
-                animal_bp_distances = np.sqrt(
-                    (
-                        self.data_df[animal_bps["bp_1"] + "_x"]
-                        - self.data_df[animal_bps["bp_2"] + "_x"]
-                    )
-                    ** 2
-                    + (
-                        self.data_df[animal_bps["bp_1"] + "_y"]
-                        - self.data_df[animal_bps["bp_2"] + "_y"]
-                    )
-                    ** 2
-                )
-                self.animal_criteria[animal_name] = (
-                    animal_bp_distances.mean() * self.criterion
-                )
-            self.bp_dict = {}
-            for animal_name, animal_bps in self.animal_bp_dict.items():
-                bp_col_names = np.array(
-                    [[i, j] for i, j in zip(animal_bps["X_bps"], animal_bps["Y_bps"])]
-                ).ravel()
-                animal_arr = self.data_df[bp_col_names].to_numpy()
-                self.bp_dict[animal_name] = {}
-                for bp_cnt, bp_col_start in enumerate(range(0, animal_arr.shape[1], 2)):
-                    bp_name = animal_bps["X_bps"][bp_cnt][:-2]
-                    self.bp_dict[animal_name][bp_name] = animal_arr[
-                        :, bp_col_start : bp_col_start + 2
-                    ]
-            self.__find_location_outliers()
-            self.__correct_outliers()
-            write_df(df=self.data_df, file_type=self.file_type, save_path=save_path)
-            video_timer.stop_timer()
-            print(
-                f"Corrected location outliers for file {self.video_name} (elapsed time: {video_timer.elapsed_time_str}s)..."
-            )
+        print(f"Processing {len(self.outlier_corrected_movement_paths)} file(s)...")
+        results, self.processed_cnt, self.skipped_cnt = run_file_tasks(
+            func=functools.partial(
+                self._correct_file,
+                file_type=self.file_type,
+                save_dir=self.outlier_corrected_dir,
+                animal_bp_dict=self.animal_bp_dict,
+                outlier_bp_dict=self.outlier_bp_dict,
+                criterion=self.criterion,
+            ),
+            file_paths=self.outlier_corrected_movement_paths,
+            core_cnt=self.core_cnt,
+            source=self.__class__.__name__,
+        )
+        self.log = pd.DataFrame(
+            [row for file_log in results.values() for row in file_log],
+            columns=[
+                "Video",
+                "Animal",
+                "Body-part",
+                "Corrections",
+                "Correction ratio (%)",
+            ],
+        )
         self.__save_log_file()
 
     def __save_log_file(self):
-        out_df_lst = []
-        for video_name, video_data in self.above_criterion_dict_dict.items():
-            for animal_name, animal_data in video_data.items():
-                for bp_name, vid_idx_lst in animal_data.items():
-                    correction_ratio = round(len(vid_idx_lst) / len(self.data_df), 6)
-                    out_df_lst.append(
-                        pd.DataFrame(
-                            [
-                                [
-                                    video_name,
-                                    animal_name,
-                                    bp_name,
-                                    len(vid_idx_lst),
-                                    correction_ratio,
-                                ]
-                            ],
-                            columns=[
-                                "Video",
-                                "Animal",
-                                "Body-part",
-                                "Corrections",
-                                "Correction ratio (%)",
-                            ],
-                        )
-                    )
-        out_df = pd.concat(out_df_lst, axis=0).reset_index(drop=True)
         self.logs_path = os.path.join(
             self.logs_path, f"Outliers_location_{self.datetime}.csv"
         )
-        out_df.to_csv(self.logs_path)
+        self.log.to_csv(self.logs_path)
         self.timer.stop_timer()
         stdout_success(
-            msg='Log for corrected "location outliers" saved in project_folder/logs',
+            msg=f'{self.processed_cnt} file(s) corrected for "location outliers" ({self.skipped_cnt} file(s) skipped). Log saved in project_folder/logs',
             elapsed_time=self.timer.elapsed_time_str,
         )
 
@@ -1,7 +1,9 @@
 __author__ = "Simon Nilsson"
 
+import functools
 import glob
 import os
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -9,9 +11,11 @@ from numba import jit, prange
 
 from simba.mixins.config_reader import ConfigReader
 from simba.mixins.feature_extraction_mixin import FeatureExtractionMixin
-from simba.utils.enums import ConfigKey, Dtypes
+from simba.utils.checks import check_int
+from simba.utils.errors import DataHeaderError
 from simba.utils.printing import SimbaTimer, stdout_success
-from simba.utils.read_write import (get_fn_ext, read_config_entry, read_df,
+from simba.utils.read_write import (find_core_cnt, get_fn_ext, read_df,
+                                    read_outlier_settings, run_file_tasks,
                                     write_df)
 
 
@@ -22,6 +26,7 @@ class OutlierCorrecterMovement(ConfigReader, FeatureExtractionMixin):
     under the [Outlier settings] header.
 
     :parameter str config_path: path to SimBA project config file in Configparser format
+    :parameter Optional[int] core_cnt: Number of files to process in parallel. If -1, then all available cores. Default: 1.
 
     .. image:: _static/img/movement_outlier.png
        :width: 500
@@ -36,44 +41,28 @@ class OutlierCorrecterMovement(ConfigReader, FeatureExtractionMixin):
     >>> outlier_correcter_movement.run()
     """
 
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, core_cnt: Optional[int] = 1):
         ConfigReader.__init__(self, config_path=config_path)
         FeatureExtractionMixin.__init__(self)
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
+        )
+        self.core_cnt = core_cnt
         if not os.path.exists(self.outlier_corrected_movement_dir):
             os.makedirs(self.outlier_corrected_movement_dir)
-        if self.animal_cnt == 1:
-            self.animal_id = read_config_entry(
-                self.config,
-                ConfigKey.MULTI_ANIMAL_ID_SETTING.value,
-                ConfigKey.MULTI_ANIMAL_IDS.value,
-                Dtypes.STR.value,
-            )
-            if self.animal_id != "None":
-                self.animal_bp_dict[self.animal_id] = self.animal_bp_dict.pop(
-                    "Animal_1"
-                )
-        self.above_criterion_dict_dict = {}
-        self.criterion = read_config_entry(
-            self.config,
-            ConfigKey.OUTLIER_SETTINGS.value,
-            ConfigKey.MOVEMENT_CRITERION.value,
-            Dtypes.FLOAT.value,
+        (
+            self.animal_bp_dict,
+            self.outlier_bp_dict,
+            self.criterion,
+        ) = read_outlier_settings(
+            config=self.config,
+            animal_bp_dict=self.animal_bp_dict,
+            animal_cnt=self.animal_cnt,
+            outlier_type="movement",
         )
-        self.outlier_bp_dict = {}
-        for animal_name in self.animal_bp_dict.keys():
-            self.outlier_bp_dict[animal_name] = {}
-            self.outlier_bp_dict[animal_name]["bp_1"] = read_config_entry(
-                self.config,
-                "Outlier settings",
-                "movement_bodypart1_{}".format(animal_name.lower()),
-                "str",
-            )
-            self.outlier_bp_dict[animal_name]["bp_2"] = read_config_entry(
-                self.config,
-                "Outlier settings",
-                "movement_bodypart2_{}".format(animal_name.lower()),
-                "str",
-            )
 
     @staticmethod
     @jit(nopython=True)
@@ -87,80 +76,136 @@ class OutlierCorrecterMovement(ConfigReader, FeatureExtractionMixin):
             results[i, :] = current_value
         return results, cnt
 
-    def __outlier_replacer(self):
-        for animal_name, animal_body_parts in self.animal_bp_dict.items():
+    @staticmethod
+    def _correct_file(
+        file_path: Union[str, os.PathLike],
+        file_type: str,
+        save_dir: Union[str, os.PathLike],
+        bp_headers: List[str],
+        animal_bp_dict: Dict[str, Any],
+        outlier_bp_dict: Dict[str, Dict[str, str]],
+        criterion: float,
+    ) -> List[list]:
+        """
+        Helper to correct the movement outliers in a single file and save the results in ``save_dir``. Called by
+        :meth:`simba.outlier_tools.outlier_corrector_movement.OutlierCorrecterMovement.run` through
+        :func:`simba.utils.read_write.run_file_tasks`.
+
+        :return List[list]: The log rows of the file with one row per body-part.
+        """
+
+        video_timer = SimbaTimer(start=True)
+        _, video_name, _ = get_fn_ext(file_path)
+        print(f"Processing video {video_name}...")
+        data_df = read_df(file_path, file_type, check_multiindex=True)
+        if len(data_df.columns) != len(bp_headers):
+            raise DataHeaderError(
+                msg=f"SIMBA ERROR: SimBA expects {len(bp_headers)} columns of data inside the files within project_folder/csv/input_csv directory. However, within file {file_path} file, SimBA found {len(data_df.columns)} columns.",
+                source=OutlierCorrecterMovement.__name__,
+            )
+        data_df.columns = bp_headers
+        data_df, log = OutlierCorrecterMovement.correct_movement_outliers(
+            data_df=data_df,
+            video_name=video_name,
+            animal_bp_dict=animal_bp_dict,
+            outlier_bp_dict=outlier_bp_dict,
+            criterion=criterion,
+        )
+        save_path = os.path.join(save_dir, video_name + "." + file_type)
+        write_df(df=data_df, file_type=file_type, save_path=save_path)
+        video_timer.stop_timer()
+        print(
+            f"Corrected movement outliers for file {video_name} (elapsed time: {video_timer.elapsed_time_str}s)..."
+        )
+        return log
+
+    @staticmethod
+    def correct_movement_outliers(
+        data_df: pd.DataFrame,
+        video_name: str,
+        animal_bp_dict: Dict[str, Any],
+        outlier_bp_dict: Dict[str, Dict[str, str]],
+        criterion: float,
+    ) -> Tuple[pd.DataFrame, List[list]]:
+        """
+        Correct the movement outliers in a single dataframe of pose-estimation data. The criterion of each animal is
+        ``criterion`` multiplied by the mean distance between the two outlier body-parts of the animal.
+
+        :parameter pd.DataFrame data_df: Pose-estimation data with the body-part headers of the SimBA project.
+        :parameter str video_name: Name of the video represented by ``data_df``. Used in the log.
+        :parameter Dict[str, Any] animal_bp_dict: The x and y body-part header names of each animal.
+        :parameter Dict[str, Dict[str, str]] outlier_bp_dict: The two body-parts of each animal used to compute the animal criterion.
+        :parameter float criterion: The movement criterion from the project_config.ini.
+        :return Tuple[pd.DataFrame, List[list]]: The corrected dataframe, and the log rows with one row per body-part.
+        """
+
+        animal_criteria = {}
+        for animal_name, animal_bps in outlier_bp_dict.items():
+            animal_bp_distances = np.sqrt(
+                (
+                    data_df[animal_bps["bp_1"] + "_x"]
+                    - data_df[animal_bps["bp_2"] + "_x"]
+                )
+                ** 2
+                + (
+                    data_df[animal_bps["bp_1"] + "_y"]
+                    - data_df[animal_bps["bp_2"] + "_y"]
+                )
+                ** 2
+            )
+            animal_criteria[animal_name] = animal_bp_distances.mean() * criterion
+        log = []
+        for animal_name, animal_body_parts in animal_bp_dict.items():
             for bp_x_name, bp_y_name in zip(
                 animal_body_parts["X_bps"], animal_body_parts["Y_bps"]
             ):
-                vals, cnt = self.__corrector(
-                    data=self.data_df[[bp_x_name, bp_y_name]].values,
-                    criterion=self.animal_criteria[animal_name],
+                vals, cnt = OutlierCorrecterMovement.__corrector(
+                    data=data_df[[bp_x_name, bp_y_name]].values,
+                    criterion=animal_criteria[animal_name],
                 )
                 df = pd.DataFrame(vals, columns=[bp_x_name, bp_y_name])
-                self.data_df.update(df)
-                self.log.loc[len(self.log)] = [
-                    self.video_name,
-                    animal_name,
-                    bp_x_name[:-2],
-                    cnt,
-                    round(cnt / len(df), 6),
-                ]
+                data_df.update(df)
+                log.append(
+                    [
+                        video_name,
+                        animal_name,
+                        bp_x_name[:-2],
+                        cnt,
+                        round(cnt / len(df), 6),
+                    ]
+                )
+        return data_df, log
 
     def run(self):
         """
         Runs outlier detection and correction. Results are stored in the
         ``project_folder/csv/outlier_corrected_movement`` directory of the SimBA project.
         """
+        print(f"Processing {len(self.input_csv_paths)} file(s)...")
+        results, self.processed_cnt, self.skipped_cnt = run_file_tasks(
+            func=functools.partial(
+                self._correct_file,
+                file_type=self.file_type,
+                save_dir=self.outlier_corrected_movement_dir,
+                bp_headers=self.bp_headers,
+                animal_bp_dict=self.animal_bp_dict,
+                outlier_bp_dict=self.outlier_bp_dict,
+                criterion=self.criterion,
+            ),
+            file_paths=self.input_csv_paths,
+            core_cnt=self.core_cnt,
+            source=self.__class__.__name__,
+        )
         self.log = pd.DataFrame(
+            [row for file_log in results.values() for row in file_log],
             columns=[
                 "VIDEO",
                 "ANIMAL",
                 "BODY-PART",
                 "CORRECTION COUNT",
                 "CORRECTION PCT",
-            ]
+            ],
         )
-        for file_cnt, file_path in enumerate(self.input_csv_paths):
-            video_timer = SimbaTimer(start=True)
-            _, self.video_name, _ = get_fn_ext(file_path)
-            print(
-                "Processing video {}. Video {}/{}...".format(
-                    self.video_name, str(file_cnt + 1), str(len(self.input_csv_paths))
-                )
-            )
-            self.above_criterion_dict_dict[self.video_name] = {}
-            save_path = os.path.join(
-                self.outlier_corrected_movement_dir,
-                self.video_name + "." + self.file_type,
-            )
-            self.data_df = read_df(file_path, self.file_type, check_multiindex=True)
-            self.data_df = self.insert_column_headers_for_outlier_correction(
-                data_df=self.data_df, new_headers=self.bp_headers, filepath=file_path
-            )
-            self.data_df_combined = self.create_shifted_df(df=self.data_df)
-            self.animal_criteria = {}
-            for animal_name, animal_bps in self.outlier_bp_dict.items():
-                animal_bp_distances = np.sqrt(
-                    (
-                        self.data_df[animal_bps["bp_1"] + "_x"]
-                        - self.data_df[animal_bps["bp_2"] + "_x"]
-                    )
-                    ** 2
-                    + (
-                        self.data_df[animal_bps["bp_1"] + "_y"]
-                        - self.data_df[animal_bps["bp_2"] + "_y"]
-                    )
-                    ** 2
-                )
-                self.animal_criteria[animal_name] = (
-                    animal_bp_distances.mean() * self.criterion
-                )
-            self.__outlier_replacer()
-            write_df(df=self.data_df, file_type=self.file_type, save_path=save_path)
-            video_timer.stop_timer()
-            print(
-                f"Corrected movement outliers for file {self.video_name} (elapsed time: {video_timer.elapsed_time_str}s)..."
-            )
         self.__save_log_file()
 
     def __save_log_file(self):
@@ -170,7 +215,7 @@ class OutlierCorrecterMovement(ConfigReader, FeatureExtractionMixin):
         self.log.to_csv(self.log_fn)
         self.timer.stop_timer()
         stdout_success(
-            msg='Log for corrected "movement outliers" saved in project_folder/logs',
+            msg=f'{self.processed_cnt} file(s) corrected for "movement outliers" ({self.skipped_cnt} file(s) skipped). Log saved in project_folder/logs',
             elapsed_time=self.timer.elapsed_time_str,
         )
 
@@ -95,7 +95,16 @@ class DistancePlotterSingleCore(ConfigReader, PlottingMixin):
 
         for file_cnt, file_path in enumerate(self.files_found):
             video_timer = SimbaTimer(start=True)
-            self.data_df = read_df(file_path, self.file_type)
+            self.data_df = read_df(
+                file_path=file_path,
+                file_type=self.file_type,
+                usecols=[
+                    f"{bp}_{axis}"
+                    for data in self.line_attr.values()
+                    for bp in data[0:2]
+                    for axis in ("x", "y")
+                ],
+            )
             distance_arr = np.full(
                 (len(self.data_df), len(self.line_attr.keys())), np.nan
             )
@@ -88,7 +88,9 @@ class GanttCreatorSingleProcess(ConfigReader, PlottingMixin):
     def run(self):
         for file_cnt, file_path in enumerate(self.files_found):
             _, self.video_name, _ = get_fn_ext(file_path)
-            self.data_df = read_df(file_path, self.file_type).reset_index(drop=True)
+            self.data_df = read_df(
+                file_path, self.file_type, usecols=list(self.clf_names)
+            ).reset_index(drop=True)
             self.video_info_settings, _, self.fps = self.read_video_info(
                 video_name=self.video_name
             )
@@ -122,7 +122,9 @@ class GanttCreatorMultiprocess(ConfigReader, PlottingMixin):
             video_timer = SimbaTimer()
             video_timer.start_timer()
             _, self.video_name, _ = get_fn_ext(file_path)
-            self.data_df = read_df(file_path, self.file_type).reset_index(drop=True)
+            self.data_df = read_df(
+                file_path, self.file_type, usecols=list(self.clf_names)
+            ).reset_index(drop=True)
             print(
                 "Processing video {}, Frame count: {} (Video {}/{})...".format(
                     self.video_name,
@@ -190,7 +190,11 @@ class HeatMapperClfSingleCore(ConfigReader, PlottingMixin):
                 )
                 if not os.path.exists(self.save_video_folder):
                     os.makedirs(self.save_video_folder)
-            self.data_df = read_df(file_path=file_path, file_type=self.file_type)
+            self.data_df = read_df(
+                file_path=file_path,
+                file_type=self.file_type,
+                usecols=self.bp_lst + [self.clf_name],
+            )
             clf_array, aspect_ratio = self.__calculate_bin_attr(
                 data_df=self.data_df,
                 clf_name=self.clf_name,
@@ -182,7 +182,9 @@ class HeatmapperLocationSingleCore(ConfigReader, PlottingMixin):
                 )
                 if not os.path.exists(self.save_video_folder):
                     os.makedirs(self.save_video_folder)
-            self.data_df = read_df(file_path, self.file_type)[self.bp_lst]
+            self.data_df = read_df(
+                file_path=file_path, file_type=self.file_type, usecols=self.bp_lst
+            )[self.bp_lst]
             squares, aspect_ratio = GeometryMixin().bucket_img_into_grid_square(
                 bucket_grid_size_mm=self.style_attr["bin_size"],
                 img_size=(self.width, self.height),
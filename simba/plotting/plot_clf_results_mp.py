@@ -48,6 +48,24 @@ def _multiprocess_sklearn_video(
         data["index"].iloc[0],
         data["index"].iloc[-1],
     )
+    PlottingMixin.check_chunk_frame_index(
+        frm_idx=data["index"].values, source=_multiprocess_sklearn_video.__name__
+    )
+    bp_data = {}
+    for animal_name, animal_data in bp_dict.items():
+        bp_cols = []
+        for x_bp, y_bp, p_bp in zip(
+            animal_data["X_bps"], animal_data["Y_bps"], animal_data["P_bps"]
+        ):
+            bp_cols.extend([x_bp, y_bp, p_bp])
+        bp_data[animal_name] = data[bp_cols].values.reshape(len(data), -1, 3)
+    clf_data, cumsum_data = {}, {}
+    for model in models_info.values():
+        clf_data[model["model_name"]] = data[model["model_name"]].values
+        if print_timers:
+            cumsum_data[model["model_name"]] = data[
+                model["model_name"] + "_cumsum"
+            ].values
 
     if video_setting:
         video_save_path = os.path.join(video_save_dir, "{}.mp4".format(str(group)))
@@ -60,31 +78,28 @@ def _multiprocess_sklearn_video(
     cap.set(1, start_frm)
     while current_frm < end_frm:
         ret, img = cap.read()
+        frm_idx = current_frm - start_frm
         add_spacer = 2
         for animal_name, animal_data in bp_dict.items():
             animal_clr = animal_data["colors"]
             id_flag_cords = None
             for bp_no in range(len(animal_data["X_bps"])):
                 bp_clr = animal_clr[bp_no]
-                x_bp, y_bp, p_bp = (
-                    animal_data["X_bps"][bp_no],
-                    animal_data["Y_bps"][bp_no],
-                    animal_data["P_bps"][bp_no],
-                )
-                bp_cords = data.loc[current_frm, [x_bp, y_bp, p_bp]]
-                if bp_cords[p_bp] > pose_threshold:
+                x_bp = animal_data["X_bps"][bp_no]
+                bp_cords = bp_data[animal_name][frm_idx][bp_no]
+                if bp_cords[2] > pose_threshold:
                     cv2.circle(
                         img,
-                        (int(bp_cords[x_bp]), int(bp_cords[y_bp])),
+                        (int(bp_cords[0]), int(bp_cords[1])),
                         0,
                         bp_clr,
                         text_attr["circle_scale"],
                     )
                     if ("centroid" in x_bp.lower()) or ("center" in x_bp.lower()):
-                        id_flag_cords = (int(bp_cords[x_bp]), int(bp_cords[y_bp]))
+                        id_flag_cords = (int(bp_cords[0]), int(bp_cords[1]))
 
             if not id_flag_cords:
-                id_flag_cords = (int(bp_cords[x_bp]), int(bp_cords[y_bp]))
+                id_flag_cords = (int(bp_cords[0]), int(bp_cords[1]))
             cv2.putText(
                 img,
                 animal_name,
@@ -108,13 +123,10 @@ def _multiprocess_sklearn_video(
             )
         frame_results = {}
         for model in models_info.values():
-            frame_results[model["model_name"]] = data.loc[
-                current_frm, model["model_name"]
-            ]
+            frame_results[model["model_name"]] = clf_data[model["model_name"]][frm_idx]
             if print_timers:
                 cumulative_time = round(
-                    data.loc[current_frm, model["model_name"] + "_cumsum"]
-                    / video_meta_data["fps"],
+                    cumsum_data[model["model_name"]][frm_idx] / video_meta_data["fps"],
                     3,
                 )
                 cv2.putText(
@@ -96,7 +96,9 @@ class TresholdPlotCreatorSingleProcess(ConfigReader, PlottingMixin):
             video_info, self.px_per_mm, fps = self.read_video_info(
                 video_name=self.video_name
             )
-            data_df = read_df(file_path, self.file_type)
+            data_df = read_df(
+                file_path=file_path, file_type=self.file_type, usecols=[self.clf_name]
+            )
             check_that_column_exist(
                 df=data_df, column_name=self.clf_name, file_name=self.video_name
             )
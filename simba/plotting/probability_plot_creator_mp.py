@@ -98,7 +98,11 @@ class TresholdPlotCreatorMultiprocess(ConfigReader, PlottingMixin):
             video_info, self.px_per_mm, self.fps = self.read_video_info(
                 video_name=self.video_name
             )
-            data_df = read_df(file_path, self.file_type)
+            data_df = read_df(
+                file_path=file_path,
+                file_type=self.file_type,
+                usecols=[self.probability_col, self.clf_name],
+            )
             if self.probability_col not in data_df.columns:
                 raise ColumnNotFoundError(
                     column_name=self.probability_col, file_name=file_path
@@ -15,6 +15,7 @@ import numpy as np
 from simba.mixins.config_reader import ConfigReader
 from simba.mixins.plotting_mixin import PlottingMixin
 from simba.mixins.train_model_mixin import TrainModelMixin
+from simba.model.model_cache import read_cached_model
 from simba.utils.data import plug_holes_shortest_bout
 from simba.utils.enums import TagNames
 from simba.utils.printing import log_event, stdout_success
@@ -97,7 +98,7 @@ class ValidateModelOneVideo(ConfigReader, PlottingMixin, TrainModelMixin):
         self.clf_data_save_path = os.path.join(
             self.clf_data_validation_dir, self.feature_filename + ".csv"
         )
-        self.clf = read_df(file_path=model_path, file_type="pickle")
+        self.clf = read_cached_model(file_path=model_path)
         self.in_df = read_df(feature_file_path, self.file_type)
 
     def __run_clf(self):
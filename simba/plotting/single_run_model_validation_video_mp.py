@@ -15,6 +15,7 @@ import numpy as np
 from simba.mixins.config_reader import ConfigReader
 from simba.mixins.plotting_mixin import PlottingMixin
 from simba.mixins.train_model_mixin import TrainModelMixin
+from simba.model.model_cache import read_cached_model
 from simba.utils.data import plug_holes_shortest_bout
 from simba.utils.printing import stdout_success
 from simba.utils.read_write import (concatenate_videos_in_folder, get_fn_ext,
@@ -91,7 +92,7 @@ class ValidateModelOneVideoMultiprocess(ConfigReader, PlottingMixin, TrainModelM
             self.clf_data_validation_dir, self.feature_filename + ".csv"
         )
         self.video_meta_data = get_video_meta_data(video_path=self.video_path)
-        self.clf = read_df(file_path=model_path, file_type="pickle")
+        self.clf = read_cached_model(file_path=model_path)
         self.in_df = read_df(feature_file_path, self.file_type)
         self.feature_file_path = feature_file_path
         self.temp_dir = os.path.join(self.single_validation_video_save_dir, "temp")
@@ -3,7 +3,7 @@ __author__ = "Simon Nilsson"
 import glob
 import os
 import shutil
-from typing import List, Union
+from typing import List, Optional, Union
 
 import pandas as pd
 
@@ -145,7 +145,22 @@ def import_multiple_dlc_tracking_csv_file(
     smoothing_setting: str,
     smoothing_time: int,
     data_dir: str,
+    core_cnt: Optional[int] = 1,
 ):
+    """
+    Import a folder of DLC pose-estimation CSV files to a SimBA project, and interpolate and smooth the imported files.
+
+    :parameter str config_path: path to SimBA project config file in Configparser format
+    :parameter str interpolation_setting: Type of interpolation. OPTIONS: 'None', 'Animal(s): Nearest', 'Animal(s): Linear', 'Animal(s): Quadratic','Body-parts: Nearest', 'Body-parts: Linear', 'Body-parts: Quadratic'.
+    :parameter str smoothing_setting: Type of smoothing. OPTIONS: 'None', 'Gaussian', 'Savitzky Golay'.
+    :parameter int smoothing_time: Smoothing time window in milliseconds.
+    :parameter str data_dir: path to folder containing DLC pose-estimation CSV files.
+    :parameter Optional[int] core_cnt: Number of files to interpolate and smooth in parallel. If -1, then all available cores. Default: 1.
+
+    :example:
+    >>> import_multiple_dlc_tracking_csv_file(config_path='project_folder/project_config.ini', interpolation_setting='Body-parts: Nearest', smoothing_setting='Savitzky Golay', smoothing_time=200, data_dir='CSV_import', core_cnt=-1)
+    """
+
     timer = SimbaTimer(start=True)
     if (smoothing_setting == Methods.GAUSSIAN.value) or (
         smoothing_setting == Methods.SAVITZKY_GOLAY.value
@@ -159,6 +174,7 @@ def import_multiple_dlc_tracking_csv_file(
             config_path=config_path,
             method=interpolation_setting,
             initial_import_multi_index=True,
+            core_cnt=core_cnt,
         )
     if (smoothing_setting == Methods.GAUSSIAN.value) or (
         smoothing_setting == Methods.SAVITZKY_GOLAY.value
@@ -169,6 +185,7 @@ def import_multiple_dlc_tracking_csv_file(
             time_window=int(smoothing_time),
             smoothing_method=smoothing_setting,
             initial_import_multi_index=True,
+            core_cnt=core_cnt,
         )
     timer.stop_timer()
     stdout_success(
@@ -2,6 +2,7 @@ __author__ = "Simon Nilsson"
 
 import os
 from copy import deepcopy
+from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -9,10 +10,11 @@ import pandas as pd
 from simba.data_processors.interpolation_smoothing import Interpolate, Smooth
 from simba.mixins.config_reader import ConfigReader
 from simba.mixins.pose_importer_mixin import PoseImporterMixin
+from simba.utils.checks import check_int
 from simba.utils.enums import Formats, Methods
 from simba.utils.errors import BodypartColumnNotFoundError
 from simba.utils.printing import SimbaTimer, stdout_success
-from simba.utils.read_write import (find_all_videos_in_project,
+from simba.utils.read_write import (find_all_videos_in_project, find_core_cnt,
                                     get_video_meta_data, write_df)
 
 
@@ -30,6 +32,7 @@ class MADLCImporterH5(ConfigReader, PoseImporterMixin):
         'Body-parts: Quadratic'.
     :parameter dict smoothing_settings: Dictionary defining the pose estimation smoothing method. EXAMPLE: {'Method': 'Savitzky Golay',
         'Parameters': {'Time_window': '200'}})
+    :parameter Optional[int] core_cnt: Number of files to import in parallel. If not 1, files are imported without user interaction and animal identities follow the track order of the data files (see :meth:`simba.mixins.pose_importer_mixin.PoseImporterMixin.run_parallel_import`). If -1, then all available cores. Default: 1.
 
     .. note::
        `Multi-animal import tutorial <https://github.com/sgoldenlab/simba/blob/master/docs/Multi_animal_pose.md>`__.
@@ -52,14 +55,21 @@ class MADLCImporterH5(ConfigReader, PoseImporterMixin):
         id_lst: list,
         interpolation_settings: str,
         smoothing_settings: dict,
+        core_cnt: Optional[int] = 1,
     ):
         ConfigReader.__init__(self, config_path=config_path, read_video_info=False)
         PoseImporterMixin.__init__(self)
-
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
+        )
         self.interpolation_settings, self.smoothing_settings = (
             interpolation_settings,
             smoothing_settings,
         )
+        self.core_cnt = int(core_cnt)
         self.data_folder, self.id_lst = data_folder, id_lst
         self.import_log_path = os.path.join(
             self.logs_path, f"data_import_log_{self.datetime}.csv"
@@ -89,7 +99,30 @@ class MADLCImporterH5(ConfigReader, PoseImporterMixin):
             self.update_bp_headers_file()
         print(f"Importing {len(list(self.data_and_videos_lk.keys()))} file(s)...")
 
+    @staticmethod
+    def read_madlc_h5(file_path: Union[str, os.PathLike]) -> pd.DataFrame:
+        """
+        Read the pose-estimation data of a maDLC H5 file into a dataframe. Infinite and missing values are set to 0.
+
+        :parameter Union[str, os.PathLike] file_path: Path to the maDLC H5 file.
+        :return pd.DataFrame: The pose-estimation data.
+        """
+
+        return pd.read_hdf(file_path).replace([np.inf, -np.inf], np.nan).fillna(0)
+
     def run(self):
+        if self.core_cnt != 1:
+            self.run_parallel_import(
+                read_func=self.read_madlc_h5,
+                output_names={x: x for x in self.data_and_videos_lk.keys()},
+                core_cnt=self.core_cnt,
+            )
+            self.timer.stop_timer()
+            stdout_success(
+                msg="All maDLC H5 data files imported",
+                elapsed_time=self.timer.elapsed_time_str,
+            )
+            return
         import_log = pd.DataFrame(
             columns=[
                 "VIDEO",
@@ -108,11 +141,7 @@ class MADLCImporterH5(ConfigReader, PoseImporterMixin):
                 video_name,
             )
             print(f"Processing {video_name} ...")
-            self.data_df = (
-                pd.read_hdf(video_data["DATA"])
-                .replace([np.inf, -np.inf], np.nan)
-                .fillna(0)
-            )
+            self.data_df = self.read_madlc_h5(file_path=video_data["DATA"])
             if len(self.data_df.columns) != len(self.bp_headers):
                 raise BodypartColumnNotFoundError(
                     msg=f'The number of body-parts in data file {video_data["DATA"]} do not match the number of body-parts in your SimBA project. '
@@ -1,7 +1,9 @@
 __author__ = "Simon Nilsson"
 
+import functools
 import os
 from copy import deepcopy
+from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -9,13 +11,13 @@ import pandas as pd
 from simba.data_processors.interpolation_smoothing import Interpolate, Smooth
 from simba.mixins.config_reader import ConfigReader
 from simba.mixins.pose_importer_mixin import PoseImporterMixin
-from simba.utils.checks import check_that_column_exist
+from simba.utils.checks import check_int, check_that_column_exist
 from simba.utils.enums import Methods, TagNames
 from simba.utils.errors import CountError
 from simba.utils.printing import SimbaTimer, log_event, stdout_success
 from simba.utils.read_write import (clean_sleap_file_name,
-                                    find_all_videos_in_project, get_fn_ext,
-                                    get_video_meta_data, write_df)
+                                    find_all_videos_in_project, find_core_cnt,
+                                    get_fn_ext, get_video_meta_data, write_df)
 
 TRACK = "track"
 INSTANCE_SCORE = "instance.score"
@@ -37,6 +39,7 @@ class SLEAPImporterCSV(ConfigReader, PoseImporterMixin):
         'Body-parts: Quadratic'.
     :parameter str smoothing_settings: Dictionary defining the pose estimation smoothing method. EXAMPLE: {'Method': 'Savitzky Golay',
         'Parameters': {'Time_window': '200'}})
+    :parameter Optional[int] core_cnt: Number of files to import in parallel. If not 1, files are imported without user interaction and animal identities follow the track order of the data files (see :meth:`simba.mixins.pose_importer_mixin.PoseImporterMixin.run_parallel_import`). If -1, then all available cores. Default: 1.
 
     References
     ----------
@@ -54,6 +57,7 @@ class SLEAPImporterCSV(ConfigReader, PoseImporterMixin):
         id_lst: list,
         interpolation_settings: str,
         smoothing_settings: dict,
+        core_cnt: Optional[int] = 1,
     ):
         ConfigReader.__init__(self, config_path=config_path, read_video_info=False)
         PoseImporterMixin.__init__(self)
@@ -62,10 +66,17 @@ class SLEAPImporterCSV(ConfigReader, PoseImporterMixin):
             log_type=TagNames.CLASS_INIT.value,
             msg=self.create_log_msg_from_init_args(locals=locals()),
         )
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
+        )
         self.interpolation_settings, self.smoothing_settings = (
             interpolation_settings,
             smoothing_settings,
         )
+        self.core_cnt = int(core_cnt)
         self.data_folder, self.id_lst = data_folder, id_lst
         self.import_log_path = os.path.join(
             self.logs_path, f"data_import_log_{self.datetime}.csv"
@@ -102,7 +113,57 @@ class SLEAPImporterCSV(ConfigReader, PoseImporterMixin):
             )
         print(f"Importing {len(list(self.data_and_videos_lk.keys()))} file(s)...")
 
+    @staticmethod
+    def read_sleap_csv(
+        file_path: Union[str, os.PathLike], animal_cnt: int
+    ) -> pd.DataFrame:
+        """
+        Read the pose-estimation data of a SLEAP CSV file into a dataframe with one row per frame, and one x, y and p
+        column per track and node.
+
+        :parameter Union[str, os.PathLike] file_path: Path to the SLEAP CSV file.
+        :parameter int animal_cnt: The number of animals in the SimBA project.
+        :return pd.DataFrame: The pose-estimation data.
+        """
+
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        data_df = pd.read_csv(file_path)
+        if INSTANCE_SCORE in data_df.columns:
+            data_df = data_df.drop([INSTANCE_SCORE], axis=1)
+        idx = data_df.iloc[:, :2]
+        check_that_column_exist(df=idx, column_name=TRACK, file_name=video_name)
+        idx[TRACK] = idx[TRACK].fillna("track_1")
+        idx[TRACK] = idx[TRACK].str.replace(r"[^\d.]+", "").astype(int)
+        data_df = data_df.iloc[:, 2:].fillna(0)
+        if animal_cnt > 1:
+            return pd.DataFrame(
+                PoseImporterMixin.transpose_multi_animal_table(
+                    data=data_df.values, idx=idx.values, animal_cnt=animal_cnt
+                )
+            )
+        idx = list(idx.drop(TRACK, axis=1)["frame_idx"])
+        data_df = data_df.set_index([idx]).sort_index()
+        data_df.columns = np.arange(len(data_df.columns))
+        return data_df.reindex(range(0, data_df.index[-1] + 1), fill_value=0)
+
     def run(self):
+        if self.core_cnt != 1:
+            self.run_parallel_import(
+                read_func=functools.partial(
+                    self.read_sleap_csv, animal_cnt=self.animal_cnt
+                ),
+                output_names={
+                    x: clean_sleap_file_name(filename=x)
+                    for x in self.data_and_videos_lk.keys()
+                },
+                core_cnt=self.core_cnt,
+            )
+            self.timer.stop_timer()
+            stdout_success(
+                msg=f"{len(list(self.data_and_videos_lk.keys()))} file(s) imported to the SimBA project (project_folder/csv/input_csv directory)",
+                source=self.__class__.__name__,
+            )
+            return
         for file_cnt, (video_name, video_data) in enumerate(
             self.data_and_videos_lk.items()
         ):
@@ -113,28 +174,9 @@ class SLEAPImporterCSV(ConfigReader, PoseImporterMixin):
             self.save_path = os.path.join(
                 os.path.join(self.input_csv_dir, f"{output_filename}.{self.file_type}")
             )
-            data_df = pd.read_csv(video_data["DATA"])
-            if INSTANCE_SCORE in data_df.columns:
-                data_df = data_df.drop([INSTANCE_SCORE], axis=1)
-            idx = data_df.iloc[:, :2]
-            check_that_column_exist(df=idx, column_name=TRACK, file_name=video_name)
-            idx[TRACK] = idx[TRACK].fillna("track_1")
-            idx[TRACK] = idx[TRACK].str.replace(r"[^\d.]+", "").astype(int)
-            data_df = data_df.iloc[:, 2:].fillna(0)
-            if self.animal_cnt > 1:
-                self.data_df = pd.DataFrame(
-                    self.transpose_multi_animal_table(
-                        data=data_df.values, idx=idx.values, animal_cnt=self.animal_cnt
-                    )
-                )
-            else:
-                idx = list(idx.drop(TRACK, axis=1)["frame_idx"])
-                self.data_df = data_df.set_index([idx]).sort_index()
-                self.data_df.columns = np.arange(len(self.data_df.columns))
-                self.data_df = self.data_df.reindex(
-                    range(0, self.data_df.index[-1] + 1), fill_value=0
-                )
-
+            self.data_df = self.read_sleap_csv(
+                file_path=video_data["DATA"], animal_cnt=self.animal_cnt
+            )
             if len(self.bp_headers) != len(self.data_df.columns):
                 raise CountError(
                     msg=f"SimBA project expects {len(self.bp_headers)} data columns, but your SLEAP data file {video_name} contains {len(self.data_df.columns)} columns. Missing columns: {list(set(self.bp_headers) - set(self.data_df.columns))}",
@@ -1,6 +1,6 @@
 #### MODIFIED FROM @Toshea111 - https://github.com/Toshea111/sleap/blob/develop/docs/notebooks/Convert_HDF5_to_CSV_updated.ipynb
-import io
 import os
+from typing import Optional, Union
 
 import h5py
 import numpy as np
@@ -9,13 +9,16 @@ import pandas as pd
 from simba.data_processors.interpolation_smoothing import Interpolate, Smooth
 from simba.mixins.config_reader import ConfigReader
 from simba.mixins.pose_importer_mixin import PoseImporterMixin
+from simba.utils.checks import check_int
+from simba.utils.data import sleap_tracks_to_array
 from simba.utils.enums import Methods, TagNames
-from simba.utils.errors import BodypartColumnNotFoundError
+from simba.utils.errors import (BodypartColumnNotFoundError,
+                                InvalidFileTypeError)
 from simba.utils.printing import (SimbaTimer, log_event, stdout_success,
                                   stdout_warning)
 from simba.utils.read_write import (clean_sleap_file_name,
-                                    find_all_videos_in_project, get_fn_ext,
-                                    get_video_meta_data, write_df)
+                                    find_all_videos_in_project, find_core_cnt,
+                                    get_fn_ext, get_video_meta_data, write_df)
 
 
 class SLEAPImporterH5(ConfigReader, PoseImporterMixin):
@@ -30,6 +33,7 @@ class SLEAPImporterH5(ConfigReader, PoseImporterMixin):
         'Body-parts: Quadratic'.
     :parameter str smoothing_settings: Dictionary defining the pose estimation smoothing method. EXAMPLE: {'Method': 'Savitzky Golay',
         'Parameters': {'Time_window': '200'}}
+    :parameter Optional[int] core_cnt: Number of files to import in parallel. If not 1, files are imported without user interaction and animal identities follow the track order of the data files (see :meth:`simba.mixins.pose_importer_mixin.PoseImporterMixin.run_parallel_import`). If -1, then all available cores. Default: 1.
 
     .. note::
        `Multi-animal import tutorial <https://github.com/sgoldenlab/simba/blob/master/docs/Multi_animal_pose.md>`__.
@@ -50,6 +54,7 @@ class SLEAPImporterH5(ConfigReader, PoseImporterMixin):
         id_lst: list,
         interpolation_settings: str,
         smoothing_settings: dict,
+        core_cnt: Optional[int] = 1,
     ):
         ConfigReader.__init__(self, config_path=config_path, read_video_info=False)
         PoseImporterMixin.__init__(self)
@@ -58,10 +63,17 @@ class SLEAPImporterH5(ConfigReader, PoseImporterMixin):
             log_type=TagNames.CLASS_INIT.value,
             msg=self.create_log_msg_from_init_args(locals=locals()),
         )
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
+        )
         self.interpolation_settings, self.smoothing_settings = (
             interpolation_settings,
             smoothing_settings,
         )
+        self.core_cnt = int(core_cnt)
         self.data_folder, self.id_lst = data_folder, id_lst
         self.import_log_path = os.path.join(
             self.logs_path, f"data_import_log_{self.datetime}.csv"
@@ -103,7 +115,50 @@ class SLEAPImporterH5(ConfigReader, PoseImporterMixin):
         )
         print(f"Importing {len(list(self.data_and_videos_lk.keys()))} file(s)...")
 
+    @staticmethod
+    def read_sleap_h5(file_path: Union[str, os.PathLike]) -> pd.DataFrame:
+        """
+        Read the pose-estimation data of a SLEAP H5 file into a dataframe with one x, y and p column per track
+        and node.
+
+        :parameter Union[str, os.PathLike] file_path: Path to the SLEAP H5 file.
+        :return pd.DataFrame: The pose-estimation data.
+        """
+
+        with h5py.File(file_path, "r") as f:
+            missing_keys = [
+                x
+                for x in ["tracks", "point_scores", "node_names", "track_names"]
+                if not x in list(f.keys())
+            ]
+            if missing_keys:
+                raise InvalidFileTypeError(
+                    msg=f"{file_path} is not a valid SLEAP H5 file. Missing keys {missing_keys}",
+                    source=SLEAPImporterH5.__name__,
+                )
+            tracks = f["tracks"][:].T
+            point_scores = f["point_scores"][:].T
+        return pd.DataFrame(
+            sleap_tracks_to_array(tracks=tracks, point_scores=point_scores)
+        )
+
     def run(self):
+        if self.core_cnt != 1:
+            self.run_parallel_import(
+                read_func=self.read_sleap_h5,
+                output_names={
+                    x: clean_sleap_file_name(filename=x)
+                    for x in self.data_and_videos_lk.keys()
+                },
+                core_cnt=self.core_cnt,
+            )
+            self.timer.stop_timer()
+            stdout_success(
+                msg="All SLEAP H5 data files imported",
+                elapsed_time=self.timer.elapsed_time_str,
+                source=self.__class__.__name__,
+            )
+            return
         for file_cnt, (video_name, video_data) in enumerate(
             self.data_and_videos_lk.items()
         ):
@@ -125,24 +180,9 @@ class SLEAPImporterH5(ConfigReader, PoseImporterMixin):
                 tracks = f["tracks"][:].T
                 point_scores = f["point_scores"][:].T
 
-            csv_rows = []
-            n_frames, n_nodes, _, n_tracks = tracks.shape
-            for frame_ind in range(n_frames):
-                csv_row = []
-                for track_ind in range(n_tracks):
-                    for node_ind in range(n_nodes):
-                        for xyp in range(3):
-                            if xyp == 0 or xyp == 1:
-                                data = tracks[frame_ind, node_ind, xyp, track_ind]
-                            else:
-                                data = point_scores[frame_ind, node_ind, track_ind]
-
-                            csv_row.append(f"{data:.3f}")
-                csv_rows.append(" ".join(csv_row))
-            csv_rows = "\n".join(csv_rows)
-            self.data_df = pd.read_csv(
-                io.StringIO(csv_rows), delim_whitespace=True, header=None
-            ).fillna(0)
+            self.data_df = pd.DataFrame(
+                sleap_tracks_to_array(tracks=tracks, point_scores=point_scores)
+            )
             if len(self.data_df.columns) != len(self.bp_headers):
                 raise BodypartColumnNotFoundError(
                     msg=f'The number of body-parts in data file {video_data["DATA"]} do not match the number of body-parts in your SimBA project. '
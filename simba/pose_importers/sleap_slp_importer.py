@@ -1,9 +1,9 @@
 __author__ = "Simon Nilsson"
 
-import itertools
+import functools
 import json
 import os
-from collections import defaultdict
+from typing import Dict, Optional, Tuple, Union
 
 import h5py
 import numpy as np
@@ -12,10 +12,11 @@ import pandas as pd
 from simba.data_processors.interpolation_smoothing import Interpolate, Smooth
 from simba.mixins.config_reader import ConfigReader
 from simba.mixins.pose_importer_mixin import PoseImporterMixin
+from simba.utils.checks import check_int
 from simba.utils.enums import Methods
-from simba.utils.printing import SimbaTimer, stdout_success
-from simba.utils.read_write import (find_all_videos_in_project,
-                                    get_video_meta_data, write_df)
+from simba.utils.printing import SimbaTimer, stdout_success, stdout_warning
+from simba.utils.read_write import (find_all_videos_in_project, find_core_cnt,
+                                    get_fn_ext, get_video_meta_data, write_df)
 
 
 class SLEAPImporterSLP(ConfigReader, PoseImporterMixin):
@@ -34,6 +35,7 @@ class SLEAPImporterSLP(ConfigReader, PoseImporterMixin):
         'Body-parts: Quadratic'.
     :parameter str smoothing_settings: Dictionary defining the pose estimation smoothing method. EXAMPLE: {'Method': 'Savitzky Golay',
         'Parameters': {'Time_window': '200'}}.
+    :parameter Optional[int] core_cnt: Number of files to import in parallel. If not 1, files are imported without user interaction and animal identities follow the track order of the data files (see :meth:`simba.mixins.pose_importer_mixin.PoseImporterMixin.run_parallel_import`). If -1, then all available cores. Default: 1.
 
     Example
     ----------
@@ -54,13 +56,21 @@ class SLEAPImporterSLP(ConfigReader, PoseImporterMixin):
         id_lst: list,
         interpolation_settings: str,
         smoothing_settings: dict,
+        core_cnt: Optional[int] = 1,
     ):
         ConfigReader.__init__(self, config_path=project_path, read_video_info=False)
         PoseImporterMixin.__init__(self)
+        check_int(
+            name=f"{self.__class__.__name__} core_cnt",
+            value=core_cnt,
+            min_value=-1,
+            max_value=find_core_cnt()[0],
+        )
         self.interpolation_settings, self.smoothing_settings = (
             interpolation_settings,
             smoothing_settings,
         )
+        self.core_cnt = int(core_cnt)
         self.data_folder, self.id_lst = data_folder, id_lst
         self.import_log_path = os.path.join(
             self.logs_path, f"data_import_log_{self.datetime}.csv"
@@ -88,35 +98,6 @@ class SLEAPImporterSLP(ConfigReader, PoseImporterMixin):
             self.update_bp_headers_file()
         print(f"Importing {len(list(self.data_and_videos_lk.keys()))} file(s)...")
 
-    def __h5_to_dict(self, name, obj):
-        attr = list(obj.attrs.items())
-        if name == "metadata":
-            jsonList = attr[1][1]
-            jsonList = jsonList.decode("utf-8")
-            final_dictionary = json.loads(jsonList)
-            final_dictionary = dict(final_dictionary)
-            return final_dictionary
-
-    def __check_that_all_animals_exist_in_frame(self):
-        existing_animals = list(self.frame_dict.keys())
-        missing_animals = [
-            x for x in range(self.animal_cnt) if x not in existing_animals
-        ]
-        for missing_animal in missing_animals:
-            self.frame_dict[missing_animal] = (
-                [0] * ((len(self.analysis_dict["ordered_bps"]))) * 3
-            )
-
-    def __fill_missing_indexes(self):
-        missing_indexes = list(
-            set(list(range(0, self.video_info["frame_count"])))
-            - set(list(self.data_df.index))
-        )
-        missing_df = pd.DataFrame(
-            0, index=missing_indexes, columns=self.analysis_dict["xyp_headers"]
-        )
-        self.data_df = pd.concat([self.data_df, missing_df], axis=0)
-
     def __run_interpolation(self):
         print(
             f"Interpolating missing values in video {self.video_name} (Method: {self.interpolation_settings})..."
@@ -136,60 +117,45 @@ class SLEAPImporterSLP(ConfigReader, PoseImporterMixin):
             config_path=self.config_path,
             input_path=self.save_path,
             time_window=int(self.smoothing_settings["Parameters"]["Time_window"]),
-            smoothing_method=self.smoothing_settings,
+            smoothing_method=self.smoothing_settings["Method"],
+            initial_import_multi_index=True,
         )
 
     def run(self):
-        self.analysis_dict = defaultdict(list)
-        self.save_paths_lst = []
+        if self.core_cnt != 1:
+            self.run_parallel_import(
+                read_func=functools.partial(
+                    self.read_slp,
+                    track_cnt=self.animal_cnt,
+                    frame_cnts={
+                        x["DATA"]: get_video_meta_data(video_path=x["VIDEO"])[
+                            "frame_count"
+                        ]
+                        for x in self.data_and_videos_lk.values()
+                    },
+                ),
+                output_names={x: x for x in self.data_and_videos_lk.keys()},
+                core_cnt=self.core_cnt,
+            )
+            self.timer.stop_timer()
+            stdout_success(
+                msg="All SLEAP SLP data files imported",
+                elapsed_time=self.timer.elapsed_time_str,
+            )
+            return
         for file_cnt, (video_name, video_data) in enumerate(
             self.data_and_videos_lk.items()
         ):
             print(f"Analysing {video_name}...")
             video_timer = SimbaTimer(start=True)
             self.video_name = video_name
-            in_h5 = h5py.File(video_data["DATA"], "r")
-            self.sleap_dict = in_h5.visititems(self.__h5_to_dict)
             self.video_info = get_video_meta_data(video_path=video_data["VIDEO"])
-            self.analysis_dict["bp_names"] = []
-            self.analysis_dict["ordered_ids"] = []
-            self.analysis_dict["ordered_bps"] = []
-            self.analysis_dict["xy_headers"] = []
-            self.analysis_dict["xyp_headers"] = []
-            self.analysis_dict["animals_in_each_frame"] = []
-            for bp in self.sleap_dict["nodes"]:
-                self.analysis_dict["bp_names"].append(bp["name"])
-            for orderVar in self.sleap_dict["skeletons"][0]["nodes"]:
-                self.analysis_dict["ordered_ids"].append((orderVar["id"]))
-            for index in self.analysis_dict["ordered_ids"]:
-                self.analysis_dict["ordered_bps"].append(
-                    self.analysis_dict["bp_names"][index]
-                )
-
-            with h5py.File(video_data["DATA"], "r") as file:
-                self.analysis_dict["frames"] = file["frames"][:]
-                self.analysis_dict["instances"] = file["instances"][:]
-                self.analysis_dict["predicted_points"] = np.reshape(
-                    file["pred_points"][:], (file["pred_points"][:].size, 1)
-                )
-            self.analysis_dict["no_frames"] = len(self.analysis_dict["frames"])
-
-            for c in itertools.product(self.id_lst, self.analysis_dict["ordered_bps"]):
-                x, y, p = (
-                    str("{}_{}_x".format(c[0], c[1])),
-                    str("{}_{}_y".format(c[0], c[1])),
-                    (str("{}_{}_p".format(c[0], c[1]))),
-                )
-                self.analysis_dict["xy_headers"].extend((x, y))
-                self.analysis_dict["xyp_headers"].extend((x, y, p))
-            #
-            self.data_df = pd.DataFrame(columns=self.analysis_dict["xyp_headers"])
-            frames_lst = [l.tolist() for l in self.analysis_dict["frames"]]
-            self.analysis_dict["animals_in_each_frame"] = [
-                x[4] - x[3] for x in frames_lst
-            ]
-            self.__create_tracks()
-
+            self.data_df = self.read_slp(
+                file_path=video_data["DATA"],
+                track_cnt=self.animal_cnt,
+                frame_cnts={video_data["DATA"]: self.video_info["frame_count"]},
+            )
+            self.data_df.columns = self.bp_headers
             self.initialize_multi_animal_ui(
                 animal_bp_dict=self.animal_bp_dict,
                 video_info=self.video_info,
@@ -222,54 +188,149 @@ class SLEAPImporterSLP(ConfigReader, PoseImporterMixin):
             elapsed_time=self.timer.elapsed_time_str,
         )
 
-    def __create_tracks(self):
-        start_frame = 0
-        for frame_cnt, frame in enumerate(range(self.analysis_dict["no_frames"])):
-            frame_idx = self.analysis_dict["frames"][frame_cnt][2]
-            self.frame_dict = {}
+    @staticmethod
+    def create_tracks_array(
+        frames: np.ndarray,
+        instances: np.ndarray,
+        predicted_points: np.ndarray,
+        track_cnt: int,
+        bp_cnt: int,
+        frame_cnt: int = 0,
+        chunk_size: int = 100000,
+        video_name: str = "",
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Place the predicted points of a SLEAP ``.slp`` file into a preallocated array with one row per video frame.
+
+        The instances of each frame are found from the ``instance_id_start`` and ``instance_id_end`` fields of the
+        ``frames`` table, and the points of each instance from the ``point_id_start`` and ``point_id_end`` fields of the
+        ``instances`` table. Each instance is placed in the slot of its track. Untracked instances are placed, in their
+        order within the frame, in the slots not taken by the tracked instances of the frame. Frames are processed in
+        chunks of ``chunk_size`` frames.
+
+        :parameter np.ndarray frames: The ``frames`` table of the ``.slp`` file.
+        :parameter np.ndarray instances: The ``instances`` table of the ``.slp`` file.
+        :parameter np.ndarray predicted_points: The ``pred_points`` table of the ``.slp`` file.
+        :parameter int track_cnt: The number of animals (tracks) in the output array.
+        :parameter int bp_cnt: The number of body-parts of each animal.
+        :parameter int frame_cnt: The minimum number of frames in the output array, e.g., the frame count of the video. Default: 0.
+        :parameter int chunk_size: Number of frames restructured between progress prints. Default: 100000.
+        :parameter str video_name: Video name used in progress prints. Default: "".
+        :return Tuple[np.ndarray, int]: 4D float32 array of size len(frames) x track_cnt x bp_cnt x 3 with the x, y and probability of each body-part. Missing values are 0. And the number of predicted instances that could not be placed, as their track is larger than ``track_cnt`` or no slot is left free for them in their frame.
+
+        :example:
+        >>> with h5py.File('project_folder/data/Video_1.slp', "r") as f:
+        >>>     results, _ = SLEAPImporterSLP.create_tracks_array(frames=f["frames"][:], instances=f["instances"][:], predicted_points=f["pred_points"][:], track_cnt=2, bp_cnt=8)
+        """
+
+        frame_idxs = frames["frame_idx"].astype(np.int64)
+        results = np.zeros(
+            (
+                max(frame_cnt, int(frame_idxs.max()) + 1 if len(frames) > 0 else 0),
+                track_cnt,
+                bp_cnt,
+                3,
+            ),
+            dtype=np.float32,
+        )
+        dropped_cnt = 0
+        for chunk_start in range(0, len(frames), chunk_size):
             print(
-                f"Restructuring SLEAP frame: {frame_cnt}/{self.analysis_dict['no_frames']}, Video: {self.video_name}"
+                f"Restructuring SLEAP frames: {chunk_start}/{len(frames)}, Video: {video_name}"
+            )
+            chunk = frames[chunk_start : chunk_start + chunk_size]
+            instance_starts = chunk["instance_id_start"].astype(np.int64)
+            instance_cnts = chunk["instance_id_end"].astype(np.int64) - instance_starts
+            instance_frame = np.repeat(
+                frame_idxs[chunk_start : chunk_start + chunk_size], instance_cnts
+            )
+            instance_order = np.arange(np.sum(instance_cnts)) - np.repeat(
+                np.cumsum(instance_cnts) - instance_cnts, instance_cnts
+            )
+            instance_ids = np.repeat(instance_starts, instance_cnts) + instance_order
+            chunk_instances = instances[instance_ids]
+            slots = chunk_instances["track"].astype(np.int64)
+            predicted = chunk_instances["instance_type"] == 1
+            keep = predicted & (slots >= 0) & (slots < track_cnt)
+            # untracked instances take the slots left free by the tracked instances of their frame, in instance order
+            instance_row = np.repeat(np.arange(len(chunk)), instance_cnts)
+            free = np.ones((len(chunk), track_cnt), dtype=bool)
+            free[instance_row[keep], slots[keep]] = False
+            untracked = predicted & (slots < 0)
+            untracked_idx, untracked_row = (
+                np.flatnonzero(untracked),
+                instance_row[untracked],
+            )
+            untracked_cum = np.concatenate(([0], np.cumsum(untracked)))
+            frame_untracked_cnt = untracked_cum[
+                np.cumsum(instance_cnts) - instance_cnts
+            ]
+            untracked_rank = (
+                untracked_cum[untracked_idx] - frame_untracked_cnt[untracked_row]
+            )
+            free_slots = free[untracked_row] & (
+                np.cumsum(free, axis=1)[untracked_row] - 1
+                == untracked_rank.reshape(-1, 1)
             )
-            self.cnt_animals_frm = self.analysis_dict["animals_in_each_frame"][frame]
-            if self.cnt_animals_frm == 0:
-                self.frame_dict[0] = [0] * len(self.analysis_dict["xyp_headers"])
-                end_frame = start_frame + (
-                    len(self.analysis_dict["ordered_bps"]) * self.cnt_animals_frm
-                )
+            placed = np.any(free_slots, axis=1)
+            slots[untracked_idx[placed]] = np.argmax(free_slots[placed], axis=1)
+            keep[untracked_idx[placed]] = True
+            dropped_cnt += int(np.sum(predicted) - np.sum(keep))
+            instance_frame, slots, chunk_instances = (
+                instance_frame[keep],
+                slots[keep],
+                chunk_instances[keep],
+            )
+            point_ids = chunk_instances["point_id_start"].astype(np.int64).reshape(
+                -1, 1
+            ) + np.arange(bp_cnt)
+            valid = point_ids < chunk_instances["point_id_end"].astype(
+                np.int64
+            ).reshape(-1, 1)
+            instance_idx, bp_idx = np.nonzero(valid)
+            points = predicted_points[point_ids[instance_idx, bp_idx]]
+            for field_cnt, field in enumerate(["x", "y", "score"]):
+                results[
+                    instance_frame[instance_idx], slots[instance_idx], bp_idx, field_cnt
+                ] = points[field]
+        results[np.isnan(results)] = 0
+        return results, dropped_cnt
 
-            else:
-                end_frame = start_frame + (
-                    len(self.analysis_dict["ordered_bps"]) * self.cnt_animals_frm
-                )
-                start_animal, end_animal = 0, len(self.analysis_dict["ordered_bps"])
-                frame_arr = self.analysis_dict["predicted_points"][
-                    start_frame:end_frame
-                ]
-                for instance_counter, animal in enumerate(range(self.cnt_animals_frm)):
-                    currRow = []
-                    animal_arr = frame_arr[start_animal:end_animal]
-                    track_id = self.analysis_dict["instances"][instance_counter][4]
-                    for bp in animal_arr:
-                        currRow.extend((bp[0][0], bp[0][1], bp[0][4]))
-                    self.frame_dict[track_id] = currRow
-                    start_animal += len(self.analysis_dict["ordered_bps"])
-                    end_animal += len(self.analysis_dict["ordered_bps"])
+    @staticmethod
+    def read_slp(
+        file_path: Union[str, os.PathLike],
+        track_cnt: int,
+        frame_cnts: Optional[Dict[str, int]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read the predicted points of a SLEAP ``.slp`` file into a dataframe with one row per frame, and one x, y and p
+        column per track and body-part. See :meth:`simba.pose_importers.sleap_slp_importer.SLEAPImporterSLP.create_tracks_array`.
 
-            if self.animal_cnt > 1:
-                self.__check_that_all_animals_exist_in_frame()
-            frame_lst = [
-                item for sublist in list(self.frame_dict.values()) for item in sublist
-            ]
-            start_frame = end_frame
-            try:
-                self.data_df.loc[frame_idx] = frame_lst
-            except ValueError:
-                break
+        :parameter Union[str, os.PathLike] file_path: Path to the SLEAP ``.slp`` file.
+        :parameter int track_cnt: The number of animals in the SimBA project.
+        :parameter Optional[Dict[str, int]] frame_cnts: The frame count of the video of each ``.slp`` file, keyed by ``.slp`` file path. If the file is in ``frame_cnts``, then frames missing at the end of the file are filled with zeros. Default: None.
+        :return pd.DataFrame: The pose-estimation data.
+        """
 
-        self.data_df.fillna(0, inplace=True)
-        self.__fill_missing_indexes()
-        self.data_df.sort_index(inplace=True)
-        self.data_df.columns = self.bp_headers
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        with h5py.File(file_path, "r") as file:
+            metadata = json.loads(
+                list(file["metadata"].attrs.items())[1][1].decode("utf-8")
+            )
+            results, dropped_cnt = SLEAPImporterSLP.create_tracks_array(
+                frames=file["frames"][:],
+                instances=file["instances"][:],
+                predicted_points=file["pred_points"][:],
+                track_cnt=track_cnt,
+                bp_cnt=len(metadata["skeletons"][0]["nodes"]),
+                frame_cnt=(frame_cnts or {}).get(file_path, 0),
+                video_name=video_name,
+            )
+        if dropped_cnt > 0:
+            stdout_warning(
+                msg=f"{dropped_cnt} SLEAP instances in video {video_name} could not be assigned to one of the {track_cnt} animals of the SimBA project and were not imported."
+            )
+        return pd.DataFrame(results.reshape(len(results), -1))
 
 
 # test = SLEAPImporterSLP(project_path="/Users/simon/Desktop/envs/simba/troubleshooting/sleap_two_animals/project_folder/project_config.ini",
@@ -0,0 +1,121 @@
+__author__ = "Simon Nilsson"
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from simba.mixins.feature_extraction_mixin import FeatureExtractionMixin
+from simba.utils.data import run_length_encode
+
+
+def roi_containment(
+    locations: np.ndarray,
+    rectangles_df: pd.DataFrame,
+    circles_df: pd.DataFrame,
+    polygons_df: pd.DataFrame,
+    probabilities: Optional[np.ndarray] = None,
+    threshold: float = 0.0,
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Compute if the body-parts of all animals are inside all ROI shapes of a video in a single pass.
+
+    Rectangles and circles are evaluated for all frames, animals and shapes at once. Polygons are evaluated with the
+    jitted point-in-polygon :meth:`simba.mixins.feature_extraction_mixin.FeatureExtractionMixin.framewise_inside_polygon_roi`.
+    A body-part is inside a rectangle if it is on or within the rectangle edges, and inside a circle if its distance
+    to the circle center is less or equal to the radius.
+
+    :param np.ndarray locations: 3D array of size len(frames) x len(animals) x 2 with the x and y coordinates of the body-part of each animal.
+    :param pd.DataFrame rectangles_df: The rectangles of the video, with ``Name``, ``topLeftX``, ``topLeftY``, ``Bottom_right_X`` and ``Bottom_right_Y`` fields.
+    :param pd.DataFrame circles_df: The circles of the video, with ``Name``, ``centerX``, ``centerY`` and ``radius`` fields.
+    :param pd.DataFrame polygons_df: The polygons of the video, with ``Name`` and ``vertices`` fields.
+    :param Optional[np.ndarray] probabilities: 2D array of size len(frames) x len(animals) with the body-part probabilities. If not None, then body-parts with probabilities below ``threshold`` are outside all shapes. Default: None.
+    :param float threshold: The body-part probability threshold. Default: 0.0.
+    :return Tuple[np.ndarray, List[str]]: 3D boolean array of size len(frames) x len(animals) x len(shapes), and the shape names in the order of the last dimension (rectangles, circles, polygons).
+
+    :example:
+    >>> locations = np.random.randint(0, 500, (1000, 2, 2)).astype(np.float64)
+    >>> rectangles_df = pd.DataFrame({'Name': ['Rectangle_1'], 'topLeftX': [0], 'topLeftY': [0], 'Bottom_right_X': [200], 'Bottom_right_Y': [200]})
+    >>> circles_df = pd.DataFrame({'Name': ['Circle_1'], 'centerX': [250], 'centerY': [250], 'radius': [50]})
+    >>> polygons_df = pd.DataFrame({'Name': ['Polygon_1'], 'vertices': [np.array([[300, 300], [500, 300], [400, 500]])]})
+    >>> containment, shape_names = roi_containment(locations=locations, rectangles_df=rectangles_df, circles_df=circles_df, polygons_df=polygons_df)
+    """
+
+    locations = locations.astype(np.float64)
+    x, y = locations[:, :, 0:1], locations[:, :, 1:2]
+    rectangles = (
+        rectangles_df[["topLeftX", "topLeftY", "Bottom_right_X", "Bottom_right_Y"]]
+        .to_numpy()
+        .astype(np.float64)
+    )
+    inside_rectangles = (
+        (x >= rectangles[:, 0])
+        & (x <= rectangles[:, 2])
+        & (y >= rectangles[:, 1])
+        & (y <= rectangles[:, 3])
+    )
+    circles = circles_df[["centerX", "centerY", "radius"]].to_numpy().astype(np.float64)
+    inside_circles = (
+        np.sqrt((x - circles[:, 0]) ** 2 + (y - circles[:, 1]) ** 2) <= circles[:, 2]
+    )
+    inside_polygons = np.full(
+        (locations.shape[0], locations.shape[1], len(polygons_df)), False
+    )
+    for polygon_cnt, vertices in enumerate(polygons_df["vertices"]):
+        vertices = np.ascontiguousarray(np.array(vertices)[:, 0:2], dtype=np.float64)
+        for animal_cnt in range(locations.shape[1]):
+            inside_polygons[:, animal_cnt, polygon_cnt] = (
+                FeatureExtractionMixin.framewise_inside_polygon_roi(
+                    bp_location=np.ascontiguousarray(locations[:, animal_cnt]),
+                    roi_coords=vertices,
+                )
+                == 1
+            )
+    results = np.concatenate(
+        [inside_rectangles, inside_circles, inside_polygons], axis=2
+    )
+    if probabilities is not None:
+        results = results & (probabilities >= threshold)[:, :, np.newaxis]
+    shape_names = (
+        list(rectangles_df["Name"])
+        + list(circles_df["Name"])
+        + list(polygons_df["Name"])
+    )
+    return results, shape_names
+
+
+def roi_entries_exits(inside: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the entry and exit frames of the continuous sequences of frames a body-part is inside a ROI shape.
+
+    :param np.ndarray inside: 1D boolean array of size len(frames). True if the body-part is inside the shape.
+    :return Tuple[np.ndarray, np.ndarray]: The first (entry) and last (exit) frame of each sequence inside the shape.
+
+    :example:
+    >>> roi_entries_exits(inside=np.array([False, True, True, False, True]))
+    >>> (array([1, 4]), array([2, 4]))
+    """
+
+    values, starts, lengths = run_length_encode(data=inside)
+    values = values.astype(bool)
+    return starts[values], starts[values] + lengths[values] - 1
+
+
+def roi_movement(locations: np.ndarray, inside: np.ndarray, px_per_mm: float) -> float:
+    """
+    Compute the distance a body-part moves while inside a ROI shape. Only movements between two consecutive
+    frames that are both inside the shape are counted.
+
+    :param np.ndarray locations: 2D array of size len(frames) x 2 with the x and y coordinates of the body-part.
+    :param np.ndarray inside: 1D boolean array of size len(frames). True if the body-part is inside the shape.
+    :param float px_per_mm: Pixels per millimeter of the video.
+    :return float: The distance moved inside the shape in millimeters.
+
+    :example:
+    >>> roi_movement(locations=np.array([[0, 0], [3, 4], [6, 8], [9, 12]]), inside=np.array([True, True, False, True]), px_per_mm=1.0)
+    >>> 5.0
+    """
+
+    inside = inside.astype(bool)
+    distances = np.sqrt(np.sum(np.diff(locations, axis=0) ** 2, axis=1))
+    return float(np.sum(distances[inside[1:] & inside[:-1]]) / px_per_mm)
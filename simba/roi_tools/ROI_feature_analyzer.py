@@ -145,23 +145,14 @@ class ROIFeatureCreator(ConfigReader, FeatureExtractionMixin):
             ):
                 column_name = "{} {} {}".format(shape_name, animal_name, "in zone")
                 self.inside_roi_columns.append(column_name)
-                video_animal_shape_df = self.roi_entries_df.loc[
-                    (self.roi_entries_df["VIDEO"] == self.video_name)
-                    & (self.roi_entries_df["SHAPE"] == shape_name)
-                    & (self.roi_entries_df["ANIMAL"] == animal_name)
-                ]
+                inside = self.roi_analyzer.get_inside_roi_frames(
+                    video_name=self.video_name,
+                    shape_name=shape_name,
+                    animal_name=animal_name,
+                )
                 self.out_df[column_name] = 0
-                if len(video_animal_shape_df) > 0:
-                    inside_roi_idx = list(
-                        video_animal_shape_df.apply(
-                            lambda x: list(
-                                range(int(x["ENTRY FRAMES"]), int(x["EXIT FRAMES"]) + 1)
-                            ),
-                            1,
-                        )
-                    )
-                    inside_roi_idx = [x for xs in inside_roi_idx for x in xs]
-                    self.out_df.loc[inside_roi_idx, column_name] = 1
+                if inside is not None:
+                    self.out_df.loc[np.flatnonzero(inside), column_name] = 1
                 self.out_df[column_name + "_cumulative_time"] = self.out_df[
                     column_name
                 ].cumsum() * float(1 / self.fps)
@@ -182,24 +173,15 @@ class ROIFeatureCreator(ConfigReader, FeatureExtractionMixin):
                     shape_name, animal_name, bp_name, "zone"
                 )
                 self.inside_roi_columns.append(column_name)
-                video_body_part_shape_df = self.roi_entries_df.loc[
-                    (self.roi_entries_df["VIDEO"] == self.video_name)
-                    & (self.roi_entries_df["SHAPE"] == shape_name)
-                    & (self.roi_entries_df["ANIMAL"] == animal_name)
-                    & (self.roi_entries_df["BODY-PART"] == bp_name)
-                ]
+                inside = self.roi_analyzer.get_inside_roi_frames(
+                    video_name=self.video_name,
+                    shape_name=shape_name,
+                    animal_name=animal_name,
+                    body_part=bp_name,
+                )
                 self.out_df[column_name] = 0
-                if len(video_body_part_shape_df) > 0:
-                    inside_roi_idx = list(
-                        video_body_part_shape_df.apply(
-                            lambda x: list(
-                                range(int(x["ENTRY FRAMES"]), int(x["EXIT FRAMES"]) + 1)
-                            ),
-                            1,
-                        )
-                    )
-                    inside_roi_idx = [x for xs in inside_roi_idx for x in xs]
-                    self.out_df.loc[inside_roi_idx, column_name] = 1
+                if inside is not None:
+                    self.out_df.loc[np.flatnonzero(inside), column_name] = 1
                 self.out_df[column_name + "_cumulative_time"] = self.out_df[
                     column_name
                 ].cumsum() * float(1 / self.fps)
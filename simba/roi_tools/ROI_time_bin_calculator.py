@@ -2,15 +2,17 @@ import itertools
 import os
 from typing import List, Union
 
+import numpy as np
 import pandas as pd
 
 from simba.mixins.config_reader import ConfigReader
 from simba.roi_tools.ROI_analyzer import ROIAnalyzer
+from simba.roi_tools.ROI_containment import roi_entries_exits
 from simba.utils.checks import check_float, check_int
 from simba.utils.enums import DirNames
 from simba.utils.errors import ROICoordinatesNotFoundError
 from simba.utils.printing import SimbaTimer, stdout_success
-from simba.utils.read_write import get_fn_ext, read_df, write_df
+from simba.utils.read_write import get_data_file_row_count, get_fn_ext
 
 
 class ROITimebinCalculator(ConfigReader):
@@ -84,63 +86,45 @@ class ROITimebinCalculator(ConfigReader):
             _, self.video_name, _ = get_fn_ext(filepath=file_path)
             _, _, fps = self.read_video_info(video_name=self.video_name)
             frames_per_bin = int(fps * self.bin_length)
-            video_frms = list(
-                range(0, len(read_df(file_path=file_path, file_type=self.file_type)))
+            frm_cnt = get_data_file_row_count(
+                file_path=file_path, file_type=self.file_type
             )
-            frame_bins = [
-                video_frms[i * frames_per_bin : (i + 1) * frames_per_bin]
-                for i in range((len(video_frms) + frames_per_bin - 1) // frames_per_bin)
-            ]
-            self.video_data = self.entries_exits_df[
-                self.entries_exits_df["VIDEO"] == self.video_name
-            ]
+            bin_cnt = (frm_cnt + frames_per_bin - 1) // frames_per_bin
+            frm_bins = np.arange(frm_cnt) // frames_per_bin
             for animal_name, shape_name in list(
                 itertools.product(self.animal_names, self.shape_names)
             ):
-                results_entries = pd.DataFrame(
-                    columns=["VIDEO", "SHAPE", "ANIMAL", "TIME BIN", "ENTRY COUNT"]
+                inside = self.roi_analyzer.get_inside_roi_frames(
+                    video_name=self.video_name,
+                    shape_name=shape_name,
+                    animal_name=animal_name,
                 )
+                if inside is None:
+                    inside = np.full(frm_cnt, False)
+                entry_frms, _ = roi_entries_exits(inside=inside)
                 results_time = pd.DataFrame(
-                    columns=[
-                        "VIDEO",
-                        "SHAPE",
-                        "ANIMAL",
-                        "TIME BIN",
-                        "TIME INSIDE SHAPE (S)",
-                    ]
+                    {
+                        "VIDEO": self.video_name,
+                        "SHAPE": shape_name,
+                        "ANIMAL": animal_name,
+                        "TIME BIN": np.arange(bin_cnt),
+                        "TIME INSIDE SHAPE (S)": np.bincount(
+                            frm_bins[inside], minlength=bin_cnt
+                        )
+                        / fps,
+                    }
+                )
+                results_entries = pd.DataFrame(
+                    {
+                        "VIDEO": self.video_name,
+                        "SHAPE": shape_name,
+                        "ANIMAL": animal_name,
+                        "TIME BIN": np.arange(bin_cnt),
+                        "ENTRY COUNT": np.bincount(
+                            frm_bins[entry_frms], minlength=bin_cnt
+                        ),
+                    }
                 )
-                data_df = self.video_data.loc[
-                    (self.video_data["SHAPE"] == shape_name)
-                    & (self.video_data["ANIMAL"] == animal_name)
-                ]
-                entry_frms = list(data_df["ENTRY FRAMES"])
-                inside_shape_frms = [
-                    list(range(x, y))
-                    for x, y in zip(
-                        list(data_df["ENTRY FRAMES"].astype(int)),
-                        list(data_df["EXIT FRAMES"].astype(int) + 1),
-                    )
-                ]
-                inside_shape_frms = [i for s in inside_shape_frms for i in s]
-                for bin_cnt, bin_frms in enumerate(frame_bins):
-                    frms_inside_roi_in_timebin = [
-                        x for x in inside_shape_frms if x in bin_frms
-                    ]
-                    entry_roi_in_timebin = [x for x in entry_frms if x in bin_frms]
-                    results_time.loc[len(results_time)] = [
-                        self.video_name,
-                        shape_name,
-                        animal_name,
-                        bin_cnt,
-                        len(frms_inside_roi_in_timebin) / fps,
-                    ]
-                    results_entries.loc[len(results_entries)] = [
-                        self.video_name,
-                        shape_name,
-                        animal_name,
-                        bin_cnt,
-                        len(entry_roi_in_timebin),
-                    ]
                 self.out_time_lst.append(results_time)
                 self.out_entries_lst.append(results_entries)
             video_timer.stop_timer()
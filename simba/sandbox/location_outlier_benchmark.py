@@ -0,0 +1,96 @@
+"""
+Benchmark of the vectorized location-outlier detection and forward-fill correction in OutlierCorrecterLocation
+against the previous per-frame, per-body-part loops, timed for synthetic multi-animal pose data.
+
+The previous loops are timed on a slice of the data only, as the correction is O(outliers x frames).
+
+Run: python simba/sandbox/location_outlier_benchmark.py
+"""
+
+import time
+
+import numpy as np
+
+from simba.outlier_tools.outlier_corrector_location import \
+    OutlierCorrecterLocation
+
+
+def _per_frame_outliers(data: np.ndarray, criterion: float) -> np.ndarray:
+    results = np.full((data.shape[0], data.shape[1]), False)
+    for bp in range(data.shape[1]):
+        for frame in range(data.shape[0]):
+            distance_above_criterion_counter = 0
+            for second_bp in [x for x in range(data.shape[1]) if x != bp]:
+                distance = np.sqrt(
+                    (data[frame, bp, 0] - data[frame, second_bp, 0]) ** 2
+                    + (data[frame, bp, 1] - data[frame, second_bp, 1]) ** 2
+                )
+                if distance > criterion:
+                    distance_above_criterion_counter += 1
+            results[frame, bp] = distance_above_criterion_counter > 1
+    return results
+
+
+def _per_outlier_correction(data: np.ndarray, outliers: np.ndarray) -> np.ndarray:
+    data = np.copy(data)
+    for bp in range(data.shape[1]):
+        below_criterion = list(np.argwhere(~outliers[:, bp]).flatten())
+        for outlier_idx in np.argwhere(outliers[:, bp]).flatten():
+            try:
+                closest_idx = max([i for i in below_criterion if outlier_idx > i])
+            except ValueError:
+                closest_idx = outlier_idx
+            data[outlier_idx, bp] = data[closest_idx, bp]
+    return data
+
+
+def _vectorized(data: np.ndarray, criterion: float) -> np.ndarray:
+    outliers = OutlierCorrecterLocation.find_location_outliers(
+        data=data, criterion=criterion
+    )
+    results = np.copy(data)
+    for bp in range(data.shape[1]):
+        fill_idx = OutlierCorrecterLocation.last_valid_idx(outliers=outliers[:, bp])
+        results[:, bp] = data[fill_idx, bp]
+    return results
+
+
+def run(
+    frm_cnt: int = 1_000_000,
+    animal_cnt: int = 2,
+    bp_cnt: int = 8,
+    loop_frm_cnt: int = 20_000,
+    criterion: float = 60.0,
+):
+    animals = []
+    for _ in range(animal_cnt):
+        centroid = np.cumsum(np.random.normal(0, 2, (frm_cnt, 1, 2)), axis=0) + 500
+        animal = centroid + np.random.normal(0, 15, (frm_cnt, bp_cnt, 2))
+        jumps = np.random.random((frm_cnt, bp_cnt)) < 0.02
+        animal[jumps] += np.random.normal(0, 200, (np.sum(jumps), 2))
+        animals.append(animal)
+    print(f"{frm_cnt} frames, {animal_cnt} animals, {bp_cnt} body-parts per animal")
+
+    start = time.perf_counter()
+    expected = []
+    for animal in animals:
+        subset = animal[:loop_frm_cnt]
+        expected.append(
+            _per_outlier_correction(subset, _per_frame_outliers(subset, criterion))
+        )
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    results = [_vectorized(animal[:loop_frm_cnt], criterion) for animal in animals]
+    vectorized_time = time.perf_counter() - start
+    identical = all([np.array_equal(x, y) for x, y in zip(expected, results)])
+    print(
+        f"{loop_frm_cnt} frames: loops {loop_time:.3f}s, vectorized {vectorized_time:.3f}s ({loop_time / vectorized_time:.1f}x), identical: {identical}"
+    )
+
+    start = time.perf_counter()
+    _ = [_vectorized(animal, criterion) for animal in animals]
+    print(f"{frm_cnt} frames: vectorized {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,86 @@
+"""
+Benchmark of the jitted path tortuosity in FeatureExtractionMixin against the previous per-frame, per-window
+``angle3pt`` loop of the hard-coded feature extractors, timed for a single synthetic video file.
+
+Run: python simba/sandbox/path_tortuosity_benchmark.py
+"""
+
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from simba.mixins.feature_extraction_mixin import FeatureExtractionMixin
+from simba.utils.checks import check_minimum_roll_windows
+from simba.utils.enums import Options
+
+
+def _per_frame_tortuosity(out_data: pd.DataFrame, window: int) -> list:
+    as_strided = np.lib.stride_tricks.as_strided
+    win_size = 3
+    centroid_x = as_strided(
+        out_data["Center_x"],
+        (len(out_data) - (win_size - 1), win_size),
+        (out_data["Center_x"].values.strides * 2),
+    )
+    centroid_y = as_strided(
+        out_data["Center_y"],
+        (len(out_data) - (win_size - 1), win_size),
+        (out_data["Center_y"].values.strides * 2),
+    )
+    start, end, results = 0, int(window), []
+    for frame in range(len(out_data)):
+        angles = []
+        c_centroid_x, c_centroid_y = centroid_x[start:end], centroid_y[start:end]
+        for frame_in_window in range(len(c_centroid_x)):
+            angles.append(
+                FeatureExtractionMixin.angle3pt(
+                    c_centroid_x[frame_in_window][0],
+                    c_centroid_y[frame_in_window][0],
+                    c_centroid_x[frame_in_window][1],
+                    c_centroid_y[frame_in_window][1],
+                    c_centroid_x[frame_in_window][2],
+                    c_centroid_y[frame_in_window][2],
+                )
+            )
+        results.append(sum(angles) / (2 * math.pi))
+        start += 1
+        end += 1
+    return results
+
+
+def run(frm_cnt: int = 54_000, fps: int = 30):
+    out_data = pd.DataFrame(
+        np.cumsum(np.random.normal(0, 2, (frm_cnt, 2)), axis=0).astype(np.float32),
+        columns=["Center_x", "Center_y"],
+    )
+    roll_windows_values = check_minimum_roll_windows(
+        Options.ROLLING_WINDOW_DIVISORS.value, fps
+    )
+    FeatureExtractionMixin.path_tortuosity(
+        x=out_data["Center_x"].values[:100],
+        y=out_data["Center_y"].values[:100],
+        window_sizes=roll_windows_values,
+    )
+    print(f"{frm_cnt} frames, windows {roll_windows_values}")
+    start = time.perf_counter()
+    expected = [_per_frame_tortuosity(out_data, x) for x in roll_windows_values]
+    per_frame_time = time.perf_counter() - start
+    start = time.perf_counter()
+    results = FeatureExtractionMixin.path_tortuosity(
+        x=out_data["Center_x"].values,
+        y=out_data["Center_y"].values,
+        window_sizes=roll_windows_values,
+    )
+    jitted_time = time.perf_counter() - start
+    identical = all(
+        [np.array_equal(np.array(x), results[:, i]) for i, x in enumerate(expected)]
+    )
+    print(
+        f"per-frame {per_frame_time:.3f}s, jitted {jitted_time:.3f}s ({per_frame_time / jitted_time:.1f}x), identical: {identical}"
+    )
+
+
+if __name__ == "__main__":
+    run()
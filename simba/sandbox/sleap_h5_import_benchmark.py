@@ -0,0 +1,74 @@
+"""
+Benchmark of the vectorized SLEAP H5 ``tracks`` / ``point_scores`` conversion in SLEAPImporterH5 against the previous
+path, which formatted every value as text and re-parsed the text with ``pd.read_csv``, timed for synthetic
+multi-animal SLEAP data.
+
+Run: python simba/sandbox/sleap_h5_import_benchmark.py
+"""
+
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+from simba.utils.data import sleap_tracks_to_array
+
+
+def _text_round_trip(tracks: np.ndarray, point_scores: np.ndarray) -> pd.DataFrame:
+    csv_rows = []
+    n_frames, n_nodes, _, n_tracks = tracks.shape
+    for frame_ind in range(n_frames):
+        csv_row = []
+        for track_ind in range(n_tracks):
+            for node_ind in range(n_nodes):
+                for xyp in range(3):
+                    if xyp == 0 or xyp == 1:
+                        data = tracks[frame_ind, node_ind, xyp, track_ind]
+                    else:
+                        data = point_scores[frame_ind, node_ind, track_ind]
+                    csv_row.append(f"{data:.3f}")
+        csv_rows.append(" ".join(csv_row))
+    csv_rows = "\n".join(csv_rows)
+    return pd.read_csv(
+        io.StringIO(csv_rows), delim_whitespace=True, header=None
+    ).fillna(0)
+
+
+def run(
+    frm_cnt: int = 1_000_000,
+    track_cnt: int = 4,
+    node_cnt: int = 8,
+    text_frm_cnt: int = 20_000,
+):
+    tracks = np.random.uniform(0, 1000, (frm_cnt, node_cnt, 2, track_cnt))
+    point_scores = np.random.uniform(0, 1, (frm_cnt, node_cnt, track_cnt))
+    missing = np.random.random((frm_cnt, node_cnt, track_cnt)) < 0.05
+    tracks[np.repeat(missing[:, :, np.newaxis, :], 2, axis=2)] = np.nan
+    point_scores[missing] = np.nan
+    print(f"{frm_cnt} frames, {track_cnt} tracks, {node_cnt} nodes per track")
+
+    start = time.perf_counter()
+    expected = _text_round_trip(
+        tracks=tracks[:text_frm_cnt], point_scores=point_scores[:text_frm_cnt]
+    )
+    text_time = time.perf_counter() - start
+    start = time.perf_counter()
+    results = sleap_tracks_to_array(
+        tracks=tracks[:text_frm_cnt], point_scores=point_scores[:text_frm_cnt]
+    )
+    vectorized_time = time.perf_counter() - start
+    max_diff = np.max(np.abs(expected.values - results))
+    print(
+        f"{text_frm_cnt} frames: text round-trip {text_time:.3f}s, vectorized {vectorized_time:.3f}s ({text_time / vectorized_time:.1f}x), max difference: {max_diff:.4f} (text rounds to 3 decimals)"
+    )
+
+    start = time.perf_counter()
+    results = sleap_tracks_to_array(tracks=tracks, point_scores=point_scores)
+    print(
+        f"{frm_cnt} frames: vectorized {time.perf_counter() - start:.3f}s ({results.nbytes / 1e6:.1f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    run()
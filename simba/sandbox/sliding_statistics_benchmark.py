@@ -0,0 +1,95 @@
+"""
+Benchmark of the incremental O(n) sliding statistics in TimeseriesFeatureMixin against the previous
+per-window implementations, which re-computed every window from scratch in O(n * window size).
+
+Run: python simba/sandbox/sliding_statistics_benchmark.py
+"""
+
+import time
+
+import numpy as np
+from numba import njit, typed
+
+from simba.mixins.timeseries_features_mixin import TimeseriesFeatureMixin
+
+STATISTICS = [
+    "var",
+    "max",
+    "min",
+    "std",
+    "median",
+    "mean",
+    "mad",
+    "sum",
+    "mac",
+    "rms",
+    "absenergy",
+]
+
+
+@njit("(float32[:], int64, unicode_type)")
+def _per_window_statistic(
+    data: np.ndarray, window_size: int, statistic: str
+) -> np.ndarray:
+    results = np.full(data.shape[0], -1.0)
+    for r in range(window_size, data.shape[0] + 1):
+        sample = data[r - window_size : r]
+        if statistic == "var":
+            results[r - 1] = np.var(sample)
+        elif statistic == "max":
+            results[r - 1] = np.max(sample)
+        elif statistic == "min":
+            results[r - 1] = np.min(sample)
+        elif statistic == "std":
+            results[r - 1] = np.std(sample)
+        elif statistic == "median":
+            results[r - 1] = np.median(sample)
+        elif statistic == "mean":
+            results[r - 1] = np.mean(sample)
+        elif statistic == "mad":
+            results[r - 1] = np.median(np.abs(sample - np.median(sample)))
+        elif statistic == "sum":
+            results[r - 1] = np.sum(sample)
+        elif statistic == "mac":
+            results[r - 1] = np.mean(np.abs(sample[1:] - sample[:-1]))
+        elif statistic == "rms":
+            results[r - 1] = np.sqrt(np.mean(sample**2))
+        elif statistic == "absenergy":
+            results[r - 1] = np.sqrt(np.sum(sample**2))
+    return results.astype(np.float32)
+
+
+def run(frm_cnt: int = 1_000_000, fps: int = 30, window_s: float = 10.0):
+    data = np.cumsum(np.random.normal(0, 1, frm_cnt)).astype(np.float32)
+    window_size = int(window_s * fps)
+    small = data[:10_000]
+    TimeseriesFeatureMixin.sliding_descriptive_statistics(
+        data=small,
+        window_sizes=np.array([1.0]),
+        sample_rate=fps,
+        statistics=typed.List(STATISTICS),
+    )
+    print(f"{frm_cnt} frames, {window_s}s window ({window_size} frames)")
+    for statistic in STATISTICS:
+        _per_window_statistic(small, window_size, statistic)
+        start = time.perf_counter()
+        expected = _per_window_statistic(data, window_size, statistic)
+        per_window_time = time.perf_counter() - start
+        start = time.perf_counter()
+        results = TimeseriesFeatureMixin.sliding_descriptive_statistics(
+            data=data,
+            window_sizes=np.array([window_s]),
+            sample_rate=fps,
+            statistics=typed.List([statistic]),
+        )[0, :, 0]
+        incremental_time = time.perf_counter() - start
+        max_error = np.max(
+            np.abs(results - expected) / np.maximum(np.abs(expected), 1.0)
+        )
+        print(
+            f"{statistic}: per-window {per_window_time:.3f}s, incremental {incremental_time:.3f}s ({per_window_time / incremental_time:.1f}x), max relative error {max_error:.2e}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -148,6 +148,12 @@ class MachineModelSettingsPopUp(PopUpMixin, ConfigReader):
             com=lambda x: self.create_class_weight_table(),
         )
         self.class_weights_dropdown.setChoices("None")
+        self.training_store_var = BooleanVar()
+        self.training_store_cb = Checkbutton(
+            self.hyperparameters_frm,
+            text="Read training data through on-disk training store (large projects)",
+            variable=self.training_store_var,
+        )
 
         self.evaluations_frm = LabelFrame(
             self.main_frm,
@@ -327,6 +333,7 @@ class MachineModelSettingsPopUp(PopUpMixin, ConfigReader):
         self.oversample_settings_dropdown.grid(row=8, column=0, sticky=NW)
         self.over_sample_ratio_entrybox.grid(row=9, column=0, sticky=NW)
         self.class_weights_dropdown.grid(row=10, column=0, sticky=NW)
+        self.training_store_cb.grid(row=12, column=0, sticky=NW)
 
         self.evaluations_frm.grid(row=4, column=0, sticky=NW)
         self.meta_data_file_cb.grid(row=0, column=0, sticky=NW)
@@ -448,6 +455,7 @@ class MachineModelSettingsPopUp(PopUpMixin, ConfigReader):
         self.over_sample_ratio = "NaN"
         if self.oversample_settings_dropdown.getChoices() != "None":
             self.over_sample_ratio = self.over_sample_ratio_entrybox.entry_get
+        self.training_store = self.training_store_var.get()
         self.class_weight_method = self.class_weights_dropdown.getChoices()
         self.class_custom_weights = {}
         if self.class_weight_method == "custom":
@@ -619,6 +627,11 @@ class MachineModelSettingsPopUp(PopUpMixin, ConfigReader):
         self.config.set(
             "create ensemble settings", "custom_weights", str(self.class_custom_weights)
         )
+        self.config.set(
+            "create ensemble settings",
+            "use_training_store",
+            str(self.training_store),
+        )
 
         with open(self.config_path, "w") as f:
             self.config.write(f)
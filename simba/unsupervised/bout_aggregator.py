@@ -95,11 +95,10 @@ def bout_aggregator(
             f'Processing video {video} ({str(cnt+1)}/{str(len(data["VIDEO"].unique()))})...'
         )
         video_df = data[data["VIDEO"] == video].reset_index(drop=True)
+        _, _, fps = read_video_info(vid_info_df=video_info, video_name=video)
+        video_bouts = detect_bouts(data_df=video_df, target_lst=clfs, fps=fps)
         for clf in clfs:
-            _, _, fps = read_video_info(vid_info_df=video_info, video_name=video)
-            bouts = detect_bouts(
-                data_df=video_df, target_lst=[clf], fps=fps
-            ).sort_values(by="Start_frame")
+            bouts = video_bouts[video_bouts["Event"] == clf]
             bouts = bouts[bouts["Bout_time"] >= min_bout_length / 1000][
                 ["Start_frame", "End_frame"]
             ].values
@@ -3,7 +3,6 @@ __author__ = "Simon Nilsson"
 import ast
 import configparser
 import glob
-import io
 import os
 import subprocess
 from copy import deepcopy
@@ -47,19 +46,42 @@ from simba.utils.read_write import (find_video_of_file, get_fn_ext,
                                     read_roi_data, write_df)
 
 
+def _detect_runs(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Helper to find the runs of identical consecutive values in all columns of a 2D array in one pass.
+
+    :param np.ndarray data: 2D array with frames as rows and e.g. classifiers as columns.
+    :return Tuple[np.ndarray, np.ndarray, np.ndarray]: Column index, first row and last row of each run, ordered by column and first row.
+    """
+
+    if data.shape[0] == 0:
+        return tuple(np.empty(0, dtype=np.int64) for _ in range(3))
+    changes = np.ones(data.shape, dtype=bool)
+    changes[1:] = data[1:] != data[:-1]
+    column_idx, start_idx = np.nonzero(changes.T)
+    end_idx = np.append(start_idx[1:] - 1, data.shape[0] - 1)
+    last_runs = np.append(column_idx[1:] != column_idx[:-1], True)
+    end_idx[last_runs] = data.shape[0] - 1
+    return column_idx, start_idx, end_idx
+
+
 def detect_bouts(
     data_df: pd.DataFrame, target_lst: List[str], fps: int
 ) -> pd.DataFrame:
     """
     Detect behavior "bouts" (e.g., continous sequence of classified behavior-present frames) for specified classifiers.
 
+    All fields in ``target_lst`` are run-length encoded in one pass over the data.
+
     .. note::
        Can be any field of boolean type. E.g., target_lst = ['Inside_ROI_1`] also works for bouts inside ROI shape.
 
+       Frame numbers are taken from the index of ``data_df``.
+
     :param pd.DataFrame data_df: Dataframe with fields representing classifications in boolean type.
     :param List[str] target_lst: Classifier names. E.g., ['Attack', 'Sniffing', 'Grooming'] or ROIs
     :param int fps: The fps of the input video.
-    :return pd.DataFrame: Dataframe where bouts are represented by rows and fields are represented by 'Event type ', 'Start time', 'End time', 'Start frame', 'End frame', 'Bout time'
+    :return pd.DataFrame: Dataframe where bouts are represented by rows ordered by ``target_lst`` and start frame, with fields 'Event' (str), 'Start_time' (float), 'End Time' (float), 'Start_frame' (int), 'End_frame' (int), and 'Bout_time' (float).
 
     :example:
     >>> data_df = read_df(file_path='tests/data/test_projects/two_c57/project_folder/csv/machine_results/Together_1.csv', file_type='csv')
@@ -70,56 +92,26 @@ def detect_bouts(
     >>> 2  'Sniffing'   3.47          3.83          104        114            0.37
     """
 
-    boutsList, nameList, startTimeList, endTimeList, startFrameLst, endFrameList = (
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
+    data = data_df[list(target_lst)].values
+    column_idx, start_idx, end_idx = _detect_runs(data=data)
+    bouts = data[start_idx, column_idx] != 0
+    column_idx, start_idx, end_idx = (
+        column_idx[bouts],
+        start_idx[bouts],
+        end_idx[bouts],
     )
-    for target_name in target_lst:
-        groupDf = pd.DataFrame()
-        v = (data_df[target_name] != data_df[target_name].shift()).cumsum()
-        u = data_df.groupby(v)[target_name].agg(["all", "count"])
-        m = u["all"] & u["count"].ge(1)
-        groupDf["groups"] = data_df.groupby(v).apply(
-            lambda x: (x.index[0], x.index[-1])
-        )[m]
-        for _, row in groupDf.iterrows():
-            bout = list(row["groups"])
-            bout_time = ((bout[-1] - bout[0]) + 1) / fps
-            bout_start = (bout[0]) / fps
-            bout_end = (bout[1] + 1) / fps
-            bout_start_frm = bout[0] + 1
-            endFrame = bout[1]
-            endTimeList.append(bout_end)
-            startTimeList.append(bout_start)
-            boutsList.append(bout_time)
-            nameList.append(target_name)
-            endFrameList.append(endFrame)
-            startFrameLst.append(bout_start_frm)
-
-    startFrameLst = [x - 1 for x in startFrameLst]
+    frames = data_df.index.values
+    start_frames = frames[start_idx].astype(np.int64)
+    end_frames = frames[end_idx].astype(np.int64)
     return pd.DataFrame(
-        list(
-            zip(
-                nameList,
-                startTimeList,
-                endTimeList,
-                startFrameLst,
-                endFrameList,
-                boutsList,
-            )
-        ),
-        columns=[
-            "Event",
-            "Start_time",
-            "End Time",
-            "Start_frame",
-            "End_frame",
-            "Bout_time",
-        ],
+        {
+            "Event": np.array(target_lst, dtype=object)[column_idx],
+            "Start_time": start_frames / fps,
+            "End Time": (end_frames + 1) / fps,
+            "Start_frame": start_frames,
+            "End_frame": end_frames,
+            "Bout_time": ((end_frames - start_frames) + 1) / fps,
+        }
     )
 
 
@@ -133,64 +125,112 @@ def detect_bouts_multiclass(
     :param str target: Name of the target column in ``data``.
     :param int fps: Frames per second of the video used to collect ``data``. Default is 1.
     :param Dict[int, str] classifier_map: A dictionary mapping class labels to their names. Used to replace numeric labels with descriptive names. If None, then numeric event labels are kept.
+    :return pd.DataFrame: Dataframe where bouts are represented by rows ordered by class label and start frame, with fields 'Event', 'Start_time' (float), 'End_time' (float), 'Start_frame' (int), 'End_frame' (int), and 'Bout_time' (float).
 
     :example:
     >>> df = pd.DataFrame({'value': [0, 0, 0, 2, 2, 1, 1, 1, 3, 3]})
     >>> detect_bouts_multiclass(data=df, target='value', fps=3, classifier_map={0: 'None', 1: 'sharp', 2: 'track', 3: 'sync'})
     >>>    'Event'  'Start_time'  'End_time'  'Start_frame'  'End_frame'  'Bout_time'
-    >>> 0   'None'    0.000000  1.000000          0.0        2.0   1.000000
-    >>> 1   'sharp'   1.666667  2.666667          5.0        7.0   1.000000
-    >>> 2   'track'   1.000000  1.666667          3.0        4.0   0.666667
-    >>> 3   'sync '   2.666667  3.333333          8.0        9.0   0.666667
+    >>> 0   'None'    0.000000  1.000000          0        2   1.000000
+    >>> 1   'sharp'   1.666667  2.666667          5        7   1.000000
+    >>> 2   'track'   1.000000  1.666667          3        4   0.666667
+    >>> 3   'sync '   2.666667  3.333333          8        9   0.666667
     """
 
     check_int(name="FPS", value=fps, min_value=1.0)
+    values = data[target].values
+    _, start_idx, end_idx = _detect_runs(data=values.reshape(-1, 1))
+    events = values[start_idx]
+    bouts = ~pd.isna(events)
+    events, start_idx, end_idx = events[bouts], start_idx[bouts], end_idx[bouts]
+    order = np.lexsort((start_idx, pd.factorize(events, sort=True)[0]))
+    events, start_idx, end_idx = events[order], start_idx[order], end_idx[order]
+    frames = data.index.values
+    start_frames = frames[start_idx].astype(np.int64)
+    end_frames = frames[end_idx].astype(np.int64)
+    start_times = np.where(start_frames != 0, start_frames / fps, 0.0)
+    end_times = np.where(end_frames != 0, (end_frames + 1) / fps, 0.0)
     results = pd.DataFrame(
-        columns=[
-            "Event",
-            "Start_time",
-            "End_time",
-            "Start_frame",
-            "End_frame",
-            "Bout_time",
-        ]
-    )
-    data["is_new_bout"] = (data[target] != data[target].shift(1)).cumsum()
-    bouts = data.groupby([target, "is_new_bout"]).apply(
-        lambda x: (x.index[0], x.index[-1])
+        {
+            "Event": events,
+            "Start_time": start_times,
+            "End_time": end_times,
+            "Start_frame": start_frames,
+            "End_frame": end_frames,
+            "Bout_time": end_times - start_times,
+        }
     )
-    for start_idx, end_idx in bouts:
-        if start_idx != 0:
-            start_time = start_idx / fps
-        else:
-            start_time = 0
-        if end_idx != 0:
-            end_time = (end_idx + 1) / fps
-        else:
-            end_time = 0
-        bout_time = end_time - start_time
-        event = data.at[start_idx, target]
-        results.loc[len(results)] = [
-            event,
-            start_time,
-            end_time,
-            start_idx,
-            end_idx,
-            bout_time,
-        ]
-
     if classifier_map:
         results["Event"] = results["Event"].map(classifier_map)
 
     return results
 
 
+def run_length_encode(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run-length encode a 1D array, e.g., frame-wise classifications, into runs of identical consecutive values.
+
+    :param np.ndarray data: 1D array.
+    :return Tuple[np.ndarray, np.ndarray, np.ndarray]: The value, first index, and length of each run.
+
+    :example:
+    >>> run_length_encode(data=np.array([0, 0, 1, 1, 1, 0]))
+    >>> (array([0, 1, 0]), array([0, 2, 5]), array([2, 3, 1]))
+    """
+
+    data = np.asarray(data).flatten()
+    if data.shape[0] == 0:
+        return data, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    starts = np.concatenate(([0], np.flatnonzero(data[1:] != data[:-1]) + 1))
+    lengths = np.diff(np.append(starts, data.shape[0]))
+    return data[starts], starts.astype(np.int64), lengths.astype(np.int64)
+
+
+def plug_holes_shortest_bout_arr(data: np.ndarray, frames_to_plug: int) -> np.ndarray:
+    """
+    Array version of :meth:`simba.utils.data.plug_holes_shortest_bout` operating on run-length encoded classifications.
+
+    First, runs of ``0`` of at most ``frames_to_plug`` frames that are preceded and followed by ``1`` are set to ``1``.
+    Then, runs of ``1`` of at most ``frames_to_plug`` frames that are preceded and followed by ``0`` are set to ``0``.
+    Runs at the start and end of ``data`` are never changed.
+
+    :param np.ndarray data: 1D array of frame-wise classifications (``0`` and ``1``).
+    :param int frames_to_plug: Maximum length of the gaps to fill and the bouts to remove, in frames.
+    :return np.ndarray: Copy of ``data`` with short gaps filled and short bouts removed.
+
+    :example:
+    >>> plug_holes_shortest_bout_arr(data=np.array([1, 0, 1, 1, 0, 0, 1, 0, 0, 0]), frames_to_plug=1)
+    >>> array([1, 1, 1, 1, 0, 0, 0, 0, 0, 0])
+    """
+
+    data = np.asarray(data).flatten()
+    for present, absent in ((1, 0), (0, 1)):
+        values, _, lengths = run_length_encode(data=data)
+        if values.shape[0] < 3:
+            break
+        inner = np.arange(1, values.shape[0] - 1)
+        inner = inner[
+            (values[inner] == absent)
+            & (values[inner - 1] == present)
+            & (values[inner + 1] == present)
+            & (lengths[inner] <= frames_to_plug)
+        ]
+        values = values.copy()
+        values[inner] = present
+        data = np.repeat(values, lengths)
+    return data.copy()
+
+
 def plug_holes_shortest_bout(
     data_df: pd.DataFrame, clf_name: str, fps: int, shortest_bout: int
 ) -> pd.DataFrame:
     """
     Removes behavior "bouts" that are shorter than the minimum user-specified length within a dataframe.
 
+    Gaps between behavior bouts that are shorter than the minimum length are filled first, then behavior bouts shorter
+    than the minimum length are removed. Computed on the run-length encoded classifications by
+    :meth:`simba.utils.data.plug_holes_shortest_bout_arr`.
+
     :param pd.DataFrame data_df: Pandas Dataframe with classifier prediction data.
     :param str clf_name: Name of the classifier field.
     :param int fps: The fps of the input video.
@@ -209,50 +249,10 @@ def plug_holes_shortest_bout(
     """
 
     frames_to_plug = int(int(fps) * int(shortest_bout) / 1000)
-    frames_to_plug_lst = list(range(1, frames_to_plug + 1))
-    frames_to_plug_lst.reverse()
-    patternListofLists, negPatternListofList = [], []
-    for k in frames_to_plug_lst:
-        zerosInList, oneInlist = [0] * k, [1] * k
-        currList = [1]
-        currList.extend(zerosInList)
-        currList.extend([1])
-        currListNeg = [0]
-        currListNeg.extend(oneInlist)
-        currListNeg.extend([0])
-        patternListofLists.append(currList)
-        negPatternListofList.append(currListNeg)
-    fill_patterns = np.asarray(patternListofLists)
-    remove_patterns = np.asarray(negPatternListofList)
-
-    for currPattern in fill_patterns:
-        n_obs = len(currPattern)
-        data_df["rolling_match"] = (
-            data_df[clf_name]
-            .rolling(window=n_obs, min_periods=n_obs)
-            .apply(lambda x: (x == currPattern).all())
-            .mask(lambda x: x == 0)
-            .bfill(limit=n_obs - 1)
-            .fillna(0)
-            .astype(bool)
+    if frames_to_plug > 0:
+        data_df[clf_name] = plug_holes_shortest_bout_arr(
+            data=data_df[clf_name].values, frames_to_plug=frames_to_plug
         )
-        data_df.loc[data_df["rolling_match"] == True, clf_name] = 1
-        data_df = data_df.drop(["rolling_match"], axis=1)
-
-    for currPattern in remove_patterns:
-        n_obs = len(currPattern)
-        data_df["rolling_match"] = (
-            data_df[clf_name]
-            .rolling(window=n_obs, min_periods=n_obs)
-            .apply(lambda x: (x == currPattern).all())
-            .mask(lambda x: x == 0)
-            .bfill(limit=n_obs - 1)
-            .fillna(0)
-            .astype(bool)
-        )
-        data_df.loc[data_df["rolling_match"] == True, clf_name] = 0
-        data_df = data_df.drop(["rolling_match"], axis=1)
-
     return data_df
 
 
@@ -762,6 +762,34 @@ def fast_mean_rank(data: np.ndarray, descending: bool = True):
     return results
 
 
+def sleap_tracks_to_array(tracks: np.ndarray, point_scores: np.ndarray) -> np.ndarray:
+    """
+    Helper to convert SLEAP H5 ``tracks`` and ``point_scores`` datasets to a 2D array with one row per frame,
+    and the x, y and probability values of every body-part of every track as columns.
+
+    .. note::
+       Expects the datasets transposed to frame-first order, i.e., ``f["tracks"][:].T`` and ``f["point_scores"][:].T``.
+       Missing (NaN) values are returned as 0.
+
+    :param np.ndarray tracks: 4D array of size len(frames) x len(nodes) x 2 x len(tracks) with the x and y coordinates of the body-parts.
+    :param np.ndarray point_scores: 3D array of size len(frames) x len(nodes) x len(tracks) with the body-part probabilities.
+    :return np.ndarray: 2D float32 array of size len(frames) x (len(tracks) * len(nodes) * 3). Columns are ordered by track, then node, then x, y and probability.
+
+    :example:
+    >>> tracks, point_scores = np.random.random((3, 2, 2, 100)).T, np.random.random((2, 2, 100)).T
+    >>> sleap_tracks_to_array(tracks=tracks, point_scores=point_scores).shape
+    >>> (100, 12)
+    """
+
+    n_frames, n_nodes, _, n_tracks = tracks.shape
+    results = np.empty((n_frames, n_tracks, n_nodes, 3), dtype=np.float32)
+    results[..., 0:2] = np.transpose(tracks, (0, 3, 1, 2))
+    results[..., 2] = np.transpose(point_scores, (0, 2, 1))
+    results = results.reshape(n_frames, n_tracks * n_nodes * 3)
+    results[np.isnan(results)] = 0
+    return results
+
+
 def slp_to_df_convert(
     file_path: Union[str, os.PathLike],
     headers: List[str],
@@ -807,22 +835,7 @@ def slp_to_df_convert(
         node_names = [n.decode() for n in f["node_names"][:].tolist()]
         track_names = [n.decode() for n in f["track_names"][:].tolist()]
 
-    csv_rows = []
-    n_frames, n_nodes, _, n_tracks = tracks.shape
-
-    for frame_ind in range(n_frames):
-        csv_row = []
-        for track_ind in range(n_tracks):
-            for node_ind in range(n_nodes):
-                for xyp in range(3):
-                    if xyp == 0 or xyp == 1:
-                        data = tracks[frame_ind, node_ind, xyp, track_ind]
-                    else:
-                        data = point_scores[frame_ind, node_ind, track_ind]
-
-                    csv_row.append(f"{data:.3f}")
-        csv_rows.append(" ".join(csv_row))
-
+    _, n_nodes, _, n_tracks = tracks.shape
     sleap_header = []
     sleap_header_unique = []
     for track_ind in range(n_tracks):
@@ -831,10 +844,9 @@ def slp_to_df_convert(
             for suffix in ["x", "y", "p"]:
                 sleap_header.append(f"{node_names[node_ind]}_{track_ind + 1}_{suffix}")
 
-    csv_rows = "\n".join(csv_rows)
-    data_df = pd.read_csv(
-        io.StringIO(csv_rows), delim_whitespace=True, header=None
-    ).fillna(0)
+    data_df = pd.DataFrame(
+        sleap_tracks_to_array(tracks=tracks, point_scores=point_scores)
+    )
     if len(data_df.columns) != len(sleap_header):
         raise BodypartColumnNotFoundError(
             msg=f"The number of body-parts in data file {file_path} do not match the number of body-parts in your SimBA project. "
@@ -844,7 +856,7 @@ def slp_to_df_convert(
             source=slp_to_df_convert.__name__,
         )
 
-    if len(drop_body_parts) > 0:
+    if drop_body_parts:
         data_df.columns = sleap_header
         headers_to_drop = []
         for h in drop_body_parts:
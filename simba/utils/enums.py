@@ -55,6 +55,7 @@ class Paths(Enum):
     INPUT_CSV = Path("csv/input_csv/")
     LINE_PLOT_DIR = Path("frames/output/line_plot/")
     VIDEO_INFO = Path("logs/video_info.csv")
+    VIDEO_META_DATA_CACHE = Path("logs/video_meta_data_cache.json")
     OUTLIER_CORRECTED = Path("csv/outlier_corrected_movement_location/")
     OUTLIER_CORRECTED_MOVEMENT = Path("csv/outlier_corrected_movement/")
     MACHINE_RESULTS_DIR = Path("csv/machine_results/")
@@ -98,6 +99,7 @@ class Paths(Enum):
     FRAMES_OUTPUT_DIR = Path("frames/output/")
     FEATURES_EXTRACTED_DIR = Path("csv/features_extracted/")
     TARGETS_INSERTED_DIR = Path("csv/targets_inserted/")
+    TRAINING_STORE_DIR = Path("csv/training_store/")
     PATH_PLOT_DIR = Path("frames/output/path_plots")
     ABOUT_ME = Path("assets/img/about_me.png")
     PROBABILITY_PLOTS_DIR = Path("frames/output/probability_plots/")
@@ -124,6 +126,7 @@ class Formats(Enum):
     CSV = "csv"
     PARQUET = "parquet"
     PICKLE = "pickle"
+    SBP = "sbp"
     XLXS = "xlsx"
     PERIMETER = "perimeter"
     AREA = "area"
@@ -369,6 +372,7 @@ class Defaults(Enum):
     MAX_TASK_PER_CHILD = 10
     LARGE_MAX_TASK_PER_CHILD = 1000
     CHUNK_SIZE = 1
+    MODEL_CACHE_SIZE_MB = 4000
     SPLASH_TIME = 2500
     try:
         WELCOME_MSG = f'Welcome fellow scientists! \n SimBA v.{pkg_resources.get_distribution("simba-uw-tf-dev").version} \n '
@@ -629,6 +633,7 @@ class MLParamKeys(Enum):
     SAVE_TRAIN_TEST_FRM_IDX = "save_train_test_frm_idx"
     SHAP_MULTIPROCESS = "shap_multiprocess"
     CLASSIFIER_MAP = "classifier_map"
+    TRAINING_STORE = "use_training_store"
 
 
 class TestPaths(Enum):
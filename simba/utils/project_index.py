@@ -0,0 +1,160 @@
+__author__ = "Simon Nilsson"
+
+import glob
+import os
+import threading
+import time
+from typing import Any, Dict, List, Union
+
+import pandas as pd
+
+from simba.utils.read_write import (get_data_file_headers,
+                                    get_data_file_row_count)
+
+# Listings of directories modified within this many nanoseconds are not cached, as a file added within the
+# modification time resolution of the file system would not change the directory modification time.
+RECENTLY_MODIFIED_NS = 2_000_000_000
+
+
+class ProjectFileIndex(object):
+    """
+    Process-wide, lazily populated index of SimBA project files.
+
+    The index holds directory listings, file sizes, row counts, column names and the contents of small CSV files
+    (e.g., ``project_bp_names.csv`` and ``video_info.csv``). Nothing is read until requested. A directory listing is
+    only re-read when the modification time of the directory has changed, and file entries are only re-read when the
+    modification time or size of the file has changed.
+
+    :example:
+    >>> index = ProjectFileIndex()
+    >>> file_paths = index.file_paths(directory='project_folder/csv/features_extracted', file_type='csv')
+    >>> file_paths = index.file_paths(directory='project_folder/csv/features_extracted', file_type='csv') # No directory listing
+    >>> row_cnt = index.row_count(file_path=file_paths[0], file_type='csv')
+    """
+
+    def __init__(self):
+        self._listings = {}
+        self._files = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_file_key(file_path: Union[str, os.PathLike]) -> (str, int, int):
+        file_path = os.path.abspath(file_path)
+        file_stat = os.stat(file_path)
+        return file_path, file_stat.st_mtime_ns, file_stat.st_size
+
+    def file_paths(
+        self, directory: Union[str, os.PathLike], file_type: str
+    ) -> List[str]:
+        """
+        Return the paths of the files with the ``file_type`` extension in ``directory``, in the same form and order as
+        ``glob.glob(directory + f"/*.{file_type}")``.
+
+        :parameter Union[str, os.PathLike] directory: The directory to list.
+        :parameter str file_type: The file extension, e.g., ``csv`` or ``parquet``.
+        :return List[str]: The file paths. Empty list if the directory does not exist.
+        """
+
+        key = (os.path.abspath(directory), str(directory), file_type)
+        try:
+            dir_mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []
+        with self._lock:
+            if (key in self._listings) and (self._listings[key][0] == dir_mtime):
+                return list(self._listings[key][1])
+        file_paths = glob.glob(str(directory) + f"/*.{file_type}")
+        if time.time_ns() - dir_mtime > RECENTLY_MODIFIED_NS:
+            with self._lock:
+                self._listings[key] = (dir_mtime, file_paths)
+        return list(file_paths)
+
+    def _get_file_entry(
+        self, file_path: Union[str, os.PathLike], name: str, func: Any
+    ) -> Any:
+        file_path, mtime, size = self._get_file_key(file_path=file_path)
+        with self._lock:
+            entry = self._files.get(file_path)
+            if (entry is None) or (entry["mtime"] != mtime) or (entry["size"] != size):
+                entry = {"mtime": mtime, "size": size}
+                self._files[file_path] = entry
+            if name in entry:
+                return entry[name]
+        value = func()
+        with self._lock:
+            entry[name] = value
+        return value
+
+    def file_size(self, file_path: Union[str, os.PathLike]) -> int:
+        """
+        Return the size of a file in bytes.
+
+        :parameter Union[str, os.PathLike] file_path: Path to the file.
+        :return int: The file size in bytes.
+        """
+
+        return self._get_file_key(file_path=file_path)[2]
+
+    def row_count(self, file_path: Union[str, os.PathLike], file_type: str) -> int:
+        """
+        Return the number of data rows in a SimBA data file. See :func:`simba.utils.read_write.get_data_file_row_count`.
+
+        :parameter Union[str, os.PathLike] file_path: Path to data file.
+        :parameter str file_type: Type of data. OPTIONS: 'parquet', 'csv', 'pickle', 'sbp'.
+        :return int: The number of rows in the file.
+        """
+
+        return self._get_file_entry(
+            file_path=file_path,
+            name="row_count",
+            func=lambda: get_data_file_row_count(
+                file_path=file_path, file_type=file_type
+            ),
+        )
+
+    def column_names(
+        self, file_path: Union[str, os.PathLike], file_type: str
+    ) -> List[str]:
+        """
+        Return the data column names of a SimBA data file. See :func:`simba.utils.read_write.get_data_file_headers`.
+
+        :parameter Union[str, os.PathLike] file_path: Path to data file.
+        :parameter str file_type: Type of data. OPTIONS: 'parquet', 'csv', 'pickle', 'sbp'.
+        :return List[str]: The column names in file order.
+        """
+
+        return list(
+            self._get_file_entry(
+                file_path=file_path,
+                name="column_names",
+                func=lambda: get_data_file_headers(
+                    file_path=file_path, file_type=file_type
+                ),
+            )
+        )
+
+    def read_csv(
+        self, file_path: Union[str, os.PathLike], **kwargs: Dict[str, Any]
+    ) -> pd.DataFrame:
+        """
+        Return the contents of a small CSV file, e.g., ``project_folder/logs/video_info.csv``, read with
+        ``pd.read_csv(file_path, **kwargs)``. A copy is returned, so the result can be modified by the caller.
+
+        :parameter Union[str, os.PathLike] file_path: Path to the CSV file.
+        :return pd.DataFrame: The contents of the CSV file.
+        """
+
+        return self._get_file_entry(
+            file_path=file_path,
+            name=f"csv_{sorted(kwargs.items())}",
+            func=lambda: pd.read_csv(file_path, **kwargs),
+        ).copy()
+
+    def clear(self) -> None:
+        """Remove all entries from the index."""
+        with self._lock:
+            self._listings.clear()
+            self._files.clear()
+
+
+PROJECT_FILE_INDEX = ProjectFileIndex()
@@ -1,19 +1,24 @@
 __author__ = "Simon Nilsson"
 
 import configparser
+import functools
 import glob
+import json
+import mmap
 import multiprocessing
+import numbers
 import os
 import pickle
 import platform
 import re
 import shutil
 import threading
+import time
 import webbrowser
 from configparser import ConfigParser
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import cv2
@@ -21,6 +26,7 @@ import numpy as np
 import pandas as pd
 import pkg_resources
 import pyarrow as pa
+import pyarrow.parquet as pq
 from pyarrow import csv
 from shapely.geometry import (LineString, MultiLineString, MultiPolygon, Point,
                               Polygon)
@@ -30,9 +36,10 @@ from simba.utils.checks import (check_file_exist_and_readable, check_float,
                                 check_if_filepath_list_is_empty,
                                 check_if_string_value_is_valid_video_timestamp,
                                 check_instance, check_int,
-                                check_nvidea_gpu_available, check_valid_lst)
-from simba.utils.enums import ConfigKey, Dtypes, Formats, Keys
-from simba.utils.errors import (DataHeaderError, DuplicationError,
+                                check_nvidea_gpu_available, check_str,
+                                check_valid_lst)
+from simba.utils.enums import ConfigKey, Defaults, Dtypes, Formats, Keys, Paths
+from simba.utils.errors import (CountError, DataHeaderError, DuplicationError,
                                 FeatureNumberMismatchError,
                                 FFMPEGCodecGPUError, FileExistError,
                                 FrameRangeError, IntegerError,
@@ -43,13 +50,21 @@ from simba.utils.errors import (DataHeaderError, DuplicationError,
                                 ParametersFileError, PermissionError)
 from simba.utils.printing import SimbaTimer, stdout_success
 from simba.utils.warnings import (FileExistWarning, InvalidValueWarning,
-                                  NoDataFoundWarning, NoFileFoundWarning)
+                                  NoDataFoundWarning, NoFileFoundWarning,
+                                  SkippingFileWarning)
 
 # from simba.utils.keyboard_listener import KeyboardListener
 
 
 PARSE_OPTIONS = csv.ParseOptions(delimiter=",")
 READ_OPTIONS = csv.ReadOptions(encoding="utf8")
+SBP_MAGIC = b"SIMBASBP"
+SBP_VERSION = 1
+SBP_COMPRESSION_OPTIONS = ("lz4", "zstd")
+VIDEO_META_DATA_CACHE_LOCK = threading.Lock()
+VIDEO_META_DATA_CACHE = {}
+VIDEO_META_DATA_CACHE_PATHS = {}
+VIDEO_META_DATA_CACHE_LOCK_TIMEOUT = 10
 
 
 def read_df(
@@ -61,77 +76,168 @@ def read_df(
     anipose_data: Optional[bool] = False,
     check_multiindex: Optional[bool] = False,
     multi_index_headers_to_keep: Optional[int] = None,
+    frame_range: Optional[Tuple[int, int]] = None,
 ) -> pd.DataFrame:
     """
     Read single tabular data file or pickle
 
     .. note::
        For improved runtime, defaults to :external:py:meth:`pyarrow.csv.write_cs` if file type is ``csv``.
+       If ``usecols`` or ``remove_columns`` is passed, the column selection is pushed down to the ``pyarrow`` reader
+       so that only the requested columns are parsed. If ``frame_range`` is passed, the file is read in blocks (``csv``),
+       row-groups (``parquet``) or chunks (``sbp``), and reading stops once the last frame of the range has been parsed.
 
     :parameter str file_path: Path to data file
-    :parameter str file_type: Type of data. OPTIONS: 'parquet', 'csv', 'pickle'.
+    :parameter str file_type: Type of data. OPTIONS: 'parquet', 'csv', 'pickle', 'sbp'.
     :parameter Optional[bool]: If the input file has an initial index column. Default: True.
     :parameter Optional[List[str]] remove_columns: If not None, then remove columns in lits.
     :parameter Optional[List[str]] usecols: If not None, then keep columns in list.
     :parameter bool check_multiindex: check file is multi-index headers. Default: False.
     :parameter int multi_index_headers_to_keep: If reading multi-index file, and we want to keep one of the dropped multi-index levels as the header in the output file, specify the index of the multiindex hader as int.
+    :parameter Optional[Tuple[int, int]] frame_range: If not None, a (start, end) tuple of frame indexes where start is inclusive and end is exclusive. Only rows within the range are returned, and the index of the returned dataframe holds the original frame numbers. Default: None.
     :return pd.DataFrame
 
     :example:
     >>> read_df(file_path='project_folder/csv/input_csv/Video_1.csv', file_type='csv', check_multiindex=True)
+    >>> read_df(file_path='project_folder/csv/features_extracted/Video_1.csv', file_type='csv', usecols=['Nose_1_x', 'Nose_1_y'], frame_range=(1000, 2000))
     """
     check_file_exist_and_readable(file_path=file_path)
+    if frame_range is not None:
+        check_valid_lst(
+            data=list(frame_range),
+            source=f"{read_df.__name__} frame_range",
+            min_len=2,
+            max_len=2,
+        )
+        for value in frame_range:
+            if isinstance(value, bool) or not isinstance(value, numbers.Integral):
+                raise InvalidInputError(
+                    msg=f"The frame_range has to hold integers, got {frame_range}.",
+                    source=read_df.__name__,
+                )
+        check_int(name="frame_range start", value=frame_range[0], min_value=0)
+        check_int(name="frame_range end", value=frame_range[1], min_value=0)
+        frame_range = (int(frame_range[0]), int(frame_range[1]))
+        if frame_range[0] >= frame_range[1]:
+            raise FrameRangeError(
+                msg=f"The frame_range start ({frame_range[0]}) has to be smaller than the frame_range end ({frame_range[1]}).",
+                source=read_df.__name__,
+            )
+    pushdown = (
+        (usecols is not None)
+        or (remove_columns is not None)
+        or (frame_range is not None)
+    ) and not (anipose_data or check_multiindex)
+    range_applied = False
     if file_type == Formats.CSV.value:
         try:
-            df = csv.read_csv(
-                file_path, parse_options=PARSE_OPTIONS, read_options=READ_OPTIONS
-            )
-            duplicate_headers = list(
-                set([x for x in df.column_names if df.column_names.count(x) > 1])
-            )
-            if len(duplicate_headers) > 0:
-                new_headers = [
-                    duplicate_headers[0] + f"_{x}" for x in range(len(df.column_names))
-                ]
-                df = df.rename_columns(new_headers)
-            if anipose_data:
+            file_headers = None
+            if pushdown:
+                file_headers = read_csv_headers(file_path=file_path)
+                data_headers = _filter_columns(
+                    columns=file_headers[1:],
+                    usecols=usecols,
+                    remove_columns=remove_columns,
+                )
+                if (len(file_headers) != len(set(file_headers))) or (
+                    len(data_headers) == 0
+                ):
+                    file_headers = None
+            if file_headers is not None:
+                if frame_range is None:
+                    df = csv.read_csv(
+                        file_path,
+                        parse_options=PARSE_OPTIONS,
+                        read_options=READ_OPTIONS,
+                        convert_options=csv.ConvertOptions(
+                            include_columns=data_headers
+                        ),
+                    )
+                else:
+                    reader = csv.open_csv(
+                        file_path,
+                        parse_options=PARSE_OPTIONS,
+                        read_options=READ_OPTIONS,
+                        convert_options=csv.ConvertOptions(
+                            include_columns=data_headers,
+                            column_types={x: pa.float64() for x in data_headers},
+                        ),
+                    )
+                    batches, batch_start = [], 0
+                    for batch in reader:
+                        batch_end = batch_start + batch.num_rows
+                        if batch_end > frame_range[0]:
+                            slice_start = max(frame_range[0], batch_start)
+                            slice_end = min(frame_range[1], batch_end)
+                            batches.append(
+                                batch.slice(
+                                    slice_start - batch_start, slice_end - slice_start
+                                )
+                            )
+                        if batch_end >= frame_range[1]:
+                            break
+                        batch_start = batch_end
+                    df = pa.Table.from_batches(batches, schema=reader.schema)
+                    range_applied = True
                 df = df.to_pandas()
-                has_index = True
+                if range_applied:
+                    df.index = pd.RangeIndex(
+                        start=frame_range[0], stop=frame_range[0] + len(df)
+                    )
+                if not has_index:
+                    df = df.reset_index()
+                df = df.astype(np.float32)
             else:
-                df = df.to_pandas().iloc[:, 1:]
-            if check_multiindex:
-                header_col_cnt = get_number_of_header_columns_in_df(df=df)
-                if multi_index_headers_to_keep is not None:
-                    if multi_index_headers_to_keep not in list(
-                        range(0, header_col_cnt)
-                    ):
-                        raise InvalidInputError(
-                            msg=f"The selected multi-header index column {multi_index_headers_to_keep} does not exist in the multi-index header columns: {list(range(0, header_col_cnt))}",
-                            source=read_df.__name__,
-                        )
-                    else:
-                        new_header = list(
-                            df.iloc[multi_index_headers_to_keep, :].values
-                        )
-                        new_header_xy = []
-                        for header in list(set(new_header)):
-                            new_header_xy.append(f"{header}_x")
-                            new_header_xy.append(f"{header}_y"), new_header_xy.append(
-                                f"{header}_likelihood"
+                df = csv.read_csv(
+                    file_path, parse_options=PARSE_OPTIONS, read_options=READ_OPTIONS
+                )
+                duplicate_headers = list(
+                    set([x for x in df.column_names if df.column_names.count(x) > 1])
+                )
+                if len(duplicate_headers) > 0:
+                    new_headers = [
+                        duplicate_headers[0] + f"_{x}"
+                        for x in range(len(df.column_names))
+                    ]
+                    df = df.rename_columns(new_headers)
+                if anipose_data:
+                    df = df.to_pandas()
+                    has_index = True
+                else:
+                    df = df.to_pandas().iloc[:, 1:]
+                if check_multiindex:
+                    header_col_cnt = get_number_of_header_columns_in_df(df=df)
+                    if multi_index_headers_to_keep is not None:
+                        if multi_index_headers_to_keep not in list(
+                            range(0, header_col_cnt)
+                        ):
+                            raise InvalidInputError(
+                                msg=f"The selected multi-header index column {multi_index_headers_to_keep} does not exist in the multi-index header columns: {list(range(0, header_col_cnt))}",
+                                source=read_df.__name__,
+                            )
+                        else:
+                            new_header = list(
+                                df.iloc[multi_index_headers_to_keep, :].values
                             )
+                            new_header_xy = []
+                            for header in list(set(new_header)):
+                                new_header_xy.append(f"{header}_x")
+                                new_header_xy.append(
+                                    f"{header}_y"
+                                ), new_header_xy.append(f"{header}_likelihood")
+                            df = df.drop(
+                                df.index[list(range(0, header_col_cnt))]
+                            ).apply(pd.to_numeric)
+                            df.columns = new_header_xy
+                    else:
                         df = df.drop(df.index[list(range(0, header_col_cnt))]).apply(
                             pd.to_numeric
                         )
-                        df.columns = new_header_xy
+                if not has_index:
+                    df = df.reset_index()
                 else:
-                    df = df.drop(df.index[list(range(0, header_col_cnt))]).apply(
-                        pd.to_numeric
-                    )
-            if not has_index:
-                df = df.reset_index()
-            else:
-                df = df.reset_index(drop=True)
-            df = df.astype(np.float32)
+                    df = df.reset_index(drop=True)
+                df = df.astype(np.float32)
 
         except Exception as e:
             print(e, e.args)
@@ -143,7 +249,50 @@ def read_df(
         if usecols:
             df = df[df.columns[df.columns.isin(usecols)]]
     elif file_type == Formats.PARQUET.value:
-        df = pd.read_parquet(file_path)
+        columns = None
+        if pushdown and ((usecols is not None) or (remove_columns is not None)):
+            columns = _filter_columns(
+                columns=[
+                    x
+                    for x in pq.read_schema(file_path).names
+                    if not x.startswith("__index_level_")
+                ],
+                usecols=usecols,
+                remove_columns=remove_columns,
+            )
+        if pushdown and (frame_range is not None):
+            parquet_file = pq.ParquetFile(file_path)
+            tables, row_group_start = [], 0
+            for row_group in range(parquet_file.num_row_groups):
+                row_group_end = (
+                    row_group_start
+                    + parquet_file.metadata.row_group(row_group).num_rows
+                )
+                if row_group_end > frame_range[0]:
+                    slice_start = max(frame_range[0], row_group_start)
+                    slice_end = min(frame_range[1], row_group_end)
+                    tables.append(
+                        parquet_file.read_row_group(
+                            row_group, columns=columns, use_pandas_metadata=False
+                        ).slice(
+                            slice_start - row_group_start, slice_end - slice_start
+                        )
+                    )
+                if row_group_end >= frame_range[1]:
+                    break
+                row_group_start = row_group_end
+            if len(tables) > 0:
+                df = pa.concat_tables(tables)
+            else:
+                df = parquet_file.schema_arrow.empty_table()
+            df = df.replace_schema_metadata(None).to_pandas()
+            df = df[[x for x in df.columns if not x.startswith("__index_level_")]]
+            df.index = pd.RangeIndex(
+                start=frame_range[0], stop=frame_range[0] + len(df)
+            )
+            range_applied = True
+        else:
+            df = pd.read_parquet(file_path, columns=columns)
         if check_multiindex:
             header_col_cnt = get_number_of_header_columns_in_df(df=df)
             df = (
@@ -152,19 +301,141 @@ def read_df(
                 .reset_index(drop=True)
             )
         df = df.astype(np.float32)
+        if remove_columns:
+            df = df[df.columns[~df.columns.isin(remove_columns)]]
+        if usecols:
+            df = df[df.columns[df.columns.isin(usecols)]]
 
+    elif file_type == Formats.SBP.value:
+        columns = None
+        if (usecols is not None) or (remove_columns is not None):
+            columns = _filter_columns(
+                columns=read_sbp_header(file_path=file_path)["columns"],
+                usecols=usecols,
+                remove_columns=remove_columns,
+            )
+        df = read_sbp(file_path=file_path, usecols=columns, frame_range=frame_range)
+        range_applied = True
     elif file_type == Formats.PICKLE.value:
         with open(file_path, "rb") as fp:
             df = pickle.load(fp)
     else:
         raise InvalidFileTypeError(
-            msg=f"{file_type} is not a valid filetype OPTIONS: [pickle, csv, parquet]",
+            msg=f"{file_type} is not a valid filetype OPTIONS: [pickle, csv, parquet, sbp]",
             source=read_df.__name__,
         )
+    if (
+        (frame_range is not None)
+        and (not range_applied)
+        and isinstance(df, pd.DataFrame)
+    ):
+        df = df.iloc[frame_range[0] : frame_range[1]]
 
     return df
 
 
+def _filter_columns(
+    columns: List[str],
+    usecols: Optional[List[str]] = None,
+    remove_columns: Optional[List[str]] = None,
+) -> List[str]:
+    """Helper to return the ``columns`` that are in ``usecols`` and not in ``remove_columns`` while preserving file order."""
+    if usecols:
+        columns = [x for x in columns if x in usecols]
+    if remove_columns:
+        columns = [x for x in columns if x not in remove_columns]
+    return columns
+
+
+def read_csv_headers(file_path: Union[str, os.PathLike]) -> List[str]:
+    """
+    Read the header row of a CSV file without parsing the data rows.
+
+    :parameter Union[str, os.PathLike] file_path: Path to CSV file.
+    :return List[str]: The column names in file order, including the (often unnamed) index column.
+
+    :example:
+    >>> read_csv_headers(file_path='project_folder/csv/features_extracted/Video_1.csv')
+    >>> ['', 'Ear_left_1_x', 'Ear_left_1_y', ...]
+    """
+    check_file_exist_and_readable(file_path=file_path)
+    reader = csv.open_csv(
+        file_path, parse_options=PARSE_OPTIONS, read_options=READ_OPTIONS
+    )
+    headers = reader.schema.names
+    reader.close()
+    return headers
+
+
+def get_data_file_headers(
+    file_path: Union[str, os.PathLike], file_type: Union[str, os.PathLike]
+) -> List[str]:
+    """
+    Get the data column names of a SimBA data file without reading the data. The index column is not included.
+
+    .. note::
+       ``csv``, ``parquet`` and ``sbp`` headers are read from the file header or schema. ``pickle`` files are read in full.
+
+    :parameter Union[str, os.PathLike] file_path: Path to data file.
+    :parameter str file_type: Type of data. OPTIONS: 'parquet', 'csv', 'pickle', 'sbp'.
+    :return List[str]: The column names in file order.
+
+    :example:
+    >>> get_data_file_headers(file_path='project_folder/csv/targets_inserted/Video_1.csv', file_type='csv')
+    """
+
+    check_file_exist_and_readable(file_path=file_path)
+    if file_type == Formats.CSV.value:
+        return read_csv_headers(file_path=file_path)[1:]
+    elif file_type == Formats.PARQUET.value:
+        return [
+            x
+            for x in pq.read_schema(file_path).names
+            if not x.startswith("__index_level_")
+        ]
+    elif file_type == Formats.SBP.value:
+        return read_sbp_header(file_path=file_path)["columns"]
+    else:
+        return list(read_df(file_path=file_path, file_type=file_type).columns)
+
+
+def get_data_file_row_count(
+    file_path: Union[str, os.PathLike], file_type: Union[str, os.PathLike]
+) -> int:
+    """
+    Get the number of data rows (frames) in a SimBA data file without parsing the data.
+
+    .. note::
+       ``parquet`` and ``sbp`` row counts are read from the file meta data. ``csv`` row counts are the number of line breaks
+       after the header row, counted in binary blocks. ``pickle`` files are read in full.
+
+    :parameter Union[str, os.PathLike] file_path: Path to data file.
+    :parameter str file_type: Type of data. OPTIONS: 'parquet', 'csv', 'pickle', 'sbp'.
+    :return int: The number of rows in the file.
+
+    :example:
+    >>> get_data_file_row_count(file_path='project_folder/csv/targets_inserted/Video_1.csv', file_type='csv')
+    >>> 9000
+    """
+
+    check_file_exist_and_readable(file_path=file_path)
+    if file_type == Formats.CSV.value:
+        line_cnt, last_block = 0, b""
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                line_cnt += block.count(b"\n")
+                last_block = block
+        if (len(last_block) > 0) and (not last_block.endswith(b"\n")):
+            line_cnt += 1
+        return max(0, line_cnt - 1)
+    elif file_type == Formats.PARQUET.value:
+        return pq.ParquetFile(file_path).metadata.num_rows
+    elif file_type == Formats.SBP.value:
+        return read_sbp_header(file_path=file_path)["frame_count"]
+    else:
+        return len(read_df(file_path=file_path, file_type=file_type))
+
+
 def write_df(
     df: pd.DataFrame,
     file_type: str,
@@ -178,7 +449,7 @@ def write_df(
        For improved runtime, defaults to ``pyarrow.csv`` if file_type == ``csv``.
 
     :parameter pd.DataFrame df: Pandas dataframe to save to disk.
-    :parameter str file_type: Type of data. OPTIONS: ``parquet``, ``csv``,  ``pickle``.
+    :parameter str file_type: Type of data. OPTIONS: ``parquet``, ``csv``,  ``pickle``, ``sbp``.
     :parameter str save_path: Location where to store the data.
     :parameter bool check_multiindex: check if input file is multi-index headers. Default: False.
 
@@ -203,6 +474,8 @@ def write_df(
             df.to_csv(save_path)
     elif file_type == Formats.PARQUET.value:
         df.to_parquet(save_path)
+    elif file_type == Formats.SBP.value:
+        write_sbp(df=df, save_path=save_path)
     elif file_type == Formats.PICKLE.value:
         try:
             with open(save_path, "wb") as f:
@@ -214,11 +487,297 @@ def write_df(
             )
     else:
         raise InvalidFileTypeError(
-            msg=f"{file_type} is not a valid filetype OPTIONS: [csv, pickle, parquet]",
+            msg=f"{file_type} is not a valid filetype OPTIONS: [csv, pickle, parquet, sbp]",
             source=write_df.__name__,
         )
 
 
+def _write_sbp_columns(
+    f, data: np.ndarray, chunk_size: int, compression: Optional[str]
+) -> List[List[List[int]]]:
+    """Helper to write the columns of a 2D float32 array in chunks at the current position of an open SimBA binary pose file, returns the (offset, byte count) of each chunk of each column."""
+    offsets = []
+    for col in range(data.shape[1]):
+        column, column_offsets = np.ascontiguousarray(data[:, col]), []
+        for start in range(0, column.shape[0], chunk_size):
+            chunk = column[start : start + chunk_size].tobytes()
+            if compression is not None:
+                chunk = pa.compress(chunk, codec=compression, asbytes=True)
+            column_offsets.append([f.tell(), len(chunk)])
+            f.write(chunk)
+        offsets.append(column_offsets)
+    return offsets
+
+
+def _write_sbp_footer(f, header: Dict[str, Any]) -> None:
+    """Helper to write the schema footer, footer byte count and magic bytes at the current position of an open SimBA binary pose file."""
+    footer = json.dumps(header).encode("utf-8")
+    f.write(footer)
+    f.write(len(footer).to_bytes(8, "little"))
+    f.write(SBP_MAGIC)
+
+
+def _read_sbp_footer(file_path: Union[str, os.PathLike]) -> Dict[str, Any]:
+    """Helper to read the schema footer, including the chunk offsets of each column, of a SimBA binary pose file."""
+    check_file_exist_and_readable(file_path=file_path)
+    with open(file_path, "rb") as f:
+        file_size = f.seek(0, os.SEEK_END)
+        if file_size >= (len(SBP_MAGIC) * 2) + 8:
+            f.seek(0)
+            start_magic = f.read(len(SBP_MAGIC))
+            f.seek(file_size - len(SBP_MAGIC) - 8)
+            footer_size = int.from_bytes(f.read(8), "little")
+            end_magic = f.read(len(SBP_MAGIC))
+            if (start_magic == SBP_MAGIC) and (end_magic == SBP_MAGIC):
+                f.seek(file_size - len(SBP_MAGIC) - 8 - footer_size)
+                return json.loads(f.read(footer_size).decode("utf-8"))
+    raise InvalidFileTypeError(
+        msg=f"{file_path} is not a valid SimBA binary pose (sbp) file",
+        source=_read_sbp_footer.__name__,
+    )
+
+
+def write_sbp(
+    df: pd.DataFrame,
+    save_path: Union[str, os.PathLike],
+    body_parts: Optional[List[str]] = None,
+    fps: Optional[float] = None,
+    px_per_mm: Optional[float] = None,
+    chunk_size: int = 10000,
+    compression: Optional[str] = "lz4",
+) -> None:
+    """
+    Write a dataframe to a SimBA binary pose (``sbp``) file.
+
+    The values are stored as float32 columns split into chunks of ``chunk_size`` frames, each chunk compressed
+    separately. A schema footer stores the column names, the frame count, the chunk offsets, and the body-part
+    names, fps and pixels per millimeter of the video. The dataframe index is not stored.
+
+    .. note::
+       Read ``sbp`` files with :meth:`simba.utils.read_write.read_sbp` or with :meth:`simba.utils.read_write.read_df`
+       and ``file_type='sbp'``. Add columns with :meth:`simba.utils.read_write.append_sbp_columns`.
+
+    :parameter pd.DataFrame df: Dataframe with numerical columns to save to disk.
+    :parameter Union[str, os.PathLike] save_path: Location where to store the data.
+    :parameter Optional[List[str]] body_parts: Body-part names stored in the schema. If None, then the names of the columns with ``_x`` suffixes that have a ``_y`` counterpart. Default: None.
+    :parameter Optional[float] fps: The frame rate of the video stored in the schema. Default: None.
+    :parameter Optional[float] px_per_mm: The pixels per millimeter of the video stored in the schema. Default: None.
+    :parameter int chunk_size: Number of frames per chunk. Default: 10000.
+    :parameter Optional[str] compression: Chunk compression codec. OPTIONS: 'lz4', 'zstd', None. Default: 'lz4'.
+
+    :example:
+    >>> df = read_df(file_path='project_folder/csv/outlier_corrected_movement_location/Video_1.csv', file_type='csv')
+    >>> write_sbp(df=df, save_path='project_folder/csv/outlier_corrected_movement_location/Video_1.sbp', fps=30, px_per_mm=4.5)
+    """
+
+    check_instance(
+        source=write_sbp.__name__, instance=df, accepted_types=(pd.DataFrame,)
+    )
+    check_int(name=f"{write_sbp.__name__} chunk_size", value=chunk_size, min_value=1)
+    if compression is not None:
+        check_str(
+            name=f"{write_sbp.__name__} compression",
+            value=compression,
+            options=SBP_COMPRESSION_OPTIONS,
+        )
+    if fps is not None:
+        check_float(name=f"{write_sbp.__name__} fps", value=fps, min_value=0)
+        fps = float(fps)
+    if px_per_mm is not None:
+        check_float(
+            name=f"{write_sbp.__name__} px_per_mm", value=px_per_mm, min_value=0
+        )
+        px_per_mm = float(px_per_mm)
+    df = df.drop("scorer", axis=1, errors="ignore")
+    columns = [str(x) for x in df.columns]
+    if len(columns) != len(set(columns)):
+        raise DuplicationError(
+            msg=f"The dataframe saved to {save_path} contains duplicate column names.",
+            source=write_sbp.__name__,
+        )
+    try:
+        data = df.to_numpy(dtype=np.float32)
+    except ValueError:
+        raise InvalidInputError(
+            msg=f"The dataframe saved to {save_path} contains non-numerical columns.",
+            source=write_sbp.__name__,
+        )
+    if body_parts is None:
+        body_parts = [
+            x[:-2] for x in columns if x.endswith("_x") and f"{x[:-2]}_y" in columns
+        ]
+    header = {
+        "version": SBP_VERSION,
+        "frame_count": data.shape[0],
+        "chunk_size": chunk_size,
+        "compression": compression,
+        "body_parts": list(body_parts),
+        "fps": fps,
+        "px_per_mm": px_per_mm,
+    }
+    with open(save_path, "wb") as f:
+        f.write(SBP_MAGIC)
+        offsets = _write_sbp_columns(
+            f=f, data=data, chunk_size=chunk_size, compression=compression
+        )
+        header["columns"] = [
+            {"name": name, "chunks": chunks} for name, chunks in zip(columns, offsets)
+        ]
+        _write_sbp_footer(f=f, header=header)
+
+
+def read_sbp_header(file_path: Union[str, os.PathLike]) -> Dict[str, Any]:
+    """
+    Read the schema of a SimBA binary pose (``sbp``) file without reading the data.
+
+    :parameter Union[str, os.PathLike] file_path: Path to ``sbp`` file.
+    :return dict: The ``columns``, ``frame_count``, ``body_parts``, ``fps``, ``px_per_mm``, ``chunk_size``, ``compression`` and ``version`` of the file.
+
+    :example:
+    >>> read_sbp_header(file_path='project_folder/csv/outlier_corrected_movement_location/Video_1.sbp')
+    >>> {'version': 1, 'frame_count': 9000, 'chunk_size': 10000, 'compression': 'lz4', 'body_parts': ['Nose_1', ...], 'fps': 30.0, 'px_per_mm': 4.5, 'columns': ['Nose_1_x', ...]}
+    """
+
+    header = _read_sbp_footer(file_path=file_path)
+    header["columns"] = [x["name"] for x in header["columns"]]
+    return header
+
+
+def read_sbp(
+    file_path: Union[str, os.PathLike],
+    usecols: Optional[List[str]] = None,
+    frame_range: Optional[Tuple[int, int]] = None,
+) -> pd.DataFrame:
+    """
+    Read a SimBA binary pose (``sbp``) file.
+
+    The file is memory-mapped, and only the chunks of the requested columns that overlap ``frame_range`` are read
+    and decompressed.
+
+    :parameter Union[str, os.PathLike] file_path: Path to ``sbp`` file.
+    :parameter Optional[List[str]] usecols: If not None, then read only the columns in list, in list order. An empty list returns a dataframe without columns. Default: None.
+    :parameter Optional[Tuple[int, int]] frame_range: If not None, a (start, end) tuple of frame indexes where start is inclusive and end is exclusive. The index of the returned dataframe holds the original frame numbers. Default: None.
+    :return pd.DataFrame: Dataframe with float32 columns.
+
+    :example:
+    >>> read_sbp(file_path='project_folder/csv/outlier_corrected_movement_location/Video_1.sbp', usecols=['Nose_1_x', 'Nose_1_y'], frame_range=(1000, 2000))
+    """
+
+    header = _read_sbp_footer(file_path=file_path)
+    columns = header["columns"]
+    if usecols is not None:
+        columns = {x["name"]: x for x in columns}
+        columns = [columns[x] for x in usecols if x in columns]
+    frame_cnt, chunk_size = header["frame_count"], header["chunk_size"]
+    start, end = 0, frame_cnt
+    if frame_range is not None:
+        end = min(int(frame_range[1]), frame_cnt)
+        start = min(int(frame_range[0]), end)
+    results = np.empty((end - start, len(columns)), dtype=np.float32)
+    first_chunk, last_chunk = start // chunk_size, -(-end // chunk_size)
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for column_cnt, column in enumerate(columns):
+                for chunk_idx in range(first_chunk, last_chunk):
+                    offset, byte_cnt = column["chunks"][chunk_idx]
+                    chunk_start = chunk_idx * chunk_size
+                    chunk_end = min(chunk_start + chunk_size, frame_cnt)
+                    chunk = mm[offset : offset + byte_cnt]
+                    if header["compression"] is not None:
+                        chunk = pa.decompress(
+                            chunk,
+                            decompressed_size=(chunk_end - chunk_start) * 4,
+                            codec=header["compression"],
+                        )
+                    chunk = np.frombuffer(chunk, dtype=np.float32)
+                    slice_start, slice_end = max(start, chunk_start), min(
+                        end, chunk_end
+                    )
+                    results[slice_start - start : slice_end - start, column_cnt] = (
+                        chunk[slice_start - chunk_start : slice_end - chunk_start]
+                    )
+    df = pd.DataFrame(results, columns=[x["name"] for x in columns])
+    if frame_range is not None:
+        df.index = pd.RangeIndex(start=start, stop=end)
+    return df
+
+
+def append_sbp_columns(df: pd.DataFrame, file_path: Union[str, os.PathLike]) -> None:
+    """
+    Append new columns to an existing SimBA binary pose (``sbp``) file.
+
+    The new column chunks and an updated schema footer replace the old footer, so existing columns are never decoded
+    or re-encoded. The update is written to a temporary copy that atomically replaces ``file_path``, so the original
+    file stays readable if the append fails.
+
+    :parameter pd.DataFrame df: Dataframe with the new numerical columns. Has to have the same number of rows as the file.
+    :parameter Union[str, os.PathLike] file_path: Path to ``sbp`` file.
+    :raise CountError: The dataframe and the file have different number of frames.
+    :raise DuplicationError: The dataframe holds columns that already exist in the file.
+
+    :example:
+    >>> append_sbp_columns(df=features_df, file_path='project_folder/csv/features_extracted/Video_1.sbp')
+    """
+
+    check_instance(
+        source=append_sbp_columns.__name__,
+        instance=df,
+        accepted_types=(pd.DataFrame,),
+    )
+    header = _read_sbp_footer(file_path=file_path)
+    if len(df) != header["frame_count"]:
+        raise CountError(
+            msg=f"Cannot append {len(df)} rows to {file_path} which contains {header['frame_count']} frames.",
+            source=append_sbp_columns.__name__,
+        )
+    columns = [str(x) for x in df.columns]
+    existing_columns = [x["name"] for x in header["columns"]]
+    duplicate_columns = [x for x in columns if x in existing_columns]
+    if (len(duplicate_columns) > 0) or (len(columns) != len(set(columns))):
+        raise DuplicationError(
+            msg=f"Cannot append columns to {file_path}: duplicate column names {list(set(duplicate_columns))}.",
+            source=append_sbp_columns.__name__,
+        )
+    try:
+        data = df.to_numpy(dtype=np.float32)
+    except ValueError:
+        raise InvalidInputError(
+            msg=f"The dataframe appended to {file_path} contains non-numerical columns.",
+            source=append_sbp_columns.__name__,
+        )
+    data_end = max(
+        [
+            offset + byte_cnt
+            for x in header["columns"]
+            for offset, byte_cnt in x["chunks"]
+        ]
+        + [len(SBP_MAGIC)]
+    )
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        shutil.copyfile(file_path, temp_path)
+        with open(temp_path, "r+b") as f:
+            f.seek(data_end)
+            offsets = _write_sbp_columns(
+                f=f,
+                data=data,
+                chunk_size=header["chunk_size"],
+                compression=header["compression"],
+            )
+            header["columns"].extend(
+                [
+                    {"name": name, "chunks": chunks}
+                    for name, chunks in zip(columns, offsets)
+                ]
+            )
+            _write_sbp_footer(f=f, header=header)
+            f.truncate()
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+
+
 def get_fn_ext(filepath: Union[os.PathLike, str]) -> (str, str, str):
     """
     Split file path into three components: (i) directory, (ii) file name, and (iii) file extension.
@@ -309,6 +868,62 @@ def read_config_entry(
             )
 
 
+def read_outlier_settings(
+    config: configparser.ConfigParser,
+    animal_bp_dict: Dict[str, Any],
+    animal_cnt: int,
+    outlier_type: str,
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, str]], float]:
+    """
+    Helper to read the movement or location outlier correction settings from the ``[Outlier settings]`` section of the
+    SimBA project_config.ini. Used by :class:`simba.outlier_tools.outlier_corrector_movement.OutlierCorrecterMovement`,
+    :class:`simba.outlier_tools.outlier_corrector_location.OutlierCorrecterLocation` and
+    :class:`simba.data_processors.preprocessing_pipeline.PreprocessingPipeline`.
+
+    :param configparser.ConfigParser config: Parsed SimBA project_config.ini. Use :meth:`simba.utils.read_config_file` to parse file.
+    :param Dict[str, Any] animal_bp_dict: The body-part dictionary of the project. See :meth:`simba.mixins.config_reader.ConfigReader.create_body_part_dictionary`. The dictionary is not modified.
+    :param int animal_cnt: The number of animals in the project.
+    :param str outlier_type: Type of outlier correction. OPTIONS: 'movement', 'location'.
+    :return Tuple[Dict[str, Any], Dict[str, Dict[str, str]], float]: The body-part dictionary with the animal named as in the project_config.ini, the two reference body-parts of each animal, and the outlier criterion.
+
+    :example:
+    >>> animal_bp_dict, outlier_bp_dict, criterion = read_outlier_settings(config=config, animal_bp_dict=animal_bp_dict, animal_cnt=2, outlier_type='movement')
+    """
+
+    check_str(
+        name=f"{read_outlier_settings.__name__} outlier_type",
+        value=outlier_type,
+        options=("movement", "location"),
+    )
+    animal_bp_dict = dict(animal_bp_dict)
+    if animal_cnt == 1:
+        animal_id = read_config_entry(
+            config,
+            ConfigKey.MULTI_ANIMAL_ID_SETTING.value,
+            ConfigKey.MULTI_ANIMAL_IDS.value,
+            Dtypes.STR.value,
+        )
+        if animal_id != "None":
+            animal_bp_dict[animal_id] = animal_bp_dict.pop("Animal_1")
+    criterion = read_config_entry(
+        config,
+        ConfigKey.OUTLIER_SETTINGS.value,
+        f"{outlier_type}_criterion",
+        Dtypes.FLOAT.value,
+    )
+    outlier_bp_dict = {}
+    for animal_name in animal_bp_dict.keys():
+        outlier_bp_dict[animal_name] = {}
+        for bp_cnt in [1, 2]:
+            outlier_bp_dict[animal_name][f"bp_{bp_cnt}"] = read_config_entry(
+                config,
+                ConfigKey.OUTLIER_SETTINGS.value,
+                f"{outlier_type}_bodypart{bp_cnt}_{animal_name.lower()}",
+                Dtypes.STR.value,
+            )
+    return animal_bp_dict, outlier_bp_dict, criterion
+
+
 def read_project_path_and_file_type(config: configparser.ConfigParser) -> (str, str):
     """
     Helper to read the path and file type of the SimBA project from the project_config.ini.
@@ -415,14 +1030,165 @@ def read_config_file(config_path: Union[str, os.PathLike]) -> configparser.Confi
     return config
 
 
+def _find_video_meta_data_cache_path(
+    video_path: Union[str, os.PathLike]
+) -> Optional[str]:
+    """
+    Helper to find the video meta data cache of the SimBA project holding ``video_path``, i.e., the
+    ``logs/video_meta_data_cache.json`` file of the closest parent directory holding a ``project_config.ini`` file.
+    Returns None if the video is not inside a SimBA project.
+    """
+
+    video_dir = os.path.dirname(os.path.abspath(video_path))
+    if video_dir not in VIDEO_META_DATA_CACHE_PATHS:
+        cache_path, current_dir = None, video_dir
+        while True:
+            if os.path.isfile(
+                os.path.join(current_dir, "project_config.ini")
+            ) and os.path.isdir(os.path.join(current_dir, "logs")):
+                cache_path = os.path.join(
+                    current_dir, Paths.VIDEO_META_DATA_CACHE.value
+                )
+                break
+            parent_dir = os.path.dirname(current_dir)
+            if parent_dir == current_dir:
+                break
+            current_dir = parent_dir
+        VIDEO_META_DATA_CACHE_PATHS[video_dir] = cache_path
+    return VIDEO_META_DATA_CACHE_PATHS[video_dir]
+
+
+def _read_video_meta_data_cache(cache_path: Union[str, os.PathLike]) -> dict:
+    """
+    Helper to read a video meta data cache. The cache is kept in memory, and re-read if the cache file has been
+    modified, e.g., by another process.
+    """
+
+    try:
+        cache_mtime = os.stat(cache_path).st_mtime_ns
+    except OSError:
+        return {}
+    if cache_path in VIDEO_META_DATA_CACHE:
+        if VIDEO_META_DATA_CACHE[cache_path][0] == cache_mtime:
+            return VIDEO_META_DATA_CACHE[cache_path][1]
+    try:
+        with open(cache_path, "r") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        entries = {}
+    VIDEO_META_DATA_CACHE[cache_path] = (cache_mtime, entries)
+    return entries
+
+
+def _acquire_video_meta_data_cache_lock(lock_path: Union[str, os.PathLike]) -> bool:
+    """
+    Helper to acquire the inter-process lock of a video meta data cache by exclusively creating ``lock_path``. Lock
+    files older than ``VIDEO_META_DATA_CACHE_LOCK_TIMEOUT`` seconds, e.g., left behind by a crashed process, are
+    removed. Returns False if the lock could not be acquired within ``VIDEO_META_DATA_CACHE_LOCK_TIMEOUT`` seconds or
+    the lock file can not be created (e.g., read-only storage).
+    """
+
+    start_time = time.time()
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                if (
+                    time.time() - os.stat(lock_path).st_mtime
+                    > VIDEO_META_DATA_CACHE_LOCK_TIMEOUT
+                ):
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if time.time() - start_time > VIDEO_META_DATA_CACHE_LOCK_TIMEOUT:
+                return False
+            time.sleep(0.01)
+        except OSError:
+            return False
+
+
+def _write_video_meta_data_cache(
+    cache_path: Union[str, os.PathLike], entries: Dict[str, dict]
+) -> None:
+    """
+    Helper to add ``entries`` to a video meta data cache. The read-merge-write of the cache file is done while holding
+    an inter-process lock file (``video_meta_data_cache.json.lock``), so processes sharing the cache do not drop each
+    other's entries, and the cache file is replaced atomically, so processes never read a partially written file.
+    The cache is optional: if it can not be locked or written (e.g., read-only storage), the entries are not cached.
+    """
+
+    lock_path = f"{cache_path}.lock"
+    with VIDEO_META_DATA_CACHE_LOCK:
+        if not _acquire_video_meta_data_cache_lock(lock_path=lock_path):
+            return
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            VIDEO_META_DATA_CACHE.pop(cache_path, None)
+            entries = {**_read_video_meta_data_cache(cache_path=cache_path), **entries}
+            with open(temp_path, "w") as f:
+                json.dump(entries, f)
+            os.replace(temp_path, cache_path)
+            VIDEO_META_DATA_CACHE[cache_path] = (
+                os.stat(cache_path).st_mtime_ns,
+                entries,
+            )
+        except OSError:
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+        finally:
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+
+
+def _video_meta_data_cache_entry(video_path: Union[str, os.PathLike]) -> dict:
+    """
+    Helper to read the meta data of a video file with OpenCV, together with the size and modification time of the
+    file that the cached meta data is validated against. Raises ``InvalidVideoFileError`` if the fps, width, height
+    or frame count of the video is 0, so unreadable videos are never cached.
+    """
+
+    file_stat = os.stat(video_path)
+    cap = cv2.VideoCapture(video_path)
+    entry = {
+        "size": file_stat.st_size,
+        "mtime": file_stat.st_mtime_ns,
+        "fps": cap.get(cv2.CAP_PROP_FPS),
+        "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        "frame_count": int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+    }
+    cap.release()
+    for k in ["fps", "width", "height", "frame_count"]:
+        if entry[k] == 0:
+            raise InvalidVideoFileError(
+                msg=f"Video {get_fn_ext(video_path)[1]} has {k} of {str(entry[k])} (full error video path: {video_path}).",
+                source=_video_meta_data_cache_entry.__name__,
+            )
+    return entry
+
+
 def get_video_meta_data(
-    video_path: Union[str, os.PathLike], fps_as_int: bool = True
+    video_path: Union[str, os.PathLike],
+    fps_as_int: bool = True,
+    use_cache: bool = True,
 ) -> dict:
     """
     Read video metadata (fps, resolution, frame cnt etc.) from video file (e.g., mp4).
 
+    .. note::
+       If the video is inside a SimBA project, the metadata is cached in the ``project_folder/logs/video_meta_data_cache.json``
+       file keyed by the video path, and is only read from the video file if the size or modification time of the file
+       has changed since it was cached. The cache is shared by all processes. Use :func:`simba.utils.read_write.warm_video_meta_data_cache`
+       to cache the metadata of all videos in a project.
+
     :parameter str video_path: Path to a video file.
     :parameter bool fps_as_int: If True, force video fps to int through floor rounding, else float. Default = True.
+    :parameter bool use_cache: If True, read and store the metadata in the video meta data cache of the SimBA project. Default = True.
     :return dict: Video file meta data.
 
     :example:
@@ -431,15 +1197,39 @@ def get_video_meta_data(
 
     """
 
-    video_data = {}
-    cap = cv2.VideoCapture(video_path)
+    video_data, entry, cache_path = {}, None, None
     _, video_data["video_name"], _ = get_fn_ext(video_path)
-    video_data["fps"] = cap.get(cv2.CAP_PROP_FPS)
+    if use_cache and os.path.isfile(video_path):
+        cache_path = _find_video_meta_data_cache_path(video_path=video_path)
+    if cache_path is not None:
+        file_stat = os.stat(video_path)
+        entry = _read_video_meta_data_cache(cache_path=cache_path).get(
+            os.path.abspath(video_path)
+        )
+        if (entry is not None) and (
+            (entry["size"] != file_stat.st_size)
+            or (entry["mtime"] != file_stat.st_mtime_ns)
+        ):
+            entry = None
+        if entry is None:
+            entry = _video_meta_data_cache_entry(video_path=video_path)
+        else:
+            cache_path = None
+    else:
+        cap = cv2.VideoCapture(video_path)
+        entry = {
+            "fps": cap.get(cv2.CAP_PROP_FPS),
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "frame_count": int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+        }
+        cap.release()
+    video_data["fps"] = entry["fps"]
     if fps_as_int:
         video_data["fps"] = int(video_data["fps"])
-    video_data["width"] = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-    video_data["height"] = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-    video_data["frame_count"] = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    video_data["width"] = entry["width"]
+    video_data["height"] = entry["height"]
+    video_data["frame_count"] = entry["frame_count"]
     for k, v in video_data.items():
         if v == 0:
             raise InvalidVideoFileError(
@@ -450,9 +1240,71 @@ def get_video_meta_data(
         f'{video_data["width"]} x {video_data["height"]}'
     )
     video_data["video_length_s"] = int(video_data["frame_count"] / video_data["fps"])
+    if cache_path is not None:
+        _write_video_meta_data_cache(
+            cache_path=cache_path, entries={os.path.abspath(video_path): entry}
+        )
     return video_data
 
 
+def warm_video_meta_data_cache(
+    config_path: Union[str, os.PathLike], core_cnt: int = 1
+) -> Dict[str, dict]:
+    """
+    Cache the metadata of all videos in the ``project_folder/videos`` directory of a SimBA project in the video meta
+    data cache of the project, so that later calls to :func:`simba.utils.read_write.get_video_meta_data` (e.g., from
+    multiprocessing workers) do not open the video files. Videos with valid cached metadata are not re-read. Videos
+    with a fps, resolution or frame count of 0 are skipped with a ``SkippingFileWarning`` and are not cached.
+
+    :parameter Union[str, os.PathLike] config_path: path to SimBA project config file in Configparser format.
+    :parameter int core_cnt: Number of videos to read in parallel. If -1, then all available cores. Default: 1.
+    :return Dict[str, dict]: The cached metadata of the videos in the project, keyed by video path.
+
+    :example:
+    >>> warm_video_meta_data_cache(config_path='project_folder/project_config.ini', core_cnt=-1)
+    """
+
+    timer = SimbaTimer(start=True)
+    project_path, _ = read_project_path_and_file_type(
+        config=read_config_file(config_path=config_path)
+    )
+    cache_path = os.path.join(
+        os.path.abspath(project_path), Paths.VIDEO_META_DATA_CACHE.value
+    )
+    video_paths = [
+        os.path.abspath(x)
+        for x in find_all_videos_in_project(
+            videos_dir=os.path.join(project_path, "videos")
+        )
+    ]
+    cached_entries = _read_video_meta_data_cache(cache_path=cache_path)
+    missing_paths = []
+    for video_path in video_paths:
+        file_stat, entry = os.stat(video_path), cached_entries.get(video_path)
+        if (
+            (entry is None)
+            or (entry["size"] != file_stat.st_size)
+            or (entry["mtime"] != file_stat.st_mtime_ns)
+        ):
+            missing_paths.append(video_path)
+    entries, _, _ = run_file_tasks(
+        func=_video_meta_data_cache_entry,
+        file_paths=missing_paths,
+        core_cnt=core_cnt,
+        source=warm_video_meta_data_cache.__name__,
+    )
+    if len(entries) > 0:
+        _write_video_meta_data_cache(cache_path=cache_path, entries=entries)
+    cached_entries = _read_video_meta_data_cache(cache_path=cache_path)
+    timer.stop_timer()
+    stdout_success(
+        msg=f"Video meta data of {len(video_paths)} video(s) cached ({len(entries)} video(s) read)",
+        elapsed_time=timer.elapsed_time_str,
+        source=warm_video_meta_data_cache.__name__,
+    )
+    return {x: cached_entries[x] for x in video_paths if x in cached_entries}
+
+
 def remove_a_folder(folder_dir: Union[str, os.PathLike]) -> None:
     """Helper to remove a directory"""
     shutil.rmtree(folder_dir, ignore_errors=True)
@@ -911,6 +1763,141 @@ def convert_csv_to_parquet(directory: Union[str, os.PathLike]) -> None:
     )
 
 
+def _convert_data_files_in_directory(
+    directory: Union[str, os.PathLike],
+    in_file_type: str,
+    out_file_type: str,
+    source: str,
+    video_info_path: Optional[Union[str, os.PathLike]] = None,
+) -> None:
+    """Helper to convert all data files of ``in_file_type`` in a directory to ``out_file_type`` through :meth:`simba.utils.read_write.read_df` and :meth:`simba.utils.read_write.write_df`."""
+    if not os.path.isdir(directory):
+        raise NotDirectoryError(
+            msg=f"SIMBA ERROR: {directory} is not a valid directory", source=source
+        )
+    files_found = glob.glob(directory + f"/*.{in_file_type}")
+    if len(files_found) < 1:
+        raise NoFilesFoundError(
+            msg=f"SIMBA ERROR: No {in_file_type} files (with .{in_file_type} file ending) found in the {directory} directory",
+            source=source,
+        )
+    video_info_df = None
+    if video_info_path is not None:
+        video_info_df = read_video_info_csv(file_path=video_info_path)
+    print(f"Converting {len(files_found)} files...")
+    for file_path in files_found:
+        _, video_name, _ = get_fn_ext(filepath=file_path)
+        print(f"Reading in {os.path.basename(file_path)} ...")
+        df = read_df(file_path=file_path, file_type=in_file_type)
+        new_file_path = os.path.join(directory, f"{video_name}.{out_file_type}")
+        if out_file_type == Formats.SBP.value:
+            fps, px_per_mm = None, None
+            if video_info_df is not None:
+                _, px_per_mm, fps = read_video_info(
+                    vid_info_df=video_info_df, video_name=video_name
+                )
+            write_sbp(df=df, save_path=new_file_path, fps=fps, px_per_mm=px_per_mm)
+        else:
+            write_df(df=df, file_type=out_file_type, save_path=new_file_path)
+        print(f"Saved {new_file_path}...")
+    stdout_success(
+        msg=f"{len(files_found)} {in_file_type} files in {directory} converted to {out_file_type}",
+        source=source,
+    )
+
+
+def convert_csv_to_sbp(
+    directory: Union[str, os.PathLike],
+    video_info_path: Optional[Union[str, os.PathLike]] = None,
+) -> None:
+    """
+    Convert all csv files in a directory to SimBA binary pose (``sbp``) format.
+
+    .. note::
+       The conversion is lossless with respect to the float32 values returned by :meth:`simba.utils.read_write.read_df`.
+
+    :param str directory: Path to directory holding csv files.
+    :param Optional[str] video_info_path: If not None, path to the ``project_folder/logs/video_info.csv`` file. The fps and pixels per millimeter of each video are stored in the ``sbp`` schema. Default: None.
+    :raise NoFilesFoundError: The directory has no ``csv`` files.
+
+    :examples:
+    >>> convert_csv_to_sbp(directory='project_folder/csv/outlier_corrected_movement_location', video_info_path='project_folder/logs/video_info.csv')
+    """
+
+    _convert_data_files_in_directory(
+        directory=directory,
+        in_file_type=Formats.CSV.value,
+        out_file_type=Formats.SBP.value,
+        source=convert_csv_to_sbp.__name__,
+        video_info_path=video_info_path,
+    )
+
+
+def convert_sbp_to_csv(directory: Union[str, os.PathLike]) -> None:
+    """
+    Convert all SimBA binary pose (``sbp``) files in a directory to csv format.
+
+    :param str directory: Path to directory holding ``sbp`` files.
+    :raise NoFilesFoundError: The directory has no ``sbp`` files.
+
+    :examples:
+    >>> convert_sbp_to_csv(directory='project_folder/csv/outlier_corrected_movement_location')
+    """
+
+    _convert_data_files_in_directory(
+        directory=directory,
+        in_file_type=Formats.SBP.value,
+        out_file_type=Formats.CSV.value,
+        source=convert_sbp_to_csv.__name__,
+    )
+
+
+def convert_parquet_to_sbp(
+    directory: Union[str, os.PathLike],
+    video_info_path: Optional[Union[str, os.PathLike]] = None,
+) -> None:
+    """
+    Convert all parquet files in a directory to SimBA binary pose (``sbp``) format.
+
+    .. note::
+       The conversion is lossless with respect to the float32 values returned by :meth:`simba.utils.read_write.read_df`.
+
+    :param str directory: Path to directory holding parquet files.
+    :param Optional[str] video_info_path: If not None, path to the ``project_folder/logs/video_info.csv`` file. The fps and pixels per millimeter of each video are stored in the ``sbp`` schema. Default: None.
+    :raise NoFilesFoundError: The directory has no ``parquet`` files.
+
+    :examples:
+    >>> convert_parquet_to_sbp(directory='project_folder/csv/outlier_corrected_movement_location')
+    """
+
+    _convert_data_files_in_directory(
+        directory=directory,
+        in_file_type=Formats.PARQUET.value,
+        out_file_type=Formats.SBP.value,
+        source=convert_parquet_to_sbp.__name__,
+        video_info_path=video_info_path,
+    )
+
+
+def convert_sbp_to_parquet(directory: Union[str, os.PathLike]) -> None:
+    """
+    Convert all SimBA binary pose (``sbp``) files in a directory to parquet format.
+
+    :param str directory: Path to directory holding ``sbp`` files.
+    :raise NoFilesFoundError: The directory has no ``sbp`` files.
+
+    :examples:
+    >>> convert_sbp_to_parquet(directory='project_folder/csv/outlier_corrected_movement_location')
+    """
+
+    _convert_data_files_in_directory(
+        directory=directory,
+        in_file_type=Formats.SBP.value,
+        out_file_type=Formats.PARQUET.value,
+        source=convert_sbp_to_parquet.__name__,
+    )
+
+
 def get_file_name_info_in_directory(
     directory: Union[str, os.PathLike], file_type: str
 ) -> Dict[str, str]:
@@ -1199,6 +2186,94 @@ def find_core_cnt() -> Tuple[int, int]:
     return cpu_cnt, cpu_cnt_to_use
 
 
+def _file_task_helper(
+    file_path: Union[str, os.PathLike], func: Callable
+) -> Tuple[Union[str, os.PathLike], Any, Optional[str]]:
+    """
+    Helper to run ``func`` on a single file and catch any error. Called by
+    :func:`simba.utils.read_write.run_file_tasks`.
+
+    :return Tuple[Union[str, os.PathLike], Any, Optional[str]]: The file path, the result of ``func`` and the error message (None if no error).
+    """
+
+    try:
+        return file_path, func(file_path), None
+    except Exception as e:
+        return file_path, None, f"{e.__class__.__name__}: {e}"
+
+
+def _collect_file_task_results(
+    task_results: Iterable[Tuple[Union[str, os.PathLike], Any, Optional[str]]],
+    source: str,
+) -> Tuple[Dict[Union[str, os.PathLike], Any], int, int]:
+    """
+    Helper to collect the results of :func:`simba.utils.read_write._file_task_helper` in task order and warn on each
+    skipped file. Called by :func:`simba.utils.read_write.run_file_tasks`.
+    """
+
+    results, skipped_cnt = {}, 0
+    for file_path, result, error in task_results:
+        if error is not None:
+            skipped_cnt += 1
+            SkippingFileWarning(
+                msg=f"Skipping file {file_path}: {error}", source=source
+            )
+        else:
+            results[file_path] = result
+    return results, len(results), skipped_cnt
+
+
+def run_file_tasks(
+    func: Callable,
+    file_paths: List[Union[str, os.PathLike]],
+    core_cnt: int = 1,
+    source: str = "",
+) -> Tuple[Dict[Union[str, os.PathLike], Any], int, int]:
+    """
+    Run ``func`` on each file in ``file_paths``, in parallel with one file per worker if ``core_cnt`` > 1. Used as
+    the shared per-file runner of the pre-processing stages (outlier correction, interpolation and smoothing).
+
+    .. note::
+       Results are returned in the order of ``file_paths`` regardless of the order the files complete in, so logs
+       aggregated from the results are identical for any ``core_cnt``. An error in one file does not stop the other
+       files: the file is skipped with a ``SkippingFileWarning``, is absent from the returned results, and is counted
+       in the returned skipped count.
+
+    :param Callable func: Picklable function (e.g., module-level function or ``functools.partial`` of one) that accepts a single file path.
+    :param List[Union[str, os.PathLike]] file_paths: The files to process.
+    :param int core_cnt: Number of files to process in parallel. If -1, then all available cores. Default: 1.
+    :param str source: Name of the calling class or function, used in warning messages.
+    :return Tuple[Dict[Union[str, os.PathLike], Any], int, int]: The results of ``func``, keyed by file path, for the files processed without error, the count of files processed without error, and the count of skipped files.
+
+    :example:
+    >>> results, processed_cnt, skipped_cnt = run_file_tasks(func=functools.partial(read_df, file_type='csv'), file_paths=['test_1.csv', 'test_2.csv'], core_cnt=2)
+    """
+
+    check_int(
+        name=f"{run_file_tasks.__name__} core_cnt", value=core_cnt, min_value=-1
+    )
+    core_cnt = find_core_cnt()[0] if int(core_cnt) == -1 else int(core_cnt)
+    core_cnt = max(1, min(core_cnt, len(file_paths)))
+    constants = functools.partial(_file_task_helper, func=func)
+    if core_cnt == 1:
+        return _collect_file_task_results(
+            task_results=map(constants, file_paths), source=source
+        )
+    if (platform.system() == "Darwin") and (
+        multiprocessing.get_start_method() != "spawn"
+    ):
+        multiprocessing.set_start_method("spawn", force=True)
+    with multiprocessing.Pool(
+        core_cnt, maxtasksperchild=Defaults.LARGE_MAX_TASK_PER_CHILD.value
+    ) as pool:
+        results = _collect_file_task_results(
+            task_results=pool.imap(constants, file_paths, chunksize=1), source=source
+        )
+        pool.terminate()
+        pool.join()
+    return results
+
+
 def get_number_of_header_columns_in_df(df: pd.DataFrame) -> int:
     """
     Returns the count of non-numerical header rows in dataframe. E.g., can be helpful to determine if dataframe is multi-index columns.
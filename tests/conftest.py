@@ -0,0 +1,38 @@
+import os
+import shutil
+
+import pytest
+
+from simba.utils.read_write import find_core_cnt
+
+TEST_PROJECTS_DIR = 'tests/data/test_projects'
+
+
+@pytest.fixture
+def create_project(tmp_path):
+    """
+    Returns a function that copies a test project into ``tmp_path`` and points the project_config.ini of the copy
+    at the copied project folder. The function returns the path to the project_config.ini of the copy.
+    """
+
+    def _create_project(project_name: str = 'two_c57', copy_name: str = None, config_replacements: dict = None) -> str:
+        project_dir = str(tmp_path / (copy_name or project_name))
+        shutil.copytree(os.path.join(TEST_PROJECTS_DIR, project_name), project_dir)
+        project_folder = os.path.join(project_dir, 'project_folder')
+        config_path = os.path.join(project_folder, 'project_config.ini')
+        with open(config_path, 'r') as f:
+            config = f.read()
+        config = config.replace(f'{TEST_PROJECTS_DIR}/{project_name}/project_folder', project_folder)
+        for old, new in (config_replacements or {}).items():
+            config = config.replace(old, new)
+        with open(config_path, 'w') as f:
+            f.write(config)
+        return config_path
+
+    return _create_project
+
+
+@pytest.fixture
+def parallel_core_cnt():
+    """Core count for the parallel runs of the parallel-vs-sequential tests, capped at the available cores."""
+    return min(2, find_core_cnt()[0])
@@ -1,9 +1,12 @@
 import pandas as pd
 import pytest
 import json
+import os
+import shutil
 
 from simba.mixins.config_reader import ConfigReader
 from simba.utils.read_write import get_fn_ext, read_df, read_config_file
+from simba.utils.project_index import ProjectFileIndex
 
 
 @pytest.fixture(params=['tests/data/test_projects/two_c57/project_folder/project_config.ini'])
@@ -120,3 +123,24 @@ def test_read_video_info(config_path, video_name, expected_pixels, expected_fps)
     assert fps == fps
 
 
+
+
+def test_project_file_index(tmp_path):
+    data_path = 'tests/data/test_projects/mouse_open_field/project_folder/csv/outlier_corrected_movement_location/Video1.csv'
+    shutil.copy(data_path, tmp_path / 'Video1.csv')
+    os.utime(tmp_path, ns=(0, 0))
+    index = ProjectFileIndex()
+    assert index.file_paths(directory=str(tmp_path), file_type='csv') == [str(tmp_path / 'Video1.csv')]
+    assert index.file_paths(directory=str(tmp_path / 'missing'), file_type='csv') == []
+    shutil.copy(data_path, tmp_path / 'Video2.csv')
+    assert sorted(index.file_paths(directory=str(tmp_path), file_type='csv')) == [str(tmp_path / 'Video1.csv'), str(tmp_path / 'Video2.csv')]
+    df = read_df(file_path=data_path, file_type='csv')
+    assert index.row_count(file_path=str(tmp_path / 'Video1.csv'), file_type='csv') == len(df)
+    assert index.column_names(file_path=str(tmp_path / 'Video1.csv'), file_type='csv') == list(df.columns)
+    assert index.file_size(file_path=str(tmp_path / 'Video1.csv')) == os.path.getsize(data_path)
+
+def test_config_reader_file_paths():
+    config_reader = ConfigReader(config_path='tests/data/test_projects/mouse_open_field/project_folder/project_config.ini', read_video_info=False)
+    assert [os.path.basename(x) for x in config_reader.outlier_corrected_paths] == ['Video1.csv']
+    config_reader.outlier_corrected_paths = ['Video2.csv']
+    assert config_reader.outlier_corrected_paths == ['Video2.csv']
@@ -1,11 +1,22 @@
-import pytest
+import glob
 import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
 from simba.data_processors.agg_clf_calculator import AggregateClfCalculator
 from simba.data_processors.fsttc_calculator import FSTTCCalculator
 from simba.data_processors.kleinberg_calculator import KleinbergCalculator
+from simba.data_processors.interpolation_smoothing import Interpolate
 from simba.data_processors.movement_calculator import MovementCalculator
+from simba.data_processors.preprocessing_pipeline import PreprocessingPipeline
+from simba.data_processors.pybursts_calculator import kleinberg_burst_detection
 from simba.data_processors.timebins_clf_calculator import TimeBinsClfCalculator
 from simba.data_processors.timebins_movement_calculator import TimeBinsMovementCalculator
+from simba.outlier_tools.outlier_corrector_location import OutlierCorrecterLocation
+from simba.outlier_tools.outlier_corrector_movement import OutlierCorrecterMovement
+from simba.utils.read_write import read_df
 
 
 
@@ -34,6 +45,20 @@ def test_fsttc_calculator_use_case(config_path, time_window, behavior_lst, creat
         assert os.path.isfile(fsttc_calculator.save_plot_path)
     os.remove(fsttc_calculator.file_save_path)
 
+
+@pytest.mark.parametrize("time_delta_at_onset, join_bouts_within_delta", [(False, False), (True, False), (False, True), (True, True)])
+def test_fsttc_calculator_settings(time_delta_at_onset, join_bouts_within_delta):
+    fsttc_calculator = FSTTCCalculator(config_path='tests/data/test_projects/two_c57/project_folder/project_config.ini', time_window=2000, behavior_lst=['Attack', 'Sniffing'], time_delta_at_onset=time_delta_at_onset, join_bouts_within_delta=join_bouts_within_delta)
+    fsttc_calculator.run()
+    for video_name, video_data in fsttc_calculator.video_sequences.items():
+        for sequence_name in ['FSTTC Attack Sniffing', 'FSTTC Sniffing Attack']:
+            sequences = video_data[sequence_name]
+            if sequences is not None:
+                matched = sequences[sequences['Second behaviour'] != 'None']
+                assert (matched['Second behaviour start frame'].astype(int) > matched['First behaviour start frame']).all()
+    assert len(fsttc_calculator.out_df) == 2 * len(fsttc_calculator.video_sequences)
+    os.remove(fsttc_calculator.file_save_path)
+
 @pytest.mark.parametrize("config_path, classifier_names, sigma, gamma, hierarchy, hierarchical_search", [('tests/data/test_projects/two_c57/project_folder/project_config.ini', ['Attack'], 1.1, 0.3, 5, False)])
 def test_kleinberg_calculator_use_case(config_path, classifier_names, gamma, sigma, hierarchy, hierarchical_search):
     calculator = KleinbergCalculator(config_path=config_path,
@@ -45,6 +70,29 @@ def test_kleinberg_calculator_use_case(config_path, classifier_names, gamma, sig
     calculator.run()
 
 
+def test_kleinberg_burst_detection():
+    offsets = np.array([1, 2, 3, 4, 5, 40, 41, 42, 43, 44, 45, 46, 100, 200, 201, 202, 203])
+    bursts = kleinberg_burst_detection(offsets=offsets, s=2, gamma=0.3)
+    assert bursts.tolist() == [[0, 1, 203], [1, 1, 5], [2, 1, 5], [3, 1, 5], [1, 40, 46], [2, 40, 46], [3, 40, 46], [1, 200, 203], [2, 200, 203], [3, 200, 203]]
+
+
+@pytest.mark.parametrize("hierarchical_search", [False, True])
+def test_kleinberg_calculator_parallel(tmp_path, parallel_core_cnt, hierarchical_search):
+    config_path = 'tests/data/test_projects/two_c57/project_folder/project_config.ini'
+    input_dir = str(tmp_path / 'input')
+    shutil.copytree('tests/data/test_projects/two_c57/project_folder/csv/machine_results', input_dir)
+    results = {}
+    for core_cnt in [1, parallel_core_cnt]:
+        output_dir = str(tmp_path / f'output_{core_cnt}')
+        calculator = KleinbergCalculator(config_path=config_path, classifier_names=['Attack', 'Sniffing'], sigma=1.1, gamma=0.3, hierarchy=2, hierarchical_search=hierarchical_search, input_dir=input_dir, output_dir=output_dir, core_cnt=core_cnt)
+        calculator.run()
+        results[core_cnt] = (calculator.detailed_df, read_df(glob.glob(output_dir + '/*.csv')[0], 'csv'))
+        os.remove(glob.glob(os.path.join(calculator.logs_path, f'Kleinberg_detailed_log_{calculator.datetime}.csv'))[0])
+    assert list(results[1][1].columns) == list(read_df(glob.glob(input_dir + '/*.csv')[0], 'csv').columns)
+    pd.testing.assert_frame_equal(results[1][0], results[parallel_core_cnt][0])
+    pd.testing.assert_frame_equal(results[1][1], results[parallel_core_cnt][1])
+
+
 @pytest.mark.parametrize("config_path, body_parts, threshold", [('tests/data/test_projects/two_c57/project_folder/project_config.ini', ['simon CENTER OF GRAVITY'], 0.0),
                                                                 ('tests/data/test_projects/two_c57/project_folder/project_config.ini', ['Nose_1'], 0.0)])
 def test_movement_calculator_use_case(config_path, body_parts, threshold):
@@ -78,3 +126,26 @@ def test_time_bins_movement_calculator_use_case(config_path, bin_length, plots,
     assert os.path.isfile(calculator.save_path); os.remove(calculator.save_path)
     if plots:
         assert os.path.isfile(calculator.plot_save_path); os.remove(calculator.plot_save_path)
+
+
+@pytest.mark.parametrize("interpolation_settings", ['Body-parts: Nearest', 'Animal(s): Linear'])
+def test_preprocessing_pipeline(create_project, parallel_core_cnt, interpolation_settings):
+    staged_config_path = create_project(copy_name='staged')
+    staged_input_dir = os.path.join(os.path.dirname(staged_config_path), 'csv', 'input_csv')
+    Interpolate(input_path=staged_input_dir, config_path=staged_config_path, method=interpolation_settings, initial_import_multi_index=True)
+    movement_corrector = OutlierCorrecterMovement(config_path=staged_config_path)
+    movement_corrector.run()
+    location_corrector = OutlierCorrecterLocation(config_path=staged_config_path)
+    location_corrector.run()
+
+    pipeline_config_path = create_project(copy_name='pipeline')
+    shutil.rmtree(os.path.join(os.path.dirname(pipeline_config_path), 'csv', 'outlier_corrected_movement'))
+    pipeline = PreprocessingPipeline(config_path=pipeline_config_path, interpolation_settings=interpolation_settings, core_cnt=parallel_core_cnt)
+    assert not os.path.isdir(pipeline.outlier_corrected_movement_dir)
+    pipeline.run()
+    pd.testing.assert_frame_equal(pipeline.movement_log, movement_corrector.log)
+    pd.testing.assert_frame_equal(pipeline.location_log, location_corrector.log)
+    for video_name in ['Together_1', 'Together_2']:
+        staged_results = read_df(os.path.join(location_corrector.outlier_corrected_dir, f'{video_name}.csv'), 'csv')
+        pipeline_results = read_df(os.path.join(pipeline.outlier_corrected_dir, f'{video_name}.csv'), 'csv')
+        pd.testing.assert_frame_equal(pipeline_results, staged_results)
@@ -29,6 +29,14 @@ def test_angle3pt_serialized():
     assert results.shape[0] == x.shape[0]
     assert results[0] == 180
 
+def test_path_tortuosity():
+    x, y = np.array([0, 1, 1, 0, 0, 1]), np.array([0, 0, 1, 1, 0, 0])
+    results = FeatureExtractionMixin.path_tortuosity(x=x, y=y, window_sizes=[1, 2, 10])
+    assert results.shape == (6, 3)
+    assert np.allclose(results[:, 0], np.array([270, 270, 270, 270, 0, 0]) / (2 * np.pi))
+    assert np.allclose(results[:, 1], np.array([540, 540, 540, 270, 0, 0]) / (2 * np.pi))
+    assert np.allclose(results[:, 2], np.array([1080, 810, 540, 270, 0, 0]) / (2 * np.pi))
+
 def test_convex_hull_calculator_mp():
     coordinates = np.array([[1, 2], [4, 7], [9, 1], [3, 6]])
     results = FeatureExtractionMixin.convex_hull_calculator_mp(arr=coordinates, px_per_mm=1)
@@ -123,6 +131,17 @@ def test_dataframe_savgol_smoother(time_window):
     assert out_df.equals(pd.DataFrame(data=[32, 68, 92, 126, 182], columns=['Feature_1']))
 
 
+def test_jitted_line_crosses_to_nonstatic_target_permutations():
+    left_ear, right_ear, nose = np.random.randint(0, 500, (3, 100, 3, 2)).astype(np.float32)
+    targets = np.random.randint(0, 500, (100, 6, 2)).astype(np.float32)
+    observer_idx, target_idx = np.array([0, 0, 1, 1, 2, 2]), np.array([2, 5, 0, 4, 1, 3])
+    results = FeatureExtractionMixin.jitted_line_crosses_to_nonstatic_target_permutations(left_ear_array=left_ear, right_ear_array=right_ear, nose_array=nose, target_array=targets, observer_idx=observer_idx, target_idx=target_idx)
+    assert results.shape == (100, 6)
+    for i, (observer, target) in enumerate(zip(observer_idx, target_idx)):
+        expected = FeatureExtractionMixin.jitted_line_crosses_to_nonstatic_targets(left_ear_array=left_ear[:, observer], right_ear_array=right_ear[:, observer], nose_array=nose[:, observer], target_array=targets[:, target])
+        assert np.array_equal(results[:, i], expected[:, 3] == 1)
+
+
 
 #test_euclidean_distance()
 # test_angle3pt()
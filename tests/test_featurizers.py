@@ -31,3 +31,13 @@ class TestFeatureExtractors(object):
         assert len(feature_extractor.out_data.columns) == 165
         assert len(feature_extractor.out_data.columns) == len(feature_extractor.out_data.select_dtypes([np.number]).columns)
         for f in glob.glob(feature_extractor.save_dir + '/*.csv'): os.remove(f)
+
+@pytest.mark.parametrize('config_path', ['tests/data/test_projects/mouse_open_field/project_folder/project_config.ini'])
+def test_feature_extraction_multiprocess(config_path):
+    from simba.feature_extractors.feature_extraction_mp import FeatureExtractionMultiProcess
+    feature_extractor = FeatureExtractionMultiProcess(config_path=config_path, core_cnt=1)
+    feature_extractor.run()
+    assert len(feature_extractor.failed_videos.keys()) == 0
+    save_paths = glob.glob(feature_extractor.features_dir + f'/*.{feature_extractor.file_type}')
+    assert len(save_paths) == len(feature_extractor.outlier_corrected_paths)
+    for f in save_paths: os.remove(f)
@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 import math
+import shapely
 from shapely.geometry import Polygon, Point, LineString
 from simba.mixins.geometry_mixin import GeometryMixin
 
@@ -46,7 +47,7 @@ def test_is_shape_covered():
     results = GeometryMixin().is_shape_covered(shape=polygon_1, other_shape=polygon_2)
     assert results is False
 
-@pytest.mark.parametrize('data_size,', [(10, 2), (15, 2), (4, 2)])
+@pytest.mark.parametrize('data_size', [(10, 2), (15, 2), (4, 2)])
 def test_area(data_size):
     data = np.random.randint(0, 100, size=(data_size))
     polygon = GeometryMixin().bodyparts_to_polygon(data)
@@ -76,8 +77,43 @@ def test_point_lineside():
     results = GeometryMixin().point_lineside(lines=lines, points=points)
     assert np.array_equal(results, np.array([1., 0., 1.]))
 
+@pytest.mark.parametrize('cap_style, parallel_offset', [('round', 10), ('square', 5), ('flat', 3)])
+def test_multiframe_bodyparts_to_polygon(cap_style, parallel_offset):
+    data = np.random.randint(0, 100, (25, 6, 2))
+    data[0] = 5
+    results = GeometryMixin().multiframe_bodyparts_to_polygon(data=data, cap_style=cap_style, parallel_offset=parallel_offset, core_cnt=1)
+    assert len(results) == data.shape[0]
+    for frm_data, result in zip(data, results):
+        expected = GeometryMixin.bodyparts_to_polygon(data=frm_data, cap_style=cap_style, parallel_offset=parallel_offset)
+        assert result.equals_exact(expected, tolerance=0)
 
+def test_multiframe_compute_pct_shape_overlap():
+    shape_1 = GeometryMixin().multiframe_bodyparts_to_polygon(data=np.random.randint(0, 100, (25, 6, 2)), core_cnt=1)
+    shape_2 = GeometryMixin().multiframe_bodyparts_to_polygon(data=np.random.randint(0, 100, (25, 6, 2)), core_cnt=1)
+    results = GeometryMixin().multiframe_compute_pct_shape_overlap(shape_1=shape_1, shape_2=shape_2, core_cnt=1)
+    expected = [GeometryMixin().compute_pct_shape_overlap(shapes=[x, y]) for x, y in zip(shape_1, shape_2)]
+    assert np.allclose(results, expected)
+    results = GeometryMixin().multiframe_area(shapes=shape_1, pixels_per_mm=2.0, core_cnt=1)
+    assert np.allclose(results, [GeometryMixin().area(shape=x, pixels_per_mm=2.0) for x in shape_1])
 
+def test_multiframe_union_ragged():
+    polygons = GeometryMixin().multiframe_bodyparts_to_polygon(data=np.random.randint(0, 100, (5, 6, 2)), core_cnt=1)
+    shapes = [[polygons[0], polygons[1]], [polygons[2], polygons[3], polygons[4]]]
+    results = GeometryMixin().multiframe_union(shapes=shapes, core_cnt=1)
+    assert len(results) == 2
+    for frm_shapes, result in zip(shapes, results):
+        assert result.equals(GeometryMixin.union(shapes=frm_shapes))
+    results = GeometryMixin().multiframe_difference(shapes=shapes, core_cnt=1)
+    for frm_shapes, result in zip(shapes, results):
+        assert result.equals(GeometryMixin.difference(shapes=frm_shapes))
+    results = GeometryMixin().multiframe_symmetric_difference(shapes=shapes, core_cnt=1)
+    assert [len(x) for x in results] == [len(GeometryMixin.symmetric_difference(shapes=x)) for x in shapes]
+    assert GeometryMixin().multiframe_union(shapes=[], core_cnt=1) == []
 
-
-
+def test_batch_geometry_apply():
+    polygons = np.array(GeometryMixin().multiframe_bodyparts_to_polygon(data=np.random.randint(0, 100, (23, 6, 2)), core_cnt=1), dtype=object)
+    offsets = np.arange(len(polygons)).astype(np.float64)
+    func = lambda x, y: shapely.area(x) + y
+    expected = func(polygons, offsets)
+    for core_cnt in [1, 4, 30]:
+        assert np.array_equal(GeometryMixin._batch_geometry_apply(func=func, data=(polygons, offsets), core_cnt=core_cnt), expected)
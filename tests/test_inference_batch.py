@@ -0,0 +1,24 @@
+import os
+import shutil
+
+import pandas as pd
+
+from simba.model.inference_batch import InferenceBatch
+from simba.utils.read_write import read_df
+
+
+def test_inference_batch_parallel(tmp_path, create_project, parallel_core_cnt):
+    model_path = os.path.join(str(tmp_path / 'two_c57'), 'models', 'generated_models', 'Attack.sav')
+    config_path = create_project(config_replacements={'no_targets = 2': 'no_targets = 1', 'model_path_1 = ': f'model_path_1 = {model_path}'})
+    features_dir = os.path.join(os.path.dirname(config_path), 'csv', 'features_extracted')
+    shutil.copy(os.path.join(features_dir, 'Together_1.csv'), os.path.join(features_dir, 'Together_2.csv'))
+    results = {}
+    for core_cnt in [1, parallel_core_cnt]:
+        inferencer = InferenceBatch(config_path=config_path, core_cnt=core_cnt)
+        inferencer.run()
+        results[core_cnt] = {}
+        for video_name in ['Together_1', 'Together_2']:
+            results[core_cnt][video_name] = read_df(os.path.join(inferencer.machine_results_dir, f'{video_name}.csv'), 'csv')
+    for video_name in ['Together_1', 'Together_2']:
+        assert 'Probability_Attack' in results[1][video_name].columns
+        pd.testing.assert_frame_equal(results[1][video_name], results[parallel_core_cnt][video_name])
@@ -1,6 +1,9 @@
 import pytest
 import os
 
+import numpy as np
+import pandas as pd
+
 from simba.outlier_tools.outlier_corrector_location import OutlierCorrecterLocation
 from simba.outlier_tools.outlier_corrector_movement import OutlierCorrecterMovement
 from simba.outlier_tools.skip_outlier_correction import OutlierCorrectionSkipper
@@ -20,3 +23,30 @@ def test_outlier_skipper_use_case(config_path):
     skipper = OutlierCorrectionSkipper(config_path=config_path)
     skipper.run()
 
+
+def test_find_location_outliers():
+    data = np.random.randint(0, 500, (200, 7, 2)).astype(np.float64)
+    results = OutlierCorrecterLocation.find_location_outliers(data=data, criterion=250.0, chunk_size=30)
+    for frm in range(data.shape[0]):
+        for bp in range(data.shape[1]):
+            distances = np.sqrt(np.sum((data[frm] - data[frm, bp]) ** 2, axis=1))
+            assert results[frm, bp] == (np.sum(distances > 250.0) > 1)
+
+def test_last_valid_idx():
+    assert list(OutlierCorrecterLocation.last_valid_idx(outliers=np.array([True, True, False, True, True, False, False, True]))) == [0, 1, 2, 2, 2, 5, 6, 6]
+    assert list(OutlierCorrecterLocation.last_valid_idx(outliers=np.array([], dtype=bool))) == []
+
+@pytest.mark.parametrize("corrector", [OutlierCorrecterMovement, OutlierCorrecterLocation])
+def test_outlier_corrector_parallel(create_project, parallel_core_cnt, corrector):
+    config_path = create_project()
+    logs, results = {}, {}
+    for core_cnt in [1, parallel_core_cnt]:
+        outlier_corrector = corrector(config_path=config_path, core_cnt=core_cnt)
+        outlier_corrector.run()
+        logs[core_cnt] = outlier_corrector.log
+        save_dir = outlier_corrector.outlier_corrected_dir if corrector is OutlierCorrecterLocation else outlier_corrector.outlier_corrected_movement_dir
+        results[core_cnt] = {x: pd.read_csv(os.path.join(save_dir, f'{x}.csv')) for x in ['Together_1', 'Together_2']}
+    assert list(logs[1].iloc[:, 0].unique()) == ['Together_1', 'Together_2']
+    pd.testing.assert_frame_equal(logs[1], logs[parallel_core_cnt])
+    for video_name in ['Together_1', 'Together_2']:
+        pd.testing.assert_frame_equal(results[1][video_name], results[parallel_core_cnt][video_name])
@@ -0,0 +1,135 @@
+import os
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pandas as pd
+import pytest
+
+from simba.mixins.plotting_mixin import PlottingMixin
+from simba.plotting.plot_clf_results_mp import _multiprocess_sklearn_video
+from simba.utils.errors import FrameRangeError
+from simba.utils.read_write import get_video_meta_data
+
+FPS, FRM_CNT, START_FRM, END_FRM = 10, 40, 10, 30
+BPS = ['Nose_1', 'Center_1']
+
+
+@pytest.fixture
+def video_path(tmp_path):
+    video_path = os.path.join(tmp_path, 'video.mp4')
+    writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*'mp4v'), FPS, (64, 48))
+    for _ in range(FRM_CNT):
+        writer.write(np.random.randint(0, 255, (48, 64, 3)).astype(np.uint8))
+    writer.release()
+    return video_path
+
+
+@pytest.fixture
+def data():
+    np.random.seed(0)
+    data = {}
+    for bp in BPS:
+        data[f'{bp}_x'] = np.random.uniform(0, 64, FRM_CNT)
+        data[f'{bp}_y'] = np.random.uniform(0, 48, FRM_CNT)
+        data[f'{bp}_p'] = np.random.uniform(0, 1, FRM_CNT)
+    data = pd.DataFrame(data)
+    data['Attack'] = np.random.randint(0, 2, FRM_CNT)
+    data['Attack_cumsum'] = data['Attack'].cumsum()
+    data['Animal_1_Rect_cum_sum_time'] = np.cumsum(np.random.uniform(0, 0.1, FRM_CNT))
+    data['Animal_1_Rect_cum_sum_entries'] = np.cumsum(np.random.randint(0, 2, FRM_CNT))
+    data['index'] = data.index
+    return data
+
+
+@pytest.fixture
+def drawn(monkeypatch):
+    drawn = {'circle': [], 'putText': [], 'line': []}
+    for name, arg_idx in (('circle', slice(1, 2)), ('putText', slice(1, 2)), ('line', slice(1, 3))):
+        def _record(*args, _name=name, _arg_idx=arg_idx, _func=getattr(cv2, name), **kwargs):
+            drawn[_name].append(tuple(args[_arg_idx]))
+            return _func(*args, **kwargs)
+        monkeypatch.setattr(cv2, name, _record)
+    return drawn
+
+
+def _get_chunk(data: pd.DataFrame, start: int = START_FRM, end: int = END_FRM) -> pd.DataFrame:
+    chunk = data.loc[start:end - 1].copy()
+    chunk['group'] = 1
+    return chunk
+
+
+def _bp_dict() -> dict:
+    return {'Animal_1': {'X_bps': [f'{x}_x' for x in BPS], 'Y_bps': [f'{x}_y' for x in BPS], 'P_bps': [f'{x}_p' for x in BPS], 'colors': [(255, 0, 0), (0, 255, 0)]}}
+
+
+def test_multiprocess_sklearn_video(tmp_path, video_path, data, drawn):
+    _multiprocess_sklearn_video(data=_get_chunk(data), video_path=video_path, video_save_dir=str(tmp_path), frame_save_dir=str(tmp_path), clf_colors=[(0, 0, 255)], models_info={0: {'model_name': 'Attack'}}, bp_dict=_bp_dict(), text_attr={'circle_scale': 2, 'font_size': 0.5, 'text_thickness': 1, 'spacing_scale': 10}, rotate=False, print_timers=True, video_setting=True, frame_setting=False, pose_threshold=0.5)
+    expected_circles, expected_texts = [], []
+    for frm in range(START_FRM, END_FRM - 1):
+        for bp in BPS:
+            if data.loc[frm, f'{bp}_p'] > 0.5:
+                expected_circles.append(((int(data.loc[frm, f'{bp}_x']), int(data.loc[frm, f'{bp}_y'])),))
+        expected_texts.extend([('Animal_1',), ('Timers',), (f"Attack {round(data.loc[frm, 'Attack_cumsum'] / FPS, 3)}s",), ('Ensemble prediction',)])
+        if data.loc[frm, 'Attack'] == 1:
+            expected_texts.append(('Attack',))
+    assert drawn['circle'] == expected_circles
+    assert drawn['putText'] == expected_texts
+
+
+def test_validation_video_mp(tmp_path, video_path, data, drawn):
+    clf_data = data['Attack'].values
+    PlottingMixin.validation_video_mp(data=_get_chunk(data), bp_dict=_bp_dict(), video_save_dir=str(tmp_path), settings={'pose': True, 'animal_names': True, 'styles': {'circle size': 2, 'font size': 0.5, 'space_scale': 10}}, video_path=video_path, video_meta_data=get_video_meta_data(video_path), gantt_setting=None, final_gantt=None, clf_data=clf_data, clrs=[[(255, 0, 0), (0, 255, 0)]], clf_name='Attack', bouts_df=None)
+    expected_circles, expected_texts = [], []
+    for frm in range(START_FRM, END_FRM - 1):
+        for bp in BPS:
+            expected_circles.append(((int(data.loc[frm, f'{bp}_x']), int(data.loc[frm, f'{bp}_y'])),))
+        expected_texts.extend([('Animal_1',), ('Timer',), (f'Attack {round((1 / FPS) * np.sum(clf_data[0:frm]), 2)}s',), ('Ensemble prediction',)])
+        if clf_data[frm] == 1:
+            expected_texts.append(('Attack',))
+    assert drawn['circle'] == expected_circles
+    assert drawn['putText'] == expected_texts
+
+
+def test_roi_plotter_mp(tmp_path, video_path, data, drawn):
+    shape_info = {'Name': ['Rect'], 'Color BGR': [(0, 0, 255)], 'topLeftX': [5], 'topLeftY': [5], 'Bottom_right_X': [20], 'Bottom_right_Y': [20], 'Thickness': [1]}
+    roi_analyzer_data = SimpleNamespace(video_recs=pd.DataFrame(shape_info), video_circs=pd.DataFrame(columns=['Name', 'Color BGR']), video_polys=pd.DataFrame(columns=['Name', 'Color BGR']))
+    loc_dict = {'Animal_1': {'Rect': {'timer_text': 'Rect timer', 'timer_text_loc': (70, 10), 'entries_text': 'Rect entries', 'entries_text_loc': (70, 20), 'timer_data_loc': (100, 10), 'entries_data_loc': (100, 20)}}}
+    PlottingMixin.roi_plotter_mp(data=_get_chunk(data), loc_dict=loc_dict, scalers={'font_size': 0.5, 'circle_size': 2}, video_meta_data=get_video_meta_data(video_path), save_temp_directory=str(tmp_path), shape_meta_data={'Rect': {'Color BGR': (0, 0, 255)}}, video_shape_names=['Rect'], input_video_path=video_path, body_part_dict={'Animal_1': ['Nose_1_x', 'Nose_1_y', 'Nose_1_p']}, roi_analyzer_data=roi_analyzer_data, colors=[(255, 0, 0)], style_attr={'Show_body_part': True, 'Show_animal_name': True}, animal_ids=['Animal_1'], threshold=0.5)
+    expected_circles, expected_texts = [], []
+    for frm in range(START_FRM, END_FRM - 1):
+        expected_texts.extend([('Rect timer',), ('Rect entries',)])
+        bp_data = data.loc[frm, ['Nose_1_x', 'Nose_1_y', 'Nose_1_p']].values
+        if 0.5 < bp_data[2]:
+            expected_circles.append(((int(bp_data[0]), int(bp_data[1])),))
+            expected_texts.append(('Animal_1',))
+        expected_texts.append((str(round(data.loc[frm, 'Animal_1_Rect_cum_sum_time'], 2)),))
+        expected_texts.append((str(data.loc[frm, 'Animal_1_Rect_cum_sum_entries']),))
+    assert drawn['circle'] == expected_circles
+    assert drawn['putText'] == expected_texts
+
+
+def test_directing_animals_mp(tmp_path, video_path, data, drawn):
+    directionality_data = []
+    for frm in range(0, FRM_CNT, 3):
+        for animal_2 in ['Animal_2', 'Animal_3']:
+            directionality_data.append([frm, 'Animal_1', animal_2] + list(np.random.randint(0, 48, 4)))
+    directionality_data = pd.DataFrame(directionality_data, columns=['Frame_#', 'Animal_1', 'Animal_2', 'Eye_x', 'Eye_y', 'Animal_2_bodypart_x', 'Animal_2_bodypart_y'])
+    style_attr = {'Show_pose': True, 'Pose_circle_size': 2, 'Direction_color': 'Orange', 'Direction_thickness': 1, 'Highlight_endpoints': False, 'Polyfill': False}
+    PlottingMixin.directing_animals_mp(data=_get_chunk(data), directionality_data=directionality_data, bp_names=_bp_dict(), style_attr=style_attr, save_temp_dir=str(tmp_path), video_path=video_path, video_meta_data=get_video_meta_data(video_path), colors=[(255, 165, 0)])
+    expected_circles, expected_lines = [], []
+    for frm in range(START_FRM, END_FRM - 1):
+        for bp in BPS:
+            expected_circles.append(((int(data.loc[frm, f'{bp}_x']), int(data.loc[frm, f'{bp}_y'])),))
+        img_data = directionality_data[directionality_data['Frame_#'] == frm]
+        for _, r in img_data.iterrows():
+            expected_lines.append(((int(r['Eye_x']), int(r['Eye_y'])), (int(r['Animal_2_bodypart_x']), int(r['Animal_2_bodypart_y']))))
+    assert drawn['circle'] == expected_circles
+    assert drawn['line'] == expected_lines
+
+
+def test_non_contiguous_chunk(tmp_path, video_path, data):
+    chunk = data.loc[[10, 11, 13, 14]].copy()
+    chunk['group'] = 1
+    with pytest.raises(FrameRangeError):
+        PlottingMixin.validation_video_mp(data=chunk, bp_dict=_bp_dict(), video_save_dir=str(tmp_path), settings={'pose': True, 'animal_names': True, 'styles': {'circle size': 2, 'font size': 0.5, 'space_scale': 10}}, video_path=video_path, video_meta_data=get_video_meta_data(video_path), gantt_setting=None, final_gantt=None, clf_data=data['Attack'].values, clrs=[[(255, 0, 0), (0, 255, 0)]], clf_name='Attack', bouts_df=None)
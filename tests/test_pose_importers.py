@@ -0,0 +1,87 @@
+import json
+import os
+
+import h5py
+import numpy as np
+
+from simba.pose_importers.sleap_h5_importer import SLEAPImporterH5
+from simba.pose_importers.sleap_slp_importer import SLEAPImporterSLP
+from simba.utils.read_write import read_df
+
+FRAMES_DTYPE = [('frame_id', 'u8'), ('video', 'u4'), ('frame_idx', 'u8'), ('instance_id_start', 'u8'), ('instance_id_end', 'u8')]
+INSTANCES_DTYPE = [('instance_id', 'i8'), ('instance_type', 'u1'), ('frame_id', 'u8'), ('skeleton', 'u4'), ('track', 'i4'), ('from_predicted', 'i8'), ('score', 'f4'), ('point_id_start', 'u8'), ('point_id_end', 'u8'), ('tracking_score', 'f4')]
+POINTS_DTYPE = [('x', 'f8'), ('y', 'f8'), ('visible', '?'), ('complete', '?'), ('score', 'f8')]
+
+
+def _instance(instance_id, instance_type, track, point_start, bp_cnt=2):
+    return (instance_id, instance_type, 0, 0, track, -1, 1.0, point_start, point_start + bp_cnt, 1.0)
+
+
+def test_create_tracks_array():
+    frames = np.array([(0, 0, 0, 0, 2), (1, 0, 2, 2, 5), (2, 0, 3, 5, 7), (3, 0, 5, 7, 10)], dtype=FRAMES_DTYPE)
+    instances = np.array([_instance(0, 1, 1, 0),
+                          _instance(1, 1, 0, 2),
+                          _instance(2, 0, 0, 4),
+                          _instance(3, 1, 0, 6),
+                          _instance(4, 1, 2, 8),
+                          _instance(5, 1, -1, 10),
+                          _instance(6, 1, -1, 12),
+                          _instance(7, 1, -1, 14),
+                          _instance(8, 1, 0, 16),
+                          _instance(9, 1, -1, 18)], dtype=INSTANCES_DTYPE)
+    points = np.zeros(20, dtype=POINTS_DTYPE)
+    points['x'], points['y'], points['score'] = np.arange(20), np.arange(20) + 100, np.arange(20) / 100
+    points['x'][3] = np.nan
+    for chunk_size in [1, 2, 100]:
+        results, dropped_cnt = SLEAPImporterSLP.create_tracks_array(frames=frames, instances=instances, predicted_points=points, track_cnt=2, bp_cnt=2, frame_cnt=5, chunk_size=chunk_size)
+        assert results.shape == (6, 2, 2, 3) and results.dtype == np.float32
+        assert dropped_cnt == 2
+        assert np.allclose(results[0, 1], [[0, 100, 0.0], [1, 101, 0.01]])
+        assert np.allclose(results[0, 0], [[2, 102, 0.02], [0, 103, 0.03]])
+        assert np.allclose(results[1], 0)
+        assert np.allclose(results[2, 0], [[6, 106, 0.06], [7, 107, 0.07]])
+        assert np.allclose(results[2, 1], 0)
+        assert np.allclose(results[3, 0], [[10, 110, 0.10], [11, 111, 0.11]])
+        assert np.allclose(results[3, 1], [[12, 112, 0.12], [13, 113, 0.13]])
+        assert np.allclose(results[4], 0)
+        assert np.allclose(results[5, 0], [[16, 116, 0.16], [17, 117, 0.17]])
+        assert np.allclose(results[5, 1], [[14, 114, 0.14], [15, 115, 0.15]])
+
+def test_read_slp(tmp_path):
+    file_path = str(tmp_path / 'Video1.slp')
+    frames = np.array([(0, 0, 1, 0, 1)], dtype=FRAMES_DTYPE)
+    instances = np.array([_instance(0, 1, 0, 0)], dtype=INSTANCES_DTYPE)
+    points = np.zeros(2, dtype=POINTS_DTYPE)
+    points['x'], points['y'], points['score'] = [1, 2], [3, 4], [0.5, 0.6]
+    metadata = {'skeletons': [{'nodes': [{'id': 0}, {'id': 1}]}], 'nodes': [{'name': 'nose'}, {'name': 'tail'}]}
+    with h5py.File(file_path, 'w') as f:
+        group = f.create_group('metadata')
+        group.attrs['format_id'] = 1.2
+        group.attrs['json'] = np.bytes_(json.dumps(metadata))
+        f.create_dataset('frames', data=frames)
+        f.create_dataset('instances', data=instances)
+        f.create_dataset('pred_points', data=points)
+    results = SLEAPImporterSLP.read_slp(file_path=file_path, track_cnt=1, frame_cnts={file_path: 4})
+    assert results.shape == (4, 6)
+    assert np.allclose(results.values[1], [1, 3, 0.5, 2, 4, 0.6])
+    assert np.allclose(results.values[[0, 2, 3]], 0)
+
+
+def test_sleap_h5_importer_parallel(tmp_path, create_project, parallel_core_cnt):
+    data_dir = str(tmp_path / 'data')
+    os.makedirs(data_dir)
+    tracks, point_scores = np.random.random((1, 2, 4, 500)) * 500, np.random.random((1, 4, 500))
+    tracks[0, :, 1, 100:120] = np.nan
+    with h5py.File(os.path.join(data_dir, 'Video1.h5'), 'w') as f:
+        f.create_dataset('tracks', data=tracks)
+        f.create_dataset('point_scores', data=point_scores)
+        f.create_dataset('node_names', data=[b'Left_ear', b'Right_ear', b'Nose', b'Tail'])
+        f.create_dataset('track_names', data=[b'track_0'])
+    results = {}
+    for core_cnt in [1, parallel_core_cnt]:
+        config_path = create_project(project_name='mouse_open_field', copy_name=f'project_{len(results)}')
+        importer = SLEAPImporterH5(config_path=config_path, data_folder=data_dir, id_lst=['Animal_1'], interpolation_settings='Body-parts: Nearest', smoothing_settings={'Method': 'Savitzky Golay', 'Parameters': {'Time_window': '200'}}, core_cnt=core_cnt)
+        importer.run()
+        results[core_cnt] = read_df(os.path.join(importer.input_csv_dir, 'Video1.csv'), 'csv', check_multiindex=True)
+    assert results[1].shape == (500, 12)
+    assert np.array_equal(results[1].values, results[parallel_core_cnt].values)
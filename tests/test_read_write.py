@@ -0,0 +1,130 @@
+import functools
+import json
+import os
+import shutil
+
+import pytest
+import numpy as np
+import pandas as pd
+from simba.utils.errors import CountError, DuplicationError, InvalidInputError
+from simba.utils.read_write import read_df, write_df, read_csv_headers, get_data_file_row_count, get_data_file_headers, run_file_tasks, write_sbp, read_sbp, read_sbp_header, append_sbp_columns, convert_csv_to_sbp, convert_sbp_to_csv, convert_sbp_to_parquet, convert_parquet_to_sbp, get_video_meta_data, warm_video_meta_data_cache
+
+@pytest.mark.parametrize("data_path", ['tests/data/test_projects/two_c57/project_folder/csv/outlier_corrected_movement_location/Together_1.csv'])
+def test_read_df_column_and_frame_range_pushdown(data_path):
+    full_df = read_df(file_path=data_path, file_type='csv')
+    usecols = list(full_df.columns[[0, 4, 10]])
+    assert read_csv_headers(file_path=data_path)[1:] == list(full_df.columns)
+    pd.testing.assert_frame_equal(read_df(file_path=data_path, file_type='csv', usecols=usecols), full_df[usecols])
+    pd.testing.assert_frame_equal(read_df(file_path=data_path, file_type='csv', remove_columns=usecols), full_df.drop(usecols, axis=1))
+    pd.testing.assert_frame_equal(read_df(file_path=data_path, file_type='csv', usecols=usecols, frame_range=(100, 200)), full_df[usecols].iloc[100:200])
+
+def test_read_df_parquet_frame_range(tmp_path):
+    df = pd.DataFrame(data=[[1, 2], [3, 4], [5, 6], [7, 8]], columns=['a', 'b']).astype('float32')
+    save_path = str(tmp_path / 'test.parquet')
+    write_df(df=df, file_type='parquet', save_path=save_path)
+    results = read_df(file_path=save_path, file_type='parquet', usecols=['b'], frame_range=(1, 3))
+    pd.testing.assert_frame_equal(results, df[['b']].iloc[1:3])
+    results = read_df(file_path=save_path, file_type='parquet', usecols=['b'], frame_range=(np.int64(1), np.int32(3)))
+    pd.testing.assert_frame_equal(results, df[['b']].iloc[1:3])
+    with pytest.raises(InvalidInputError):
+        read_df(file_path=save_path, file_type='parquet', frame_range=(1.0, 3))
+
+@pytest.mark.parametrize("data_path", ['tests/data/test_projects/two_c57/project_folder/csv/targets_inserted/Together_1.csv'])
+def test_get_data_file_row_count_and_headers(data_path):
+    df = read_df(file_path=data_path, file_type='csv')
+    assert get_data_file_row_count(file_path=data_path, file_type='csv') == len(df)
+    assert get_data_file_headers(file_path=data_path, file_type='csv') == list(df.columns)
+
+@pytest.mark.parametrize("core_cnt", [1, 2])
+def test_run_file_tasks(tmp_path, core_cnt):
+    file_paths = []
+    for i in range(3):
+        file_paths.append(str(tmp_path / f'test_{i}.csv'))
+        write_df(df=pd.DataFrame(data=[[i, i + 1]], columns=['a', 'b']), file_type='csv', save_path=file_paths[-1])
+    file_paths.insert(1, str(tmp_path / 'missing.csv'))
+    results, processed_cnt, skipped_cnt = run_file_tasks(func=functools.partial(read_df, file_type='csv'), file_paths=file_paths, core_cnt=core_cnt)
+    assert (processed_cnt, skipped_cnt) == (3, 1)
+    assert list(results.keys()) == [file_paths[0], file_paths[2], file_paths[3]]
+    for i, file_path in enumerate(results.keys()):
+        assert list(results[file_path].iloc[0]) == [i, i + 1]
+
+@pytest.mark.parametrize("compression, chunk_size", [('lz4', 100), ('zstd', 10000), (None, 7)])
+def test_sbp_read_write(tmp_path, compression, chunk_size):
+    df = read_df(file_path='tests/data/test_projects/two_c57/project_folder/csv/outlier_corrected_movement_location/Together_1.csv', file_type='csv')
+    save_path = str(tmp_path / 'Together_1.sbp')
+    write_sbp(df=df, save_path=save_path, fps=30, px_per_mm=4.5, chunk_size=chunk_size, compression=compression)
+    header = read_sbp_header(file_path=save_path)
+    assert header['columns'] == list(df.columns)
+    assert header['frame_count'] == len(df)
+    assert header['fps'] == 30.0 and header['px_per_mm'] == 4.5
+    assert header['body_parts'] == [x[:-2] for x in df.columns if x.endswith('_x')]
+    pd.testing.assert_frame_equal(read_sbp(file_path=save_path), df)
+    usecols = list(df.columns[[0, 4, 10]])
+    pd.testing.assert_frame_equal(read_df(file_path=save_path, file_type='sbp', usecols=usecols, frame_range=(95, 312)), df[usecols].iloc[95:312])
+    pd.testing.assert_frame_equal(read_df(file_path=save_path, file_type='sbp', remove_columns=usecols), df.drop(usecols, axis=1))
+    assert get_data_file_row_count(file_path=save_path, file_type='sbp') == len(df)
+    assert get_data_file_headers(file_path=save_path, file_type='sbp') == list(df.columns)
+
+def test_append_sbp_columns(tmp_path):
+    df = pd.DataFrame(np.random.random((1000, 4)), columns=['a', 'b', 'c', 'd']).astype(np.float32)
+    save_path = str(tmp_path / 'test.sbp')
+    write_sbp(df=df[['a', 'b']], save_path=save_path, chunk_size=300)
+    append_sbp_columns(df=df[['c', 'd']], file_path=save_path)
+    write_sbp(df=df, save_path=str(tmp_path / 'expected.sbp'), chunk_size=300)
+    with open(save_path, 'rb') as f, open(str(tmp_path / 'expected.sbp'), 'rb') as f_expected:
+        assert f.read() == f_expected.read()
+    assert sorted(os.listdir(tmp_path)) == ['expected.sbp', 'test.sbp']
+    pd.testing.assert_frame_equal(read_sbp(file_path=save_path), df)
+    pd.testing.assert_frame_equal(read_sbp(file_path=save_path, usecols=['d'], frame_range=(250, 650)), df[['d']].iloc[250:650])
+    pd.testing.assert_frame_equal(read_sbp(file_path=save_path, usecols=['d', 'a']), df[['d', 'a']])
+    assert read_sbp(file_path=save_path, usecols=[]).shape == (1000, 0)
+    with pytest.raises(DuplicationError):
+        append_sbp_columns(df=df[['a']], file_path=save_path)
+    with pytest.raises(CountError):
+        append_sbp_columns(df=df[['a']].iloc[:10].rename(columns={'a': 'e'}), file_path=save_path)
+
+def test_sbp_conversion(tmp_path):
+    data_dir = str(tmp_path / 'data')
+    os.makedirs(data_dir)
+    shutil.copy('tests/data/test_projects/two_c57/project_folder/csv/outlier_corrected_movement_location/Together_1.csv', data_dir)
+    df = read_df(file_path=os.path.join(data_dir, 'Together_1.csv'), file_type='csv')
+    convert_csv_to_sbp(directory=data_dir, video_info_path='tests/data/test_projects/two_c57/project_folder/logs/video_info.csv')
+    assert read_sbp_header(file_path=os.path.join(data_dir, 'Together_1.sbp'))['fps'] is not None
+    os.remove(os.path.join(data_dir, 'Together_1.csv'))
+    convert_sbp_to_csv(directory=data_dir)
+    pd.testing.assert_frame_equal(read_df(file_path=os.path.join(data_dir, 'Together_1.csv'), file_type='csv'), df)
+    convert_sbp_to_parquet(directory=data_dir)
+    os.remove(os.path.join(data_dir, 'Together_1.sbp'))
+    convert_parquet_to_sbp(directory=data_dir)
+    pd.testing.assert_frame_equal(read_df(file_path=os.path.join(data_dir, 'Together_1.sbp'), file_type='sbp'), df)
+
+def test_video_meta_data_cache(tmp_path):
+    project_dir = str(tmp_path / 'mouse_open_field')
+    shutil.copytree('tests/data/test_projects/mouse_open_field', project_dir)
+    config_path = os.path.join(project_dir, 'project_folder', 'project_config.ini')
+    with open(config_path, 'r') as f:
+        config = f.read()
+    with open(config_path, 'w') as f:
+        f.write(config.replace('tests/data/test_projects/mouse_open_field/project_folder', os.path.join(project_dir, 'project_folder')))
+    video_path = os.path.join(project_dir, 'project_folder', 'videos', 'Video1.mp4')
+    cache_path = os.path.join(project_dir, 'project_folder', 'logs', 'video_meta_data_cache.json')
+    invalid_video_path = os.path.join(project_dir, 'project_folder', 'videos', 'Invalid.mp4')
+    with open(invalid_video_path, 'w') as f:
+        f.write('not a video')
+    expected = get_video_meta_data(video_path=video_path, use_cache=False)
+    assert not os.path.isfile(cache_path)
+    entries = warm_video_meta_data_cache(config_path=config_path)
+    assert os.path.isfile(cache_path)
+    assert entries[os.path.abspath(video_path)]['frame_count'] == expected['frame_count']
+    assert os.path.abspath(invalid_video_path) not in entries
+    with open(cache_path, 'r') as f:
+        assert list(json.load(f).keys()) == [os.path.abspath(video_path)]
+    assert get_video_meta_data(video_path=video_path) == expected
+    with open(cache_path, 'r') as f:
+        cache = json.load(f)
+    cache[os.path.abspath(video_path)]['frame_count'] = 9000
+    with open(cache_path, 'w') as f:
+        json.dump(cache, f)
+    assert get_video_meta_data(video_path=video_path)['frame_count'] == 9000
+    os.utime(video_path, ns=(0, 0))
+    assert get_video_meta_data(video_path=video_path) == expected
@@ -1,7 +1,10 @@
 import pytest
 import numpy as np
+import pandas as pd
+from shapely.geometry import Point, Polygon
 from simba.roi_tools.ROI_analyzer import ROIAnalyzer
 from simba.roi_tools.ROI_clf_calculator import ROIClfCalculator
+from simba.roi_tools.ROI_containment import roi_containment, roi_entries_exits, roi_movement
 from simba.roi_tools.ROI_directing_analyzer import DirectingROIAnalyzer
 from simba.roi_tools.ROI_feature_analyzer import ROIFeatureCreator
 from simba.roi_tools.ROI_movement_analyzer import ROIMovementAnalyzer
@@ -66,3 +69,38 @@ def test_roi_timbin_calculator(config_path_args, bin_length, threshold):
     timebin_calculator = ROITimebinCalculator(config_path=config_path_args.param, bin_length=bin_length, body_parts=['Nose_1'], threshold=threshold)
     timebin_calculator.run()
     timebin_calculator.save()
+
+def test_roi_containment():
+    locations = np.random.uniform(0, 500, (1000, 2, 2))
+    probabilities = np.random.uniform(0, 1, (1000, 2))
+    rectangles_df = pd.DataFrame({'Name': ['Rectangle_1'], 'topLeftX': [0], 'topLeftY': [0], 'Bottom_right_X': [200], 'Bottom_right_Y': [300]})
+    circles_df = pd.DataFrame({'Name': ['Circle_1', 'Circle_2'], 'centerX': [250, 400], 'centerY': [250, 100], 'radius': [50, 100]})
+    polygons_df = pd.DataFrame({'Name': ['Polygon_1'], 'vertices': [np.array([[300, 300], [500, 300], [450, 450], [400, 350], [300, 500]])]})
+    results, shape_names = roi_containment(locations=locations, rectangles_df=rectangles_df, circles_df=circles_df, polygons_df=polygons_df, probabilities=probabilities, threshold=0.5)
+    assert shape_names == ['Rectangle_1', 'Circle_1', 'Circle_2', 'Polygon_1']
+    assert results.shape == (1000, 2, 4)
+    polygon = Polygon(polygons_df['vertices'][0])
+    for frm in range(locations.shape[0]):
+        for animal in range(locations.shape[1]):
+            x, y = locations[frm, animal]
+            expected = [(0 <= x <= 200) and (0 <= y <= 300),
+                        np.sqrt((x - 250) ** 2 + (y - 250) ** 2) <= 50,
+                        np.sqrt((x - 400) ** 2 + (y - 100) ** 2) <= 100,
+                        polygon.contains(Point(x, y))]
+            expected = [i and probabilities[frm, animal] >= 0.5 for i in expected]
+            assert list(results[frm, animal]) == expected
+
+@pytest.mark.parametrize("inside, expected_entries, expected_exits", [([False, True, True, False, True], [1, 4], [2, 4]),
+                                                                      ([True, True, True], [0], [2]),
+                                                                      ([False, False], [], [])])
+def test_roi_entries_exits(inside, expected_entries, expected_exits):
+    entries, exits = roi_entries_exits(inside=np.array(inside))
+    assert list(entries) == expected_entries
+    assert list(exits) == expected_exits
+
+@pytest.mark.parametrize("inside, px_per_mm, expected", [([True, True, False, True], 1.0, 5.0),
+                                                         ([True, True, True, True], 5.0, 3.0),
+                                                         ([True, False, True, False], 1.0, 0.0)])
+def test_roi_movement(inside, px_per_mm, expected):
+    locations = np.array([[0, 0], [3, 4], [6, 8], [9, 12]])
+    assert roi_movement(locations=locations, inside=np.array(inside), px_per_mm=px_per_mm) == expected
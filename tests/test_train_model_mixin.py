@@ -5,7 +5,8 @@ import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 
 from simba.mixins.train_model_mixin import TrainModelMixin
-from simba.utils.read_write import read_config_file, read_df
+from simba.utils.errors import DataHeaderError
+from simba.utils.read_write import read_config_file, read_df, write_df
 
 @pytest.fixture(params=['tests/data/test_projects/two_c57/project_folder/project_config.ini'])
 def parsed_config_args(request):
@@ -18,6 +19,29 @@ def parsed_config_args(request):
 #     assert len(results) == 1738
 #     assert len(results.columns) == 50
 
+@pytest.mark.parametrize("file_paths", [['tests/data/test_projects/two_c57/project_folder/csv/targets_inserted/Together_1.csv']])
+def test_read_all_files_in_folder_preallocated(file_paths):
+    results, frm_numbers = TrainModelMixin().read_all_files_in_folder(file_paths=file_paths, file_type='csv', classifier_names=['Attack', 'Sniffing'])
+    assert results.shape[0] == len(frm_numbers) == 1738
+    assert list(results.index.unique()) == ['Together_1']
+    assert results.values.dtype == np.float32
+
+@pytest.mark.parametrize("file_path", ['tests/data/test_projects/two_c57/project_folder/csv/targets_inserted/Together_1.csv'])
+def test_read_all_files_in_folder_pickle(file_path, tmp_path):
+    pickle_path = str(tmp_path / 'Together_1.pickle')
+    write_df(df=read_df(file_path=file_path, file_type='csv'), file_type='pickle', save_path=pickle_path)
+    csv_results, csv_frm_numbers = TrainModelMixin().read_all_files_in_folder(file_paths=[file_path], file_type='csv', classifier_names=['Attack'])
+    pickle_results, pickle_frm_numbers = TrainModelMixin().read_all_files_in_folder(file_paths=[pickle_path], file_type='pickle', classifier_names=['Attack'])
+    pd.testing.assert_frame_equal(csv_results, pickle_results)
+    assert csv_frm_numbers == pickle_frm_numbers
+
+def test_read_all_files_in_folder_duplicate_headers(tmp_path):
+    file_path = str(tmp_path / 'Video_1.csv')
+    with open(file_path, 'w') as f:
+        f.write(',Feature_1,Feature_1,Attack\n0,1.0,2.0,0\n1,3.0,4.0,1\n')
+    with pytest.raises(DataHeaderError):
+        TrainModelMixin().read_all_files_in_folder(file_paths=[file_path], file_type='csv')
+
 def test_read_in_all_model_names_to_remove(parsed_config_args):
     results = TrainModelMixin().read_in_all_model_names_to_remove(config=parsed_config_args, model_cnt=2, clf_name='Attack')
     assert results == ['Sniffing']
@@ -215,3 +239,29 @@ def test_clf_fit():
     #                         save_file_no: Optional[int] = None) -> None:
 
 #test_clf_fit()
+
+@pytest.mark.parametrize("clf_path", ['tests/data/test_projects/two_c57/models/generated_models/Attack.sav'])
+def test_read_pickle_use_cache(clf_path):
+    train_model_mixin = TrainModelMixin()
+    clf_1 = train_model_mixin.read_pickle(file_path=clf_path, use_cache=True)
+    clf_2 = train_model_mixin.read_pickle(file_path=clf_path, use_cache=True)
+    assert clf_1 is clf_2
+    assert clf_1 is not train_model_mixin.read_pickle(file_path=clf_path)
+
+@pytest.mark.parametrize("file_path", ['tests/data/test_projects/two_c57/project_folder/csv/targets_inserted/Together_1.csv'])
+def test_training_data_store(file_path, tmp_path):
+    from simba.model.training_store import TrainingDataStore
+    store = TrainingDataStore(store_dir=str(tmp_path))
+    store.update(file_paths=[file_path], file_type='csv')
+    df = read_df(file_path=file_path, file_type='csv')
+    assert store.row_cnt == len(df)
+    assert store.get_row_ranges() == {'Together_1': (0, len(df))}
+    y = store.read_columns(columns=['Attack'])
+    assert np.array_equal(y['Attack'].values, df['Attack'].values.astype(np.float32))
+    rows = np.array([100, 5, 1500])
+    x = store.read_rows(rows=rows, columns=['Attack', 'Sniffing'])
+    assert list(x.index) == list(rows)
+    assert np.allclose(x.values, df[['Attack', 'Sniffing']].values[rows])
+    assert TrainingDataStore(store_dir=str(tmp_path)).row_cnt == len(df)
+    store.update(file_paths=[], file_type='csv')
+    assert store.row_cnt == 0
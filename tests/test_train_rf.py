@@ -0,0 +1,56 @@
+import os
+import shutil
+
+import pytest
+
+from simba.model.train_multiclass_rf import TrainMultiClassRandomForestClassifier
+from simba.model.train_rf import TrainRandomForestClassifier
+
+PROJECT_DIR = 'tests/data/test_projects/two_c57'
+SETTINGS = {'rf_n_estimators = 200': 'rf_n_estimators = 5',
+            'generate_learning_curve = no': 'generate_sklearn_learning_curves = yes\nlearning_curve_k_splits = 2',
+            'learningcurve_shuffle_data_splits = NaN': 'learningcurve_shuffle_data_splits = 2',
+            'generate_precision_recall_curve = yes': 'generate_precision_recall_curve = no',
+            'generate_features_importance_bar_graph = yes': 'generate_features_importance_bar_graph = no',
+            'shap_target_absent_no = \n': "shap_target_absent_no = \nuse_training_store = True\nclassifier_map = {0: 'None', 1: 'Attack'}\n"}
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    project_dir = str(tmp_path / 'two_c57')
+    shutil.copytree(PROJECT_DIR, project_dir)
+    project_folder = os.path.join(project_dir, 'project_folder')
+    config_path = os.path.join(project_folder, 'project_config.ini')
+    with open(config_path, 'r') as f:
+        config = f.read()
+    config = config.replace('tests/data/test_projects/two_c57/project_folder', project_folder)
+    for k, v in SETTINGS.items():
+        assert k in config
+        config = config.replace(k, v)
+    with open(config_path, 'w') as f:
+        f.write(config)
+    return config_path
+
+
+def test_train_rf_training_store(config_path):
+    with open(config_path, 'r') as f:
+        config = f.read()
+    with open(config_path, 'w') as f:
+        f.write(config.replace('under_sample_setting = None', 'under_sample_setting = random undersample').replace('under_sample_ratio = None', 'under_sample_ratio = 1.0'))
+    model_trainer = TrainRandomForestClassifier(config_path=config_path)
+    assert model_trainer.use_training_store
+    model_trainer.run()
+    assert len(model_trainer.sampled_rows) < model_trainer.store.row_cnt
+    assert list(model_trainer.x_y_df.index) == list(model_trainer.sampled_rows)
+    assert list(model_trainer.x_y_df.columns) == list(model_trainer.feature_names) + ['Attack']
+    assert os.listdir(model_trainer.eval_out_path)
+
+
+def test_train_multiclass_rf_training_store(config_path):
+    model_trainer = TrainMultiClassRandomForestClassifier(config_path=config_path)
+    assert model_trainer.use_training_store
+    model_trainer.run()
+    assert list(model_trainer.x_train.columns) == list(model_trainer.feature_names)
+    assert list(model_trainer.x_train.index) == list(model_trainer.y_train.index)
+    assert len(model_trainer.x_y_df) == len(model_trainer.x_train) + len(model_trainer.x_test)
+    assert model_trainer.rf_clf.n_features_in_ == len(model_trainer.feature_names)
@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from numba import typed
 from simba.mixins.timeseries_features_mixin import TimeseriesFeatureMixin
 
 def test_local_maxima_minima_1():
@@ -93,6 +94,24 @@ def test_sliding_variance():
     expected = np.array([[-1.], [-1.], [-1.], [-1.], [ 1.], [ 8.], [36.], [37.], [32.], [27.]], dtype=np.float32)
     assert np.array_equal(np.rint(results), expected)
 
+@pytest.mark.parametrize('statistic, func', [('var', np.var), ('max', np.max), ('min', np.min), ('std', np.std), ('median', np.median),
+                                             ('mean', np.mean), ('mad', lambda x: np.median(np.abs(x - np.median(x)))), ('sum', np.sum),
+                                             ('mac', lambda x: np.mean(np.abs(np.diff(x)))), ('rms', lambda x: np.sqrt(np.mean(x ** 2))),
+                                             ('absenergy', lambda x: np.sqrt(np.sum(x ** 2)))])
+def test_sliding_descriptive_statistics(statistic, func):
+    data = np.random.normal(loc=50, scale=10, size=(500,)).astype(np.float32)
+    results = TimeseriesFeatureMixin().sliding_descriptive_statistics(data=data, window_sizes=np.array([0.5, 2.5]), sample_rate=10, statistics=typed.List([statistic]))
+    for i, window_size in enumerate([5, 25]):
+        expected = np.array([func(data[r - window_size: r].astype(np.float64)) for r in range(window_size, data.shape[0] + 1)])
+        assert np.all(results[0, : window_size - 1, i] == -1.0)
+        assert np.allclose(results[0, window_size - 1:, i], expected, rtol=1e-4, atol=1e-3)
+
+def test_sliding_line_length():
+    data = np.array([1, 4, 2, 3, 5, 6, 8, 7, 9, 10]).astype(np.float32)
+    results = TimeseriesFeatureMixin().sliding_line_length(data=data, window_sizes=np.array([0.5]), sample_rate=10)
+    expected = np.array([-1., -1., -1., -1., 8., 6., 6., 6., 6., 6.], dtype=np.float32)
+    assert np.array_equal(results.flatten(), expected)
+
 @pytest.mark.parametrize('data, above, expected', [(np.array([1, 8, 2, 10, 8, 6, 8, 1, 1, 1]).astype(np.float32), True, 2),
                                                    (np.array([1, 8, 2, 10, 8, 6, 8, 2, 2, 2]).astype(np.float32), False, 3)])
 def test_longest_strike(data, above, expected):
@@ -1,21 +1,71 @@
 import pytest
+import h5py
+import numpy as np
 import pandas as pd
 from simba.utils.read_write import read_df
 from simba.utils.data import (detect_bouts,
+                              detect_bouts_multiclass,
                               plug_holes_shortest_bout,
+                              plug_holes_shortest_bout_arr,
+                              run_length_encode,
                               create_color_palettes,
-                              create_color_palette)
+                              create_color_palette,
+                              sleap_tracks_to_array,
+                              slp_to_df_convert)
 
 @pytest.mark.parametrize("data_path, target_lst, fps", [('tests/data/test_projects/two_c57/project_folder/csv/machine_results/Together_1.csv', ['Attack', 'Sniffing'], 30)])
 def test_detect_bouts(data_path, target_lst, fps):
     data_df = read_df(file_path=data_path, file_type='csv')
     results = detect_bouts(data_df=data_df, target_lst=target_lst, fps=fps)
 
+def test_detect_bouts_columnar():
+    data_df = pd.DataFrame({'Attack': [0, 1, 1, 0, 1, 1, 1], 'Sniffing': [True, True, False, False, False, False, True]}, index=range(10, 17))
+    results = detect_bouts(data_df=data_df, target_lst=['Attack', 'Sniffing'], fps=10)
+    expected = pd.DataFrame({'Event': ['Attack', 'Attack', 'Sniffing', 'Sniffing'],
+                             'Start_time': [1.1, 1.4, 1.0, 1.6],
+                             'End Time': [1.3, 1.7, 1.2, 1.7],
+                             'Start_frame': [11, 14, 10, 16],
+                             'End_frame': [12, 16, 11, 16],
+                             'Bout_time': [0.2, 0.3, 0.2, 0.1]})
+    pd.testing.assert_frame_equal(results, expected)
+    results = detect_bouts(data_df=data_df.iloc[0:0], target_lst=['Attack', 'Sniffing'], fps=10)
+    assert len(results) == 0 and results['Start_frame'].dtype == np.int64
+
+def test_detect_bouts_multiclass():
+    df = pd.DataFrame({'value': [0, 0, 0, 2, 2, 1, 1, 1, 3, 3]})
+    results = detect_bouts_multiclass(data=df, target='value', fps=3, classifier_map={0: 'None', 1: 'sharp', 2: 'track', 3: 'sync'})
+    assert list(results['Event']) == ['None', 'sharp', 'track', 'sync']
+    assert list(results['Start_frame']) == [0, 5, 3, 8] and list(results['End_frame']) == [2, 7, 4, 9]
+    assert np.allclose(results['Bout_time'], [1.0, 1.0, 2 / 3, 2 / 3])
+    assert list(df.columns) == ['value']
+
 def test_plug_holes_shortest_bout():
     data_df = pd.DataFrame(data=[1, 0, 1, 1, 1], columns=['target'])
     results = plug_holes_shortest_bout(data_df=data_df, clf_name='target', fps=10, shortest_bout=2000)
     pd.testing.assert_frame_equal(results, pd.DataFrame(data=[1, 1, 1, 1, 1], columns=['target']))
 
+def _plug_holes_rolling(data_df: pd.DataFrame, clf_name: str, frames_to_plug: int) -> pd.DataFrame:
+    for fill_value in [1, 0]:
+        for k in range(frames_to_plug, 0, -1):
+            pattern = np.array([fill_value] + [1 - fill_value] * k + [fill_value])
+            match = data_df[clf_name].rolling(window=len(pattern), min_periods=len(pattern)).apply(lambda x: (x == pattern).all()).mask(lambda x: x == 0).bfill(limit=len(pattern) - 1).fillna(0).astype(bool)
+            data_df.loc[match, clf_name] = fill_value
+    return data_df
+
+@pytest.mark.parametrize("fps, shortest_bout", [(10, 300), (25, 200), (30, 0), (30, 1000)])
+def test_plug_holes_shortest_bout_rolling_equivalence(fps, shortest_bout):
+    np.random.seed(fps + shortest_bout)
+    data = np.repeat(np.random.randint(0, 2, 300), np.random.randint(1, 8, 300))
+    expected = _plug_holes_rolling(data_df=pd.DataFrame({'target': data}), clf_name='target', frames_to_plug=int(fps * shortest_bout / 1000))
+    results = plug_holes_shortest_bout(data_df=pd.DataFrame({'target': data}), clf_name='target', fps=fps, shortest_bout=shortest_bout)
+    pd.testing.assert_frame_equal(results, expected)
+
+def test_run_length_encode():
+    values, starts, lengths = run_length_encode(data=np.array([0, 0, 1, 1, 1, 0]))
+    assert np.array_equal(values, [0, 1, 0]) and np.array_equal(starts, [0, 2, 5]) and np.array_equal(lengths, [2, 3, 1])
+    assert len(run_length_encode(data=np.array([]))[0]) == 0
+    assert np.array_equal(plug_holes_shortest_bout_arr(data=np.array([1, 0, 1, 1, 0, 0, 1, 0, 0, 0]), frames_to_plug=1), [1, 1, 1, 1, 0, 0, 0, 0, 0, 0])
+
 def test_create_color_palettes():
     results = create_color_palettes(no_animals=2, map_size=2)
     assert results == [[[255.0, 0.0, 255.0], [0.0, 255.0, 255.0]], [[102.0, 127.5, 0.0], [102.0, 255.0, 255.0]]]
@@ -27,3 +77,31 @@ def test_create_color_palette():
     assert results == [[0.5, 0.0, 0.0], [1.0, 0.8333333333333334, 0.0], [0.0, 0.9012345679012345, 1.0], [0.0, 0.0, 0.5]]
     results = create_color_palette(pallete_name='jet', increments=3, as_hex=True)
     assert results == ['#800000', '#ffd400', '#00e6ff', '#000080']
+
+def test_sleap_tracks_to_array():
+    tracks, point_scores = np.random.random((100, 4, 2, 3)), np.random.random((100, 4, 3))
+    tracks[5, 1, :, 2], point_scores[7, 3, 0] = np.nan, np.nan
+    results = sleap_tracks_to_array(tracks=tracks, point_scores=point_scores)
+    assert results.shape == (100, 36) and results.dtype == np.float32
+    for frm in range(tracks.shape[0]):
+        expected = []
+        for track in range(tracks.shape[3]):
+            for node in range(tracks.shape[1]):
+                expected.extend([tracks[frm, node, 0, track], tracks[frm, node, 1, track], point_scores[frm, node, track]])
+        assert np.array_equal(results[frm], np.nan_to_num(np.array(expected, dtype=np.float32)))
+
+def test_slp_to_df_convert(tmp_path):
+    file_path = str(tmp_path / 'video_1.h5')
+    tracks, point_scores = np.random.random((2, 2, 3, 50)), np.random.random((2, 3, 50))
+    with h5py.File(file_path, 'w') as f:
+        f.create_dataset('tracks', data=tracks)
+        f.create_dataset('point_scores', data=point_scores)
+        f.create_dataset('node_names', data=[b'nose', b'tail', b'center'])
+        f.create_dataset('track_names', data=[b'track_0', b'track_1'])
+    headers = [f'{bp}_{animal}_{c}' for animal in [1, 2] for bp in ['nose', 'center'] for c in ['x', 'y', 'p']]
+    results = slp_to_df_convert(file_path=file_path, headers=headers, multi_index=False, drop_body_parts=['tail_1', 'tail_2'])
+    assert list(results.columns) == headers
+    assert np.allclose(results['center_2_y'].values, tracks[1, 1, 2])
+    assert np.allclose(results['nose_1_p'].values, point_scores[0, 0])
+    results = slp_to_df_convert(file_path=file_path, headers=[f'{x}_{y}' for x in range(6) for y in ['x', 'y', 'p']])
+    assert results.shape == (50, 18)